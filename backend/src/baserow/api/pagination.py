@@ -1,6 +1,14 @@
-from typing import Protocol
+import base64
+import datetime
+import hashlib
+import json
+import uuid
+from decimal import Decimal
+from typing import Any, List, Optional, Protocol
 
 from django.core.paginator import Paginator as DjangoPaginator
+from django.db.models import QuerySet
+from django.utils.duration import duration_iso_string
 
 from rest_framework.exceptions import APIException
 from rest_framework.pagination import (
@@ -11,6 +19,9 @@ from rest_framework.pagination import (
 )
 from rest_framework.response import Response
 from rest_framework.status import HTTP_400_BAD_REQUEST
+from rest_framework.utils.urls import replace_query_param
+
+from baserow.core.db import KeysetPaginator, get_estimated_count
 
 
 class Pageable(Protocol):
@@ -150,3 +161,168 @@ class LimitOffsetPaginationWithoutCount(LimitOffsetPagination):
                 "results": schema,
             },
         }
+
+
+def _encode_cursor_value(value: Any) -> Any:
+    """
+    Converts the keyset values that can't be JSON serialized into strings. Unlike the
+    `DjangoJSONEncoder`, the full precision is preserved so that no row is skipped or
+    returned twice. The string values are converted back by the output field of the
+    ordering expression when the cursor is compared with the rows.
+    """
+
+    if isinstance(value, datetime.timedelta):
+        return duration_iso_string(value)
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, uuid.UUID)):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not serializable.")
+
+
+class CursorPagination:
+    """
+    Paginates a queryset by an opaque cursor instead of a page number or offset. The
+    cursor contains the ordering values of the last row of the previous page, and the
+    next page is selected by comparing the rows with those values. Contrary to the
+    `OFFSET` based pagination, every page can be fetched equally fast and no count is
+    needed. Any ordering is supported because the primary key is added as tiebreaker.
+
+    The first page is requested by providing an empty `cursor` query parameter. The
+    `next_cursor` in the response can be used to fetch the next page, it's `null` if
+    there are no more rows. If the `approximate_count` query parameter is provided,
+    an estimation of the total number of rows made by the PostgreSQL planner is
+    included in the response.
+    """
+
+    page_size = 100
+    page_size_query_param = "size"
+    cursor_query_param = "cursor"
+    approximate_count_query_param = "approximate_count"
+
+    def __init__(self, limit_page_size: Optional[int] = None):
+        self.limit_page_size = limit_page_size
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        if page_size <= 0:
+            return self.page_size
+
+        if self.limit_page_size and page_size > self.limit_page_size:
+            exception = APIException(
+                {
+                    "error": "ERROR_PAGE_SIZE_LIMIT",
+                    "detail": f"The page size is limited to {self.limit_page_size}.",
+                }
+            )
+            exception.status_code = HTTP_400_BAD_REQUEST
+            raise exception
+
+        return page_size
+
+    def get_ordering_hash(self, paginator: KeysetPaginator) -> str:
+        """
+        Returns a short hash of the ordering of the queryset. It's stored in the
+        cursor so that a cursor can't be used if the sorts have changed in the
+        meantime, because the keyset values would not match the ordering anymore.
+        """
+
+        query = paginator.queryset.query
+        compiler = query.get_compiler(using=paginator.queryset.db)
+        ordering = []
+        for alias, order_by in zip(paginator.aliases, paginator.order_bys):
+            sql, params = compiler.compile(query.annotations[alias])
+            ordering.append(
+                [sql, [str(param) for param in params], order_by.descending]
+            )
+        ordering = json.dumps(ordering)
+        return hashlib.shake_128(ordering.encode("utf-8")).hexdigest(8)
+
+    def encode_cursor(self, paginator: KeysetPaginator, keyset: List[Any]) -> str:
+        cursor = json.dumps(
+            [self.get_ordering_hash(paginator), keyset],
+            default=_encode_cursor_value,
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(cursor.encode("utf-8")).decode("ascii")
+
+    def decode_cursor(self, paginator: KeysetPaginator, cursor: str) -> List[Any]:
+        try:
+            ordering_hash, keyset = json.loads(
+                base64.urlsafe_b64decode(cursor.encode("ascii"))
+            )
+            valid = (
+                ordering_hash == self.get_ordering_hash(paginator)
+                and isinstance(keyset, list)
+                and len(keyset) == len(paginator.order_bys)
+            )
+        except (ValueError, TypeError, UnicodeError):
+            valid = False
+
+        if not valid:
+            exception = APIException(
+                {
+                    "error": "ERROR_INVALID_CURSOR",
+                    "detail": "The provided cursor is invalid or doesn't match the "
+                    "ordering of the rows anymore.",
+                }
+            )
+            exception.status_code = HTTP_400_BAD_REQUEST
+            raise exception
+
+        return keyset
+
+    def paginate_queryset(self, queryset: QuerySet, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+
+        # One extra row is fetched to figure out if there is a next page.
+        paginator = KeysetPaginator(queryset, page_size + 1)
+        cursor = request.query_params.get(self.cursor_query_param)
+        keyset = self.decode_cursor(paginator, cursor) if cursor else None
+        page = paginator.get_page(keyset)
+
+        self.next_cursor = None
+        if len(page) > page_size:
+            page = page[:page_size]
+            self.next_cursor = self.encode_cursor(
+                paginator, paginator.get_keyset(page[-1])
+            )
+
+        self.approximate_count = None
+        if self.approximate_count_query_param in request.query_params:
+            self.approximate_count = get_estimated_count(queryset)
+
+        return page
+
+    def get_next_link(self) -> Optional[str]:
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        response = {
+            "next": self.get_next_link(),
+            "next_cursor": self.next_cursor,
+            "results": data,
+        }
+        if self.approximate_count is not None:
+            response["approximate_count"] = self.approximate_count
+        return Response(response)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["next", "next_cursor", "results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "next_cursor": {"type": "string", "nullable": True},
+                "approximate_count": {"type": "integer"},
+                "results": schema,
+            },
+        }
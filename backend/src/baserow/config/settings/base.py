@@ -171,6 +171,10 @@ BASEROW_ROLE_USAGE_QUEUE = os.getenv("BASEROW_GROUP_STORAGE_USAGE_QUEUE", "expor
 CELERY_BROKER_URL = REDIS_URL
 CELERY_TASK_ROUTES = {
     "baserow.contrib.database.export.tasks.run_export_job": {"queue": "export"},
+    "baserow.contrib.database.export.tasks.run_export_job_shard": {"queue": "export"},
+    "baserow.contrib.database.export.tasks.merge_export_job_shards": {
+        "queue": "export"
+    },
     "baserow.contrib.database.export.tasks.clean_up_old_jobs": {"queue": "export"},
     "baserow.core.trash.tasks.mark_old_trash_for_permanent_deletion": {
         "queue": "export"
@@ -215,6 +219,20 @@ CHANNEL_LAYERS = {
     },
 }
 
+# Realtime events that must only be sent to the users permitted to perform an
+# operation on a scope are coalesced per workspace, operation and scope within this
+# window, so that the permitted users are resolved once per batch. Set to 0 to
+# broadcast every event separately.
+BASEROW_WS_BROADCAST_COALESCE_WINDOW_MS = int(
+    os.getenv("BASEROW_WS_BROADCAST_COALESCE_WINDOW_MS", "") or 100
+)
+# The permitted users of a scope are memoized until roles or memberships change in
+# the workspace. This TTL is a safety net for changes that don't send a signal. Set
+# to 0 to disable the memoization.
+BASEROW_WS_PERMITTED_USERS_CACHE_TTL_SECONDS = int(
+    os.getenv("BASEROW_WS_PERMITTED_USERS_CACHE_TTL_SECONDS", "") or 60
+)
+
 # Database
 # https://docs.djangoproject.com/en/2.2/ref/settings/#databases
 if "DATABASE_URL" in os.environ:
@@ -299,6 +317,25 @@ BUILDER_DISPATCH_ACTION_CACHE_TTL_SECONDS = int(
     os.getenv("BASEROW_BUILDER_DISPATCH_ACTION_CACHE_TTL_SECONDS")
     or 300
 )
+# The maximum number of data sources of a page that are dispatched at the same time.
+# Data sources that depend on each other are still dispatched one after the other. Set
+# to 1 to dispatch them all sequentially.
+BUILDER_DATA_SOURCES_DISPATCH_CONCURRENCY = int(
+    os.getenv("BASEROW_BUILDER_DATA_SOURCES_DISPATCH_CONCURRENCY", "") or 4
+)
+# The maximum number of shared results that are cached for every data source that
+# opted in to share its results between the anonymous visitors of a published
+# application. The least recently used results are evicted first. Set to 0 to disable
+# the cache.
+BUILDER_DATA_SOURCE_RESULTS_CACHE_MAX_ENTRIES = int(
+    os.getenv("BASEROW_BUILDER_DATA_SOURCE_RESULTS_CACHE_MAX_ENTRIES", "") or 100
+)
+# The number of compiled runtime formulas that every process keeps in memory, so that
+# the formulas of the builder and automations don't have to be parsed every time they
+# are resolved. Set to 0 to disable it.
+BASEROW_COMPILED_FORMULAS_LRU_CACHE_SIZE = int(
+    os.getenv("BASEROW_COMPILED_FORMULAS_LRU_CACHE_SIZE", "") or 5000
+)
 
 
 CELERY_SINGLETON_BACKEND_CLASS = (
@@ -859,6 +896,13 @@ USER_THUMBNAILS_DIRECTORY = "thumbnails"
 EXPORT_FILES_DIRECTORY = "export_files"
 EXPORT_CLEANUP_INTERVAL_MINUTES = 5
 EXPORT_FILE_EXPIRE_MINUTES = 60
+# Exports of tables and views with at least BASEROW_EXPORT_SHARD_MIN_ROWS rows are
+# split into BASEROW_EXPORT_SHARDS shards that are exported in parallel by the
+# export workers. Exports are never sharded if set to 1.
+BASEROW_EXPORT_SHARDS = int(os.getenv("BASEROW_EXPORT_SHARDS", "") or 1)
+BASEROW_EXPORT_SHARD_MIN_ROWS = int(
+    os.getenv("BASEROW_EXPORT_SHARD_MIN_ROWS", "") or 100000
+)
 
 IMPORT_FILES_DIRECTORY = "import_files"
 
@@ -868,9 +912,12 @@ STALE_MENTIONS_CLEANUP_INTERVAL_MINUTES = int(
     os.getenv("BASEROW_STALE_MENTIONS_CLEANUP_INTERVAL_MINUTES", "") or 360
 )
 
-# Indicates how frequently the workspace storage should be updated. Once every X number
-# of hours.
-BASEROW_UPDATE_WORKSPACE_STORAGE_USAGE_HOURS = 24
+# The storage usage of the workspaces is kept up to date incrementally. This indicates
+# how frequently it's fully recalculated to reconcile it with the actual usage. Once
+# every X number of hours.
+BASEROW_UPDATE_WORKSPACE_STORAGE_USAGE_HOURS = int(
+    os.getenv("BASEROW_UPDATE_WORKSPACE_STORAGE_USAGE_HOURS", "") or 24 * 7
+)
 
 ONE_AM_CRONTAB_STR = "0 1 * * *"
 BASEROW_SEAT_USAGE_JOB_CRONTAB = get_crontab_from_env(
@@ -995,6 +1042,11 @@ HOURS_UNTIL_TRASH_PERMANENTLY_DELETED = int(
     os.getenv("HOURS_UNTIL_TRASH_PERMANENTLY_DELETED", 24 * 3)
 )
 OLD_TRASH_CLEANUP_CHECK_INTERVAL_MINUTES = 5
+# The maximum number of marked trash entries of the same type and parent, like the
+# rows of a table, that are permanently deleted together in one transaction.
+BASEROW_TRASH_PERMANENT_DELETION_BATCH_SIZE = int(
+    os.getenv("BASEROW_TRASH_PERMANENT_DELETION_BATCH_SIZE", "") or 1000
+)
 
 DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
 
@@ -1063,6 +1115,17 @@ BASEROW_WEBHOOKS_BATCH_LIMIT = int(os.getenv("BASEROW_WEBHOOKS_BATCH_LIMIT", 5))
 BASEROW_WEBHOOK_ROWS_ENTER_VIEW_BATCH_SIZE = int(
     os.getenv("BASEROW_WEBHOOK_ROWS_ENTER_VIEW_BATCH_SIZE", BATCH_ROWS_SIZE_LIMIT)
 )
+# The maximum number of webhook requests a delivery task makes concurrently. The
+# calls of a single webhook are still made one by one and in order. Set to 0 to
+# make every call in a separate task instead.
+BASEROW_WEBHOOKS_DELIVERY_CONCURRENCY = int(
+    os.getenv("BASEROW_WEBHOOKS_DELIVERY_CONCURRENCY", "") or 10
+)
+# The maximum number of queued events sent in one request to webhooks that have
+# opted in to batching.
+BASEROW_WEBHOOKS_DELIVERY_MAX_BATCH_SIZE = int(
+    os.getenv("BASEROW_WEBHOOKS_DELIVERY_MAX_BATCH_SIZE", "") or 10
+)
 
 OAUTH_BACKEND_URL = os.getenv("BASEROW_OAUTH_BACKEND_URL") or PUBLIC_BACKEND_URL
 
@@ -1148,6 +1211,26 @@ BASEROW_IMPORT_EXPORT_RESOURCE_REMOVAL_AFTER_DAYS = int(
 BASEROW_IMPORT_EXPORT_TABLE_ROWS_COUNT_LIMIT = int(
     os.getenv("BASEROW_IMPORT_EXPORT_TABLE_ROWS_COUNT_LIMIT", 0)
 )
+# Whether the rows of file imports and of imported applications are inserted with a
+# postgres `COPY FROM STDIN` statement instead of regular `INSERT` statements, which
+# is a lot faster.
+BASEROW_IMPORT_ROWS_USE_COPY = str_to_bool(
+    os.getenv("BASEROW_IMPORT_ROWS_USE_COPY", "true")
+)
+# The maximum number of requests that are made to Airtable at the same time when
+# importing a base. The connections are kept alive and reused between requests.
+BASEROW_AIRTABLE_IMPORT_CONCURRENCY = int(
+    os.getenv("BASEROW_AIRTABLE_IMPORT_CONCURRENCY", "") or 4
+)
+# The number of times a request to Airtable is retried if it fails because of a
+# connection error, rate limit or server error. The delay between the retries grows
+# exponentially with the backoff factor in seconds.
+BASEROW_AIRTABLE_IMPORT_MAX_RETRIES = int(
+    os.getenv("BASEROW_AIRTABLE_IMPORT_MAX_RETRIES", "") or 3
+)
+BASEROW_AIRTABLE_IMPORT_RETRY_BACKOFF_FACTOR = float(
+    os.getenv("BASEROW_AIRTABLE_IMPORT_RETRY_BACKOFF_FACTOR", "") or 0.5
+)
 
 PERMISSION_MANAGERS = [
     "view_ownership",
@@ -1234,6 +1317,12 @@ BASEROW_SYNC_TEMPLATES_TIME_LIMIT = int(
 APPEND_SLASH = False
 
 BASEROW_DISABLE_MODEL_CACHE = bool(os.getenv("BASEROW_DISABLE_MODEL_CACHE", ""))
+# The number of generated table models that every process keeps in memory, so that
+# the models of frequently used tables don't have to be constructed on every request.
+# Set to 0 to disable it.
+BASEROW_GENERATED_MODELS_LRU_CACHE_SIZE = int(
+    os.getenv("BASEROW_GENERATED_MODELS_LRU_CACHE_SIZE", "") or 100
+)
 BASEROW_NOWAIT_FOR_LOCKS = not bool(
     os.getenv("BASEROW_WAIT_INSTEAD_OF_409_CONFLICT_ERROR", False)
 )
@@ -1242,6 +1331,27 @@ BASEROW_PERSONAL_VIEW_LOWEST_ROLE_ALLOWED = (
     os.getenv("BASEROW_PERSONAL_VIEW_LOWEST_ROLE_ALLOWED", "viewer").strip().upper()
 )
 
+# The field aggregations of views that are filtered or searched are cached for this
+# many seconds, at most BASEROW_FILTERED_AGGREGATIONS_CACHE_MAX_ENTRIES per view. The
+# least recently used entries are evicted first. Set the TTL to 0 to disable it.
+BASEROW_FILTERED_AGGREGATIONS_CACHE_TTL_SECONDS = int(
+    os.getenv("BASEROW_FILTERED_AGGREGATIONS_CACHE_TTL_SECONDS", "") or 60
+)
+BASEROW_FILTERED_AGGREGATIONS_CACHE_MAX_ENTRIES = int(
+    os.getenv("BASEROW_FILTERED_AGGREGATIONS_CACHE_MAX_ENTRIES", "") or 50
+)
+
+# When the grid view rows are counted with the `estimated` count strategy, counts
+# below this threshold are still counted exactly. Counts made with the `cached`
+# strategy are cached for at most BASEROW_CACHED_ROW_COUNT_TTL_SECONDS, or until the
+# data of the table changes.
+BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD = int(
+    os.getenv("BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD", "") or 10000
+)
+BASEROW_CACHED_ROW_COUNT_TTL_SECONDS = int(
+    os.getenv("BASEROW_CACHED_ROW_COUNT_TTL_SECONDS", "") or 300
+)
+
 LICENSE_AUTHORITY_CHECK_TIMEOUT_SECONDS = 10
 ADDITIONAL_INFORMATION_TIMEOUT_SECONDS = 10
 
@@ -1306,6 +1416,7 @@ BASEROW_LAZY_LOADED_LIBRARIES = [
     "jira2markdown",
     "saml2",
     "openpyxl",
+    "pyarrow",
     "numpy",
 ]
 
@@ -1384,6 +1495,17 @@ BASEROW_POSTGRESQL_DATA_SYNC_BLACKLIST = (
     else []
 )
 
+# The number of rows that a data sync sorts in memory before spilling them to disk,
+# and the number of rows it creates, updates or deletes in one go.
+BASEROW_DATA_SYNC_BATCH_SIZE = int(
+    os.getenv("BASEROW_DATA_SYNC_BATCH_SIZE", "") or 5000
+)
+# Data syncs that support it only fetch the changed rows. Because deleted rows can't
+# be detected that way, all the rows are synced again after this number of hours.
+BASEROW_DATA_SYNC_FULL_SYNC_INTERVAL_HOURS = int(
+    os.getenv("BASEROW_DATA_SYNC_FULL_SYNC_INTERVAL_HOURS", "") or 24
+)
+
 # Default compression level for creating zip files. This setting balances the need to
 # save resources when compressing media files with the need to save space when
 # compressing text files.
@@ -89,8 +89,18 @@ REST_FRAMEWORK["DEFAULT_THROTTLE_CLASSES"] = []
 
 BUILDER_PUBLICLY_USED_PROPERTIES_CACHE_TTL_SECONDS = 10
 BUILDER_DISPATCH_ACTION_CACHE_TTL_SECONDS = 300
+# The test data isn't committed, so it's not visible from the connections of other
+# threads.
+BUILDER_DATA_SOURCES_DISPATCH_CONCURRENCY = 1
 
 AUTO_INDEX_VIEW_ENABLED = False
+# Generated models are shared between tests otherwise, tests that need it can enable
+# it explicitly.
+BASEROW_GENERATED_MODELS_LRU_CACHE_SIZE = 0
+# Tests expect realtime events to be sent right away and often change permissions
+# without sending signals. Tests that need it can enable it explicitly.
+BASEROW_WS_BROADCAST_COALESCE_WINDOW_MS = 0
+BASEROW_WS_PERMITTED_USERS_CACHE_TTL_SECONDS = 0
 # For ease of testing tests assume this setting is set to this. Set it explicitly to
 # prevent any dev env config from breaking the tests.
 BASEROW_PERSONAL_VIEW_LOWEST_ROLE_ALLOWED = "VIEWER"
@@ -116,6 +126,8 @@ STORAGES["default"] = {"BACKEND": BASE_FILE_STORAGE}
 BASEROW_LOGIN_ACTION_LOG_LIMIT = RateLimit.from_string("1000/s")
 
 BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS = False
+# Most webhook tests expect every call to be made in a separate task.
+BASEROW_WEBHOOKS_DELIVERY_CONCURRENCY = 0
 INTEGRATIONS_ALLOW_PRIVATE_ADDRESS = False
 
 CACHALOT_ENABLED = str_to_bool(os.getenv("CACHALOT_ENABLED", "false"))
@@ -329,9 +329,13 @@ class BuilderConfig(AppConfig):
 
         connect_to_domain_pre_delete_signal()
 
-        from .data_sources.receivers import connect_to_data_source_pre_delete_signal
+        from .data_sources.receivers import (
+            connect_to_data_source_pre_delete_signal,
+            connect_to_data_source_results_cache_invalidation_signals,
+        )
 
         connect_to_data_source_pre_delete_signal()
+        connect_to_data_source_results_cache_invalidation_signals()
 
         from baserow.contrib.builder.workflow_actions.receivers import (
             connect_to_builder_workflow_action_pre_delete_signal,
@@ -0,0 +1,202 @@
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Set
+
+from django.conf import settings
+from django.db import connections
+
+from baserow.contrib.builder.data_sources.builder_dispatch_context import (
+    BuilderDispatchContext,
+)
+from baserow.contrib.builder.data_sources.models import DataSource
+from baserow.core.formula import BaserowFormula, BaserowFormulaVisitor
+from baserow.core.formula.parser.exceptions import BaserowFormulaException
+from baserow.core.formula.parser.parser import (
+    convert_string_literal_token_to_string,
+    get_parse_tree_for_formula,
+)
+from baserow.core.formula.types import BASEROW_FORMULA_MODE_RAW
+from baserow.core.utils import to_path
+
+if TYPE_CHECKING:
+    from baserow.contrib.builder.data_sources.handler import DataSourceHandler
+
+# The data providers of which the first path part is the id of a data source.
+DATA_SOURCE_DATA_PROVIDER_TYPES = ["data_source", "data_source_context"]
+
+
+class DataSourceReferencesVisitor(BaserowFormulaVisitor):
+    """
+    Collects the ids of the data sources referenced by a formula. If the path of a
+    `get` function isn't a string literal, the referenced data sources can't be
+    known before the formula is resolved and the formula is flagged as dynamic.
+    """
+
+    def __init__(self):
+        self.data_source_ids: Set[int] = set()
+        self.is_dynamic = False
+
+    def visitFunctionCall(self, ctx: BaserowFormula.FunctionCallContext):
+        function_name = ctx.func_name().getText().lower()
+        function_argument_expressions = ctx.expr()
+
+        if function_name == "get":
+            first_argument = (
+                function_argument_expressions[0]
+                if function_argument_expressions
+                else None
+            )
+            if isinstance(first_argument, BaserowFormula.StringLiteralContext):
+                path = convert_string_literal_token_to_string(
+                    first_argument.getText(),
+                    first_argument.SINGLEQ_STRING_LITERAL() is not None,
+                )
+                data_provider_name, *rest = to_path(path)
+                if data_provider_name in DATA_SOURCE_DATA_PROVIDER_TYPES and rest:
+                    try:
+                        self.data_source_ids.add(int(rest[0]))
+                    except ValueError:
+                        pass
+            else:
+                self.is_dynamic = True
+
+        return self.visitChildren(ctx)
+
+
+@lru_cache(maxsize=1024)
+def get_formula_data_source_ids(formula: str) -> Optional[FrozenSet[int]]:
+    """
+    Returns the ids of the data sources that are referenced by the formula.
+
+    :param formula: The formula string.
+    :return: The referenced data source ids or None if they can't be known without
+        resolving the formula.
+    """
+
+    try:
+        tree = get_parse_tree_for_formula(formula)
+    except BaserowFormulaException:
+        # An invalid formula fails the dispatch on its own, it can't depend on
+        # anything.
+        return frozenset()
+
+    visitor = DataSourceReferencesVisitor()
+    tree.accept(visitor)
+    return None if visitor.is_dynamic else frozenset(visitor.data_source_ids)
+
+
+class DataSourcesDispatcher:
+    """
+    Dispatches the data sources of a page concurrently. The data sources that
+    reference each other in their formulas are dispatched after the data sources
+    they depend on, so that their content is already available in the
+    `data_source_contents` cache of the dispatch context. The independent ones are
+    dispatched at the same time in a thread pool, where every thread uses its own
+    database connection.
+
+    A data source can still only reference the data sources that are before it on
+    the page, that's enforced by `DataSourceHandler.dispatch_data_source`.
+    """
+
+    def __init__(
+        self,
+        handler: "DataSourceHandler",
+        dispatch_context: BuilderDispatchContext,
+        max_workers: Optional[int] = None,
+    ):
+        self.handler = handler
+        self.dispatch_context = dispatch_context
+        self.max_workers = (
+            max_workers or settings.BUILDER_DATA_SOURCES_DISPATCH_CONCURRENCY
+        )
+
+    def get_dependencies(self, data_sources: List[DataSource]) -> Dict[int, Set[int]]:
+        """
+        Returns the data sources that must be dispatched before each data source.
+        Only the data sources that are before on the page can be dependencies. If a
+        formula of a data source references a data source that can't be known
+        beforehand, it depends on all the data sources before it.
+
+        :param data_sources: The data sources to dispatch, in the page order.
+        :return: A dict mapping the data source id to the ids of its dependencies.
+        """
+
+        dependencies = {}
+        for index, data_source in enumerate(data_sources):
+            previous_ids = {d.id for d in data_sources[:index]}
+            referenced_ids: Optional[Set[int]] = set()
+
+            # A data source without a service fails the dispatch on its own, it
+            # can't depend on anything.
+            if data_source.service_id is not None:
+                service = data_source.service.specific
+                for formula in service.get_type().formula_generator(service):
+                    if (
+                        not formula["formula"]
+                        or formula["mode"] == BASEROW_FORMULA_MODE_RAW
+                    ):
+                        continue
+                    formula_ids = get_formula_data_source_ids(formula["formula"])
+                    if formula_ids is None:
+                        referenced_ids = None
+                        break
+                    referenced_ids |= formula_ids
+
+            dependencies[data_source.id] = (
+                previous_ids
+                if referenced_ids is None
+                else referenced_ids & previous_ids
+            )
+        return dependencies
+
+    def dispatch(self, data_sources: List[DataSource]) -> Dict[int, Any]:
+        """
+        Dispatches the data sources, as soon as all their dependencies have been
+        dispatched.
+
+        :param data_sources: The data sources to dispatch, in the page order.
+        :return: The result of dispatching the data sources mapped by data source
+            id. If an exception occurred, the exception is the result.
+        """
+
+        dependencies = self.get_dependencies(data_sources)
+
+        # Make sure that the dispatch contexts cloned in the threads share the same
+        # contents cache, so that a data source is only dispatched once.
+        self.dispatch_context.cache.setdefault("data_source_contents", {})
+
+        results: Dict[int, Any] = {}
+        pending = list(data_sources)
+        running: Dict[Future, DataSource] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(data_sources))
+        ) as executor:
+            while pending or running:
+                for data_source in [
+                    d for d in pending if dependencies[d.id].issubset(results)
+                ]:
+                    pending.remove(data_source)
+                    future = executor.submit(
+                        contextvars.copy_context().run,
+                        self._dispatch_in_thread,
+                        data_source,
+                    )
+                    running[future] = data_source
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future).id] = future.result()
+
+        return {data_source.id: results[data_source.id] for data_source in data_sources}
+
+    def _dispatch_in_thread(self, data_source: DataSource) -> Any:
+        try:
+            return self.handler.dispatch_data_source(data_source, self.dispatch_context)
+        except Exception as e:
+            return e
+        finally:
+            # Every thread has its own database connections that must not be left
+            # open when the pool is done.
+            connections.close_all()
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Union
 from zipfile import ZipFile
 
+from django.conf import settings
 from django.core.files.storage import Storage
 from django.db.models import QuerySet
 from django.db.utils import DatabaseError, IntegrityError
@@ -8,11 +9,13 @@ from django.db.utils import DatabaseError, IntegrityError
 from baserow.contrib.builder.data_sources.builder_dispatch_context import (
     BuilderDispatchContext,
 )
+from baserow.contrib.builder.data_sources.dispatcher import DataSourcesDispatcher
 from baserow.contrib.builder.data_sources.exceptions import (
     DataSourceDoesNotExist,
     DataSourceNameNotUniqueError,
 )
 from baserow.contrib.builder.data_sources.models import DataSource
+from baserow.contrib.builder.data_sources.result_cache import data_source_results_cache
 from baserow.contrib.builder.formula_importer import import_formula
 from baserow.contrib.builder.pages.models import Page
 from baserow.contrib.builder.types import DataSourceDict
@@ -349,6 +352,7 @@ class DataSourceHandler:
         name: str,
         service_type: Optional[ServiceType] = None,
         before: Optional[DataSource] = None,
+        public_cache_ttl: int = 0,
         **kwargs,
     ) -> DataSource:
         """
@@ -358,6 +362,8 @@ class DataSourceHandler:
         :param name: The human name of the data_source.
         :param service_type: The type of the service related to the data_source.
         :param before: If set, the new data_source is inserted before this data_source.
+        :param public_cache_ttl: The number of seconds during which the results are
+            shared between the anonymous visitors.
         :param kwargs: Additional attributes of the related service.
         :raises CannotCalculateIntermediateOrder: If it's not possible to find an
             intermediate order. The full order of the data_source of the page must be
@@ -379,7 +385,11 @@ class DataSourceHandler:
 
         try:
             data_source = DataSource.objects.create(
-                page=page, order=order, name=name, service=service
+                page=page,
+                order=order,
+                name=name,
+                service=service,
+                public_cache_ttl=public_cache_ttl,
             )
         except IntegrityError as error:
             # The only unique values are page and name, together.
@@ -397,6 +407,7 @@ class DataSourceHandler:
         service_type: Optional[ServiceType] = None,
         name: Optional[str] = None,
         page: Optional[Page] = None,
+        public_cache_ttl: Optional[int] = None,
         **kwargs,
     ) -> DataSource:
         """
@@ -406,6 +417,8 @@ class DataSourceHandler:
         :param service_type: The service type for the data_source's service.
         :param name: A new name for the data_source.
         :param page: The data source's page.
+        :param public_cache_ttl: The number of seconds during which the results are
+            shared between the anonymous visitors.
         :param kwargs: The values that should be set on the data_source.
         :return: The updated data_source.
         """
@@ -457,6 +470,9 @@ class DataSourceHandler:
         if name is not None:
             data_source.name = name
 
+        if public_cache_ttl is not None:
+            data_source.public_cache_ttl = public_cache_ttl
+
         try:
             data_source.save()
         except DatabaseError:
@@ -491,6 +507,7 @@ class DataSourceHandler:
         """
 
         data_sources_dispatch = {}
+        dispatchable_data_sources = []
         for data_source in data_sources:
             if (
                 dispatch_context.public_allowed_properties is not None
@@ -508,14 +525,31 @@ class DataSourceHandler:
                     data_sources_dispatch[data_source.id] = {}
                 continue
 
-            try:
-                data_sources_dispatch[data_source.id] = self.dispatch_data_source(
-                    data_source, dispatch_context
+            dispatchable_data_sources.append(data_source)
+
+        if (
+            settings.BUILDER_DATA_SOURCES_DISPATCH_CONCURRENCY > 1
+            and len(dispatchable_data_sources) > 1
+        ):
+            data_sources_dispatch.update(
+                DataSourcesDispatcher(self, dispatch_context).dispatch(
+                    dispatchable_data_sources
                 )
-            except Exception as e:
-                data_sources_dispatch[data_source.id] = e
+            )
+        else:
+            for data_source in dispatchable_data_sources:
+                try:
+                    data_sources_dispatch[data_source.id] = self.dispatch_data_source(
+                        data_source, dispatch_context
+                    )
+                except Exception as e:
+                    data_sources_dispatch[data_source.id] = e
 
-        return data_sources_dispatch
+        # Keep the results in the order of the given data sources.
+        return {
+            data_source.id: data_sources_dispatch[data_source.id]
+            for data_source in data_sources
+        }
 
     def dispatch_data_source(
         self, data_source: DataSource, dispatch_context: BuilderDispatchContext
@@ -556,13 +590,18 @@ class DataSourceHandler:
         cloned_dispatch_context.add_call(data_source.id)
 
         if data_source.id not in cache.setdefault("data_source_contents", {}):
-            service_dispatch = self.service_handler.dispatch_service(
-                data_source.service.specific, cloned_dispatch_context
-            )
-
             # Cache the dispatch in the formula cache if we have formulas that need
-            # it later
-            cache["data_source_contents"][data_source.id] = service_dispatch.data
+            # it later. Published data sources can also share their results between
+            # the anonymous visitors.
+            cache["data_source_contents"][
+                data_source.id
+            ] = data_source_results_cache.get_or_dispatch(
+                data_source,
+                cloned_dispatch_context,
+                lambda: self.service_handler.dispatch_service(
+                    data_source.service.specific, cloned_dispatch_context
+                ).data,
+            )
 
         return cache["data_source_contents"][data_source.id]
 
@@ -631,6 +670,7 @@ class DataSourceHandler:
             name=data_source.name,
             order=str(data_source.order),
             service=serialized_service,
+            public_cache_ttl=data_source.public_cache_ttl,
         )
 
     def import_data_source(
@@ -687,6 +727,7 @@ class DataSourceHandler:
             service=service,
             order=serialized_data_source["order"],
             name=serialized_data_source["name"],
+            public_cache_ttl=serialized_data_source.get("public_cache_ttl", 0),
         )
 
         id_mapping["builder_data_sources"][
@@ -46,6 +46,12 @@ class DataSource(
     service = models.OneToOneField(
         Service, on_delete=models.SET_NULL, null=True, related_name="data_source"
     )
+    public_cache_ttl = models.PositiveIntegerField(
+        default=0,
+        help_text="The number of seconds during which the results of this data "
+        "source are shared between the anonymous visitors of the published "
+        "application. 0 disables the cache.",
+    )
 
     class Meta:
         ordering = ("page_id", "order", "id")
@@ -1,6 +1,12 @@
+from django.db import transaction
 from django.db.models.signals import pre_delete
 
+from baserow.contrib.builder.data_sources import signals as data_source_signals
 from baserow.contrib.builder.data_sources.models import DataSource
+from baserow.contrib.builder.data_sources.result_cache import data_source_results_cache
+from baserow.contrib.database.rows import signals as row_signals
+from baserow.contrib.database.table import signals as table_signals
+from baserow.contrib.database.views import signals as view_signals
 from baserow.core.services.handler import ServiceHandler
 from baserow.core.services.models import Service
 from baserow.core.services.registries import service_type_registry
@@ -27,3 +33,76 @@ def before_data_source_permanently_deleted(sender, instance, **kwargs):
 
 def connect_to_data_source_pre_delete_signal():
     pre_delete.connect(before_data_source_permanently_deleted, DataSource)
+
+
+def _invalidate_now_and_on_commit(callback):
+    # The signals are sent before the transaction is committed. Results dispatched
+    # in the meantime still see the previous data, so the version is bumped again
+    # once the change is visible.
+    callback()
+    transaction.on_commit(callback)
+
+
+def invalidate_results_cache_of_tables(sender, **kwargs):
+    """
+    Invalidates the shared results of the data sources using a table of which the
+    rows, the schema or a view have changed. The tables of the fields depending on
+    the changed rows are invalidated as well.
+    """
+
+    table_ids = set()
+    if kwargs.get("table_id"):
+        table_ids.add(kwargs["table_id"])
+    if kwargs.get("table") is not None:
+        table_ids.add(kwargs["table"].id)
+
+    for key in ["view", "view_filter", "view_filter_group", "view_sort"]:
+        instance = kwargs.get(key)
+        if instance is not None:
+            view = instance if key == "view" else instance.view
+            table_ids.add(view.table_id)
+
+    table_ids.update(field.table_id for field in kwargs.get("dependant_fields") or [])
+
+    if table_ids:
+        _invalidate_now_and_on_commit(
+            lambda: data_source_results_cache.invalidate_tables(table_ids)
+        )
+
+
+def invalidate_results_cache_of_data_source(sender, **kwargs):
+    data_source_id = (
+        kwargs["data_source"].id
+        if kwargs.get("data_source") is not None
+        else kwargs["data_source_id"]
+    )
+    _invalidate_now_and_on_commit(
+        lambda: data_source_results_cache.invalidate_data_source(data_source_id)
+    )
+
+
+def connect_to_data_source_results_cache_invalidation_signals():
+    for signal in [
+        row_signals.rows_created,
+        row_signals.rows_updated,
+        row_signals.rows_deleted,
+        table_signals.table_schema_changed,
+        view_signals.view_updated,
+        view_signals.view_deleted,
+        view_signals.view_filter_created,
+        view_signals.view_filter_updated,
+        view_signals.view_filter_deleted,
+        view_signals.view_filter_group_created,
+        view_signals.view_filter_group_updated,
+        view_signals.view_filter_group_deleted,
+        view_signals.view_sort_created,
+        view_signals.view_sort_updated,
+        view_signals.view_sort_deleted,
+    ]:
+        signal.connect(invalidate_results_cache_of_tables)
+
+    for signal in [
+        data_source_signals.data_source_updated,
+        data_source_signals.data_source_deleted,
+    ]:
+        signal.connect(invalidate_results_cache_of_data_source)
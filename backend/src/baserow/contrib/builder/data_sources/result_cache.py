@@ -0,0 +1,235 @@
+import hashlib
+import json
+import time
+from typing import Any, Callable, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from django_redis import get_redis_connection
+from loguru import logger
+
+from baserow.contrib.builder.data_sources.builder_dispatch_context import (
+    BuilderDispatchContext,
+)
+from baserow.contrib.builder.data_sources.models import DataSource
+from baserow.core.formula import resolve_formula
+from baserow.core.formula.registries import formula_runtime_function_registry
+
+RESULTS_CACHE_KEY_PREFIX = "ab_data_source_results"
+TABLE_VERSION_CACHE_KEY_PREFIX = "ab_data_source_results_table_version"
+DATA_SOURCE_VERSION_CACHE_KEY_PREFIX = "ab_data_source_results_version"
+VERSION_KEY_TTL = 60 * 60 * 24 * 10  # 10 days
+SENTINEL = object()
+
+
+def _get_redis_client():
+    return get_redis_connection("default")
+
+
+class DataSourceResultsCache:
+    """
+    Shares the results of the data sources of published applications between the
+    anonymous visitors, so that the same table queries are not executed for every
+    visitor. A data source must opt in by setting a `public_cache_ttl`.
+
+    A result is keyed by the data source, the table its service uses and a
+    fingerprint of everything the dispatch depends on: the resolved formulas of the
+    service, the requested range and the allowed properties. The data source and the
+    table both have a version that is bumped when they change, which makes all the
+    previous results unreachable. The most recently used results of every data
+    source are tracked in a sorted set so that the least recently used ones are
+    evicted when there are too many.
+    """
+
+    @property
+    def max_entries(self) -> int:
+        return settings.BUILDER_DATA_SOURCE_RESULTS_CACHE_MAX_ENTRIES
+
+    def _get_table_version_key(self, table_id: int) -> str:
+        return f"{TABLE_VERSION_CACHE_KEY_PREFIX}_{table_id}"
+
+    def _get_data_source_version_key(self, data_source_id: int) -> str:
+        return f"{DATA_SOURCE_VERSION_CACHE_KEY_PREFIX}_{data_source_id}"
+
+    def _get_lru_key(self, data_source_id: int) -> str:
+        return f"{RESULTS_CACHE_KEY_PREFIX}_{data_source_id}_lru"
+
+    def _bump_version(self, key: str):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, timeout=VERSION_KEY_TTL)
+
+    def invalidate_tables(self, table_ids: Iterable[int]):
+        """
+        Makes all the cached results of the data sources using one of the tables
+        unreachable.
+
+        :param table_ids: The ids of the tables of which the data has changed.
+        """
+
+        if self.max_entries <= 0:
+            return
+
+        for table_id in set(table_ids):
+            self._bump_version(self._get_table_version_key(table_id))
+
+    def invalidate_data_source(self, data_source_id: int):
+        """
+        Makes all the cached results of the data source unreachable.
+
+        :param data_source_id: The id of the data source that has changed.
+        """
+
+        self._bump_version(self._get_data_source_version_key(data_source_id))
+
+    def get_table_id(self, data_source: DataSource) -> Optional[int]:
+        """
+        Returns the id of the table used by the service of the data source if the
+        results of the data source can be cached.
+        """
+
+        from baserow.contrib.integrations.local_baserow.service_types import (
+            LocalBaserowTableServiceType,
+        )
+
+        service = data_source.service.specific
+        if not isinstance(service.get_type(), LocalBaserowTableServiceType):
+            return None
+        return getattr(service, "table_id", None)
+
+    def is_cacheable(
+        self, data_source: DataSource, dispatch_context: BuilderDispatchContext
+    ) -> bool:
+        """
+        Only the dispatches of anonymous visitors of a published application without
+        ad hoc filters, sortings or search query are cached, because those are the
+        only ones shared by many visitors.
+        """
+
+        if self.max_entries <= 0 or data_source.public_cache_ttl <= 0:
+            return False
+
+        if not dispatch_context.only_expose_public_allowed_properties:
+            return False
+
+        user_source_user = getattr(dispatch_context.request, "user_source_user", None)
+        if user_source_user is None or user_source_user.is_authenticated:
+            return False
+
+        if (
+            dispatch_context.search_query()
+            or dispatch_context.filters()
+            or dispatch_context.sortings()
+        ):
+            return False
+
+        return True
+
+    def get_fingerprint(
+        self, data_source: DataSource, dispatch_context: BuilderDispatchContext
+    ) -> str:
+        """
+        Returns a hash of all the inputs of the dispatch.
+        """
+
+        service = data_source.service.specific
+        resolved_formulas = [
+            resolve_formula(
+                formula, formula_runtime_function_registry, dispatch_context.clone()
+            )
+            for formula in service.get_type().formula_generator(service)
+        ]
+
+        public_allowed_properties = dispatch_context.public_allowed_properties or {}
+        inputs = {
+            "formulas": resolved_formulas,
+            "range": dispatch_context.range(service),
+            "only_record_id": dispatch_context.only_record_id,
+            "element_id": getattr(dispatch_context.element, "id", None),
+            "timezone": dispatch_context.get_timezone_name(),
+            "properties": {
+                key: sorted(properties.get(service.id, []))
+                for key, properties in public_allowed_properties.items()
+            },
+        }
+
+        return hashlib.sha256(
+            json.dumps(inputs, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def get_or_dispatch(
+        self,
+        data_source: DataSource,
+        dispatch_context: BuilderDispatchContext,
+        dispatch: Callable[[], Any],
+    ) -> Any:
+        """
+        Returns the cached result of the data source for the dispatch context, or
+        dispatches it and caches the result if it's cacheable.
+
+        :param data_source: The data source to dispatch.
+        :param dispatch_context: The context used for the dispatch.
+        :param dispatch: A callable returning the result of the dispatch.
+        :return: The result of the dispatch.
+        """
+
+        if not self.is_cacheable(data_source, dispatch_context):
+            return dispatch()
+
+        table_id = self.get_table_id(data_source)
+        if table_id is None:
+            return dispatch()
+
+        try:
+            fingerprint = self.get_fingerprint(data_source, dispatch_context)
+        except Exception:
+            # If a formula can't be resolved, the dispatch will fail with a proper
+            # error.
+            return dispatch()
+
+        table_version_key = self._get_table_version_key(table_id)
+        data_source_version_key = self._get_data_source_version_key(data_source.id)
+        versions = cache.get_many([table_version_key, data_source_version_key])
+        key = (
+            f"{RESULTS_CACHE_KEY_PREFIX}_{data_source.id}_"
+            f"{versions.get(data_source_version_key, 0)}_{table_id}_"
+            f"{versions.get(table_version_key, 0)}_{fingerprint}"
+        )
+
+        result = cache.get(key, SENTINEL)
+        if result is not SENTINEL:
+            self._touch(data_source.id, key)
+            return result
+
+        result = dispatch()
+        cache.set(key, result, timeout=data_source.public_cache_ttl)
+        self._touch(data_source.id, key, evict=True)
+        return result
+
+    def _touch(self, data_source_id: int, key: str, evict: bool = False):
+        """
+        Marks the result as the most recently used one of the data source and
+        evicts the least recently used results if there are too many.
+        """
+
+        lru_key = self._get_lru_key(data_source_id)
+        try:
+            redis = _get_redis_client()
+            pipeline = redis.pipeline()
+            pipeline.zadd(lru_key, {key: time.time()})
+            pipeline.expire(lru_key, VERSION_KEY_TTL)
+            if evict:
+                pipeline.zrange(lru_key, 0, -self.max_entries - 1)
+                pipeline.zremrangebyrank(lru_key, 0, -self.max_entries - 1)
+            results = pipeline.execute()
+        except Exception:
+            logger.exception("Failed to track the data source results cache usage.")
+            return
+
+        if evict and results[2]:
+            cache.delete_many([k.decode() for k in results[2]])
+
+
+data_source_results_cache = DataSourceResultsCache()
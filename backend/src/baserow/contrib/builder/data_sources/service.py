@@ -121,6 +121,7 @@ class DataSourceService:
         service_type: ServiceType,
         name: Optional[str] = None,
         before: Optional[DataSource] = None,
+        public_cache_ttl: int = 0,
         **kwargs,
     ) -> DataSource:
         """
@@ -130,6 +131,8 @@ class DataSourceService:
         :param page: The page the data_source exists in.
         :param service_type: The type of the related service.
         :param before: If set, the new data_source is inserted before this data_source.
+        :param public_cache_ttl: The number of seconds during which the results are
+            shared between the anonymous visitors.
         :param kwargs: Additional attributes of the data_source and the service.
         :return: The created data_source.
         """
@@ -163,6 +166,7 @@ class DataSourceService:
                 service_type=service_type,
                 before=before,
                 name=name,
+                public_cache_ttl=public_cache_ttl,
                 **prepared_values,
             )
         except CannotCalculateIntermediateOrder:
@@ -178,6 +182,7 @@ class DataSourceService:
                 service_type=service_type,
                 before=before,
                 name=name,
+                public_cache_ttl=public_cache_ttl,
                 **prepared_values,
             )
 
@@ -236,6 +241,8 @@ class DataSourceService:
             # the new one, instead of the old one.
             service_type_for_preparation = new_service_type
 
+        public_cache_ttl = kwargs.pop("public_cache_ttl", None)
+
         if service_type_for_preparation:
             service = data_source.service.specific if data_source.service_id else None
             prepared_values = service_type_for_preparation.prepare_values(
@@ -247,6 +254,9 @@ class DataSourceService:
         if page is not None:
             prepared_values["page"] = page
 
+        if public_cache_ttl is not None:
+            prepared_values["public_cache_ttl"] = public_cache_ttl
+
         data_source = self.handler.update_data_source(
             data_source, service_type, **prepared_values
         )
@@ -0,0 +1,22 @@
+# Generated by Django 5.0.14 on 2026-10-17 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("builder", "0067_slackwritemessageworkflowaction"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="datasource",
+            name="public_cache_ttl",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="The number of seconds during which the results of this data "
+                "source are shared between the anonymous visitors of the published "
+                "application. 0 disables the cache.",
+            ),
+        ),
+    ]
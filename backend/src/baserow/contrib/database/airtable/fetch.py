@@ -0,0 +1,132 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.cookiejar import DefaultCookiePolicy
+from threading import Lock
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+from django.conf import settings
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
+_session = None
+_session_lock = Lock()
+
+
+def create_airtable_session() -> requests.Session:
+    """
+    Creates a `requests` session that keeps the connections to Airtable alive, so
+    that they can be reused by all the requests of an import, and that retries the
+    requests failing because of a connection error, rate limit or server error with
+    an exponential backoff.
+
+    The session never stores the cookies of the responses because it's shared by all
+    the imports of the process. The cookies of an import must always be provided
+    with every request.
+
+    :return: The configured session.
+    """
+
+    retry = Retry(
+        total=settings.BASEROW_AIRTABLE_IMPORT_MAX_RETRIES,
+        backoff_factor=settings.BASEROW_AIRTABLE_IMPORT_RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(["GET"]),
+        respect_retry_after_header=True,
+        # Return the last response if the retries are exhausted, so that the
+        # status code can be handled by the caller.
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=settings.BASEROW_AIRTABLE_IMPORT_CONCURRENCY,
+        pool_maxsize=settings.BASEROW_AIRTABLE_IMPORT_CONCURRENCY,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+def get_airtable_session() -> requests.Session:
+    """
+    Returns the session of the process that must be used for all the requests to
+    Airtable. It's created the first time it's needed.
+    """
+
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_airtable_session()
+    return _session
+
+
+def reset_airtable_session():
+    """
+    Closes the connections of the session of the process, so that a new session is
+    created with the current settings on the next request.
+    """
+
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+def fetch_concurrently(
+    fetch: Callable[[T], R],
+    items: Sequence[T],
+    on_completed: Optional[Callable[[], None]] = None,
+) -> List[R]:
+    """
+    Calls the `fetch` function for every item using at most
+    `BASEROW_AIRTABLE_IMPORT_CONCURRENCY` threads at the same time. The `fetch`
+    function must not use the database because every thread has its own connection.
+
+    :param fetch: The function that's called with every item.
+    :param items: The items that must be fetched.
+    :param on_completed: Optionally a function that's called in the calling thread
+        every time an item has been fetched. Can for example be used to increment the
+        progress.
+    :raises Exception: The first exception raised by the `fetch` function. The
+        items that have not been fetched yet are cancelled.
+    :return: The results of the `fetch` function in the same order as the items.
+    """
+
+    max_workers = min(settings.BASEROW_AIRTABLE_IMPORT_CONCURRENCY, len(items))
+
+    if max_workers <= 1:
+        results = []
+        for item in items:
+            results.append(fetch(item))
+            if on_completed:
+                on_completed()
+        return results
+
+    results = [None] * len(items)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(fetch, item): index for index, item in enumerate(items)
+        }
+        try:
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+                if on_completed:
+                    on_completed()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    return results
@@ -11,7 +11,6 @@ from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.core.files.storage import Storage
 
-import requests
 from requests import Response
 
 from baserow.contrib.database.airtable.constants import (
@@ -52,6 +51,7 @@ from .exceptions import (
     AirtableSkipCellValue,
     FileDownloadFailed,
 )
+from .fetch import fetch_concurrently, get_airtable_session
 from .import_report import (
     ERROR_TYPE_OTHER,
     ERROR_TYPE_UNSUPPORTED_FEATURE,
@@ -109,7 +109,9 @@ def download_airtable_file(
     """
 
     if download_file.type == AIRTABLE_DOWNLOAD_FILE_TYPE_FETCH:
-        response = requests.get(download_file.url, headers=headers)  # nosec B113
+        response = get_airtable_session().get(
+            download_file.url, headers=headers
+        )  # nosec B113
     elif download_file.type == AIRTABLE_DOWNLOAD_FILE_TYPE_ATTACHMENT_ENDPOINT:
         response = AirtableHandler.fetch_attachment(
             row_id=download_file.row_id,
@@ -197,7 +199,7 @@ class AirtableHandler:
         """
 
         url = f"{AIRTABLE_BASE_URL}/{share_id}"
-        response = requests.get(
+        response = get_airtable_session().get(
             url,
             headers=BASE_HEADERS,
             cookies=config.get_session_cookies(),
@@ -243,7 +245,8 @@ class AirtableHandler:
         :param request_id: The request_id returned by the initially requested shared
             base.
         :param headers: The headers to be passed into the `requests` request.
-        :param kwargs: THe kwargs that must be passed into the `requests.get` method.
+        :param kwargs: THe kwargs that must be passed into the `requests.get` method
+            of the shared Airtable session.
         :return: The requests Response object related to the request.
         """
 
@@ -259,7 +262,7 @@ class AirtableHandler:
         params["accessPolicy"] = json.dumps(access_policy)
         params["request_id"] = request_id
 
-        return requests.get(
+        return get_airtable_session().get(
             headers={
                 "x-airtable-application-id": application_id,
                 "x-airtable-client-queue-time": "45",
@@ -642,16 +645,33 @@ class AirtableHandler:
             headers=BASE_HEADERS,
         )
 
-        failed_files = []
-        for file_name, download_file in files_to_download.items():
-            headers = BASE_HEADERS.copy()
-            headers["Range"] = "bytes=0-5"
+        headers = BASE_HEADERS.copy()
+        headers["Range"] = "bytes=0-5"
 
+        def check_file(file_name: str) -> bool:
             try:
-                download_airtable_file(
-                    file_name, download_file, init_data, request_id, cookies, headers
+                response = download_airtable_file(
+                    file_name,
+                    files_to_download[file_name],
+                    init_data,
+                    request_id,
+                    cookies,
+                    headers,
                 )
             except FileDownloadFailed:
+                return False
+            response.close()
+            return True
+
+        # The files are checked concurrently because a large base can contain
+        # thousands of files, and every check is a separate request.
+        file_names = list(files_to_download.keys())
+        files_available = fetch_concurrently(check_file, file_names)
+
+        failed_files = []
+        for file_name, file_available in zip(file_names, files_available):
+            if not file_available:
+                download_file = files_to_download[file_name]
                 field_name = ""
                 table_name = ""
                 baserow_row_id = download_file.row_id
@@ -1107,19 +1127,17 @@ class AirtableHandler:
         )
         progress.increment(state=AIRTABLE_EXPORT_JOB_DOWNLOADING_BASE)
 
-        # Loop over all the tables and make a request for each table to obtain the raw
-        # Airtable table data.
-        tables = []
+        # Make a request for each table to obtain the raw Airtable table data. The
+        # requests are made concurrently, and the progress is incremented every time
+        # one of them completes.
         raw_tables = list(
             init_data["singleApplicationScaffoldingData"]["tableById"].keys()
         )
-        for index, table_id in enumerate(
-            progress.track(
-                represents_progress=49,
-                state=AIRTABLE_EXPORT_JOB_DOWNLOADING_BASE,
-                iterable=raw_tables,
-            )
-        ):
+        tables_progress = progress.create_child(
+            represents_progress=49, total=len(raw_tables)
+        )
+
+        def fetch_table(table_id: str) -> dict:
             response = cls.fetch_table_data(
                 table_id=table_id,
                 init_data=init_data,
@@ -1128,14 +1146,18 @@ class AirtableHandler:
                 # At least one request must also fetch the application structure that
                 # contains the schema of all the tables, so we do this for the first
                 # table.
-                fetch_application_structure=index == 0,
+                fetch_application_structure=table_id == raw_tables[0],
                 stream=False,
             )
-            json_decoded_content = parse_json_and_remove_invalid_surrogate_characters(
-                response
-            )
+            return parse_json_and_remove_invalid_surrogate_characters(response)
 
-            tables.append(json_decoded_content)
+        tables = fetch_concurrently(
+            fetch_table,
+            raw_tables,
+            on_completed=lambda: tables_progress.increment(
+                state=AIRTABLE_EXPORT_JOB_DOWNLOADING_BASE
+            ),
+        )
 
         # Split database schema from the tables because we need this to be separated
         # later on.
@@ -1155,24 +1177,33 @@ class AirtableHandler:
 
                 view_data_to_fetch.append((table["id"], view["id"]))
 
-        # Fetch the missing view data, and add them to the table object so that we have
-        # a complete object.
-        for table_id, view_id in progress.track(
-            represents_progress=50,
-            state=AIRTABLE_EXPORT_JOB_DOWNLOADING_BASE,
-            iterable=view_data_to_fetch,
-        ):
+        views_progress = progress.create_child(
+            represents_progress=50, total=len(view_data_to_fetch)
+        )
+
+        def fetch_view(table_and_view_id: Tuple[str, str]) -> dict:
             response = cls.fetch_view_data(
-                view_id=view_id,
+                view_id=table_and_view_id[1],
                 init_data=init_data,
                 request_id=request_id,
                 cookies=cookies,
                 stream=False,
             )
-            json_decoded_content = parse_json_and_remove_invalid_surrogate_characters(
-                response
-            )
-            tables[table_id]["viewDatas"].append(json_decoded_content["data"])
+            return parse_json_and_remove_invalid_surrogate_characters(response)
+
+        view_datas = fetch_concurrently(
+            fetch_view,
+            view_data_to_fetch,
+            on_completed=lambda: views_progress.increment(
+                state=AIRTABLE_EXPORT_JOB_DOWNLOADING_BASE
+            ),
+        )
+
+        # Add the missing view data to the table object so that we have a complete
+        # object. This is done in the original order so that the result doesn't
+        # depend on which request completed first.
+        for (table_id, view_id), view_data in zip(view_data_to_fetch, view_datas):
+            tables[table_id]["viewDatas"].append(view_data["data"])
 
         return init_data, request_id, cookies, schema, tables
 
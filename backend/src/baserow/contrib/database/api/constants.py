@@ -6,6 +6,7 @@ from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter
 
 from baserow.contrib.database.search.handler import SearchMode
+from baserow.contrib.database.views.constants import ALL_ROW_COUNT_STRATEGIES
 from baserow.contrib.database.views.registries import view_filter_type_registry
 
 PUBLIC_PLACEHOLDER_ENTITY_ID = 0
@@ -48,6 +49,43 @@ EXCLUDE_COUNT_API_PARAM = OpenApiParameter(
         "number of results is slow."
     ),
 )
+CURSOR_API_PARAM = OpenApiParameter(
+    name="cursor",
+    location=OpenApiParameter.QUERY,
+    type=OpenApiTypes.STR,
+    description=(
+        "If provided, the rows are paginated by a cursor instead of a page or offset. "
+        "Provide an empty value to get the first page, and the `next_cursor` of the "
+        "response to get the next page. Every page can be fetched equally fast, "
+        "which makes this the preferred method for large datasets. The response "
+        "doesn't contain a count, the `size` parameter defines how many rows should "
+        "be returned."
+    ),
+)
+APPROXIMATE_COUNT_API_PARAM = OpenApiParameter(
+    name="approximate_count",
+    location=OpenApiParameter.QUERY,
+    type=OpenApiTypes.BOOL,
+    description=(
+        "Can only be used in combination with the `cursor` parameter. If provided, "
+        "the response contains an `approximate_count` with an estimation of the "
+        "total number of rows that's much faster to compute than an exact count."
+    ),
+)
+COUNT_STRATEGY_API_PARAM = OpenApiParameter(
+    name="count_strategy",
+    location=OpenApiParameter.QUERY,
+    type=OpenApiTypes.STR,
+    enum=ALL_ROW_COUNT_STRATEGIES,
+    description=(
+        "Defines how the `count` is computed. The default `exact` counts the rows "
+        "on every request, which can be slow for large tables. `estimated` returns "
+        "an estimation of the row count, except when the count is small. `cached` "
+        "returns an exact count that's reused until the data of the table changes. "
+        "If not `exact`, the response contains `count_is_estimated`, and the "
+        "`previous` and `next` properties are excluded."
+    ),
+)
 INCLUDE_OPERATION_METADATA = OpenApiParameter(
     name="include_metadata",
     location=OpenApiParameter.QUERY,
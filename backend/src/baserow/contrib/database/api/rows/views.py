@@ -25,7 +25,7 @@ from baserow.api.exceptions import (
     QueryParameterValidationException,
     RequestBodyValidationException,
 )
-from baserow.api.pagination import PageNumberPagination
+from baserow.api.pagination import CursorPagination, PageNumberPagination
 from baserow.api.schemas import (
     CLIENT_SESSION_ID_SCHEMA_PARAMETER,
     CLIENT_UNDO_REDO_ACTION_GROUP_ID_SCHEMA_PARAMETER,
@@ -37,6 +37,8 @@ from baserow.api.utils import validate_data
 from baserow.config.settings.utils import str_to_bool
 from baserow.contrib.database.api.constants import (
     ADHOC_FILTERS_API_PARAMS,
+    APPROXIMATE_COUNT_API_PARAM,
+    CURSOR_API_PARAM,
     INCLUDE_OPERATION_METADATA,
     SEARCH_MODE_API_PARAM,
 )
@@ -313,13 +315,16 @@ class RowsView(APIView):
                 description="Includes all the filters and sorts of the provided view.",
             ),
             SEARCH_MODE_API_PARAM,
+            CURSOR_API_PARAM,
+            APPROXIMATE_COUNT_API_PARAM,
         ],
         tags=["Database table rows"],
         operation_id="list_database_table_rows",
         description=(
             "Lists all the rows of the table related to the provided parameter if the "
             "user has access to the related database's workspace. The response is "
-            "paginated by a page/size style. It is also possible to provide an "
+            "paginated by a page/size style, or by a cursor if the `cursor` parameter "
+            "is provided. It is also possible to provide an "
             "optional search query, only rows where the data matches the search query "
             "are going to be returned then. The properties of the returned rows "
             "depends on which fields the table has. For a complete overview of fields "
@@ -337,6 +342,7 @@ class RowsView(APIView):
                     "ERROR_USER_NOT_IN_GROUP",
                     "ERROR_REQUEST_BODY_VALIDATION",
                     "ERROR_PAGE_SIZE_LIMIT",
+                    "ERROR_INVALID_CURSOR",
                     "ERROR_ORDER_BY_FIELD_NOT_FOUND",
                     "ERROR_ORDER_BY_FIELD_NOT_POSSIBLE",
                     "ERROR_FILTER_FIELD_NOT_FOUND",
@@ -456,7 +462,12 @@ class RowsView(APIView):
         if order_by:
             queryset = queryset.order_by_fields_string(order_by, user_field_names)
 
-        paginator = PageNumberPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+        if CURSOR_API_PARAM.name in request.GET:
+            paginator = CursorPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+        else:
+            paginator = PageNumberPagination(
+                limit_page_size=settings.ROW_PAGE_SIZE_LIMIT
+            )
         page = paginator.paginate_queryset(queryset, request, self)
         serializer_class = get_row_serializer_class(
             model,
@@ -2,6 +2,11 @@ from django.utils.functional import lazy
 
 from rest_framework import serializers
 
+from baserow.api.search.serializers import SearchQueryParamSerializer
+from baserow.contrib.database.views.constants import (
+    ALL_ROW_COUNT_STRATEGIES,
+    RowCountStrategy,
+)
 from baserow.contrib.database.views.models import GridViewFieldOptions
 from baserow.contrib.database.views.registries import view_aggregation_type_registry
 
@@ -53,3 +58,11 @@ class GridViewFilterSerializer(serializers.Serializer):
         child=serializers.IntegerField(),
         help_text="Only rows related to the provided ids are added to the response.",
     )
+
+
+class ListGridViewRowsQueryParamsSerializer(SearchQueryParamSerializer):
+    count_strategy = serializers.ChoiceField(
+        required=False,
+        default=RowCountStrategy.EXACT.value,
+        choices=ALL_ROW_COUNT_STRATEGIES,
+    )
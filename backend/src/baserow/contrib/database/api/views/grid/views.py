@@ -23,6 +23,9 @@ from baserow.contrib.database.api.constants import (
     ADHOC_FILTERS_API_PARAMS_WITH_AGGREGATION,
     ADHOC_FILTERS_API_PARAMS_WITH_AGGREGATION_NO_COMBINE,
     ADHOC_SORTING_API_PARAM,
+    APPROXIMATE_COUNT_API_PARAM,
+    COUNT_STRATEGY_API_PARAM,
+    CURSOR_API_PARAM,
     EXCLUDE_COUNT_API_PARAM,
     EXCLUDE_FIELDS_API_PARAM,
     INCLUDE_FIELDS_API_PARAM,
@@ -75,6 +78,7 @@ from baserow.contrib.database.fields.exceptions import (
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.utils import get_field_id_from_field_key
 from baserow.contrib.database.table.operations import ListRowsDatabaseTableOperationType
+from baserow.contrib.database.views.constants import RowCountStrategy
 from baserow.contrib.database.views.exceptions import (
     AggregationTypeDoesNotExist,
     NoAuthorizationToPubliclySharedView,
@@ -99,7 +103,7 @@ from .schemas import (
     field_aggregation_response_schema,
     field_aggregations_response_schema,
 )
-from .serializers import GridViewFilterSerializer
+from .serializers import GridViewFilterSerializer, ListGridViewRowsQueryParamsSerializer
 
 
 def get_available_aggregation_type():
@@ -139,7 +143,10 @@ class GridViewView(APIView):
             ),
             ONLY_COUNT_API_PARAM,
             EXCLUDE_COUNT_API_PARAM,
+            COUNT_STRATEGY_API_PARAM,
             *PAGINATION_API_PARAMS,
+            CURSOR_API_PARAM,
+            APPROXIMATE_COUNT_API_PARAM,
             *ADHOC_FILTERS_API_PARAMS_NO_COMBINE,
             ADHOC_SORTING_API_PARAM,
             INCLUDE_FIELDS_API_PARAM,
@@ -153,9 +160,9 @@ class GridViewView(APIView):
         description=(
             "Lists the requested rows of the view's table related to the provided "
             "`view_id` if the authorized user has access to the database's workspace. "
-            "The response is paginated either by a limit/offset or page/size style. "
-            "The style depends on the provided GET parameters. The properties of the "
-            "returned rows depends on which fields the table has. For a complete "
+            "The response is paginated either by a limit/offset, page/size or cursor "
+            "style. The style depends on the provided GET parameters. The properties "
+            "of the returned rows depends on which fields the table has. For a complete "
             "overview of fields use the **list_database_table_fields** endpoint to "
             "list them all. In the example all field types are listed, but normally "
             "the number in field_{id} key is going to be the id of the field. "
@@ -183,6 +190,7 @@ class GridViewView(APIView):
             400: get_error_schema(
                 [
                     "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_INVALID_CURSOR",
                     "ERROR_ORDER_BY_FIELD_NOT_FOUND",
                     "ERROR_ORDER_BY_FIELD_NOT_POSSIBLE",
                     "ERROR_FILTER_FIELD_NOT_FOUND",
@@ -209,7 +217,9 @@ class GridViewView(APIView):
         }
     )
     @allowed_includes("field_options", "row_metadata")
-    @validate_query_parameters(SearchQueryParamSerializer, return_validated=True)
+    @validate_query_parameters(
+        ListGridViewRowsQueryParamsSerializer, return_validated=True
+    )
     def get(self, request, view_id, field_options, row_metadata, query_params):
         """
         Lists all the rows of a grid view, paginated either by a page or offset/limit.
@@ -251,14 +261,40 @@ class GridViewView(APIView):
             request.user, view, adhoc_filters, order_by, query_params
         )
         model = queryset.model
+        count_strategy = RowCountStrategy(query_params["count_strategy"])
+
+        def serialize_row_count():
+            row_count = view_handler.get_view_row_count(
+                view,
+                queryset,
+                count_strategy,
+                is_filtered=adhoc_filters.has_any_filters
+                or bool(query_params.get("search")),
+            )
+            if count_strategy == RowCountStrategy.EXACT:
+                return {"count": row_count.count}
+            return {
+                "count": row_count.count,
+                "count_is_estimated": row_count.is_estimated,
+            }
 
         if ONLY_COUNT_API_PARAM.name in request.GET:
-            return Response({"count": queryset.count()})
+            return Response(serialize_row_count())
 
         response, page, _ = paginate_and_serialize_queryset(
-            queryset, request, field_ids
+            queryset,
+            request,
+            field_ids,
+            with_count=count_strategy == RowCountStrategy.EXACT,
         )
 
+        if (
+            count_strategy != RowCountStrategy.EXACT
+            and EXCLUDE_COUNT_API_PARAM.name not in request.GET
+            and CURSOR_API_PARAM.name not in request.GET
+        ):
+            response.data.update(**serialize_row_count())
+
         if view_type.can_group_by and view.viewgroupby_set.all():
             group_by_fields = [
                 model._field_objects[group_by.field_id]["field"]
@@ -710,6 +746,8 @@ class PublicGridViewRowsView(APIView):
             ONLY_COUNT_API_PARAM,
             EXCLUDE_COUNT_API_PARAM,
             *PAGINATION_API_PARAMS,
+            CURSOR_API_PARAM,
+            APPROXIMATE_COUNT_API_PARAM,
             ADHOC_SORTING_API_PARAM,
             INCLUDE_FIELDS_API_PARAM,
             EXCLUDE_FIELDS_API_PARAM,
@@ -732,9 +770,9 @@ class PublicGridViewRowsView(APIView):
         description=(
             "Lists the requested rows of the view's table related to the provided "
             "`slug` if the grid view is public."
-            "The response is paginated either by a limit/offset or page/size style. "
-            "The style depends on the provided GET parameters. The properties of the "
-            "returned rows depends on which fields the table has. For a complete "
+            "The response is paginated either by a limit/offset, page/size or cursor "
+            "style. The style depends on the provided GET parameters. The properties "
+            "of the returned rows depends on which fields the table has. For a complete "
             "overview of fields use the **list_database_table_fields** endpoint to "
             "list them all. In the example all field types are listed, but normally "
             "the number in field_{id} key is going to be the id of the field. "
@@ -757,6 +795,7 @@ class PublicGridViewRowsView(APIView):
             400: get_error_schema(
                 [
                     "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_INVALID_CURSOR",
                     "ERROR_ORDER_BY_FIELD_NOT_FOUND",
                     "ERROR_ORDER_BY_FIELD_NOT_POSSIBLE",
                     "ERROR_FILTER_FIELD_NOT_FOUND",
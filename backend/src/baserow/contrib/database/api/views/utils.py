@@ -9,6 +9,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from baserow.api.pagination import (
+    CursorPagination,
     LimitOffsetPagination,
     LimitOffsetPaginationWithoutCount,
     Pageable,
@@ -16,6 +17,7 @@ from baserow.api.pagination import (
     PageNumberPaginationWithoutCount,
 )
 from baserow.contrib.database.api.constants import (
+    CURSOR_API_PARAM,
     EXCLUDE_COUNT_API_PARAM,
     LIMIT_LINKED_ITEMS_API_PARAM,
 )
@@ -158,15 +160,19 @@ class PaginatedData(NamedTuple):
     paginator: Pageable
 
 
-def _get_paginator(request: Request) -> Pageable:
+def _get_paginator(request: Request, with_count: bool = True) -> Pageable:
     """
     Returns the paginator to use based on the request query parameters.
 
     :param request: The request containing the pagination query parameters.
+    :param with_count: Whether the paginator is allowed to count the results. If
+        False, a paginator without count is used regardless of the query parameters.
     :return: The paginator to use.
     """
 
-    if EXCLUDE_COUNT_API_PARAM.name in request.GET:
+    if CURSOR_API_PARAM.name in request.GET:
+        paginator = CursorPagination()
+    elif not with_count or EXCLUDE_COUNT_API_PARAM.name in request.GET:
         if LimitOffsetPagination.limit_query_param in request.GET:
             paginator = LimitOffsetPaginationWithoutCount()
         else:
@@ -204,6 +210,7 @@ def paginate_and_serialize_queryset(
     queryset: QuerySet[GeneratedTableModel],
     request: Request,
     field_ids: Optional[Iterable[int]],
+    with_count: bool = True,
 ) -> PaginatedData:
     """
     Paginate and serialize the data for the provided queryset and view.
@@ -211,11 +218,13 @@ def paginate_and_serialize_queryset(
     :param queryset: The queryset to paginate and serialize.
     :param request: The request containing the pagination query parameters.
     :param field_ids: The (optional) field IDs to restrict the serialized data to.
+    :param with_count: Whether the response may contain the exact count of the
+        queryset. If False, the count, previous and next properties are excluded.
     :return: The paginated data containing the paginator, the page of results, and
         response containing the serialized data.
     """
 
-    paginator = _get_paginator(request)
+    paginator = _get_paginator(request, with_count=with_count)
     page = paginator.paginate_queryset(queryset, request)
 
     limit_linked_items = parse_limit_linked_items_params(request)
@@ -0,0 +1,156 @@
+import heapq
+import pickle
+import tempfile
+from datetime import date, datetime, time
+from decimal import Decimal
+from itertools import groupby
+from operator import itemgetter
+from typing import IO, Any, Callable, Iterable, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+SortKey = Tuple
+SortedItem = Tuple[SortKey, Any]
+
+# The values of the unique primary properties that are orderable among themselves.
+# Every other value is compared by its representation.
+ORDERABLE_TYPES = (str, date, datetime, time, UUID)
+
+
+def get_sortable_value(value: Any) -> Tuple:
+    """
+    Converts a unique primary value into a tuple that can be ordered against the
+    converted value of any other type. Two values that are equal in Python are
+    converted to equal tuples, so that the Baserow and data sync rows that have the
+    same unique primary end up next to each other when both are sorted.
+
+    :param value: The unique primary value.
+    :return: A tuple that can be compared with any other converted value.
+    """
+
+    if value is None:
+        return (0,)
+    if isinstance(value, (bool, int, float, Decimal)):
+        return (1, value)
+    if isinstance(value, ORDERABLE_TYPES):
+        return (2, type(value).__name__, value)
+    return (3, type(value).__name__, repr(value))
+
+
+def get_sort_key(values: Iterable[Any]) -> SortKey:
+    """
+    Returns the sort key of the unique primary values of a row.
+
+    :param values: The values of the unique primary properties in order.
+    :return: The sort key that can be compared with other sort keys.
+    """
+
+    return tuple(get_sortable_value(value) for value in values)
+
+
+class ExternalSorter:
+    """
+    Sorts an arbitrary number of items by key while only keeping `buffer_size`
+    items in memory. When the buffer is full, it's sorted and written to a
+    temporary file. Iterating over the sorter merges all the sorted files. The sort
+    is stable, items with the same key are returned in the order they were added.
+    """
+
+    def __init__(self, buffer_size: int):
+        self.buffer_size = max(buffer_size, 1)
+        self.count = 0
+        self._buffer: List[SortedItem] = []
+        self._runs: List[IO[bytes]] = []
+
+    def add(self, sort_key: SortKey, item: Any):
+        self._buffer.append((sort_key, item))
+        self.count += 1
+        if len(self._buffer) >= self.buffer_size:
+            self._spill()
+
+    def _spill(self):
+        self._buffer.sort(key=itemgetter(0))
+        run = tempfile.TemporaryFile()
+        for sorted_item in self._buffer:
+            pickle.dump(sorted_item, run, protocol=pickle.HIGHEST_PROTOCOL)
+        run.seek(0)
+        self._runs.append(run)
+        self._buffer = []
+
+    def _read_run(self, run: IO[bytes]) -> Iterator[SortedItem]:
+        while True:
+            try:
+                yield pickle.load(run)
+            except EOFError:
+                return
+
+    def __iter__(self) -> Iterator[SortedItem]:
+        self._buffer.sort(key=itemgetter(0))
+        if not self._runs:
+            return iter(self._buffer)
+
+        return heapq.merge(
+            *[self._read_run(run) for run in self._runs],
+            iter(self._buffer),
+            key=itemgetter(0),
+        )
+
+    def close(self):
+        for run in self._runs:
+            run.close()
+        self._runs = []
+        self._buffer = []
+
+    def __enter__(self) -> "ExternalSorter":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _iter_groups(
+    sorted_items: Iterable[SortedItem],
+) -> Iterator[Tuple[SortKey, List[Any]]]:
+    for sort_key, group in groupby(sorted_items, key=itemgetter(0)):
+        yield sort_key, [item for _, item in group]
+
+
+def merge_join(
+    left: Iterable[SortedItem],
+    right: Iterable[SortedItem],
+    on_group: Optional[Callable[[int], None]] = None,
+) -> Iterator[Tuple[Optional[List[Any]], Optional[List[Any]]]]:
+    """
+    Joins two iterables of `(sort_key, item)` tuples that are both sorted by key.
+    For every key that exists on either side, a tuple containing the items of the
+    left and the right with that key is yielded. If there are no items on one side,
+    None is yielded for that side.
+
+    :param left: The sorted items of the left side.
+    :param right: The sorted items of the right side.
+    :param on_group: Optionally called with the number of items of every yielded
+        key.
+    :return: An iterator of `(left_items, right_items)` tuples in key order.
+    """
+
+    left_groups = _iter_groups(left)
+    right_groups = _iter_groups(right)
+    left_group = next(left_groups, None)
+    right_group = next(right_groups, None)
+
+    while left_group is not None or right_group is not None:
+        if right_group is None or (
+            left_group is not None and left_group[0] < right_group[0]
+        ):
+            result = (left_group[1], None)
+            left_group = next(left_groups, None)
+        elif left_group is None or right_group[0] < left_group[0]:
+            result = (None, right_group[1])
+            right_group = next(right_groups, None)
+        else:
+            result = (left_group[1], right_group[1])
+            left_group = next(left_groups, None)
+            right_group = next(right_groups, None)
+
+        if on_group is not None:
+            on_group(sum(len(items) for items in result if items))
+        yield result
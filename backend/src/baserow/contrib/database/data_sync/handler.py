@@ -1,9 +1,11 @@
 from copy import deepcopy
-from typing import List, Optional
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.cache import cache
-from django.db.models import Prefetch, QuerySet
+from django.db.models import Prefetch, Q, QuerySet
 from django.utils import timezone, translation
 from django.utils.translation import gettext as _
 
@@ -15,7 +17,6 @@ from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.models import Database
 from baserow.contrib.database.operations import CreateTableDatabaseTableOperationType
 from baserow.contrib.database.rows.handler import RowHandler
-from baserow.contrib.database.rows.types import CreatedRowsData
 from baserow.contrib.database.search.handler import SearchHandler
 from baserow.contrib.database.table.models import Table
 from baserow.contrib.database.table.operations import UpdateDatabaseTableOperationType
@@ -27,10 +28,12 @@ from baserow.core.handler import CoreHandler
 from baserow.core.utils import (
     ChildProgressBuilder,
     extract_allowed,
+    grouper,
     remove_duplicates,
     set_allowed_attrs,
 )
 
+from .diff import ExternalSorter, get_sort_key, merge_join
 from .exceptions import (
     DataSyncDoesNotExist,
     PropertyNotFound,
@@ -41,7 +44,155 @@ from .exceptions import (
 )
 from .models import DataSync, DataSyncSyncedProperty
 from .operations import SyncTableOperationType
-from .registries import data_sync_type_registry, two_way_sync_strategy_type_registry
+from .registries import (
+    DataSyncProperty,
+    data_sync_type_registry,
+    two_way_sync_strategy_type_registry,
+)
+
+
+class DataSyncRowsWriter:
+    """
+    Collects the rows that must be created, updated and deleted by a data sync and
+    writes them in batches, so that the number of pending changes never exceeds
+    the batch size. The search data of every written batch is updated
+    asynchronously.
+    """
+
+    def __init__(
+        self,
+        user: AbstractUser,
+        table: Table,
+        model,
+        enabled_properties: QuerySet[DataSyncSyncedProperty],
+        key_to_property: Dict[str, DataSyncProperty],
+        batch_size: int,
+    ):
+        self.user = user
+        self.table = table
+        self.model = model
+        self.enabled_properties = enabled_properties
+        self.key_to_property = key_to_property
+        self.search_fields = [p.field for p in enabled_properties]
+        self.batch_size = max(batch_size, 1)
+        self.rows_to_create: List[Dict[str, Any]] = []
+        self.rows_to_update: List[Dict[str, Any]] = []
+        self.row_ids_to_delete: List[int] = []
+
+    def create_or_update(
+        self,
+        new_record_data: Dict[str, Any],
+        existing_record: Optional[Dict[str, Any]],
+    ):
+        """
+        Creates the row if it doesn't exist in the table yet, or updates the existing
+        row if any of its values is different.
+
+        :param new_record_data: The row as returned by the data sync type.
+        :param existing_record: The values of the existing row in the table with the
+            same unique primary values, or None if there is no such row.
+        """
+
+        if existing_record is None:
+            self.create(
+                {
+                    f"field_{property.field_id}": new_record_data[property.key]
+                    for property in self.enabled_properties
+                }
+            )
+            return
+
+        changed = False
+        for enabled_property in self.enabled_properties:
+            key = enabled_property.key
+            field_name = f"field_{enabled_property.field_id}"
+            value = new_record_data[key]
+            baserow_row_value = existing_record[field_name]
+            data_sync_property = self.key_to_property[key]
+            if not data_sync_property.is_equal(baserow_row_value, value):
+                existing_record[field_name] = value
+                changed = True
+        if changed:
+            self.update(existing_record)
+
+    def create(self, row_values: Dict[str, Any]):
+        self.rows_to_create.append(row_values)
+        if len(self.rows_to_create) >= self.batch_size:
+            self._flush_creates()
+
+    def update(self, row_values: Dict[str, Any]):
+        self.rows_to_update.append(row_values)
+        if len(self.rows_to_update) >= self.batch_size:
+            self._flush_updates()
+
+    def delete(self, row_id: int):
+        self.row_ids_to_delete.append(row_id)
+        if len(self.row_ids_to_delete) >= self.batch_size:
+            self._flush_deletes()
+
+    def flush(self):
+        self._flush_creates()
+        self._flush_updates()
+        self._flush_deletes()
+
+    def _flush_creates(self):
+        if len(self.rows_to_create) == 0:
+            return
+
+        created_rows = RowHandler().create_rows(
+            user=self.user,
+            table=self.table,
+            model=self.model,
+            rows_values=self.rows_to_create,
+            generate_error_report=False,
+            send_realtime_update=False,
+            send_webhook_events=False,
+            skip_search_update=True,
+            signal_params={"skip_two_way_sync": True},
+        )
+        self.rows_to_create = []
+        self._schedule_update_search_data([r.id for r in created_rows.created_rows])
+
+    def _flush_updates(self):
+        if len(self.rows_to_update) == 0:
+            return
+
+        RowHandler().update_rows(
+            user=self.user,
+            table=self.table,
+            rows_values=self.rows_to_update,
+            model=self.model,
+            send_realtime_update=False,
+            send_webhook_events=False,
+            skip_search_update=True,
+            signal_params={"skip_two_way_sync": True},
+        )
+        row_ids = [r["id"] for r in self.rows_to_update]
+        self.rows_to_update = []
+        self._schedule_update_search_data(row_ids)
+
+    def _flush_deletes(self):
+        if len(self.row_ids_to_delete) == 0:
+            return
+
+        RowHandler().delete_rows(
+            user=self.user,
+            table=self.table,
+            row_ids=self.row_ids_to_delete,
+            model=self.model,
+            send_realtime_update=False,
+            send_webhook_events=False,
+            # The rows should not be trashed
+            permanently_delete=True,
+            signal_params={"skip_two_way_sync": True},
+        )
+        self.row_ids_to_delete = []
+
+    def _schedule_update_search_data(self, row_ids: List[int]):
+        # No need to include this in the progress as it triggers a celery task
+        SearchHandler.schedule_update_search_data(
+            self.table, fields=self.search_fields, row_ids=row_ids
+        )
 
 
 class DataSyncHandler:
@@ -262,6 +413,9 @@ class DataSyncHandler:
                 data_sync.two_way_sync_consecutive_failures = 0
 
         data_sync = set_allowed_attrs(kwargs, allowed_fields, data_sync)
+        # The source or the synced properties could have changed, so the next sync
+        # must compare all the rows.
+        data_sync.incremental_sync_watermark = None
         data_sync.save()
 
         data_sync_properties = data_sync_type.get_properties(data_sync)
@@ -293,16 +447,23 @@ class DataSyncHandler:
         user: AbstractUser,
         data_sync: DataSync,
         progress_builder: Optional[ChildProgressBuilder] = None,
+        full_sync: bool = False,
     ) -> DataSync:
         """
         Synchronizes the table with the data sync. This will automatically create
         missing rows, update existing rows, and delete rows that no longer exist. There
         can only be one data sync active at the same time to avoid conflicts.
 
+        If the data sync type supports it, only the rows that have changed since the
+        previous sync are fetched and applied. Deleted rows are then only removed
+        during the next full sync, which happens periodically.
+
         :param user: The user on whose behalf the data sync is triggered.
         :param data_sync: The data sync object that must be synced.
         :param progress_builder: If provided will be used to build a child progress bar
             and report on this methods progress to the parent of the progress_builder.
+        :param full_sync: If True, then all the rows are synced, even if the data sync
+            supports syncing only the changed rows.
         :raises SyncDataSyncTableAlreadyRunning: if the data sync table is already
             being synced. Only one can run concurrently.
         :return:
@@ -326,7 +487,7 @@ class DataSyncHandler:
                 )
 
             try:
-                self._do_sync_table(user, data_sync, progress_builder)
+                self._do_sync_table(user, data_sync, progress_builder, full_sync)
             finally:
                 cache.delete(lock_key)
         # If calling `get_all_rows` fails with a `SyncError`, then it's an expected
@@ -343,6 +504,8 @@ class DataSyncHandler:
             update_fields=(
                 "last_sync",
                 "last_error",
+                "last_full_sync",
+                "incremental_sync_watermark",
             )
         )
 
@@ -352,7 +515,21 @@ class DataSyncHandler:
 
         return data_sync
 
-    def _do_sync_table(self, user, data_sync, progress_builder):
+    def _can_sync_incrementally(
+        self, data_sync: DataSync, watermark: Optional[str]
+    ) -> bool:
+        if watermark is None or data_sync.incremental_sync_watermark is None:
+            return False
+
+        if data_sync.last_full_sync is None:
+            return False
+
+        full_sync_interval = timedelta(
+            hours=settings.BASEROW_DATA_SYNC_FULL_SYNC_INTERVAL_HOURS
+        )
+        return timezone.now() - data_sync.last_full_sync < full_sync_interval
+
+    def _do_sync_table(self, user, data_sync, progress_builder, full_sync=False):
         progress = ChildProgressBuilder.build(progress_builder, 100)
 
         data_sync_type = data_sync_type_registry.get_by_model(data_sync)
@@ -366,6 +543,7 @@ class DataSyncHandler:
         # because data sync type properties might have changed, and we want to make sure
         # they're in sync before syncing the rows.
         enabled_properties = DataSyncSyncedProperty.objects.filter(data_sync=data_sync)
+        previous_field_ids = set(enabled_properties.values_list("field_id", flat=True))
         if data_sync.auto_add_new_properties:
             # If `auto_add_new_properties` is true, then we always want to enable all
             # the properties of the data sync. This automatically adds new ones.
@@ -393,128 +571,190 @@ class DataSyncHandler:
         key_to_property = {p.key: p for p in all_properties}
         progress.increment(by=1)  # makes the total `2`
 
-        existing_rows_queryset = model.objects.all().values(
-            # There is no need to fetch the rows cell values from the row because we
-            # don't need them.
-            *["id"]
-            + list(key_to_field_id.values())
+        # The watermark must be taken before fetching the rows, so that the rows that
+        # change during the sync are fetched again next time.
+        watermark = data_sync_type.get_incremental_sync_watermark(data_sync)
+        # If a field was added, then all the rows need a value for it.
+        fields_changed = previous_field_ids != {p.field_id for p in enabled_properties}
+        incremental = (
+            not full_sync
+            and not fields_changed
+            and self._can_sync_incrementally(data_sync, watermark)
+        )
+
+        writer = DataSyncRowsWriter(
+            user,
+            data_sync.table,
+            model,
+            enabled_properties,
+            key_to_property,
+            settings.BASEROW_DATA_SYNC_BATCH_SIZE,
         )
-        progress.increment(by=6)  # makes the total `9`
-
-        existing_rows_in_table = {
-            tuple(row[key_to_field_id[key]] for key in unique_primary_keys): row
-            for row in existing_rows_queryset
-            # Unique primaries can't be empty. If they are, then they're left dangling
-            # because the primary was removed. They will be deleted later.
-            if all(row[key_to_field_id[key]] for key in unique_primary_keys)
-        }
-        progress.increment(by=1)  # makes the total `10`
-
-        rows_of_data_sync = {
-            tuple(row[key] for key in unique_primary_keys): row
+        if incremental:
+            self._sync_changed_rows(
+                data_sync,
+                data_sync_type,
+                model,
+                writer,
+                unique_primary_keys,
+                key_to_field_id,
+                progress,
+            )
+        else:
+            self._sync_all_rows(
+                data_sync,
+                data_sync_type,
+                model,
+                writer,
+                unique_primary_keys,
+                key_to_field_id,
+                progress,
+            )
+            data_sync.last_full_sync = timezone.now()
+        writer.flush()
+
+        data_sync.incremental_sync_watermark = watermark
+
+    def _sync_all_rows(
+        self,
+        data_sync,
+        data_sync_type,
+        model,
+        writer,
+        unique_primary_keys,
+        key_to_field_id,
+        progress,
+    ):
+        """
+        Compares all the rows of the data sync with all the rows in the table, and
+        creates, updates and deletes the rows in the table accordingly.
+        """
+
+        batch_size = settings.BASEROW_DATA_SYNC_BATCH_SIZE
+
+        # Both the existing rows and the rows of the data sync are sorted by their
+        # unique primary values, spilling to disk if there are many of them, so that
+        # they can be compared by walking over them at the same time. This keeps the
+        # memory usage flat, no matter how many rows there are.
+        with ExternalSorter(batch_size) as existing_rows, ExternalSorter(
+            batch_size
+        ) as rows_of_data_sync:
+            existing_rows_queryset = model.objects.all().values(
+                # There is no need to fetch the rows cell values from the row because
+                # we don't need them.
+                *["id"]
+                + list(key_to_field_id.values())
+            )
+            for row in existing_rows_queryset.iterator(chunk_size=batch_size):
+                unique_primary_values = [
+                    row[key_to_field_id[key]] for key in unique_primary_keys
+                ]
+                # Unique primaries can't be empty. If they are, then they're left
+                # dangling because the primary was removed. They're given a key that
+                # can't match any data sync row, so that they're deleted.
+                if all(unique_primary_values):
+                    sort_key = get_sort_key(unique_primary_values)
+                else:
+                    sort_key = ((-1, row["id"]),)
+                existing_rows.add(sort_key, row)
+            progress.increment(by=7)  # makes the total `10`
+
             for row in data_sync_type.get_all_rows(
                 data_sync,
                 progress_builder=progress.create_child_builder(
                     represents_progress=56  # makes the total `66`
                 ),
-            )
-        }
-
-        rows_to_create = []
-        for new_id, data in rows_of_data_sync.items():
-            if new_id not in existing_rows_in_table:
-                rows_to_create.append(
-                    {
-                        f"field_{property.field_id}": data[property.key]
-                        for property in enabled_properties
-                    }
+            ):
+                rows_of_data_sync.add(
+                    get_sort_key(row[key] for key in unique_primary_keys), row
                 )
-        progress.increment(by=1)  # makes the total `67`
-
-        rows_to_update = []
-        for existing_id, existing_record in existing_rows_in_table.items():
-            if existing_id in rows_of_data_sync:
-                new_record_data = rows_of_data_sync[existing_id]
-                changed = False
-                for enabled_property in enabled_properties:
-                    key = enabled_property.key
-                    value = new_record_data[key]
-                    baserow_row_value = existing_record[key_to_field_id[key]]
-                    data_sync_property = key_to_property[key]
-                    if not data_sync_property.is_equal(baserow_row_value, value):
-                        existing_record[key_to_field_id[key]] = value
-                        changed = True
-                if changed:
-                    rows_to_update.append(existing_record)
-        progress.increment(by=2)  # makes the total `69`
-
-        row_ids_to_delete = []
-        for existing_id in existing_rows_in_table.keys():
-            if existing_id is None or existing_id not in rows_of_data_sync:
-                row_ids_to_delete.append(existing_rows_in_table[existing_id]["id"])
-        # Loop over the dangling rows and delete those because they can't be identified
-        # anymore.
-        for row in existing_rows_queryset:
-            if any(not row[key_to_field_id[key]] for key in unique_primary_keys):
-                row_ids_to_delete.append(row["id"])
-        progress.increment(by=1)  # makes the total `70`
-
-        created_rows = CreatedRowsData([], {}, [], None)
-        if len(rows_to_create) > 0:
-            created_rows = RowHandler().create_rows(
-                user=user,
-                table=data_sync.table,
-                model=model,
-                rows_values=rows_to_create,
-                generate_error_report=False,
-                send_realtime_update=False,
-                send_webhook_events=False,
-                skip_search_update=True,
-                signal_params={"skip_two_way_sync": True},
-            )
-        progress.increment(by=10)  # makes the total `80`
 
-        if len(rows_to_update) > 0:
-            RowHandler().update_rows(
-                user=user,
-                table=data_sync.table,
-                rows_values=rows_to_update,
-                model=model,
-                send_realtime_update=False,
-                send_webhook_events=False,
-                skip_search_update=True,
-                signal_params={"skip_two_way_sync": True},
+            merge_progress = ChildProgressBuilder.build(
+                progress.create_child_builder(
+                    represents_progress=34  # makes the total `100`
+                ),
+                child_total=max(existing_rows.count + rows_of_data_sync.count, 1),
             )
-        progress.increment(by=10)  # makes the total `90`
+            for new_records, existing_records in merge_join(
+                rows_of_data_sync,
+                existing_rows,
+                on_group=lambda count: merge_progress.increment(by=count),
+            ):
+                # If the data sync or the table contain multiple rows with the same
+                # unique primary values, then the last one is used.
+                if new_records is None:
+                    for record in existing_records:
+                        writer.delete(record["id"])
+                else:
+                    writer.create_or_update(
+                        new_records[-1],
+                        existing_records[-1] if existing_records else None,
+                    )
+
+    def _sync_changed_rows(
+        self,
+        data_sync,
+        data_sync_type,
+        model,
+        writer,
+        unique_primary_keys,
+        key_to_field_id,
+        progress,
+    ):
+        """
+        Fetches only the rows that have changed since the previous sync, and creates
+        or updates them in the table. Rows are never deleted because the data sync
+        type can't tell which rows have been deleted.
+        """
 
-        if len(row_ids_to_delete) > 0:
-            RowHandler().delete_rows(
-                user=user,
-                table=data_sync.table,
-                row_ids=row_ids_to_delete,
-                model=model,
-                send_realtime_update=False,
-                send_webhook_events=False,
-                # The rows should not be trashed
-                permanently_delete=True,
-                signal_params={"skip_two_way_sync": True},
-            )
-        progress.increment(by=10)  # makes the total `100`
-
-        if (
-            len(rows_to_create) > 0
-            or len(rows_to_update) > 0
-            or len(row_ids_to_delete) > 0
-        ):
-            # No need to include this in the progress as it triggers a celery task
-            row_ids = [r["id"] for r in rows_to_update] + [
-                r.id for r in created_rows.created_rows
-            ]
-            SearchHandler.schedule_update_search_data(
-                data_sync.table,
-                fields=[p.field for p in enabled_properties],
-                row_ids=row_ids,
-            )
+        progress.increment(by=7)  # makes the total `10`
+
+        changed_rows = data_sync_type.get_rows_changed_since(
+            data_sync,
+            data_sync.incremental_sync_watermark,
+            progress_builder=progress.create_child_builder(
+                represents_progress=56  # makes the total `66`
+            ),
+        )
+        for batch in grouper(settings.BASEROW_DATA_SYNC_BATCH_SIZE, changed_rows):
+            # If the data sync contains multiple rows with the same unique primary
+            # values, then the last one is used.
+            rows_by_key = {
+                get_sort_key(row[key] for key in unique_primary_keys): row
+                for row in batch
+            }
+
+            if len(unique_primary_keys) == 1:
+                field_name = key_to_field_id[unique_primary_keys[0]]
+                existing_filter = Q(
+                    **{
+                        f"{field_name}__in": [
+                            row[unique_primary_keys[0]] for row in rows_by_key.values()
+                        ]
+                    }
+                )
+            else:
+                existing_filter = Q()
+                for row in rows_by_key.values():
+                    existing_filter |= Q(
+                        **{
+                            key_to_field_id[key]: row[key]
+                            for key in unique_primary_keys
+                        }
+                    )
+
+            existing_rows = {
+                get_sort_key(
+                    row[key_to_field_id[key]] for key in unique_primary_keys
+                ): row
+                for row in model.objects.filter(existing_filter).values(
+                    "id", *key_to_field_id.values()
+                )
+            }
+            for key, row in rows_by_key.items():
+                writer.create_or_update(row, existing_rows.get(key))
+
+        progress.increment(by=34)  # makes the total `100`
 
     def set_data_sync_synced_properties(
         self,
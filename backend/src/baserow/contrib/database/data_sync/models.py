@@ -29,6 +29,16 @@ class DataSync(
         null=True,
         help_text="",
     )
+    last_full_sync = models.DateTimeField(
+        null=True,
+        help_text="Timestamp when all the rows of the table were last synced.",
+    )
+    incremental_sync_watermark = models.TextField(
+        null=True,
+        help_text="The watermark of the source at the moment of the last sync. Only "
+        "the rows that have changed since this watermark are fetched on the next "
+        "incremental sync.",
+    )
     content_type = models.ForeignKey(
         ContentType,
         verbose_name="content type",
@@ -117,6 +127,14 @@ class PostgreSQLDataSync(DataSync):
     postgresql_database = models.CharField(max_length=255)
     postgresql_schema = models.CharField(max_length=255, default="public")
     postgresql_table = models.CharField(max_length=255)
+    postgresql_incremental_column = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        help_text="Optionally the name of a column that increases when a row is "
+        "created or updated, like an `updated_at` timestamp. If set, only the rows "
+        "that have changed since the last sync are fetched.",
+    )
     postgresql_sslmode = models.CharField(
         max_length=12,
         default="prefer",
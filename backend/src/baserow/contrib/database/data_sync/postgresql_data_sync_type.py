@@ -1,5 +1,5 @@
 import contextlib
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from django.conf import settings
 from django.db import DEFAULT_DB_ALIAS
@@ -115,6 +115,19 @@ column_type_to_baserow_field_type = {
 }
 
 
+# The column types that can be used to incrementally sync the changed rows. The
+# type is used to cast the stored watermark, so it must be one of these.
+incremental_column_types = {
+    "smallint",
+    "integer",
+    "bigint",
+    "numeric",
+    "date",
+    "timestamp without time zone",
+    "timestamp with time zone",
+}
+
+
 class PostgreSQLDataSyncType(DataSyncType):
     type = "postgresql"
     model_class = PostgreSQLDataSync
@@ -127,6 +140,7 @@ class PostgreSQLDataSyncType(DataSyncType):
         "postgresql_schema",
         "postgresql_table",
         "postgresql_sslmode",
+        "postgresql_incremental_column",
     ]
     request_serializer_field_names = [
         "postgresql_host",
@@ -137,6 +151,7 @@ class PostgreSQLDataSyncType(DataSyncType):
         "postgresql_schema",
         "postgresql_table",
         "postgresql_sslmode",
+        "postgresql_incremental_column",
     ]
     # The `postgresql_password` should not be included because it's a secret value that
     # must only be possible to set and not get.
@@ -148,6 +163,7 @@ class PostgreSQLDataSyncType(DataSyncType):
         "postgresql_schema",
         "postgresql_table",
         "postgresql_sslmode",
+        "postgresql_incremental_column",
     ]
 
     @contextlib.contextmanager
@@ -283,16 +299,77 @@ class PostgreSQLDataSyncType(DataSyncType):
             properties.append(property_instance)
         return properties
 
+    def _get_incremental_column_type(self, cursor, instance) -> str:
+        """
+        Returns the type of the incremental column if it exists and can be compared
+        with a watermark.
+        """
+
+        cursor.execute(
+            """
+                SELECT data_type
+                FROM information_schema.columns
+                WHERE table_schema = %s
+                AND table_name = %s
+                AND column_name = %s;
+            """,
+            (
+                instance.postgresql_schema,
+                instance.postgresql_table,
+                instance.postgresql_incremental_column,
+            ),
+        )
+        result = cursor.fetchone()
+        if result is None:
+            raise SyncError(
+                f"The incremental column {instance.postgresql_incremental_column} "
+                f"does not exist."
+            )
+        if result[0] not in incremental_column_types:
+            raise SyncError(
+                f"The incremental column {instance.postgresql_incremental_column} "
+                f"must be a number, date or timestamp column."
+            )
+        return result[0]
+
+    def _iter_rows(
+        self, cursor, instance, properties, where=sql.SQL(""), params=()
+    ) -> Iterator[Dict]:
+        order_names = [p.key for p in properties if p.unique_primary]
+        column_names = [p.key for p in properties]
+
+        select_query = sql.SQL("SELECT {} FROM {}.{} {} ORDER BY {}").format(
+            sql.SQL(", ").join(map(sql.Identifier, column_names)),
+            sql.Identifier(instance.postgresql_schema),
+            sql.Identifier(instance.postgresql_table),
+            where,
+            sql.SQL(", ").join(map(sql.Identifier, order_names)),
+        )
+
+        # A server side cursor is used so that the records are fetched in batches
+        # instead of loading the whole table into memory.
+        batch_size = settings.BASEROW_DATA_SYNC_BATCH_SIZE
+        with cursor.connection.cursor(name="baserow_data_sync") as records_cursor:
+            records_cursor.itersize = batch_size
+            records_cursor.execute(select_query, params)
+            while True:
+                records = records_cursor.fetchmany(batch_size)
+                if not records:
+                    break
+                for record in records:
+                    yield {
+                        p.key: p.prepare_value(record[index])
+                        for index, p in enumerate(properties)
+                    }
+
     def get_all_rows(
         self,
         instance,
         progress_builder: Optional[ChildProgressBuilder] = None,
-    ) -> List[Dict]:
+    ) -> Iterator[Dict]:
         schema_name = f"{instance.postgresql_schema}"
         table_name = f"{instance.postgresql_table}"
         properties = self.get_properties(instance)
-        order_names = [p.key for p in properties if p.unique_primary]
-        column_names = [p.key for p in properties]
 
         with self._connection(instance) as cursor:
             count_query = sql.SQL("SELECT count(*) FROM {}.{}").format(
@@ -305,20 +382,39 @@ class PostgreSQLDataSyncType(DataSyncType):
             if limit and count > settings.INITIAL_TABLE_DATA_LIMIT:
                 raise SyncError(f"The table can't contain more than {limit} records.")
 
-            select_query = sql.SQL("SELECT {} FROM {}.{} ORDER BY {}").format(
-                sql.SQL(", ").join(map(sql.Identifier, column_names)),
-                sql.Identifier(schema_name),
-                sql.Identifier(table_name),
-                sql.SQL(", ").join(map(sql.Identifier, order_names)),
+            yield from self._iter_rows(cursor, instance, properties)
+
+    def get_incremental_sync_watermark(self, instance) -> Optional[str]:
+        if not instance.postgresql_incremental_column:
+            return None
+
+        with self._connection(instance) as cursor:
+            self._get_incremental_column_type(cursor, instance)
+            watermark_query = sql.SQL("SELECT max({})::text FROM {}.{}").format(
+                sql.Identifier(instance.postgresql_incremental_column),
+                sql.Identifier(instance.postgresql_schema),
+                sql.Identifier(instance.postgresql_table),
             )
+            cursor.execute(watermark_query)
+            return cursor.fetchone()[0]
 
-            cursor.execute(select_query)
-            records = cursor.fetchall()
+    def get_rows_changed_since(
+        self,
+        instance,
+        watermark: str,
+        progress_builder: Optional[ChildProgressBuilder] = None,
+    ) -> Iterator[Dict]:
+        properties = self.get_properties(instance)
 
-        return [
-            {
-                p.key: p.prepare_value(record[index])
-                for index, p in enumerate(properties)
-            }
-            for record in records
-        ]
+        with self._connection(instance) as cursor:
+            column_type = self._get_incremental_column_type(cursor, instance)
+            # Rows that were changed at exactly the watermark are fetched again
+            # because other rows could have been changed at the same moment after the
+            # watermark was taken.
+            where = sql.SQL("WHERE {} >= CAST(%s AS {})").format(
+                sql.Identifier(instance.postgresql_incremental_column),
+                sql.SQL(column_type),
+            )
+            yield from self._iter_rows(
+                cursor, instance, properties, where=where, params=(watermark,)
+            )
@@ -169,6 +169,9 @@ class DataSyncType(
         - Which rows already exist, update those if changed.
         - Which rows exist, but not in this list, delete those.
 
+        The rows are consumed only once, so a generator can be returned to avoid
+        holding all of them in memory at the same time.
+
         :param instance: The data sync instance of which the rows must be fetched.
         :param progress_builder: Optionally indicate the progress.
         :raises SyncError: If something goes wrong, but don't want to fail hard and
@@ -176,6 +179,52 @@ class DataSyncType(
         :return: Iterable of all rows in the data sync source.
         """
 
+    def get_incremental_sync_watermark(self, instance: "DataSync") -> Optional[str]:
+        """
+        Data sync types that can fetch only the rows that have changed since a
+        previous sync should return the current watermark of the source here. It can
+        be anything that increases when a row changes, like the maximum value of an
+        `updated_at` column or an API cursor. It's stored after the sync and passed
+        into `get_rows_changed_since` on the next sync.
+
+        An incremental sync can't detect deleted rows, that's why a full sync is
+        still done periodically.
+
+        :param instance: The data sync instance of which the watermark must be
+            fetched.
+        :raises SyncError: If something goes wrong, but don't want to fail hard and
+            expose the error via the API.
+        :return: The watermark as a string or None if the rows can't be fetched
+            incrementally.
+        """
+
+        return None
+
+    def get_rows_changed_since(
+        self,
+        instance: "DataSync",
+        watermark: str,
+        progress_builder: Optional[ChildProgressBuilder] = None,
+    ) -> Iterable[Dict]:
+        """
+        Should return the rows that have been created or updated since the provided
+        watermark, in the same format as `get_all_rows`. It's fine to return rows
+        that haven't changed, they're only updated if a value is different.
+
+        :param instance: The data sync instance of which the rows must be fetched.
+        :param watermark: The watermark returned by `get_incremental_sync_watermark`
+            during the previous sync.
+        :param progress_builder: Optionally indicate the progress.
+        :raises SyncError: If something goes wrong, but don't want to fail hard and
+            expose the error via the API.
+        :return: Iterable of the changed rows in the data sync source.
+        """
+
+        raise NotImplementedError(
+            "A data sync type that returns a watermark must implement the "
+            "`get_rows_changed_since` method."
+        )
+
     def create_rows(
         self, serialized_rows: List[dict], data_sync: "DataSync"
     ) -> (List)[dict]:
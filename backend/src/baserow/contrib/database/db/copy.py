@@ -0,0 +1,220 @@
+import io
+import json
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Type
+from uuid import UUID
+
+from django.db import connection
+from django.db.models import Model
+from django.db.models.expressions import RawSQL
+
+from baserow.core.psycopg import is_psycopg3
+
+
+class NotCopyable(Exception):
+    """
+    Raised when a value can't be written with a `COPY FROM STDIN` statement, in which
+    case the rows must be inserted with a regular `INSERT` statement instead.
+    """
+
+
+def _escape_copy_text(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _get_json_text(value: Any) -> Optional[str]:
+    """
+    Returns the JSON text of the JSON adapters returned by the postgres backend for
+    the `JSONField` values, or None if the value isn't a JSON adapter.
+    """
+
+    if is_psycopg3:
+        from psycopg.types.json import Json, Jsonb
+
+        if isinstance(value, (Json, Jsonb)):
+            dumps = value.dumps or json.dumps
+            return dumps(value.obj)
+    else:
+        from psycopg2.extras import Json
+
+        if isinstance(value, Json):
+            return value.dumps(value.adapted)
+    return None
+
+
+def to_copy_text(value: Any) -> str:
+    """
+    Converts a value prepared by `Field.get_db_prep_save` to its representation in
+    the text format of the postgres `COPY` statement.
+
+    :param value: The prepared database value.
+    :raises NotCopyable: If the value is of a type that isn't supported.
+    :return: The escaped text representation of the value.
+    """
+
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (int, float, Decimal)):
+        return str(value)
+    if isinstance(value, str):
+        return _escape_copy_text(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return f"{value.total_seconds()} seconds"
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "\\\\x" + bytes(value).hex()
+
+    json_text = _get_json_text(value)
+    if json_text is not None:
+        return _escape_copy_text(json_text)
+
+    raise NotCopyable(f"Values of type {type(value)} can't be copied.")
+
+
+def _allocate_values(raw_sql: RawSQL, count: int) -> List[Any]:
+    """
+    Evaluates the SQL expression, typically a `nextval` of a sequence, once for every
+    row that is going to be copied, in the same way a multi row `INSERT` would.
+    """
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT {raw_sql.sql} FROM generate_series(1, %s)",  # nosec B608
+            [*raw_sql.params, count],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _write_copy(copy_sql: str, data: str):
+    with connection.cursor() as cursor:
+        with connection.wrap_database_errors:
+            if is_psycopg3:
+                with cursor.cursor.copy(copy_sql) as copy:
+                    copy.write(data)
+            else:
+                cursor.cursor.copy_expert(copy_sql, io.StringIO(data))
+
+
+def copy_insert(model: Type[Model], instances: List[Model]) -> bool:
+    """
+    Inserts the provided unsaved instances into the table of the model using a
+    `COPY FROM STDIN` statement, which is a lot faster than an `INSERT` for large
+    numbers of rows. The primary keys, and the values of the fields that are
+    computed by the database when inserting, like the values of a sequence, are
+    allocated up front so that they can be set on the instances afterwards.
+
+    If all the instances already have a primary key, then those are inserted as is.
+    Like with `bulk_create`, the caller is then responsible for updating the
+    sequence of the primary key.
+
+    Nothing is inserted if one of the values can't be copied, in which case the
+    caller is expected to fall back to `bulk_create`.
+
+    :param model: The model of the table where the rows must be inserted.
+    :param instances: The unsaved instances of the model.
+    :return: True if the instances have been inserted, False otherwise.
+    """
+
+    if not instances or connection.vendor != "postgresql":
+        return False
+
+    pk_field = model._meta.pk
+    has_pks = instances[0].pk is not None
+    if any((instance.pk is not None) != has_pks for instance in instances):
+        return False
+
+    fields = [
+        field
+        for field in model._meta.concrete_fields
+        if field.column and field is not pk_field
+    ]
+
+    columns: Dict[str, List[Any]] = {}
+    allocated: Dict[str, RawSQL] = {}
+    for field in fields:
+        values = []
+        for instance in instances:
+            value = field.pre_save(instance, True)
+            if hasattr(value, "resolve_expression"):
+                if not isinstance(value, RawSQL) or (
+                    field.attname in allocated
+                    and allocated[field.attname].sql != value.sql
+                ):
+                    return False
+                allocated[field.attname] = value
+                value = None
+            else:
+                value = field.get_db_prep_save(value, connection=connection)
+            values.append(value)
+        columns[field.attname] = values
+
+    try:
+        lines = []
+        for index in range(len(instances)):
+            lines.append(
+                "\t".join(
+                    to_copy_text(columns[field.attname][index])
+                    for field in fields
+                    if field.attname not in allocated
+                )
+            )
+    except NotCopyable:
+        return False
+
+    count = len(instances)
+    to_allocate = list(allocated.items())
+    if not has_pks:
+        sequence_sql = RawSQL(
+            "nextval(pg_get_serial_sequence(%s, %s))",
+            (model._meta.db_table, pk_field.column),
+        )
+        to_allocate.insert(0, (pk_field.attname, sequence_sql))
+    allocated_values = {
+        attname: _allocate_values(raw_sql, count) for attname, raw_sql in to_allocate
+    }
+
+    for attname, values in allocated_values.items():
+        if attname == pk_field.attname:
+            continue
+        for index, value in enumerate(values):
+            lines[index] += "\t" + to_copy_text(value)
+
+    if has_pks:
+        ids = [
+            to_copy_text(pk_field.get_db_prep_save(instance.pk, connection=connection))
+            for instance in instances
+        ]
+    else:
+        ids = allocated_values[pk_field.attname]
+    lines = [f"{ids[index]}\t{line}" for index, line in enumerate(lines)]
+
+    quote_name = connection.ops.quote_name
+    column_names = [
+        pk_field.column,
+        *[field.column for field in fields if field.attname not in allocated],
+        *[model._meta.get_field(attname).column for attname in allocated],
+    ]
+    copy_sql = "COPY {} ({}) FROM STDIN".format(  # nosec B608
+        quote_name(model._meta.db_table),
+        ", ".join(quote_name(column) for column in column_names),
+    )
+    _write_copy(copy_sql, "\n".join(lines) + "\n")
+
+    for index, instance in enumerate(instances):
+        for attname, values in allocated_values.items():
+            setattr(instance, attname, values[index])
+        instance._state.adding = False
+        instance._state.db = connection.alias
+
+    return True
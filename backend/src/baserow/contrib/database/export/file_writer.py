@@ -1,17 +1,27 @@
 import abc
 import time
-from typing import Any, Callable
+from typing import Any, Callable, Iterator, Tuple
 
-from django.core.paginator import Paginator
+from django.conf import settings
+from django.core.cache import cache
 from django.db.models import QuerySet
 
 import unicodecsv as csv
 
 from baserow.contrib.database.export.exceptions import ExportJobCanceledException
+from baserow.contrib.database.export.models import (
+    EXPORT_JOB_EXPORTING_STATUS,
+    ExportJob,
+)
 from baserow.contrib.database.table.models import FieldObject
 from baserow.contrib.database.views.filters import AdHocFilters
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_type_registry
+from baserow.core.db import (
+    KeysetPaginator,
+    is_ordering_backed_by_index,
+    iterate_queryset_in_chunks,
+)
 
 
 class FileWriter(abc.ABC):
@@ -67,12 +77,16 @@ class FileWriter(abc.ABC):
 
 class PaginatedExportJobFileWriter(FileWriter):
     """
-    Uses Django's built-in paginator to write querysets to files in a memory efficient
-    manner. Also updates the provided job as it progresses through any queryset writes
-    every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
+    Writes querysets to files in a memory efficient manner by fetching the rows in
+    chunks of EXPORT_ROWS_CHUNK_SIZE. If the ordering of the queryset is backed by
+    an index, keyset pagination is used so that every chunk can be fetched in
+    constant time. Otherwise, the rows are streamed using a single server-side
+    cursor. Also updates the provided job as it progresses through any queryset
+    writes every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
     """
 
     EXPORT_JOB_UPDATE_FREQUENCY_SECONDS = 1
+    EXPORT_ROWS_CHUNK_SIZE = 2000
 
     def __init__(self, file, job):
         super().__init__(file)
@@ -107,19 +121,48 @@ class PaginatedExportJobFileWriter(FileWriter):
         """
 
         self.update_check()
-        paginator = Paginator(queryset.all(), 2000)
+        # The count is only used to report the progress. Rows that are created
+        # while exporting can make the real number of rows higher.
+        total_rows = queryset.count()
         i = 0
         results = []
-        for page in paginator.page_range:
-            for row in paginator.page(page).object_list:
-                i = i + 1
-                is_last_row = i == paginator.count
-                result = write_row(row, is_last_row)
-                if result is not None:
-                    results.append(result)
-                self._check_and_update_job(i, paginator.count, progress_weight)
+        for row, is_last_row in self._iterate_rows(queryset):
+            i = i + 1
+            result = write_row(row, is_last_row)
+            if result is not None:
+                results.append(result)
+            self._check_and_update_job(
+                i, i if is_last_row else max(total_rows, i + 1), progress_weight
+            )
         return results
 
+    def _iterate_rows(self, queryset: QuerySet) -> Iterator[Tuple[Any, bool]]:
+        """
+        Iterates over all the rows of the queryset in chunks, while keeping the
+        ordering of the queryset.
+
+        :param queryset: The queryset to iterate over.
+        :return: An iterator yielding a tuple containing the row and whether it's
+            the last row of the queryset.
+        """
+
+        if is_ordering_backed_by_index(queryset):
+            chunks = KeysetPaginator(queryset.all(), self.EXPORT_ROWS_CHUNK_SIZE)
+        else:
+            chunks = iterate_queryset_in_chunks(
+                queryset.all(), self.EXPORT_ROWS_CHUNK_SIZE
+            )
+
+        previous_row = None
+        for chunk in chunks:
+            for row in chunk:
+                if previous_row is not None:
+                    yield previous_row, False
+                previous_row = row
+
+        if previous_row is not None:
+            yield previous_row, True
+
     def _check_and_update_job(self, current_row, total_rows, progress_weight=100):
         """
         Checks if enough time has passed and if so checks the state of the job and
@@ -141,17 +184,98 @@ class PaginatedExportJobFileWriter(FileWriter):
         is_last_row = current_row == total_rows
         if enough_time_has_passed or is_last_row:
             self.update_check()
-            self.job.refresh_from_db()
-            if self.job.is_cancelled_or_expired():
-                raise ExportJobCanceledException()
-            else:
-                # min is used here because in case of files we get total size from
-                # files, but for progress measurement we use size of chunks that might
-                # be slightly bigger than the total size of the files
-                self.job.progress_percentage = min(
-                    current_row / total_rows * progress_weight, 100
-                )
-                self.job.save()
+            # min is used here because in case of files we get total size from
+            # files, but for progress measurement we use size of chunks that might
+            # be slightly bigger than the total size of the files
+            self._update_job_progress(
+                min(current_row / total_rows * progress_weight, 100)
+            )
+
+    def _update_job_progress(self, progress_percentage: float):
+        """
+        Raises a ExportJobCanceledException if the job has been cancelled, otherwise
+        stores the new progress percentage of the job.
+
+        :param progress_percentage: The progress of this writer between 0 and 100.
+        """
+
+        self.job.refresh_from_db()
+        if self.job.is_cancelled_or_expired():
+            raise ExportJobCanceledException()
+        else:
+            self.job.progress_percentage = progress_percentage
+            self.job.save()
+
+
+class _ShardFile:
+    """
+    Wraps a file and only passes writes through while enabled.
+    """
+
+    def __init__(self, file, enabled: bool):
+        self.file = file
+        self.enabled = enabled
+
+    def write(self, value):
+        if self.enabled:
+            return self.file.write(value)
+
+    def __getattr__(self, name):
+        return getattr(self.file, name)
+
+
+class ShardedExportJobFileWriter(PaginatedExportJobFileWriter):
+    """
+    Writes a single shard of an export job that has been split into multiple
+    shards which are exported in parallel. Everything a QuerysetSerializer writes
+    before the rows is only kept in the first shard, and everything written after
+    the rows only in the last shard. Concatenating the shard files in order
+    therefore results in the same file as a non sharded export.
+
+    The progress of every shard is stored in the cache, so that the progress of the
+    job can be computed as the average of all shards.
+    """
+
+    def __init__(self, file, job, shard_index: int):
+        self.shard_index = shard_index
+        self.is_first_shard = shard_index == 0
+        self.is_last_shard = shard_index == job.shard_count - 1
+        super().__init__(_ShardFile(file, enabled=self.is_first_shard), job)
+
+    def write_rows(self, queryset, write_row, progress_weight=100):
+        def write_shard_row(row, is_last_row):
+            return write_row(row, is_last_row and self.is_last_shard)
+
+        self._file.enabled = True
+        results = super().write_rows(queryset, write_shard_row, progress_weight)
+        self._file.enabled = self.is_last_shard
+        return results
+
+    def _update_job_progress(self, progress_percentage: float):
+        self.job.refresh_from_db(fields=["state"])
+        # Another shard failing means this shard can stop as well.
+        if self.job.state != EXPORT_JOB_EXPORTING_STATUS:
+            raise ExportJobCanceledException()
+
+        cache_keys = [
+            get_export_job_shard_progress_cache_key(self.job.id, shard_index)
+            for shard_index in range(self.job.shard_count)
+        ]
+        cache.set(
+            cache_keys[self.shard_index],
+            progress_percentage,
+            timeout=settings.EXPORT_FILE_EXPIRE_MINUTES * 60,
+        )
+        total_progress = sum(cache.get_many(cache_keys).values())
+        # The other shards update the progress concurrently, so only the progress
+        # is updated to not overwrite the state of the job.
+        ExportJob.objects.filter(
+            id=self.job.id, state=EXPORT_JOB_EXPORTING_STATUS
+        ).update(progress_percentage=total_progress / self.job.shard_count)
+
+
+def get_export_job_shard_progress_cache_key(job_id: int, shard_index: int) -> str:
+    return f"export_job_{job_id}_shard_{shard_index}_progress"
 
 
 class QuerysetSerializer(abc.ABC):
@@ -161,6 +285,9 @@ class QuerysetSerializer(abc.ABC):
     """
 
     can_handle_rich_value = False
+    # Whether the file can be written in multiple shards that are concatenated
+    # afterwards, see ShardedExportJobFileWriter.
+    can_be_sharded = False
 
     def __init__(self, queryset, ordered_field_objects):
         self.queryset = queryset
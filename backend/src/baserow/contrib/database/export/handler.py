@@ -1,11 +1,14 @@
+import shutil
 import uuid
 from datetime import datetime, timezone
+from math import ceil
 from os.path import join
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import transaction
+from django.db.models import F, QuerySet
 
 from loguru import logger
 
@@ -19,12 +22,17 @@ from baserow.contrib.database.export.models import (
     ExportJob,
 )
 from baserow.contrib.database.export.operations import ExportTableOperationType
-from baserow.contrib.database.export.tasks import run_export_job
+from baserow.contrib.database.export.tasks import (
+    merge_export_job_shards,
+    run_export_job,
+    run_export_job_shard,
+)
 from baserow.contrib.database.table.models import Table
 from baserow.contrib.database.views.exceptions import ViewNotInTable
 from baserow.contrib.database.views.filters import AdHocFilters
 from baserow.contrib.database.views.models import View
 from baserow.contrib.database.views.registries import view_type_registry
+from baserow.core.db import KeysetPaginator, is_ordering_backed_by_index
 from baserow.core.handler import CoreHandler
 from baserow.core.storage import (
     _create_storage_dir_if_missing_and_open,
@@ -36,7 +44,11 @@ from .exceptions import (
     TableOnlyExportUnsupported,
     ViewUnsupportedForExporterType,
 )
-from .file_writer import PaginatedExportJobFileWriter
+from .file_writer import (
+    PaginatedExportJobFileWriter,
+    QuerysetSerializer,
+    ShardedExportJobFileWriter,
+)
 from .registries import TableExporter, table_exporter_registry
 from .utils import view_is_publicly_exportable
 
@@ -156,7 +168,12 @@ class ExportHandler:
         view = job.view
         ExportHandler._raise_if_no_export_permissions(job.user, table, view)
         try:
-            return _mark_job_as_finished(_open_file_and_run_export(job))
+            job = _open_file_and_run_export(job)
+            if job.shard_count > 1:
+                # The job is marked as finished when all the shards have been
+                # exported and merged.
+                return job
+            return _mark_job_as_finished(job)
         except ExportJobCanceledException:
             # If the job was canceled then it must not be marked as failed.
             pass
@@ -164,6 +181,82 @@ class ExportHandler:
             _mark_job_as_failed(job, e)
             raise e
 
+    @staticmethod
+    def run_export_job_shard(
+        job: ExportJob,
+        shard_index: int,
+        after_keyset: Optional[List[Any]],
+        until_keyset: Optional[List[Any]],
+    ):
+        """
+        Exports the rows of a single shard of the provided job into a separate file.
+        The shard that finishes last starts the task merging all the shard files into
+        the exported file of the job.
+
+        If the export of the shard fails, the whole job is marked as failed, which
+        makes the other shards stop as well.
+
+        :param job: The sharded export job.
+        :param shard_index: The position of the shard in the export.
+        :param after_keyset: The keyset of the last row of the previous shard, or
+            None if this is the first shard.
+        :param until_keyset: The keyset of the last row of this shard, or None if
+            this is the last shard.
+        """
+
+        if job.state != EXPORT_JOB_EXPORTING_STATUS:
+            return
+
+        try:
+            _open_shard_file_and_run_export(
+                job, shard_index, after_keyset, until_keyset
+            )
+        except ExportJobCanceledException:
+            return
+        except Exception as e:
+            _mark_job_as_failed(job, e)
+            raise e
+
+        finished_shard_count = _increment_finished_shard_count(job)
+        if finished_shard_count == job.shard_count:
+            merge_export_job_shards.delay(job.id)
+
+    @staticmethod
+    def merge_export_job_shards(job: ExportJob) -> Optional[ExportJob]:
+        """
+        Concatenates the files of all the shards of the job, in order, into the
+        exported file and marks the job as finished. The shard files are deleted
+        afterwards.
+
+        :param job: The sharded export job of which all shards have been exported.
+        :return: The finished export job.
+        """
+
+        storage = get_default_storage()
+        shard_file_paths = [
+            ExportHandler.export_shard_file_path(job.exported_file_name, shard_index)
+            for shard_index in range(job.shard_count)
+        ]
+        try:
+            with _create_storage_dir_if_missing_and_open(
+                ExportHandler.export_file_path(job.exported_file_name)
+            ) as file:
+                for shard_file_path in shard_file_paths:
+                    job.refresh_from_db()
+                    if job.is_cancelled_or_expired():
+                        raise ExportJobCanceledException()
+                    with storage.open(shard_file_path, "rb") as shard_file:
+                        shutil.copyfileobj(shard_file, file)
+            return _mark_job_as_finished(job)
+        except ExportJobCanceledException:
+            pass
+        except Exception as e:
+            _mark_job_as_failed(job, e)
+            raise e
+        finally:
+            for shard_file_path in shard_file_paths:
+                storage.delete(shard_file_path)
+
     @staticmethod
     def export_file_path(exported_file_name) -> str:
         """
@@ -176,6 +269,21 @@ class ExportHandler:
 
         return join(settings.EXPORT_FILES_DIRECTORY, exported_file_name)
 
+    @staticmethod
+    def export_shard_file_path(exported_file_name, shard_index) -> str:
+        """
+        Given an export file name and the index of a shard, returns the path where the
+        rows of that shard should be put in storage before they're merged.
+
+        :param exported_file_name: The name of the final exported file.
+        :param shard_index: The position of the shard in the export.
+        :return: The path where the file of the shard should be put in storage.
+        """
+
+        return ExportHandler.export_file_path(
+            f"{exported_file_name}.shard{shard_index}"
+        )
+
     @staticmethod
     def clean_up_old_jobs():
         """
@@ -195,6 +303,15 @@ class ExportHandler:
                 # write step fails it is possible that the exported_file_name does not
                 # exist.
                 storage.delete(ExportHandler.export_file_path(job.exported_file_name))
+                # The shard files are normally deleted when merged, but they're left
+                # behind if the job was cancelled or failed while exporting.
+                if job.shard_count > 1:
+                    for shard_index in range(job.shard_count):
+                        storage.delete(
+                            ExportHandler.export_shard_file_path(
+                                job.exported_file_name, shard_index
+                            )
+                        )
                 job.exported_file_name = None
 
             job.state = EXPORT_JOB_EXPIRED_STATUS
@@ -330,10 +447,138 @@ def _register_action(job):
     )
 
 
+def _get_queryset_serializer(
+    job: ExportJob, exporter: TableExporter, export_options: Dict[str, Any]
+) -> QuerysetSerializer:
+    """
+    Creates the queryset serializer of the exporter for the table or view of the job
+    and applies the filters and ordering of the export options. These options are
+    removed from the provided export options, so that the remaining ones can be
+    passed into the `write_to_file` method of the serializer.
+
+    :param job: The job to create the serializer for.
+    :param exporter: The exporter type of the job.
+    :param export_options: A copy of the export options of the job.
+    :return: The queryset serializer ready to write the rows to a file.
+    """
+
+    filters = export_options.pop("filters", None)
+    order_by = export_options.pop("order_by", None)
+    visible_fields_in_order = export_options.pop("fields", None)
+    only_by_field_ids = None
+
+    queryset_serializer_class = exporter.queryset_serializer_class
+    if job.view is None:
+        serializer = queryset_serializer_class.for_table(job.table)
+    else:
+        serializer, visible_fields_in_view = queryset_serializer_class.for_view(
+            job.view, visible_fields_in_order
+        )
+        only_by_field_ids = [f["field"].id for f in visible_fields_in_view]
+
+    if filters is not None:
+        serializer.add_ad_hoc_filters_dict_to_queryset(
+            filters, only_by_field_ids=only_by_field_ids
+        )
+
+    if order_by is not None:
+        serializer.add_add_hoc_order_by_to_queryset(
+            order_by, only_by_field_ids=only_by_field_ids
+        )
+
+    return serializer
+
+
+def _get_shard_keysets(
+    exporter: TableExporter, queryset: QuerySet
+) -> Optional[List[Optional[List[Any]]]]:
+    """
+    Figures out whether the export should be split into multiple shards, and if so
+    returns the keysets of the boundaries between the shards. Shard `n` contains the
+    rows after keyset `n` up to and including keyset `n + 1`. Only exports of which
+    the ordering is backed by an index are sharded, because otherwise finding the
+    boundaries would require sorting all the rows.
+
+    :param exporter: The exporter type of the job.
+    :param queryset: The queryset that must be exported.
+    :return: A list of keysets where the first and last one are None, or None if
+        the export should not be sharded.
+    """
+
+    shard_count = settings.BASEROW_EXPORT_SHARDS
+    if (
+        shard_count < 2
+        or not exporter.queryset_serializer_class.can_be_sharded
+        or not is_ordering_backed_by_index(queryset)
+    ):
+        return None
+
+    row_count = queryset.count()
+    if row_count < max(settings.BASEROW_EXPORT_SHARD_MIN_ROWS, shard_count):
+        return None
+
+    paginator = KeysetPaginator(
+        queryset, PaginatedExportJobFileWriter.EXPORT_ROWS_CHUNK_SIZE
+    )
+    shard_size = ceil(row_count / shard_count)
+    boundaries = [
+        paginator.get_keyset_at(shard_size * shard_index - 1)
+        for shard_index in range(1, shard_count)
+    ]
+    # Rounding up the shard size can result in fewer shards than requested.
+    boundaries = [keyset for keyset in boundaries if keyset is not None]
+    if not boundaries:
+        return None
+    return [None, *boundaries, None]
+
+
+def _increment_finished_shard_count(job: ExportJob) -> int:
+    """
+    Atomically increments the number of finished shards of the job. The row stays
+    locked by the update until the transaction commits, so every shard gets a
+    different count back and only the last one sees all the shards finished.
+
+    :param job: The sharded export job of which a shard has been exported.
+    :return: The number of finished shards, including the one that just finished.
+    """
+
+    with transaction.atomic():
+        ExportJob.objects.filter(id=job.id).update(
+            finished_shard_count=F("finished_shard_count") + 1
+        )
+        return (
+            ExportJob.objects.filter(id=job.id)
+            .values_list("finished_shard_count", flat=True)
+            .get()
+        )
+
+
+def _start_export_job_shards(job: ExportJob, shard_keysets: List[Optional[List]]):
+    """
+    Starts a separate task for every shard of the export job.
+
+    :param job: The job to export in shards.
+    :param shard_keysets: The keysets of the boundaries between the shards as
+        returned by `_get_shard_keysets`.
+    """
+
+    job.shard_count = len(shard_keysets) - 1
+    job.finished_shard_count = 0
+    job.save(update_fields=["shard_count", "finished_shard_count"])
+    for shard_index in range(job.shard_count):
+        run_export_job_shard.delay(
+            job.id,
+            shard_index,
+            shard_keysets[shard_index],
+            shard_keysets[shard_index + 1],
+        )
+
+
 def _open_file_and_run_export(job: ExportJob) -> ExportJob:
     """
     Using the jobs exporter type exports all data into a new file placed in the
-    default storage.
+    default storage. Large exports can be split into shards that are exported by
+    separate tasks, in which case only those tasks are started.
 
     :return: An updated ExportJob instance with the exported_file_name set.
     """
@@ -352,37 +597,54 @@ def _open_file_and_run_export(job: ExportJob) -> ExportJob:
     # TODO: refactor to use the jobs systems
     _register_action(job)
 
-    filters = job.export_options.pop("filters", None)
-    order_by = job.export_options.pop("order_by", None)
-    visible_fields_in_order = job.export_options.pop("fields", None)
-    only_by_field_ids = None
+    export_options = dict(job.export_options)
+    serializer = _get_queryset_serializer(job, exporter, export_options)
+
+    shard_keysets = _get_shard_keysets(exporter, serializer.queryset)
+    if shard_keysets is not None:
+        _start_export_job_shards(job, shard_keysets)
+        return job
 
     with _create_storage_dir_if_missing_and_open(storage_location) as file:
-        queryset_serializer_class = exporter.queryset_serializer_class
-        if job.view is None:
-            serializer = queryset_serializer_class.for_table(job.table)
-        else:
-            serializer, visible_fields_in_view = queryset_serializer_class.for_view(
-                job.view, visible_fields_in_order
-            )
-            only_by_field_ids = [f["field"].id for f in visible_fields_in_view]
+        serializer.write_to_file(
+            PaginatedExportJobFileWriter(file, job), **export_options
+        )
 
-        if filters is not None:
-            serializer.add_ad_hoc_filters_dict_to_queryset(
-                filters, only_by_field_ids=only_by_field_ids
-            )
+    return job
 
-        if order_by is not None:
-            serializer.add_add_hoc_order_by_to_queryset(
-                order_by, only_by_field_ids=only_by_field_ids
-            )
 
+def _open_shard_file_and_run_export(
+    job: ExportJob,
+    shard_index: int,
+    after_keyset: Optional[List[Any]],
+    until_keyset: Optional[List[Any]],
+):
+    """
+    Exports the rows of a single shard of the job into a separate file placed in the
+    default storage.
+
+    :param job: The sharded export job.
+    :param shard_index: The position of the shard in the export.
+    :param after_keyset: The keyset of the last row of the previous shard.
+    :param until_keyset: The keyset of the last row of this shard.
+    """
+
+    exporter: TableExporter = table_exporter_registry.get(job.exporter_type)
+    export_options = dict(job.export_options)
+    serializer = _get_queryset_serializer(job, exporter, export_options)
+    paginator = KeysetPaginator(
+        serializer.queryset, PaginatedExportJobFileWriter.EXPORT_ROWS_CHUNK_SIZE
+    )
+    serializer.queryset = paginator.get_range_queryset(after_keyset, until_keyset)
+
+    storage_location = ExportHandler.export_shard_file_path(
+        job.exported_file_name, shard_index
+    )
+    with _create_storage_dir_if_missing_and_open(storage_location) as file:
         serializer.write_to_file(
-            PaginatedExportJobFileWriter(file, job), **job.export_options
+            ShardedExportJobFileWriter(file, job, shard_index), **export_options
         )
 
-    return job
-
 
 def _generate_random_file_name_with_extension(file_extension):
     return str(uuid.uuid4()) + file_extension
@@ -47,6 +47,16 @@ class ExportJob(models.Model):
     # export.
     progress_percentage = models.FloatField(default=0.0)
     export_options = JSONField()
+    shard_count = models.PositiveSmallIntegerField(
+        default=1,
+        help_text="The number of shards the export has been split into. Every shard "
+        "is exported by a separate task and merged into the exported file afterwards.",
+    )
+    finished_shard_count = models.PositiveSmallIntegerField(
+        default=0,
+        help_text="The number of shards that have been exported. The shard that "
+        "finishes last starts merging the shard files.",
+    )
 
     def is_cancelled_or_expired(self):
         return self.state in [EXPORT_JOB_CANCELLED_STATUS, EXPORT_JOB_EXPIRED_STATUS]
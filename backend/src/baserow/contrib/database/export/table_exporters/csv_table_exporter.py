@@ -36,6 +36,8 @@ class CsvTableExporter(TableExporter):
 
 
 class CsvQuerysetSerializer(QuerysetSerializer):
+    can_be_sharded = True
+
     def __init__(self, queryset, ordered_field_objects):
         super().__init__(queryset, ordered_field_objects)
 
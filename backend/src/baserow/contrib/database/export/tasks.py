@@ -27,6 +27,43 @@ def run_export_job(self, job_id):
     ExportHandler.run_export_job(job)
 
 
+# noinspection PyUnusedLocal
+@app.task(
+    bind=True,
+    soft_time_limit=EXPORT_SOFT_TIME_LIMIT,
+    time_limit=EXPORT_TIME_LIMIT,
+)
+def run_export_job_shard(self, job_id, shard_index, after_keyset, until_keyset):
+    """
+    Exports a single shard of a sharded export job into a separate file. The last
+    shard to finish starts the task that merges the shards into the exported file.
+    """
+
+    from baserow.contrib.database.export.handler import ExportHandler
+    from baserow.contrib.database.export.models import ExportJob
+
+    job = ExportJob.objects.get(id=job_id)
+    ExportHandler.run_export_job_shard(job, shard_index, after_keyset, until_keyset)
+
+
+# noinspection PyUnusedLocal
+@app.task(
+    bind=True,
+    soft_time_limit=EXPORT_SOFT_TIME_LIMIT,
+    time_limit=EXPORT_TIME_LIMIT,
+)
+def merge_export_job_shards(self, job_id):
+    """
+    Concatenates the files of all the shards of an export job into the exported file.
+    """
+
+    from baserow.contrib.database.export.handler import ExportHandler
+    from baserow.contrib.database.export.models import ExportJob
+
+    job = ExportJob.objects.get(id=job_id)
+    ExportHandler.merge_export_job_shards(job)
+
+
 # noinspection PyUnusedLocal
 @app.task(
     bind=True,
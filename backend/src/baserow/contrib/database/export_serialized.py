@@ -4,7 +4,22 @@ class DatabaseExportSerializedStructure:
         return {"tables": tables}
 
     @staticmethod
-    def table(id, name, order, fields, views, rows, data_sync, field_rules):
+    def table(
+        id,
+        name,
+        order,
+        fields,
+        views,
+        rows,
+        data_sync,
+        field_rules,
+        copy_rows_from_table_id=None,
+    ):
+        optional = {}
+
+        if copy_rows_from_table_id:
+            optional["copy_rows_from_table_id"] = copy_rows_from_table_id
+
         return {
             "id": id,
             "name": name,
@@ -14,6 +29,7 @@ class DatabaseExportSerializedStructure:
             "rows": rows,
             "data_sync": data_sync,
             "field_rules": field_rules,
+            **optional,
         }
 
     @staticmethod
@@ -1621,6 +1621,23 @@ class CreatedOnFieldType(CreatedOnLastModifiedBaseFieldType):
     model_field_kwargs = {"sync_with_add": "created_on"}
 
 
+def get_workspace_user_in_database_copy_sql(
+    source_sql: str, id_mapping: Dict[str, Any]
+) -> Tuple[str, List[Any]]:
+    """
+    Returns the SQL expression that only keeps the user id selected by the
+    `source_sql` if the user belongs to the workspace the rows are imported into, in
+    the same way the serialized import only matches the users of that workspace.
+    """
+
+    return (
+        f"CASE WHEN {source_sql} IN (SELECT user_id FROM "  # nosec B608
+        f"{WorkspaceUser._meta.db_table} WHERE workspace_id = %s) "
+        f"THEN {source_sql} END",
+        [id_mapping["import_workspace_id"]],
+    )
+
+
 class LastModifiedByFieldType(ReadOnlyFieldType):
     type = "last_modified_by"
     model_class = LastModifiedByField
@@ -1656,6 +1673,9 @@ class LastModifiedByFieldType(ReadOnlyFieldType):
     def get_serializer_field(self, instance, **kwargs):
         return CollaboratorSerializer(required=False, **kwargs)
 
+    def get_in_database_copy_sql(self, field, source_sql, id_mapping):
+        return get_workspace_user_in_database_copy_sql(source_sql, id_mapping)
+
     def before_create(
         self, table, primary, allowed_field_values, order, user, field_kwargs
     ):
@@ -1882,6 +1902,9 @@ class CreatedByFieldType(ReadOnlyFieldType):
     def get_serializer_field(self, instance, **kwargs):
         return CollaboratorSerializer(required=False, **kwargs)
 
+    def get_in_database_copy_sql(self, field, source_sql, id_mapping):
+        return get_workspace_user_in_database_copy_sql(source_sql, id_mapping)
+
     def before_create(
         self, table, primary, allowed_field_values, order, user, field_kwargs
     ):
@@ -4036,6 +4059,20 @@ class SelectOptionBaseFieldType(FieldType):
     def get_default_value(self, field: Field) -> Any:
         return getattr(field, self.get_default_options_field_name(), None)
 
+    def get_in_database_copy_sql(self, field, source_sql, id_mapping):
+        select_option_ids = {option.id for option in field.select_options.all()}
+        select_option_mapping = {
+            str(old_id): new_id
+            for old_id, new_id in id_mapping.get(
+                "database_field_select_options", {}
+            ).items()
+            if new_id in select_option_ids
+        }
+        return (
+            f"(%s::jsonb ->> ({source_sql})::text)::int",
+            [json.dumps(select_option_mapping)],
+        )
+
     def create_select_options(self, field, select_options):
         """
         Creates the select options for the field.
@@ -7030,6 +7067,9 @@ class MultipleCollaboratorsFieldType(
 
         return through_objects
 
+    def get_in_database_copy_sql(self, field, source_sql, id_mapping):
+        return get_workspace_user_in_database_copy_sql(source_sql, id_mapping)
+
     def random_value(self, instance, fake, cache):
         """
         Selects a random sublist out of the possible collaborators.
@@ -1229,6 +1229,30 @@ class FieldType(
 
         setattr(row, field_name, value)
 
+    def get_in_database_copy_sql(
+        self,
+        field: Field,
+        source_sql: str,
+        id_mapping: Dict[str, Any],
+    ) -> Tuple[str, List[Any]]:
+        """
+        When a database is duplicated or snapshotted, the rows are copied from the
+        original table to the new table inside the database instead of being
+        serialized. This method returns the SQL expression that converts the value
+        of the original field to the value of the new field. It must be overwritten
+        if the value references an object that gets a new id during the import, like
+        a select option.
+
+        :param field: The new field instance that the value is copied into.
+        :param source_sql: The SQL selecting the original value. For a many to many
+            field, this is the id of the related object in the through table.
+        :param id_mapping: The map of exported ids to newly created ids.
+        :return: The SQL expression and its parameters. If the expression evaluates
+            to NULL for a many to many field, the relation is not copied.
+        """
+
+        return source_sql, []
+
     def get_export_value(
         self, value: Any, field_object: "FieldObject", rich_value: bool = False
     ) -> Any:
@@ -0,0 +1,182 @@
+import codecs
+import json
+from json.decoder import WHITESPACE
+from typing import IO, Any, Dict, Iterator, List
+
+from django.db.models.fields.files import FieldFile
+
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class JSONStreamParser:
+    """
+    Minimal incremental JSON parser that walks through the keys of the top level
+    object of a document and decodes the items of an array one by one, so that big
+    documents can be processed without loading them in memory at once.
+    """
+
+    def __init__(self, fin: IO[bytes], chunk_size: int = READ_CHUNK_SIZE):
+        self._fin = fin
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _read_more(self) -> bool:
+        """
+        Appends the next chunk of the file to the buffer and drops the already
+        parsed part of it.
+
+        :return: False if the end of the file has been reached.
+        """
+
+        chunk = ""
+        while not chunk and not self._eof:
+            data = self._fin.read(self._chunk_size)
+            self._eof = not data
+            chunk = self._text_decoder.decode(data, final=self._eof)
+
+        if not chunk:
+            return False
+
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """
+        Skips the whitespaces and returns the next character without consuming it.
+
+        :return: The next character or an empty string at the end of the document.
+        """
+
+        while True:
+            self._pos = WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer) or not self._read_more():
+                return self._buffer[self._pos : self._pos + 1]
+
+    def _consume(self, char: str):
+        if self._peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self._buffer, self._pos)
+        self._pos += 1
+
+    def read_value(self) -> Any:
+        """
+        Decodes the next JSON value of the document.
+        """
+
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._read_more():
+                    raise
+                continue
+
+            # A value ending exactly at the end of the buffer, like a number, might
+            # continue in the next chunk of the file.
+            if end == len(self._buffer) and self._read_more():
+                continue
+
+            self._pos = end
+            return value
+
+    def iter_object_keys(self) -> Iterator[str]:
+        """
+        Yields the keys of the object starting at the current position. The value of
+        every key must be consumed, with `read_value` or `iter_array`, before
+        asking for the next key.
+        """
+
+        self._consume("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            key = self.read_value()
+            self._consume(":")
+            yield key
+            if self._peek() != ",":
+                self._consume("}")
+                return
+            self._pos += 1
+
+    def iter_array(self) -> Iterator[Any]:
+        """
+        Yields the decoded items of the array starting at the current position.
+        """
+
+        self._consume("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            yield self.read_value()
+            if self._peek() != ",":
+                self._consume("]")
+                return
+            self._pos += 1
+
+
+class FileImportDataFile:
+    """
+    Gives lazy access to the rows stored in the data file of a file import job. The
+    rows are read from the file while iterating, so they can be imported chunk by
+    chunk instead of loading the whole file in memory. Every iteration reads the
+    file again.
+    """
+
+    def __init__(self, data_file: FieldFile):
+        """
+        :param data_file: The data file of the job, containing a JSON object with
+            the `data` rows, the optional `configuration` and the `row_count`.
+        """
+
+        self.data_file = data_file
+        self._metadata = None
+
+    def _open(self) -> IO[bytes]:
+        return self.data_file.storage.open(self.data_file.name, "rb")
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """
+        Returns all the keys of the data file except the rows. The `row_count` is
+        stored before the rows by `FileImportJobType.after_job_creation`, but it's
+        computed by going through the rows for files that don't have it.
+        """
+
+        if self._metadata is None:
+            metadata = {}
+            with self._open() as fin:
+                parser = JSONStreamParser(fin)
+                for key in parser.iter_object_keys():
+                    if key != "data":
+                        metadata[key] = parser.read_value()
+                    elif "row_count" in metadata:
+                        break
+                    else:
+                        metadata["row_count"] = sum(1 for _ in parser.iter_array())
+            self._metadata = metadata
+        return self._metadata
+
+    @property
+    def configuration(self) -> Dict[str, Any] | None:
+        return self.metadata.get("configuration")
+
+    def __len__(self) -> int:
+        return self.metadata["row_count"]
+
+    def __iter__(self) -> Iterator[List[Any]]:
+        with self._open() as fin:
+            parser = JSONStreamParser(fin)
+            for key in parser.iter_object_keys():
+                if key == "data":
+                    yield from parser.iter_array()
+                    return
+                parser.read_value()
@@ -30,7 +30,6 @@ from baserow.contrib.database.fields.exceptions import (
 )
 from baserow.contrib.database.rows.actions import ImportRowsActionType
 from baserow.contrib.database.rows.exceptions import ReportMaxErrorCountExceeded
-from baserow.contrib.database.rows.types import FileImportDict
 from baserow.contrib.database.table.actions import CreateTableActionType
 from baserow.contrib.database.table.exceptions import (
     InitialTableDataDuplicateName,
@@ -40,6 +39,7 @@ from baserow.contrib.database.table.exceptions import (
 from baserow.core.action.registries import action_type_registry
 from baserow.core.jobs.registries import JobType
 
+from .data_file import FileImportDataFile
 from .models import FileImportJob
 from .serializers import ReportSerializer
 
@@ -105,12 +105,18 @@ class FileImportJobType(JobType):
 
     def after_job_creation(self, job, values):
         """
-        Save the data file for the newly created job.
+        Save the data file for the newly created job. The rows are stored last so
+        that the row count and the configuration can be read without going through
+        them. See `FileImportDataFile`.
         """
 
         data_file = ContentFile(
             json.dumps(
-                {"data": values["data"], "configuration": values.get("configuration")},
+                {
+                    "row_count": len(values["data"]),
+                    "configuration": values.get("configuration"),
+                    "data": values["data"],
+                },
                 ensure_ascii=False,
             ).encode("utf8")
         )
@@ -163,11 +169,11 @@ class FileImportJobType(JobType):
     def run(self, job, progress):
         """
         Fills the provided table with the normalized data that needs to be created upon
-        creation of the table.
+        creation of the table. The rows are streamed from the data file and imported
+        by chunks to keep the memory usage low for big files.
         """
 
-        with job.data_file.open("r") as fin:
-            data: FileImportDict = json.load(fin)
+        data = FileImportDataFile(job.data_file)
         try:
             if job.table is None:
                 new_table, error_report = action_type_registry.get_by_type(
@@ -176,7 +182,7 @@ class FileImportJobType(JobType):
                     job.user,
                     job.database,
                     name=job.name,
-                    data=data["data"],
+                    data=data,
                     first_row_header=job.first_row_header,
                     progress=progress,
                 )
@@ -189,7 +195,7 @@ class FileImportJobType(JobType):
                 ).do(
                     job.user,
                     table=job.table,
-                    data=data,
+                    data={"data": data, "configuration": data.configuration},
                     progress=progress,
                 )
         # when a job handler fails, celery worker will not commit and `after_commit`
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.14 on 2026-10-17 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0202_table_missing_m2m_indexes_added"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exportjob",
+            name="shard_count",
+            field=models.PositiveSmallIntegerField(
+                default=1,
+                help_text="The number of shards the export has been split into. Every shard is exported by a separate task and merged into the exported file afterwards.",
+            ),
+        ),
+    ]
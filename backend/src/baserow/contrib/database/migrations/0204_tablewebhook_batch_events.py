@@ -0,0 +1,20 @@
+# Generated by Django 5.0.14 on 2026-10-17 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0203_exportjob_shard_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tablewebhook",
+            name="batch_events",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates whether multiple queued events of the same type may be sent together in one request. The request body is then a list of the event payloads.",
+            ),
+        ),
+    ]
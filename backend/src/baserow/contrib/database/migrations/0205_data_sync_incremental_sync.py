@@ -0,0 +1,38 @@
+# Generated by Django 5.0.14 on 2026-10-17 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0204_tablewebhook_batch_events"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="datasync",
+            name="incremental_sync_watermark",
+            field=models.TextField(
+                help_text="The watermark of the source at the moment of the last sync. Only the rows that have changed since this watermark are fetched on the next incremental sync.",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="datasync",
+            name="last_full_sync",
+            field=models.DateTimeField(
+                help_text="Timestamp when all the rows of the table were last synced.",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="postgresqldatasync",
+            name="postgresql_incremental_column",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="Optionally the name of a column that increases when a row is created or updated, like an `updated_at` timestamp. If set, only the rows that have changed since the last sync are fetched.",
+                max_length=255,
+            ),
+        ),
+    ]
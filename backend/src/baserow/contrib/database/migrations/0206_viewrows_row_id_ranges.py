@@ -0,0 +1,66 @@
+# Generated by Django 5.0.14 on 2026-10-17 12:00
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+def compress_row_ids(row_ids):
+    row_id_ranges = []
+    for row_id in sorted(set(row_ids)):
+        if row_id_ranges and row_id_ranges[-1] == row_id - 1:
+            row_id_ranges[-1] = row_id
+        else:
+            row_id_ranges.extend([row_id, row_id])
+    return row_id_ranges
+
+
+def expand_row_id_ranges(row_id_ranges):
+    return [
+        row_id
+        for start, end in zip(row_id_ranges[::2], row_id_ranges[1::2])
+        for row_id in range(start, end + 1)
+    ]
+
+
+def forward(apps, schema_editor):
+    ViewRows = apps.get_model("database", "ViewRows")
+
+    view_rows = ViewRows.objects.order_by("id").iterator(chunk_size=100)
+    for view_rows_instance in view_rows:
+        view_rows_instance.row_id_ranges = compress_row_ids(view_rows_instance.row_ids)
+        view_rows_instance.save(update_fields=["row_id_ranges"])
+
+
+def reverse(apps, schema_editor):
+    ViewRows = apps.get_model("database", "ViewRows")
+
+    view_rows = ViewRows.objects.order_by("id").iterator(chunk_size=100)
+    for view_rows_instance in view_rows:
+        view_rows_instance.row_ids = expand_row_id_ranges(
+            view_rows_instance.row_id_ranges
+        )
+        view_rows_instance.save(update_fields=["row_ids"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0205_data_sync_incremental_sync"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="viewrows",
+            name="row_id_ranges",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.PositiveIntegerField(),
+                default=list,
+                help_text="The rows that are shown in the view, compressed as a flat list of inclusive ranges `[start_1, end_1, start_2, end_2, ...]`. This can be used by webhooks to determine which rows have been changed since the last check.",
+                size=None,
+            ),
+        ),
+        migrations.RunPython(forward, reverse),
+        migrations.RemoveField(
+            model_name="viewrows",
+            name="row_ids",
+        ),
+    ]
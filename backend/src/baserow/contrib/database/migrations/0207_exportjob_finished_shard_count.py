@@ -0,0 +1,20 @@
+# Generated by Django 5.0.14 on 2026-10-17 14:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0206_viewrows_row_id_ranges"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exportjob",
+            name="finished_shard_count",
+            field=models.PositiveSmallIntegerField(
+                default=0,
+                help_text="The number of shards that have been exported. The shard that finishes last starts merging the shard files.",
+            ),
+        ),
+    ]
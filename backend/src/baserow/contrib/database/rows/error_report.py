@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Tuple, TypeVar
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TypeVar
 
 from django.conf import settings
 
@@ -10,24 +10,38 @@ RowIndex = TypeVar("RowIndex", bound=int)
 class RowErrorReport:
     def __init__(
         self,
-        rows: List[Dict[str, Any]],
+        rows: Optional[Iterable[Dict[str, Any]]] = None,
         error_limit: int = settings.BASEROW_MAX_ROW_REPORT_ERROR_COUNT,
     ):
         """
         The RowErrorReport is a helper to track rows errors and generate a report at
-        the end.
+        the end. Big imports can be tracked chunk by chunk with `set_rows`, only the
+        rows of the current chunk are kept while the errors of all the chunks are
+        reported.
 
         :param rows: the rows list.
         :param error_limit: if the error limit is exceeded, an exception is raised.
         """
 
-        self._indexed_rows = {
-            index: {"row": row, "error": None} for index, row in enumerate(rows)
-        }
-        self._rows = rows
+        self._rows: Dict[RowIndex, Dict[str, Any]] = {}
+        self._errors: Dict[RowIndex, Dict[str, Any]] = {}
         self.error_count = 0
         self.error_limit = error_limit
 
+        if rows is not None:
+            self.set_rows(rows)
+
+    def set_rows(self, rows: Iterable[Dict[str, Any]], start_index: RowIndex = 0):
+        """
+        Replaces the tracked rows by the provided chunk of rows.
+
+        :param rows: the rows of the chunk.
+        :param start_index: the index of the first row of the chunk in the whole
+            import.
+        """
+
+        self._rows = {start_index + index: row for index, row in enumerate(rows)}
+
     def add_error(self, row_index: RowIndex, error: Dict[str, Any]):
         """
         Adds an error to the report if the error is truthy.
@@ -42,25 +56,25 @@ class RowErrorReport:
         if self.error_count > self.error_limit:
             raise ReportMaxErrorCountExceeded(self.to_dict())
 
-        self._indexed_rows[row_index]["error"] = error
+        self._errors[row_index] = error
 
     def update_row(self, row_index: RowIndex, new_row: Dict[str, Any]):
-        self._indexed_rows[row_index]["row"] = new_row
+        self._rows[row_index] = new_row
 
     def get_valid_rows_and_mapping(
         self,
     ) -> Tuple[List[Dict[str, Any]], Dict[RowIndex, RowIndex]]:
         """
-        Returns rows without error and the corresponding mapping for
+        Returns the tracked rows without error and the corresponding mapping for
         new original -> original index
         """
 
         valid_rows = []
         mapping = {}
-        for index, _ in enumerate(self._rows):
-            if not self._indexed_rows[index]["error"]:
+        for index, row in self._rows.items():
+            if index not in self._errors:
                 mapping[len(valid_rows)] = index
-                valid_rows.append(self._indexed_rows[index]["row"])
+                valid_rows.append(row)
         return valid_rows, mapping
 
     def to_dict(self) -> Dict[RowIndex, Dict[str, Any]]:
@@ -68,8 +82,4 @@ class RowErrorReport:
         Generates the report as a dict.
         """
 
-        report = {}
-        for index, _ in enumerate(self._rows):
-            if self._indexed_rows[index]["error"]:
-                report[index] = self._indexed_rows[index]["error"]
-        return report
+        return {index: self._errors[index] for index in sorted(self._errors)}
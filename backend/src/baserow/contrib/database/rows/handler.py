@@ -18,6 +18,7 @@ from typing import (
 )
 
 from django import db
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
 from django.db import connection, router, transaction
@@ -31,6 +32,7 @@ from django.utils.encoding import force_str
 from celery.utils import chunks
 from opentelemetry import metrics, trace
 
+from baserow.contrib.database.db.copy import copy_insert
 from baserow.contrib.database.field_rules.handlers import FieldRuleHandler
 from baserow.contrib.database.fields.dependencies.handler import FieldDependencyHandler
 from baserow.contrib.database.fields.dependencies.update_collector import (
@@ -961,7 +963,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         cascade_update = field_rules_handler.collector.get_processed_rows()
 
         fields, dependant_fields = self.update_dependencies_of_rows_created(
-            model, [instance]
+            model, [instance], table=table
         )
 
         self.update_dependencies_of_rows_updated(
@@ -1005,6 +1007,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             fields=fields,
             dependant_fields=dependant_fields,
             before_return=before_return,
+            cascade_update=cascade_update,
         )
 
         return instance
@@ -1301,6 +1304,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         generate_error_report: bool = False,
         skip_search_update: bool = False,
         signal_params: Optional[Dict] = None,
+        use_copy: bool = False,
     ) -> CreatedRowsData:
         """
         Creates new rows for a given table without checking permissions. It also calls
@@ -1322,6 +1326,9 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             cells update later on after many create_rows calls then set this to True
             but make sure you trigger it eventually.
         :param signal_params: Additional parameters that are added to the signal.
+        :param use_copy: If True, the rows are inserted with a `COPY FROM STDIN`
+            statement, which is a lot faster for large batches of rows. Falls back to
+            a regular insert if one of the values can't be copied.
         :return: The created row instances.
 
         """
@@ -1391,7 +1398,10 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         try:
             with transaction.atomic():
-                inserted_rows = model.objects.bulk_create(rows)
+                if use_copy and copy_insert(model, rows):
+                    inserted_rows = rows
+                else:
+                    inserted_rows = model.objects.bulk_create(rows)
         except Exception as exc:
             inserted_rows = []
             if is_unique_violation_error(exc):
@@ -1431,8 +1441,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             through.objects.bulk_create(values)
 
         _, dependant_fields = self.update_dependencies_of_rows_created(
-            model,
-            inserted_rows,
+            model, inserted_rows, table=table
         )
 
         from baserow.contrib.database.views.handler import ViewHandler
@@ -1488,6 +1497,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
                 fields=updated_fields,
                 dependant_fields=dependant_fields,
                 before_return=before_return,
+                cascade_update=cascade_updated,
                 **signal_params,
             )
 
@@ -1565,6 +1575,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         self,
         model: Type[GeneratedTableModel],
         created_rows: List[GeneratedTableModel],
+        table: Optional[Table] = None,
     ) -> List["DjangoField"]:
         """
         Generates a list of dependant fields that need to be updated after the rows have
@@ -1572,11 +1583,14 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         :param model: The model of the table.
         :param rows: The rows that have been created.
+        :param table: The table of the model. If not provided, the table the model
+            has been generated with is used.
         :return: The dependant fields that are updated.
         """
 
         row_ids = [row.id for row in created_rows]
-        table = model.baserow_table
+        if table is None:
+            table = model.baserow_table
         update_collector = FieldUpdateCollector(table, starting_row_ids=row_ids)
 
         field_cache = FieldCache()
@@ -1686,6 +1700,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         table: Table,
         rows: List[Dict[str, Any]],
         progress: Optional[Progress] = None,
+        model: Optional[Type[GeneratedTableModel]] = None,
     ) -> Dict[str, Dict[str, Any]]:
         """
         Validates rows by batch and generates an error report.
@@ -1694,6 +1709,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         :param table: The table for which the rows should be created.
         :param rows: List of rows values for rows that need to be created.
         :param progress: Give a progress instance to track the progress of the import.
+        :param model: Optional model to prevent recomputing table model.
         :return: The error report.
         """
 
@@ -1709,7 +1725,8 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         if progress:
             progress.increment(state=ROW_IMPORT_VALIDATION)
 
-        model = table.get_model()
+        if model is None:
+            model = table.get_model()
         # Use serializer to validate incoming data
         validation_serializer = get_row_serializer_class(model)
         report = {}
@@ -1734,6 +1751,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         progress: Optional[Progress] = None,
         model: Optional[Type[GeneratedTableModel]] = None,
         signal_params: Optional[Dict] = None,
+        skip_search_update: bool = False,
     ) -> Tuple[List[GeneratedTableModel], Dict[str, Dict[str, Any]]]:
         """
         Creates rows by batch and generates an error report instead of failing on first
@@ -1744,6 +1762,8 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         :param rows_values: List of rows values for rows that need to be created.
         :param progress: Give a progress instance to track the progress of the import.
         :param model: Optional model to prevent recomputing table model.
+        :param skip_search_update: If True, the search data of the created rows is
+            not updated. The caller is then responsible for scheduling the update.
         :return: The created rows and the error report.
         """
 
@@ -1777,6 +1797,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
                 # create but instead a single one for this entire table at the end.
                 skip_search_update=True,
                 signal_params=signal_params,
+                use_copy=settings.BASEROW_IMPORT_ROWS_USE_COPY,
             )
 
             for valid_index, field_errors in creation_report.items():
@@ -1789,9 +1810,10 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
             all_created_rows += created_rows
 
-        SearchHandler.schedule_update_search_data(
-            table, row_ids=[r.id for r in all_created_rows]
-        )
+        if not skip_search_update:
+            SearchHandler.schedule_update_search_data(
+                table, row_ids=[r.id for r in all_created_rows]
+            )
 
         return all_created_rows, report
 
@@ -1800,7 +1822,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         user: AbstractUser,
         table: Table,
         rows_values: List[Dict[str, Any]],
-        progress: Progress,
+        progress: Optional[Progress] = None,
         model: Optional[Type[GeneratedTableModel]] = None,
         signal_params: Optional[Dict] = None,
     ) -> Tuple[List[Dict[str, Any] | None], Dict[str, Dict[str, Any]]]:
@@ -1823,7 +1845,8 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         if signal_params is None:
             signal_params = {}
 
-        progress.increment(state=ROW_IMPORT_CREATION)
+        if progress:
+            progress.increment(state=ROW_IMPORT_CREATION)
 
         if model is None:
             model = table.get_model()
@@ -1867,11 +1890,12 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         self,
         user: AbstractUser,
         table: Table,
-        data: list[list[Any]],
+        data: Iterable[list[Any]],
         configuration: FileImportConfiguration | None = None,
         validate: bool = True,
         progress: Optional[Progress] = None,
         send_realtime_update: bool = True,
+        row_count: Optional[int] = None,
     ) -> Tuple[List[GeneratedTableModel], Dict[str, Dict[str, Any]]]:
         """
         Creates new rows for a given table if the user belongs to the related
@@ -1879,17 +1903,23 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         send_realtime_update parameter. The data are validated before the
         creation if validate is True. when a row fails to import, it doesn't
         stop the import. Instead an error report is created with the raised
-        error for each field of each failing rows.
+        error for each field of each failing rows. The data are consumed by
+        chunks of `BATCH_SIZE` rows that are validated and written before the
+        next chunk is read, so the data can be streamed from a file.
 
         :param user: The user of whose behalf the rows are created.
         :param table: The table for which the rows should be created.
-        :param data: List of rows values for rows that need to be created.
+        :param data: List of rows values for rows that need to be created. Any
+            iterable is accepted.
         :param configuration: Optional import configuration dict.
         :param validate: If True the data are validated before the import.
         :param progress: Give a progress instance to track the progress of the
             import.
         :param send_realtime_update: The parameter passed to the rows_created
             signal indicating if a realtime update should be send.
+        :param row_count: The number of rows in the data, used to track the
+            progress. Defaults to `len(data)`, so it must be provided if the
+            data has no length and a progress is given.
 
         :raises InvalidRowLength:
 
@@ -1905,7 +1935,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         )
         model = table.get_model()
 
-        error_report = RowErrorReport(data)
+        error_report = RowErrorReport()
         configuration = configuration or {}
         update_handler = UpsertRowsMappingHandler(
             table=table,
@@ -1924,6 +1954,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             ]
         except ValueError:
             raise FieldNotInTable("The field ID is not found in the table.")
+        skipped_field_names = {field.db_column for field in skipped_fields}
 
         fields = [
             field_object["field"]
@@ -1935,80 +1966,94 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         # Sort by primary first (descending), then by order, then by id
         fields.sort(key=lambda f: (not f.primary, f.order, f.id))
 
-        for index, row in enumerate(data):
-            # Check row length
-            if len(row) > len(fields):
-                error_report.add_error(
-                    index,
-                    {"non_field_errors": ["Too many values in this line."]},
-                )
-            else:
-                new_row = list(row)
-                # Fill incomplete rows with empty values
-                new_row.extend([None] * (len(fields) - len(row)))
-
-                # Reshape data by field as expected by the import
-                error_report.update_row(
-                    index,
-                    {
-                        f"field_{fields[index].id}": value
-                        for index, value in enumerate(new_row)
-                    },
-                )
+        validation_sub_progress = None
+        creation_sub_progress = None
+        if progress:
+            if row_count is None:
+                row_count = len(data)
+            if validate:
+                validation_sub_progress = progress.create_child(50, row_count)
+            creation_sub_progress = progress.create_child(
+                50 if validate else 100, row_count
+            )
 
-        # STEP 1: pre-validate data with serializer
-        if validate:
-            (
-                valid_rows,
-                original_row_index_mapping,
-            ) = error_report.get_valid_rows_and_mapping()
+        # If there's no upsert field selected, all the rows are created.
+        update_map = update_handler.process_map
 
-            validation_sub_progress = (
-                progress.create_child(50, len(valid_rows)) if progress else None
-            )
+        unwritable_field_names = None
+        created_rows = []
+        for chunk_index, chunk in enumerate(grouper(BATCH_SIZE, data)):
+            chunk_start_index = chunk_index * BATCH_SIZE
+            error_report.set_rows(chunk, chunk_start_index)
+
+            for index, row in enumerate(chunk, start=chunk_start_index):
+                # Check row length
+                if len(row) > len(fields):
+                    error_report.add_error(
+                        index,
+                        {"non_field_errors": ["Too many values in this line."]},
+                    )
+                else:
+                    new_row = list(row)
+                    # Fill incomplete rows with empty values
+                    new_row.extend([None] * (len(fields) - len(row)))
+
+                    # Reshape data by field as expected by the import
+                    error_report.update_row(
+                        index,
+                        {
+                            f"field_{fields[index].id}": value
+                            for index, value in enumerate(new_row)
+                        },
+                    )
 
-            validation_report = self.validate_rows(
-                table, valid_rows, progress=validation_sub_progress
-            )
+            # STEP 1: pre-validate data with serializer
+            if validate:
+                (
+                    valid_rows,
+                    original_row_index_mapping,
+                ) = error_report.get_valid_rows_and_mapping()
 
-            for index, error in validation_report.items():
-                error_report.add_error(original_row_index_mapping[int(index)], error)
+                validation_report = self.validate_rows(table, valid_rows, model=model)
 
-        (
-            valid_rows,
-            original_row_index_mapping,
-        ) = error_report.get_valid_rows_and_mapping()
-
-        # STEP 2: create rows in DB
-        creation_sub_progress = (
-            progress.create_child(50 if validate else 100, len(valid_rows))
-            if progress
-            else None
-        )
-
-        # Make sure to exclude fields that cannot be written by the user.
-        # NOTE: all rows contain the same fields, so we can just check the first one
-        unwritable_fields = self._check_write_fields_values_permissions(
-            user, model, valid_rows[:1], raise_if_not_permitted=False
-        )
-        unwritable_field_names = set(f.db_column for f in unwritable_fields)
-        valid_rows = [
-            {k: v for k, v in row.items() if k not in unwritable_field_names}
-            for row in valid_rows
-        ]
+                for index, error in validation_report.items():
+                    error_report.add_error(
+                        original_row_index_mapping[int(index)], error
+                    )
 
-        # split rows to insert and update lists. If there's no upsert field selected,
-        # this will not populate rows_values_to_update.
-        update_map = update_handler.process_map
+                if validation_sub_progress:
+                    validation_sub_progress.increment(
+                        len(chunk), state=ROW_IMPORT_VALIDATION
+                    )
 
-        rows_values_to_create = []
-        rows_values_to_update = []
-        if update_map:
-            skipped_field_names = set()
+            (
+                valid_rows,
+                original_row_index_mapping,
+            ) = error_report.get_valid_rows_and_mapping()
 
-            if skipped_fields:
-                skipped_field_names = {field.db_column for field in skipped_fields}
+            # STEP 2: create rows in DB
 
+            # Make sure to exclude fields that cannot be written by the user.
+            # NOTE: all rows contain the same fields, so we can just check the first
+            # one of the import.
+            if unwritable_field_names is None and valid_rows:
+                unwritable_fields = self._check_write_fields_values_permissions(
+                    user, model, valid_rows[:1], raise_if_not_permitted=False
+                )
+                unwritable_field_names = set(f.db_column for f in unwritable_fields)
+
+            if unwritable_field_names:
+                valid_rows = [
+                    {k: v for k, v in row.items() if k not in unwritable_field_names}
+                    for row in valid_rows
+                ]
+
+            # split rows to insert and update lists, keeping track of the import
+            # index of every row to report the errors.
+            rows_values_to_create = []
+            create_row_index_mapping = {}
+            rows_values_to_update = []
+            update_row_index_mapping = {}
             for current_idx, import_idx in original_row_index_mapping.items():
                 row = valid_rows[current_idx]
                 if update_idx := update_map.get(import_idx):
@@ -2020,42 +2065,45 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
                         k: v for k, v in row.items() if k not in skipped_field_names
                     }
                     filtered_row["id"] = update_idx
+                    update_row_index_mapping[len(rows_values_to_update)] = import_idx
                     rows_values_to_update.append(filtered_row)
                 else:
+                    create_row_index_mapping[len(rows_values_to_create)] = import_idx
                     rows_values_to_create.append(row)
-        else:
-            rows_values_to_create = valid_rows
-
-        created_rows, creation_report = self.force_create_rows_by_batch(
-            user,
-            table,
-            rows_values_to_create,
-            progress=creation_sub_progress,
-            model=model,
-        )
 
-        if rows_values_to_update:
-            updated_rows, updated_report = self.force_update_rows_by_batch(
+            chunk_created_rows, creation_report = self.force_create_rows_by_batch(
                 user,
                 table,
-                rows_values_to_update,
-                progress=creation_sub_progress,
+                rows_values_to_create,
                 model=model,
+                # A single search update is scheduled for all the created rows at
+                # the end of the import.
+                skip_search_update=True,
             )
+            created_rows += chunk_created_rows
+
+            # Add errors to global report
+            for index, error in creation_report.items():
+                error_report.add_error(create_row_index_mapping[int(index)], error)
+
+            if rows_values_to_update:
+                _, updated_report = self.force_update_rows_by_batch(
+                    user,
+                    table,
+                    rows_values_to_update,
+                    model=model,
+                )
 
-        # Add errors to global report
-        for index, error in creation_report.items():
-            error_report.add_error(
-                original_row_index_mapping[int(index)],
-                error,
-            )
+                for index, error in updated_report.items():
+                    error_report.add_error(update_row_index_mapping[int(index)], error)
 
-        if rows_values_to_update:
-            for index, error in updated_report.items():
-                error_report.add_error(
-                    original_row_index_mapping[int(index)],
-                    error,
-                )
+            if creation_sub_progress:
+                creation_sub_progress.increment(len(chunk), state=ROW_IMPORT_CREATION)
+
+        if created_rows:
+            SearchHandler.schedule_update_search_data(
+                table, row_ids=[r.id for r in created_rows]
+            )
 
         if send_realtime_update:
             # Just send a single table_updated here as realtime update instead
@@ -4,7 +4,11 @@ from baserow.contrib.database.search.handler import SearchHandler
 from baserow.contrib.database.table.models import GeneratedTableModel, Table
 from baserow.contrib.database.views.signals import view_loaded
 from baserow.core.models import Workspace
-from baserow.core.trash.signals import before_permanently_deleted, permanently_deleted
+from baserow.core.trash.signals import (
+    before_items_permanently_deleted,
+    before_permanently_deleted,
+    permanently_deleted,
+)
 
 
 @receiver(permanently_deleted, sender="workspace")
@@ -94,6 +98,46 @@ def handle_permanently_deleted_rows(
         SearchHandler.delete_workspace_search_table_if_exists(workspace_id)
 
 
+@receiver(before_items_permanently_deleted, sender="row")
+def handle_many_permanently_deleted_rows(
+    sender, trash_item_ids, trash_items, parent_id, *args, **kwargs
+):
+    """
+    When multiple rows of a table are permanently deleted at once, then the search
+    data of those rows should be cleaned from the search data table.
+    """
+
+    table = trash_items[0].baserow_table
+    if SearchHandler.full_text_enabled():
+        SearchHandler.mark_search_data_for_deletion(table, row_ids=trash_item_ids)
+    else:  # we can drop the entire search table if exists
+        workspace_id = table.database.workspace_id
+        SearchHandler.delete_workspace_search_table_if_exists(workspace_id)
+
+
+@receiver(before_items_permanently_deleted, sender="rows")
+def handle_many_permanently_deleted_trashed_rows(
+    sender, trash_item_ids, trash_items, parent_id, *args, **kwargs
+):
+    """
+    When multiple sets of rows of a table are permanently deleted at once, then the
+    search data of all those rows should be cleaned from the search data table.
+    """
+
+    row_ids = [
+        row_id for trashed_rows in trash_items for row_id in trashed_rows.row_ids
+    ]
+    if not row_ids:
+        return
+
+    table = trash_items[0].table
+    if SearchHandler.full_text_enabled():
+        SearchHandler.mark_search_data_for_deletion(table, row_ids=row_ids)
+    else:  # we can drop the entire search table if exists
+        workspace_id = table.database.workspace_id
+        SearchHandler.delete_workspace_search_table_if_exists(workspace_id)
+
+
 @receiver(view_loaded)
 def view_loaded_schedule_update_search_data(
     sender,
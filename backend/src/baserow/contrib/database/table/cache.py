@@ -12,23 +12,39 @@ When we construct a model we:
 3. Check if the version in the cache matches the latest table version in the db.
 4. If they differ, re-query for all the fields and save them in the cache.
 5. If they are the same use the cached field attrs.
+
+On top of that, every process keeps the most recently used fully generated model
+classes in memory, see `GeneratedModelsLRUCache`. A cached model class is only used if
+the table version still matches, and it's evicted when one of the tables the model
+depends on is invalidated, in any process, via Redis pub/sub.
 """
+import threading
+import time
 import typing
 import uuid
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple, Type
 
 from django.conf import settings
 from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+
+from django_redis import get_redis_connection
+from loguru import logger
 
 from baserow.core.cache import local_cache
 from baserow.version import VERSION as BASEROW_VERSION
 
 if typing.TYPE_CHECKING:
-    from baserow.contrib.database.table.models import Table
+    from baserow.contrib.database.table.models import GeneratedTableModel, Table
 
 generated_models_cache = caches[settings.GENERATED_MODEL_CACHE_NAME]
 
+GENERATED_MODELS_INVALIDATION_CHANNEL = (
+    f"baserow-generated-models-invalidation-{BASEROW_VERSION}"
+)
+
 
 def table_model_cache_entry_key(table_id: int) -> str:
     return f"full_table_model_{table_id}_{BASEROW_VERSION}"
@@ -53,6 +69,167 @@ def set_cached_model_field_attrs(table: "Table", field_attrs: Dict[str, Any]):
     )
 
 
+class GeneratedModelsLRUCache:
+    """
+    A bounded, thread safe and process local cache of fully generated table model
+    classes, so that the model of a frequently used table doesn't have to be fetched
+    from the generated models cache and constructed on every request.
+
+    An entry is keyed by the table id and is only returned if it has been generated
+    for the current table version. A model class also contains the models of the
+    tables it links to, so an entry is evicted when any of those tables is
+    invalidated. Other processes are notified of invalidations via Redis pub/sub. As
+    long as this process isn't subscribed, nothing is cached because invalidations
+    could be missed.
+    """
+
+    def __init__(self):
+        self._entries: OrderedDict[
+            int, Tuple[str, Set[int], Type["GeneratedTableModel"]]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        # Every invalidation increments the sequence. A model is only added if none
+        # of its tables have been invalidated since its generation started.
+        self._sequence = 0
+        self._invalidated_at: Dict[int, int] = {}
+        self._listener: Optional[threading.Thread] = None
+        self._listening = False
+
+    @property
+    def max_size(self) -> int:
+        return settings.BASEROW_GENERATED_MODELS_LRU_CACHE_SIZE
+
+    @property
+    def enabled(self) -> bool:
+        if self.max_size <= 0 or settings.BASEROW_DISABLE_MODEL_CACHE:
+            return False
+        if settings.TESTS:
+            return True
+        self._ensure_listener()
+        return self._listening
+
+    def get_sequence(self) -> int:
+        """
+        Returns the current invalidation sequence. It must be obtained before the
+        generation of a model starts and passed into `set`.
+        """
+
+        return self._sequence
+
+    def get(self, table: "Table") -> Optional[Type["GeneratedTableModel"]]:
+        with self._lock:
+            entry = self._entries.get(table.id)
+            if entry is None:
+                return None
+            version, _, model = entry
+            if version != table.version:
+                del self._entries[table.id]
+                return None
+            self._entries.move_to_end(table.id)
+            return model
+
+    def set(
+        self,
+        table: "Table",
+        model: Type["GeneratedTableModel"],
+        sequence: int,
+    ):
+        table_ids = {
+            baserow_model.baserow_table_id
+            for baserow_model in model.baserow_models.values()
+            if getattr(baserow_model, "_generated_table_model", False)
+        } | {table.id}
+
+        with self._lock:
+            if any(self._invalidated_at.get(i, 0) > sequence for i in table_ids):
+                return
+
+            self._entries[table.id] = (table.version, table_ids, model)
+            self._entries.move_to_end(table.id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, table_id: int):
+        """
+        Evicts the model of the table and all the models that depend on it.
+        """
+
+        with self._lock:
+            self._sequence += 1
+            self._invalidated_at[table_id] = self._sequence
+            for key in [
+                key
+                for key, (_, table_ids, _) in self._entries.items()
+                if table_id in table_ids
+            ]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._sequence += 1
+            self._invalidated_at.clear()
+            self._entries.clear()
+
+    def publish_invalidation(self, table_id: int):
+        """
+        Invalidates the table in this process and notifies all the other processes.
+        """
+
+        self.invalidate(table_id)
+        if self.max_size <= 0 or settings.TESTS:
+            return
+
+        try:
+            get_redis_connection("default").publish(
+                GENERATED_MODELS_INVALIDATION_CHANNEL, str(table_id)
+            )
+        except Exception as exc:
+            logger.warning(
+                "Could not publish the generated model invalidation of table {}: {}",
+                table_id,
+                exc,
+            )
+
+    def _ensure_listener(self):
+        if self._listener is not None and self._listener.is_alive():
+            return
+
+        with self._lock:
+            if self._listener is None or not self._listener.is_alive():
+                # The listener isn't running after a fork, so the inherited state
+                # can't be trusted.
+                self._listening = False
+                self._entries.clear()
+                self._listener = threading.Thread(
+                    target=self._listen,
+                    name="generated-models-invalidation-listener",
+                    daemon=True,
+                )
+                self._listener.start()
+
+    def _listen(self):
+        while True:
+            try:
+                pubsub = get_redis_connection("default").pubsub(
+                    ignore_subscribe_messages=True
+                )
+                pubsub.subscribe(GENERATED_MODELS_INVALIDATION_CHANNEL)
+                self._listening = True
+                for message in pubsub.listen():
+                    self.invalidate(int(message["data"]))
+            except Exception as exc:
+                logger.warning(
+                    "Generated models invalidation listener disconnected: {}", exc
+                )
+            # Invalidations could have been missed while not being subscribed.
+            self._listening = False
+            self.clear()
+            time.sleep(1)
+
+
+generated_models_lru_cache = GeneratedModelsLRUCache()
+
+
 def clear_generated_model_cache():
     print("Clearing Baserow's internal generated model cache...")
     if hasattr(generated_models_cache, "delete_pattern"):
@@ -64,6 +241,7 @@ def clear_generated_model_cache():
         raise ImproperlyConfigured(
             "Baserow must be run with a redis cache outside of " "tests."
         )
+    generated_models_lru_cache.clear()
     print("Done clearing cache.")
 
 
@@ -77,6 +255,14 @@ def invalidate_table_in_model_cache(table_id: int):
     # Delete model local cache
     local_cache.delete(f"database_table_model_{table_id}*")
 
+    # The model classes in memory are evicted right away, and again in all processes
+    # after the commit, so that a model generated in the meantime, based on the old
+    # state of a linked table, doesn't stay cached.
+    generated_models_lru_cache.invalidate(table_id)
+    transaction.on_commit(
+        lambda: generated_models_lru_cache.publish_invalidation(table_id)
+    )
+
     if settings.BASEROW_DISABLE_MODEL_CACHE:
         return None
 
@@ -1,9 +1,10 @@
 import traceback
-from typing import Any, Dict, List, NewType, Optional, Tuple, cast
+from collections import defaultdict
+from typing import Any, Collection, Dict, Iterator, List, NewType, Optional, Tuple, cast
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
-from django.db import DatabaseError, IntegrityError
+from django.db import DatabaseError, IntegrityError, transaction
 from django.db.models import Q, QuerySet, Sum
 from django.db.models.functions import Coalesce, Now
 from django.utils import translation
@@ -41,6 +42,7 @@ from baserow.core.handler import CoreHandler
 from baserow.core.registries import ImportExportConfig, application_type_registry
 from baserow.core.telemetry.utils import baserow_trace_methods
 from baserow.core.trash.handler import TrashHandler
+from baserow.core.usage.handler import UsageHandler
 from baserow.core.usage.registries import USAGE_UNIT_MB
 from baserow.core.user_files.models import UserFile
 from baserow.core.utils import ChildProgressBuilder, Progress, find_unused_name, grouper
@@ -109,6 +111,30 @@ class TableUsageHandler:
 
             raise integrity_exc
 
+    @classmethod
+    def get_table_row_count(cls, table_id: int) -> Optional[int]:
+        """
+        Returns the row count of the table based on the last calculated table usage
+        and the row count changes that have been recorded since then. The changes are
+        recorded asynchronously, so the result should be considered an estimation.
+
+        :param table_id: The id of the table to get the row count for.
+        :return: The row count or None if the table usage has not been calculated yet.
+        """
+
+        row_count = (
+            TableUsage.objects.filter(table_id=table_id)
+            .values_list("row_count", flat=True)
+            .first()
+        )
+        if row_count is None:
+            return None
+
+        row_count_change = TableUsageUpdate.objects.filter(
+            table_id=table_id, row_count__isnull=False
+        ).aggregate(total=Coalesce(Sum("row_count"), 0))["total"]
+        return max(row_count + row_count_change, 0)
+
     @classmethod
     def create_tables_usage_for_new_database(cls, database_id: int):
         """
@@ -160,34 +186,83 @@ class TableUsageHandler:
     def _bulk_create_or_update(cls, table_ids: List[int]) -> List[TableUsage]:
         """
         Creates or updates the table usage for the provided table ids. It uses
-        `bulk_create` to do this in a single query.
+        `bulk_create` to do this in a single query. The change of the storage usage
+        is folded into the storage usage of the workspaces in the same transaction,
+        so that it's never applied twice if the update is interrupted.
 
         :param table_ids: The ids of the tables that need to be updated.
         :return: The list of created or updated TableUsage objects.
         """
 
+        storage_usages = {
+            table_id: cls.calculate_table_storage_usage(table_id)
+            for table_id in table_ids
+        }
+
         entries = []
         for table_id in table_ids:
             table_usage = TableUsage(
                 table_id=table_id,
                 row_count=BaserowTableRowCount(table_id),
                 row_count_updated_at=Now(),
-                storage_usage=cls.calculate_table_storage_usage(table_id),
+                storage_usage=storage_usages[table_id],
                 storage_usage_updated_at=Now(),
             )
             entries.append(table_usage)
 
-        return TableUsage.objects.bulk_create(
-            entries,
-            update_conflicts=True,
-            update_fields=[
-                "row_count",
-                "row_count_updated_at",
-                "storage_usage",
-                "storage_usage_updated_at",
-            ],
-            unique_fields=["table_id"],
-        )
+        with transaction.atomic():
+            # Lock the previous usages, so that the change is computed against the
+            # usage that's being replaced, even if the tables are updated
+            # concurrently.
+            previous_storage_usages = dict(
+                TableUsage.objects.select_for_update()
+                .filter(table_id__in=table_ids)
+                .values_list("table_id", "storage_usage")
+            )
+            cls._update_workspaces_storage_usage(
+                storage_usages, previous_storage_usages
+            )
+
+            return TableUsage.objects.bulk_create(
+                entries,
+                update_conflicts=True,
+                update_fields=[
+                    "row_count",
+                    "row_count_updated_at",
+                    "storage_usage",
+                    "storage_usage_updated_at",
+                ],
+                unique_fields=["table_id"],
+            )
+
+    @classmethod
+    def _update_workspaces_storage_usage(
+        cls,
+        storage_usages: Dict[int, int],
+        previous_storage_usages: Dict[int, Optional[int]],
+    ):
+        """
+        Folds the change of the storage usage of the tables into the storage usage
+        of their workspaces, so that the workspaces don't have to be fully
+        recalculated. Only the tables that count towards the storage usage of the
+        workspace, so the ones that are not trashed, are taken into account.
+
+        :param storage_usages: A dict where the key is the id of the table and the
+            value the new storage usage in MB.
+        :param previous_storage_usages: A dict where the key is the id of the table
+            and the value the previous storage usage in MB, if it was calculated.
+        """
+
+        deltas = defaultdict(int)
+        tables = TableHandler.get_tables().filter(id__in=storage_usages.keys())
+        for table_id, workspace_id in tables.values_list(
+            "id", "database__workspace_id"
+        ):
+            deltas[workspace_id] += storage_usages[table_id] - (
+                previous_storage_usages.get(table_id) or 0
+            )
+
+        UsageHandler.update_workspaces_storage_usage(deltas)
 
     @classmethod
     def _create_missing_tables_usage(
@@ -220,7 +295,9 @@ class TableUsageHandler:
     ) -> int:
         """
         Recalculates the row count and storage usage for the tables that have changed
-        and have a TableUsageUpdate entry, and then delete them.
+        and have a TableUsageUpdate entry, and then delete them. Every chunk is
+        processed in a single transaction, so that the entries are only deleted if
+        the usage has been updated.
 
         :param usage_update_qs: The queryset containing the table usage updates that
             need to be processed.
@@ -235,8 +312,9 @@ class TableUsageHandler:
         ):
             table_ids = [u["table_id"] for u in chunk]
 
-            cls._bulk_create_or_update(table_ids)
-            TableUsageUpdate.objects.filter(table_id__in=table_ids).delete()
+            with transaction.atomic():
+                cls._bulk_create_or_update(table_ids)
+                TableUsageUpdate.objects.filter(table_id__in=table_ids).delete()
 
             total_tables_counted += len(table_ids)
 
@@ -367,7 +445,7 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         user: AbstractUser,
         database: Database,
         name: str,
-        data: Optional[List[List[Any]]] = None,
+        data: Optional[Collection[List[Any]]] = None,
         first_row_header: bool = True,
         fill_example: bool = False,
         progress: Optional[Progress] = None,
@@ -382,7 +460,9 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         :param database: The database that the table instance belongs to.
         :param name: The name of the table is created.
         :param data: A list containing all the rows that need to be inserted is
-            expected. All the values will be inserted in the database.
+            expected. All the values will be inserted in the database. Any sized
+            iterable that can be iterated several times is accepted, so that the
+            rows don't have to be loaded in memory at once.
         :param first_row_header: Indicates if the first row are the fields. The names
             of these rows are going to be used as fields. If `fields` is provided,
             this options is ignored.
@@ -403,6 +483,7 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
             progress.increment(0, state=TABLE_CREATION)
 
         if data is not None:
+            row_count = len(data) - 1 if first_row_header else len(data)
             (
                 fields,
                 data,
@@ -415,6 +496,7 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
                     fields, data = self.get_example_table_field_and_data()
                 else:
                     fields, data = self.get_minimal_table_field_and_data()
+            row_count = len(data)
 
         table = self.create_table_and_fields(user, database, name, fields)
 
@@ -422,6 +504,7 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
             user,
             table,
             data=data,
+            row_count=row_count,
             progress=progress,
             send_realtime_update=False,
         )
@@ -496,13 +579,16 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         return table
 
     def normalize_initial_table_data(
-        self, data: List[List[Any]], first_row_header: bool
-    ) -> Tuple[List, List]:
+        self, data: Collection[List[Any]], first_row_header: bool
+    ) -> Tuple[List, Iterator[List[str]]]:
         """
         Normalizes the provided initial table data. The amount of columns will be made
-        equal for each row. The header and the rows will also be separated.
+        equal for each row. The header and the rows will also be separated. The rows
+        are normalized lazily while iterating over the result, so that big data
+        doesn't have to be copied in memory.
 
-        :param data: A list containing all the provided rows.
+        :param data: A list containing all the provided rows. Any sized iterable that
+            can be iterated several times is accepted.
         :param first_row_header: Indicates if the first row is the header. For each
             of these header columns a field is going to be created.
         :raises InvalidInitialTableData: When the data doesn't contain a column or row.
@@ -511,8 +597,8 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         :raises ReservedBaserowFieldNameException: When the field name is reserved by
             Baserow.
         :raises InvalidBaserowFieldName: When the field name is invalid (empty).
-        :return: A list containing the field names with a type and a list containing all
-            the rows.
+        :return: A list containing the field names with a type and an iterator over
+            all the rows.
         """
 
         if len(data) == 0:
@@ -525,12 +611,13 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
                 f"{settings.INITIAL_TABLE_DATA_LIMIT} rows when creating a table."
             )
 
-        largest_column_count = len(max(data, key=len))
+        largest_column_count = max(len(row) for row in data)
 
         if largest_column_count == 0:
             raise InvalidInitialTableData("At least one column should be provided.")
 
-        fields = data.pop(0) if first_row_header else []
+        rows = iter(data)
+        fields = list(next(rows)) if first_row_header else []
 
         for i in range(len(fields), largest_column_count):
             fields.append(_("Field %d") % (i + 1,))
@@ -561,7 +648,7 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
             raise InvalidBaserowFieldName()
 
         fields_with_type = [(field_name, "text", {}) for field_name in fields]
-        result = [[str(value) for value in row] for row in data]
+        result = ([str(value) for value in row] for row in rows)
 
         return fields_with_type, result
 
@@ -768,6 +855,7 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
             include_permission_data=True,
             reduce_disk_space_usage=False,
             is_duplicate=True,
+            copy_rows_in_database=True,
         )
 
         serialized_tables = database_type.export_tables_serialized([table], config)
@@ -43,6 +43,7 @@ from baserow.contrib.database.search.handler import (
     SearchMode,
 )
 from baserow.contrib.database.table.cache import (
+    generated_models_lru_cache,
     get_cached_model_field_attrs,
     set_cached_model_field_attrs,
 )
@@ -1000,6 +1001,32 @@ class Table(
         :rtype: Model
         """
 
+        use_lru_cache = (
+            use_cache
+            and not fields
+            and field_ids is None
+            and field_names is None
+            and add_dependencies is True
+            and attribute_names is False
+            and manytomany_models is None
+            and managed is False
+            and app_label is None
+            and generated_models_lru_cache.enabled
+        )
+        if use_lru_cache:
+            local_cache.get(
+                f"database_table_model_{self.id}_refreshed",
+                lambda: self.refresh_from_db(fields=["version"]),
+            )
+            # The cached model class is shared by all the threads of the process, so
+            # it must not be mutated. Its `baserow_table` remains the instance it
+            # was generated with, callers that need their own instance must use it
+            # instead.
+            model = generated_models_lru_cache.get(self)
+            if model is not None:
+                return model
+            lru_cache_sequence = generated_models_lru_cache.get_sequence()
+
         if app_label is None:
             # Generate a unique app_label to make the generation of the model thread
             # safe. Related fields generate pending operations in the `apps`
@@ -1160,6 +1187,9 @@ class Table(
         if not manytomany_models:
             self._after_model_generation(attrs, model)
 
+        if use_lru_cache:
+            generated_models_lru_cache.set(self, model, lru_cache_sequence)
+
         return model
 
     def _add_needs_background_update_column(self, field_attrs, indexes):
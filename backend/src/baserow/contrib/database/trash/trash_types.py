@@ -32,6 +32,7 @@ from baserow.core.exceptions import TrashItemDoesNotExist
 from baserow.core.models import TrashEntry
 from baserow.core.trash.exceptions import RelatedTableTrashedException
 from baserow.core.trash.registries import TrashableItemType
+from baserow.core.usage.handler import UsageHandler
 
 from ..fields.operations import RestoreFieldOperationType
 from ..rows.operations import RestoreDatabaseRowOperationType
@@ -46,6 +47,7 @@ User = get_user_model()
 class TableTrashableItemType(TrashableItemType):
     type = "table"
     model_class = Table
+    permanent_deletion_order = 20
 
     def get_parent(self, trashed_item: Any) -> Optional[Any]:
         return trashed_item.database
@@ -96,6 +98,9 @@ class TableTrashableItemType(TrashableItemType):
 
     def restore(self, trashed_item: Table, trash_entry: TrashEntry):
         super().restore(trashed_item, trash_entry)
+        UsageHandler.mark_workspace_for_storage_usage_update(
+            trashed_item.database.workspace_id
+        )
 
         field_cache = FieldCache()
         field_handler = FieldHandler()
@@ -179,6 +184,9 @@ class TableTrashableItemType(TrashableItemType):
         update_collector.send_additional_field_updated_signals()
 
         super().trash(table_to_trash, requesting_user, trash_entry)
+        UsageHandler.mark_workspace_for_storage_usage_update(
+            table_to_trash.database.workspace_id
+        )
 
         # Since link_row can link this table without creating the reverse relation,
         # we need to be sure to trash that fields manually.
@@ -268,6 +276,7 @@ class FieldTrashableItemType(TrashableItemType):
 class RowTrashableItemType(TrashableItemType):
     type = "row"
     model_class = GeneratedTableModel
+    supports_batch_permanent_deletion = True
 
     @property
     def requires_parent_id(self) -> bool:
@@ -308,7 +317,7 @@ class RowTrashableItemType(TrashableItemType):
         updated_fields = [f["field"] for f in model._field_objects.values()]
 
         _, dependant_fields = RowHandler().update_dependencies_of_rows_created(
-            model, rows_to_restore
+            model, rows_to_restore, table=table
         )
 
         ViewHandler().field_value_updated(updated_fields + dependant_fields)
@@ -334,6 +343,19 @@ class RowTrashableItemType(TrashableItemType):
         ).delete()
         row.delete()
 
+    def permanently_delete_items(self, rows, trash_item_lookup_cache=None):
+        """
+        Deletes the provided rows, which all belong to the same table, with one
+        statement per related table instead of one per row.
+        """
+
+        table_id = rows[0].baserow_table_id
+        row_ids = [row.id for row in rows]
+        RichTextFieldMention.objects.filter(
+            table_id=table_id, row_id__in=row_ids
+        ).delete()
+        type(rows[0]).objects_and_trash.filter(id__in=row_ids).delete()
+
     def lookup_trashed_item(
         self, trashed_entry: TrashEntry, trash_item_lookup_cache=None
     ):
@@ -348,27 +370,49 @@ class RowTrashableItemType(TrashableItemType):
         :return: An instance of the model_class with trashed_item_id
         """
 
-        # Cache the expensive table.get_model function call if we are looking up
-        # many trash items at once.
-        if trash_item_lookup_cache is not None:
-            model_cache = trash_item_lookup_cache.setdefault(
-                "row_table_model_cache", {}
-            )
-            try:
-                model = model_cache[trashed_entry.parent_trash_item_id]
-            except KeyError:
-                model = model_cache.setdefault(
-                    trashed_entry.parent_trash_item_id,
-                    self._get_table_model(trashed_entry.parent_trash_item_id),
-                )
-        else:
-            model = self._get_table_model(trashed_entry.parent_trash_item_id)
+        model = self._get_cached_table_model(
+            trashed_entry.parent_trash_item_id, trash_item_lookup_cache
+        )
 
         try:
             return model.trash.get(id=trashed_entry.trash_item_id)
         except model.DoesNotExist:
             raise TrashItemDoesNotExist()
 
+    def lookup_trashed_items(
+        self, trashed_entries: List[TrashEntry], trash_item_lookup_cache=None
+    ):
+        """
+        Returns the trashed rows of the provided entries, which all belong to the
+        same table, with a single query.
+
+        :param trashed_entries: The entries to get the real trashed instances for.
+        :param trash_item_lookup_cache: A cache dict used to store the generated models
+            for a given table.
+        :return: The trashed rows that still exist.
+        """
+
+        model = self._get_cached_table_model(
+            trashed_entries[0].parent_trash_item_id, trash_item_lookup_cache
+        )
+        return list(
+            model.trash.filter(
+                id__in=[entry.trash_item_id for entry in trashed_entries]
+            )
+        )
+
+    def _get_cached_table_model(self, table_id, trash_item_lookup_cache=None):
+        # Cache the expensive table.get_model function call if we are looking up
+        # many trash items at once.
+        if trash_item_lookup_cache is None:
+            return self._get_table_model(table_id)
+
+        model_cache = trash_item_lookup_cache.setdefault("row_table_model_cache", {})
+        try:
+            return model_cache[table_id]
+        except KeyError:
+            return model_cache.setdefault(table_id, self._get_table_model(table_id))
+
     def _get_table_model(self, table_id):
         table = self._get_table(table_id)
         return table.get_model()
@@ -383,6 +427,7 @@ class RowTrashableItemType(TrashableItemType):
 class RowsTrashableItemType(TrashableItemType):
     type = "rows"
     model_class = TrashedRows
+    supports_batch_permanent_deletion = True
 
     @property
     def requires_parent_id(self) -> bool:
@@ -431,7 +476,7 @@ class RowsTrashableItemType(TrashableItemType):
 
         updated_fields = [f["field"] for f in model._field_objects.values()]
         _, dependant_fields = RowHandler().update_dependencies_of_rows_created(
-            model, rows_to_restore
+            model, rows_to_restore, table=table
         )
 
         ViewHandler().field_value_updated(updated_fields + dependant_fields)
@@ -484,6 +529,31 @@ class RowsTrashableItemType(TrashableItemType):
         except TrashedRows.DoesNotExist:
             raise TrashItemDoesNotExist()
 
+    def permanently_delete_items(self, trashed_items, trash_item_lookup_cache=None):
+        """
+        Deletes the rows of all the provided trashed rows, which all belong to the
+        same table, at once.
+        """
+
+        table_id = trashed_items[0].table_id
+        row_ids = [row_id for item in trashed_items for row_id in item.row_ids]
+        table_model = self._get_table_model(table_id)
+        delete_qs = table_model.objects_and_trash.filter(id__in=row_ids)
+        delete_qs._raw_delete(using=router.db_for_write(delete_qs.model))
+        TrashedRows.objects.filter(id__in=[item.id for item in trashed_items]).delete()
+        RichTextFieldMention.objects.filter(
+            table_id=table_id, row_id__in=row_ids
+        ).delete()
+
+    def lookup_trashed_items(
+        self, trashed_entries: List[TrashEntry], trash_item_lookup_cache=None
+    ):
+        return list(
+            TrashedRows.objects.filter(
+                id__in=[entry.trash_item_id for entry in trashed_entries]
+            )
+        )
+
     def _get_table_model(self, table_id):
         table = self._get_table(table_id)
         return table.get_model()
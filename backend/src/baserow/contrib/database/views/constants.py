@@ -0,0 +1,17 @@
+from enum import Enum
+
+
+class RowCountStrategy(str, Enum):
+    # Counts the rows of the queryset with an exact `COUNT(*)` on every request.
+    EXACT = "exact"
+
+    # Returns the row count of the table usage, or the estimation of the PostgreSQL
+    # planner if the view is filtered. Small counts are still counted exactly.
+    ESTIMATED = "estimated"
+
+    # Counts the rows exactly, but reuses the count until the data of the table
+    # changes or the cache expires.
+    CACHED = "cached"
+
+
+ALL_ROW_COUNT_STRATEGIES = [strategy.value for strategy in RowCountStrategy]
@@ -125,6 +125,13 @@ class AggregationTypeAlreadyRegistered(InstanceTypeAlreadyRegistered):
     """Raised when trying to register an aggregation type that exists already."""
 
 
+class AggregationDeltaNotApplicable(Exception):
+    """
+    Raised when a cached aggregation value can't be updated incrementally and must be
+    recomputed instead.
+    """
+
+
 class DecoratorValueProviderTypeDoesNotExist(InstanceTypeDoesNotExist):
     """Raised when trying to get a decorator value provider type that does not exist."""
 
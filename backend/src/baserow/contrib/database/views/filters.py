@@ -1,3 +1,4 @@
+import hashlib
 import json
 from dataclasses import dataclass
 from typing import Dict, Iterable, Literal, Optional
@@ -25,6 +26,23 @@ def sanitize_adhoc_filter_values(values: Iterable[str]):
     return [sanitize_adhoc_filter_value(val) for val in values]
 
 
+def _normalize_filter_tree(value):
+    """
+    Returns a representation of a filter tree that doesn't depend on the order of its
+    keys and lists, because the filters in a group are combined with the same
+    operator and their order doesn't change the result.
+    """
+
+    if isinstance(value, dict):
+        return {str(k): _normalize_filter_tree(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return sorted(
+            (_normalize_filter_tree(v) for v in value),
+            key=lambda v: json.dumps(v, sort_keys=True, default=str),
+        )
+    return value
+
+
 @dataclass
 class AdHocFilters:
     """Dataclass that can hold data for basic and grouped filters at the same time."""
@@ -164,6 +182,32 @@ class AdHocFilters:
     def has_any_filters(self):
         return self.api_filters or self.has_simple_filters
 
+    def get_hash(self) -> str:
+        """
+        Returns a hash of the normalized filters which is the same for equivalent
+        filters, regardless of the order in which they were provided. It can be used
+        to cache results computed with these filters.
+        """
+
+        if self.api_filters:
+            filters = {"api_filters": self.api_filters}
+        else:
+            filters = {
+                "filter_type": self.filter_type,
+                "filters": {
+                    key: value
+                    for key, value in (self.filter_object or {}).items()
+                    if key.startswith("filter__")
+                },
+            }
+        filters["user_field_names"] = self.user_field_names
+        filters["only_filter_by_field_ids"] = self.only_filter_by_field_ids
+
+        serialized = json.dumps(
+            _normalize_filter_tree(filters), sort_keys=True, default=str
+        )
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
     def apply_to_queryset(self, model, queryset):
         if self.api_filters and len(self.api_filters):
             filter_builder = construct_filter_builder_from_grouped_api_filters(
@@ -1,5 +1,6 @@
 import dataclasses
 import itertools
+import json
 import re
 import traceback
 from collections import defaultdict, namedtuple
@@ -14,6 +15,7 @@ from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.db import connection
 from django.db import models as django_models
+from django.db import transaction
 from django.db.models import Count, Q
 from django.db.models.expressions import OrderBy
 from django.db.models.query import QuerySet
@@ -37,6 +39,7 @@ from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.search.handler import SearchMode
 from baserow.contrib.database.table.models import GeneratedTableModel, Table
+from baserow.contrib.database.views.constants import RowCountStrategy
 from baserow.contrib.database.views.exceptions import ViewOwnershipTypeDoesNotExist
 from baserow.contrib.database.views.filters import AdHocFilters
 from baserow.contrib.database.views.operations import (
@@ -83,7 +86,12 @@ from baserow.contrib.database.views.registries import (
     view_ownership_type_registry,
 )
 from baserow.contrib.database.views.view_filter_groups import ViewGroupedFiltersAdapter
-from baserow.core.db import specific_iterator, sql, transaction_atomic
+from baserow.core.db import (
+    get_estimated_count,
+    specific_iterator,
+    sql,
+    transaction_atomic,
+)
 from baserow.core.exceptions import PermissionDenied
 from baserow.core.handler import CoreHandler
 from baserow.core.models import Workspace
@@ -102,6 +110,7 @@ from baserow.core.utils import (
 )
 
 from .exceptions import (
+    AggregationDeltaNotApplicable,
     CannotShareViewTypeError,
     DecoratorValueProviderTypeNotCompatible,
     FieldAggregationNotSupported,
@@ -170,7 +179,7 @@ from .signals import (
     view_updated,
     views_reordered,
 )
-from .utils import AnnotatedAggregation, DistributionAggregation
+from .utils import AnnotatedAggregation, DistributionAggregation, RowIdRanges
 from .validators import value_is_empty_for_required_form_field
 
 FieldOptionsDict = Dict[int, Dict[str, Any]]
@@ -193,6 +202,26 @@ class UpdatedViewWithChangedAttributes:
     new_view_attributes: Dict[str, Any]
 
 
+@dataclasses.dataclass
+class ViewRowCount:
+    count: int
+    is_estimated: bool
+
+
+@dataclasses.dataclass
+class ViewAggregationsDelta:
+    """
+    The cached aggregations of a view captured before rows change, together with the
+    aggregations of the rows that are about to change.
+    """
+
+    view: View
+    aggregations: List[Tuple[Field, str]]
+    values: Dict[str, Any]
+    versions: Dict[str, int]
+    removed: Dict[str, Any]
+
+
 class ViewIndexingHandler(metaclass=baserow_trace_methods(tracer)):
     @classmethod
     def does_index_exist(cls, index_name: str) -> bool:
@@ -1483,6 +1512,8 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         if not isinstance(updated_fields, list):
             updated_fields = [updated_fields]
 
+        self.clear_table_aggregation_cache(f.table_id for f in updated_fields)
+
         # Call each view types hook
         for view_type in view_type_registry.get_all():
             view_type.after_field_value_update(updated_fields)
@@ -1500,6 +1531,8 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         if not isinstance(updated_fields, list):
             updated_fields = [updated_fields]
 
+        self.clear_table_aggregation_cache(f.table_id for f in updated_fields)
+
         # Call each view types hook
         for view_type in view_type_registry.get_all():
             view_type.after_field_update(updated_fields)
@@ -2848,6 +2881,88 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
             )
         return queryset
 
+    def get_view_row_count(
+        self,
+        view: View,
+        queryset: QuerySet,
+        count_strategy: RowCountStrategy = RowCountStrategy.EXACT,
+        is_filtered: bool = True,
+    ) -> ViewRowCount:
+        """
+        Counts the rows of the provided view queryset using the provided strategy.
+        Exact counts of huge tables are slow, so the row count can either be
+        estimated, or be cached until the data of the table changes.
+
+        :param view: The view the queryset belongs to.
+        :param queryset: The filtered and searched queryset of the view.
+        :param count_strategy: The strategy used to count the rows.
+        :param is_filtered: Whether adhoc filters or a search term have been applied to
+            the queryset. The view filters are checked by this method.
+        :return: The row count and whether it's an estimation.
+        """
+
+        if count_strategy == RowCountStrategy.ESTIMATED:
+            return self._get_estimated_view_row_count(view, queryset, is_filtered)
+        elif count_strategy == RowCountStrategy.CACHED:
+            return self._get_cached_view_row_count(view, queryset)
+        return ViewRowCount(count=queryset.count(), is_estimated=False)
+
+    def _get_estimated_view_row_count(
+        self, view: View, queryset: QuerySet, is_filtered: bool
+    ) -> ViewRowCount:
+        """
+        Estimates the row count using the row count of the table usage if the view is
+        not filtered, and otherwise using the estimation of the PostgreSQL planner.
+        If the estimation is small, the rows are counted exactly because that's fast
+        anyway and estimations of small tables can be far off.
+        """
+
+        from baserow.contrib.database.table.handler import TableUsageHandler
+
+        is_filtered = is_filtered or (
+            not view.filters_disabled
+            and ViewFilter.objects.filter(view_id=view.id).exists()
+        )
+
+        estimated_count = None
+        if not is_filtered:
+            estimated_count = TableUsageHandler.get_table_row_count(view.table_id)
+        if estimated_count is None:
+            estimated_count = get_estimated_count(queryset)
+
+        if estimated_count < settings.BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD:
+            return ViewRowCount(count=queryset.count(), is_estimated=False)
+        return ViewRowCount(count=estimated_count, is_estimated=True)
+
+    def _get_cached_view_row_count(
+        self, view: View, queryset: QuerySet
+    ) -> ViewRowCount:
+        """
+        Returns the exact row count of the queryset from the cache, or counts and
+        caches it. The cache key depends on the SQL of the query, so that it changes
+        with the view filters, adhoc filters and search, and on the data version of
+        the table, so that it changes whenever a row or field of the table changes.
+        """
+
+        table_version = cache.get(
+            self._get_aggregation_table_version_cache_key(view.table_id), 1
+        )
+        query_sql, query_params = queryset.order_by().query.sql_with_params()
+        key_hash = shake_128(
+            json.dumps([table_version, query_sql, query_params], default=str).encode(
+                "utf-8"
+            )
+        ).hexdigest(16)
+        cache_key = f"view_row_count__{view.table_id}_{key_hash}"
+
+        count = cache.get(cache_key)
+        if count is None:
+            count = queryset.count()
+            cache.set(
+                cache_key, count, timeout=settings.BASEROW_CACHED_ROW_COUNT_TTL_SECONDS
+            )
+        return ViewRowCount(count=count, is_estimated=False)
+
     def _get_aggregation_lock_cache_key(self, view: View):
         """
         Returns the aggregation lock cache key for the specified view.
@@ -2869,9 +2984,48 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         return f"aggregation_version__{view.pk}_{name}"
 
+    def _get_aggregation_table_version_cache_key(self, table_id: int):
+        """
+        Returns the cache key of the version of the data of the specified table, which
+        is incremented every time a row or field of the table changes.
+        """
+
+        return f"aggregation_table_version__{table_id}"
+
+    def _get_filtered_aggregations_cache_key(self, view: View, key_hash: str):
+        """
+        Returns the cache key of the aggregations of the specified view computed with
+        the filters and search represented by the hash.
+        """
+
+        return f"aggregation_filtered__{view.pk}_{key_hash}"
+
+    def _get_filtered_aggregations_lru_cache_key(self, view: View):
+        """
+        Returns the cache key of the list of filtered aggregations cache keys of the
+        specified view, ordered from the least to the most recently used.
+        """
+
+        return f"aggregation_filtered_lru__{view.pk}"
+
+    def clear_table_aggregation_cache(self, table_ids: Iterable[int]):
+        """
+        Increments the data version of the specified tables, which invalidates the
+        cached aggregations of their filtered and searched views.
+        """
+
+        for table_id in set(table_ids):
+            cache_key = self._get_aggregation_table_version_cache_key(table_id)
+            try:
+                cache.incr(cache_key, 1)
+            except ValueError:
+                # No cache key, we create one
+                cache.set(cache_key, 2, timeout=None)
+
     def clear_full_aggregation_cache(self, view: View):
         """
-        Clears the cache key for the specified view.
+        Clears the cache key for the specified view, including the cached
+        aggregations of the filtered and searched view.
         """
 
         view_type = view_type_registry.get_by_model(view.specific_class)
@@ -2879,6 +3033,9 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         cached_names = [agg[0].db_column for agg in aggregations]
         self.clear_aggregation_cache(view, cached_names)
 
+        lru_cache_key = self._get_filtered_aggregations_lru_cache_key(view)
+        cache.delete_many(cache.get(lru_cache_key, []) + [lru_cache_key])
+
     def clear_aggregation_cache(self, view: View, names: Union[List[str], str]):
         """
         Increments the version in cache for the specified view/name.
@@ -2951,6 +3108,67 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         return (valid_cached_values, need_computation)
 
+    def _get_filtered_aggregations_cache_key_for(
+        self,
+        view: View,
+        aggregations: List[Tuple[Field, str]],
+        visible_field_ids: Set[int],
+        with_total: bool,
+        adhoc_filters: AdHocFilters,
+        combine_filters: bool,
+        search: Optional[str],
+        search_mode: Optional[SearchMode],
+    ) -> str:
+        """
+        Returns the cache key of the aggregations of a filtered or searched view. The
+        key depends on the normalized filters, search and on the current aggregation
+        and table versions, so that it changes whenever the data, the view filters or
+        the aggregations change, exactly like the unfiltered aggregations cache.
+        """
+
+        version_keys = [
+            self._get_aggregation_version_cache_key(view, field.db_column)
+            for field, _ in aggregations
+        ] + [self._get_aggregation_table_version_cache_key(view.table_id)]
+        versions = cache.get_many(version_keys)
+
+        key_data = {
+            "filters": adhoc_filters.get_hash() if adhoc_filters else None,
+            "combine_filters": combine_filters,
+            "search": search,
+            "search_mode": search_mode,
+            "with_total": with_total,
+            "aggregations": sorted((f.id, t) for f, t in aggregations),
+            "visible_field_ids": sorted(visible_field_ids),
+            "versions": [versions.get(key, 1) for key in version_keys],
+        }
+        key_hash = shake_128(
+            json.dumps(key_data, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest(16)
+        return self._get_filtered_aggregations_cache_key(view, key_hash)
+
+    def _mark_filtered_aggregations_as_recently_used(self, view: View, cache_key: str):
+        """
+        Moves the provided filtered aggregations cache key to the end of the least
+        recently used list of the view and evicts the least recently used entries if
+        the view has more than `BASEROW_FILTERED_AGGREGATIONS_CACHE_MAX_ENTRIES`.
+        """
+
+        lru_cache_key = self._get_filtered_aggregations_lru_cache_key(view)
+        cache_keys = [k for k in cache.get(lru_cache_key, []) if k != cache_key]
+        cache_keys.append(cache_key)
+
+        max_entries = settings.BASEROW_FILTERED_AGGREGATIONS_CACHE_MAX_ENTRIES
+        evicted, cache_keys = cache_keys[:-max_entries], cache_keys[-max_entries:]
+        if evicted:
+            cache.delete_many(evicted)
+
+        cache.set(
+            lru_cache_key,
+            cache_keys,
+            timeout=settings.BASEROW_FILTERED_AGGREGATIONS_CACHE_TTL_SECONDS,
+        )
+
     def get_view_field_aggregations(
         self,
         user: AbstractUser,
@@ -2967,7 +3185,9 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         Returns a dict of aggregation for all aggregation configured for the view in
         parameters. Unless the search parameter is set to a non empty string,
         the aggregations values are cached when computed and must be
-        invalidated when necessary.
+        invalidated when necessary. Aggregations of searched or filtered views are
+        cached for a short time with a key that depends on the search, the filters
+        and the aggregation and table versions.
         The dict keys are field names and value are aggregation values. The total is
         included in result if the with_total is specified.
 
@@ -2983,7 +3203,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
             together with the view filters. Otherwise ad hoc filters will be
             used if provided.
         :param search: the search string to considerate. If the search parameter is
-            defined, we don't use the cache so we recompute aggregation on the fly.
+            defined, the short-lived filtered aggregations cache is used.
         :param search_mode: the search mode that the search is using.
         :param skip_perm_check: If permission checks should be skipped,
             e.g. for public aggregations.
@@ -3022,6 +3242,27 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         # filter out aggregations for hidden fields
         aggregations = [agg for agg in aggregations if agg[0].id in visible_field_ids]
 
+        filtered_cache_key = None
+        if (
+            search or adhoc_filters.has_any_filters
+        ) and settings.BASEROW_FILTERED_AGGREGATIONS_CACHE_TTL_SECONDS > 0:
+            filtered_cache_key = self._get_filtered_aggregations_cache_key_for(
+                view,
+                aggregations,
+                visible_field_ids,
+                with_total,
+                adhoc_filters,
+                combine_filters,
+                search,
+                search_mode,
+            )
+            cached_values = cache.get(filtered_cache_key)
+            if cached_values is not None:
+                self._mark_filtered_aggregations_as_recently_used(
+                    view, filtered_cache_key
+                )
+                return cached_values
+
         (
             values,
             need_computation,
@@ -3095,6 +3336,14 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 # and it's been stolen so we don't really care
                 pass
 
+        if filtered_cache_key:
+            cache.set(
+                filtered_cache_key,
+                values,
+                timeout=settings.BASEROW_FILTERED_AGGREGATIONS_CACHE_TTL_SECONDS,
+            )
+            self._mark_filtered_aggregations_as_recently_used(view, filtered_cache_key)
+
         return values
 
     def get_field_aggregations(
@@ -3110,6 +3359,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         search_mode: Optional[SearchMode] = None,
         skip_perm_check: bool = False,
         restrict_to_field_ids: Optional[Set[int]] = None,
+        row_ids: Optional[Iterable[int]] = None,
     ) -> Dict[str, Any]:
         """
         Returns a dict of aggregation for given (field, aggregation_type) couple list.
@@ -3133,6 +3383,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         :param skip_perm_check: Skips the permission check if not necessary.
         :param restrict_to_field_ids: Restrict the aggregations only to certain
             fields, for example if the aggregation is requested for public views.
+        :param row_ids: Optionally only aggregate the rows with these ids.
         :raises FieldAggregationNotSupported: When the view type doesn't support
             field aggregation.
         :raises FieldNotInTable: When one of the field doesn't belong to the specified
@@ -3156,6 +3407,9 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         queryset = model.objects.all().enhance_by_fields()
 
+        if row_ids is not None:
+            queryset = queryset.filter(id__in=row_ids)
+
         view_type = view_type_registry.get_by_model(view.specific_class)
 
         # Check if view supports field aggregation
@@ -3232,6 +3486,211 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         aggregations.update(distribution_dict)
         return aggregations
 
+    def get_aggregations_delta(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        row_ids: Iterable[int],
+    ) -> List[ViewAggregationsDelta]:
+        """
+        Must be called before the rows with the provided ids are created, updated or
+        deleted. Collects the valid cached aggregations of the table views that can
+        be updated incrementally, together with the aggregations of the rows that are
+        about to change, so that `apply_aggregations_delta` can update the cached
+        values once the rows have changed instead of recomputing them over the whole
+        table.
+
+        :param table: The table where the rows are going to change.
+        :param model: The model of the table.
+        :param row_ids: The ids of the rows that are going to change. This is empty
+            if rows are going to be created.
+        :return: The deltas that must be passed into `apply_aggregations_delta`.
+        """
+
+        if table.field_rules_validity_column_added:
+            # Field rules can cascade the change to other rows of the table, whose
+            # previous values are not known.
+            return []
+
+        candidates = []
+        for view_type in view_type_registry.get_all():
+            if not view_type.can_aggregate_field:
+                continue
+
+            for view, aggregations in view_type.get_table_aggregations(table).items():
+                aggregations = [
+                    (field, aggregation_type)
+                    for field, aggregation_type in aggregations
+                    if field.id in model._field_objects
+                    and view_aggregation_type_registry.get(
+                        aggregation_type
+                    ).can_apply_delta
+                ]
+                if aggregations:
+                    candidates.append((view, aggregations))
+
+        if not candidates:
+            return []
+
+        cached = cache.get_many(
+            [
+                key
+                for view, aggregations in candidates
+                for field, _ in aggregations
+                for key in (
+                    self._get_aggregation_value_cache_key(view, field.db_column),
+                    self._get_aggregation_version_cache_key(view, field.db_column),
+                )
+            ]
+        )
+
+        row_ids = list(row_ids)
+        deltas = []
+        for view, aggregations in candidates:
+            values, versions = {}, {}
+            for field, _ in aggregations:
+                name = field.db_column
+                cached_value = cached.get(
+                    self._get_aggregation_value_cache_key(view, name), {"version": 0}
+                )
+                cached_version = cached.get(
+                    self._get_aggregation_version_cache_key(view, name), 1
+                )
+                # Only a value that's still valid can be updated incrementally.
+                if cached_value["version"] == cached_version:
+                    values[name] = cached_value["value"]
+                    versions[name] = cached_version
+
+            aggregations = [agg for agg in aggregations if agg[0].db_column in values]
+            if not aggregations:
+                continue
+
+            removed = self.get_field_aggregations(
+                None,
+                view,
+                aggregations,
+                model,
+                skip_perm_check=True,
+                row_ids=row_ids,
+            )
+            deltas.append(
+                ViewAggregationsDelta(view, aggregations, values, versions, removed)
+            )
+
+        return deltas
+
+    def apply_aggregations_delta(
+        self,
+        deltas: List[ViewAggregationsDelta],
+        model: GeneratedTableModel,
+        row_ids: Iterable[int],
+        updated_fields: Iterable[Field],
+        dependant_fields: Iterable[Field],
+    ):
+        """
+        Must be called after the rows have changed with the deltas returned by
+        `get_aggregations_delta`. Computes the aggregations of the changed rows and
+        updates the cached aggregation values accordingly once the transaction has
+        been committed. A value is left to be recomputed if its version doesn't match
+        anymore, because that means that another change happened concurrently, or if
+        the aggregation type can't apply the delta.
+
+        :param deltas: The deltas returned by `get_aggregations_delta`.
+        :param model: The model of the table.
+        :param row_ids: The ids of the rows that have changed. This is empty if the
+            rows have been deleted.
+        :param updated_fields: The fields that have been updated directly. The
+            aggregation versions of these fields have been incremented by
+            `field_value_updated`.
+        :param dependant_fields: The fields that have been updated because they
+            depend on the updated fields. The aggregation versions of these fields
+            have been incremented as well.
+        """
+
+        bumped_field_ids = {f.id for f in updated_fields}
+        dependant_field_ids = set()
+        for field in dependant_fields:
+            bumped_field_ids.add(field.id)
+            # A dependant field in the same table could also have changed in rows
+            # other than the ones that have changed directly.
+            if field.table_id == model.baserow_table_id:
+                dependant_field_ids.add(field.id)
+
+        row_ids = list(row_ids)
+        to_apply = []
+        for delta in deltas:
+            if dependant_field_ids and (
+                ViewFilter.objects.filter(
+                    view=delta.view, field_id__in=dependant_field_ids
+                ).exists()
+            ):
+                continue
+
+            aggregations = [
+                agg
+                for agg in delta.aggregations
+                if agg[0].id not in dependant_field_ids
+            ]
+            if not aggregations:
+                continue
+
+            added = self.get_field_aggregations(
+                None,
+                delta.view,
+                aggregations,
+                model,
+                skip_perm_check=True,
+                row_ids=row_ids,
+            )
+            expected_versions = {
+                field.db_column: delta.versions[field.db_column]
+                + (1 if field.id in bumped_field_ids else 0)
+                for field, _ in aggregations
+            }
+            to_apply.append((delta, aggregations, expected_versions, added))
+
+        if to_apply:
+            transaction.on_commit(lambda: self._apply_aggregations_delta(to_apply))
+
+    def _apply_aggregations_delta(self, to_apply):
+        """
+        Stores the incrementally updated aggregation values in the cache if their
+        version is still the one that's expected.
+        """
+
+        current_versions = cache.get_many(
+            [
+                self._get_aggregation_version_cache_key(delta.view, field.db_column)
+                for delta, aggregations, _, _ in to_apply
+                for field, _ in aggregations
+            ]
+        )
+
+        to_cache = {}
+        for delta, aggregations, expected_versions, added in to_apply:
+            for field, aggregation_type_name in aggregations:
+                name = field.db_column
+                version_key = self._get_aggregation_version_cache_key(delta.view, name)
+                if current_versions.get(version_key, 1) != expected_versions[name]:
+                    continue
+
+                aggregation_type = view_aggregation_type_registry.get(
+                    aggregation_type_name
+                )
+                try:
+                    value = aggregation_type.apply_delta(
+                        delta.values[name], delta.removed[name], added[name]
+                    )
+                except AggregationDeltaNotApplicable:
+                    continue
+
+                to_cache[self._get_aggregation_value_cache_key(delta.view, name)] = {
+                    "value": value,
+                    "version": expected_versions[name],
+                }
+
+        cache.set_many(to_cache)
+
     def rotate_view_slug(
         self, user: AbstractUser, view: View, slug_field: str = "slug"
     ) -> View:
@@ -3744,14 +4203,19 @@ class ViewSubscriptionHandler:
             row_ids = (
                 ViewHandler()
                 .get_queryset(None, view, model=model, apply_sorts=False)
+                .order_by()
                 .values_list("id", flat=True)
             )
-            view_rows.append(ViewRows(view=view, row_ids=list(row_ids)))
+            view_rows.append(
+                ViewRows(
+                    view=view, row_id_ranges=RowIdRanges.from_ids(row_ids).to_list()
+                )
+            )
 
         return ViewRows.objects.bulk_create(
             view_rows,
             update_conflicts=True,
-            update_fields=["row_ids"],
+            update_fields=["row_id_ranges"],
             unique_fields=["view_id"],
         )
 
@@ -3819,7 +4283,10 @@ class ViewSubscriptionHandler:
 
     @classmethod
     def notify_table_views_updates(
-        cls, views: list[View], model: GeneratedTableModel | None = None
+        cls,
+        views: list[View],
+        model: GeneratedTableModel | None = None,
+        row_ids: list[int] | None = None,
     ):
         """
         Verify if the views have subscribers and notify them of any changes in the view
@@ -3828,17 +4295,22 @@ class ViewSubscriptionHandler:
         :param views: The views to notify subscribers of.
         :param model: The table model to use for the views. If not provided, the model
             will be generated automatically.
+        :param row_ids: If only these rows have changed, only they are checked
+            against the filters of the views instead of the entire table.
         """
 
         view_ids_with_subscribers = ViewSubscription.objects.filter(
             view__in=views
         ).values_list("view_id", flat=True)
         if view_ids_with_subscribers:
-            cls.notify_table_views(view_ids_with_subscribers, model)
+            cls.notify_table_views(view_ids_with_subscribers, model, row_ids)
 
     @classmethod
     def notify_table_views(
-        cls, view_ids: list[int], model: GeneratedTableModel | None = None
+        cls,
+        view_ids: list[int],
+        model: GeneratedTableModel | None = None,
+        row_ids: list[int] | None = None,
     ):
         """
         Notify subscribers of any changes in the view results, emitting the appropriate
@@ -3847,6 +4319,8 @@ class ViewSubscriptionHandler:
         :param view_ids: The view ids to notify subscribers of.
         :param model: The table model to use for the views. If not provided, the model
             will be generated automatically
+        :param row_ids: If only these rows have changed, only they are checked
+            against the filters of the views instead of the entire table.
         """
 
         view_rows = list(
@@ -3861,7 +4335,9 @@ class ViewSubscriptionHandler:
 
         for view_state in view_rows:
             view = view_state.view
-            new_row_ids, row_ids_entered, row_ids_exited = view_state.get_diff(model)
+            new_row_ids, row_ids_entered, row_ids_exited = view_state.get_diff(
+                model, row_ids
+            )
             changed = False
             if row_ids_entered:
                 rows_entered_view.send(
@@ -3874,5 +4350,5 @@ class ViewSubscriptionHandler:
                 )
                 changed = True
             if changed:
-                view_state.row_ids = new_row_ids
+                view_state.row_id_ranges = new_row_ids.to_list()
                 view_state.save()
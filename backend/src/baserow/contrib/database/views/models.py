@@ -25,6 +25,7 @@ from baserow.contrib.database.views.registries import (
     view_filter_type_registry,
     view_type_registry,
 )
+from baserow.contrib.database.views.utils import RowIdRanges
 from baserow.core.db import specific_queryset
 from baserow.core.mixins import (
     CreatedAndUpdatedOnMixin,
@@ -970,31 +971,65 @@ class FormViewFieldOptionsCondition(HierarchicalModelMixin, models.Model):
 
 class ViewRows(CreatedAndUpdatedOnMixin, models.Model):
     view = models.OneToOneField(View, on_delete=models.CASCADE, related_name="rows")
-    row_ids = ArrayField(
+    row_id_ranges = ArrayField(
         models.PositiveIntegerField(),
         default=list,
-        help_text="The rows that are shown in the view. This list can be used by webhooks "
-        "to determine which rows have been changed since the last check.",
+        help_text="The rows that are shown in the view, compressed as a flat list of "
+        "inclusive ranges `[start_1, end_1, start_2, end_2, ...]`. This can be used by "
+        "webhooks to determine which rows have been changed since the last check.",
     )
 
-    def get_diff(self, model=None):
+    def get_row_ids(self) -> RowIdRanges:
+        """
+        Returns the rows that were in the view at the last check.
+        """
+
+        return RowIdRanges(self.row_id_ranges)
+
+    def get_diff(self, model=None, row_ids: Optional[Iterable[int]] = None):
         """
         Executes the view query and returns the current row IDs in the view,
         along with the differences between the current state and the last saved state.
+
+        :param model: The table model to use for the view.
+        :param row_ids: If provided, only these rows are checked against the filters
+            of the view because the other rows are known not to have changed. This
+            avoids running the query over the entire table.
+        :return: The current row ids as `RowIdRanges`, and the sorted lists of the
+            ids of the rows that entered and exited the view.
         """
 
         from baserow.contrib.database.views.handler import ViewHandler
 
-        rows = ViewHandler().get_queryset(
-            None, self.view, model=model, apply_sorts=False
+        rows = (
+            ViewHandler()
+            .get_queryset(None, self.view, model=model, apply_sorts=False)
+            .order_by()
         )
-        previous_row_ids = set(self.row_ids)
-        new_row_ids = set(rows.order_by().values_list("id", flat=True))
 
-        row_ids_entered = new_row_ids - previous_row_ids
-        row_ids_exited = previous_row_ids - new_row_ids
+        if row_ids is None:
+            previous_row_ids = set(self.get_row_ids())
+            new_row_ids = set(rows.values_list("id", flat=True))
+            return (
+                RowIdRanges.from_ids(new_row_ids),
+                sorted(new_row_ids - previous_row_ids),
+                sorted(previous_row_ids - new_row_ids),
+            )
 
-        return list(new_row_ids), list(row_ids_entered), list(row_ids_exited)
+        row_ids = set(row_ids)
+        current_row_ids = self.get_row_ids()
+        visible_row_ids = set(rows.filter(id__in=row_ids).values_list("id", flat=True))
+        row_ids_entered, row_ids_exited = [], []
+        for row_id in sorted(row_ids):
+            was_visible = row_id in current_row_ids
+            if row_id in visible_row_ids and not was_visible:
+                current_row_ids.add(row_id)
+                row_ids_entered.append(row_id)
+            elif row_id not in visible_row_ids and was_visible:
+                current_row_ids.remove(row_id)
+                row_ids_exited.append(row_id)
+
+        return current_row_ids, row_ids_entered, row_ids_exited
 
 
 class ViewSubscription(models.Model):
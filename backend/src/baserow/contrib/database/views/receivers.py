@@ -6,11 +6,15 @@ from baserow.contrib.database.fields.signals import (
     field_updated,
 )
 from baserow.contrib.database.rows.signals import (
+    before_rows_create,
+    before_rows_delete,
+    before_rows_update,
     rows_created,
     rows_deleted,
     rows_updated,
 )
 from baserow.contrib.database.table.models import GeneratedTableModel, Table
+from baserow.contrib.database.table.signals import table_updated
 from baserow.contrib.database.views.models import View
 from baserow.contrib.database.views.signals import (
     view_filter_created,
@@ -22,20 +26,26 @@ from baserow.contrib.database.views.signals import (
     view_updated,
 )
 
-from .handler import ViewSubscriptionHandler
+from .handler import ViewHandler, ViewSubscriptionHandler
 
 
-def _notify_table_data_updated(table: Table, model: GeneratedTableModel | None = None):
+def _notify_table_data_updated(
+    table: Table,
+    model: GeneratedTableModel | None = None,
+    row_ids: list[int] | None = None,
+):
     """
     Notifies the table views that the table data has been updated. This will result in
     the table views to be updated and the subscribers to be notified.
 
     :param table: The table for which the data has been updated.
     :param model: The model that was updated if available.
+    :param row_ids: The ids of the rows that have been updated, if only those rows
+        could have entered or exited the views.
     """
 
     ViewSubscriptionHandler.notify_table_views_updates(
-        table.view_set.all(), model=model
+        table.view_set.all(), model=model, row_ids=row_ids
     )
 
 
@@ -52,15 +62,92 @@ def _notify_view_results_updated(view: View):
 
 @receiver([rows_updated, rows_created, rows_deleted])
 def notify_rows_signals(sender, rows, user, table, model, dependant_fields, **kwargs):
-    _notify_table_data_updated(table, model)
-
     updated_tables = set()
     for field in dependant_fields:
         updated_tables.add(field.table)
+
+    # Only the changed rows and the rows updated in cascade by the field rules have
+    # to be checked, unless the change also updated other rows of the same table
+    # through a dependant field.
+    if table in updated_tables:
+        updated_tables.remove(table)
+        _notify_table_data_updated(table, model)
+    else:
+        row_ids = [row.id for row in rows]
+        cascade_update = kwargs.get("cascade_update")
+        if cascade_update:
+            row_ids += cascade_update.row_ids
+        _notify_table_data_updated(table, model, row_ids=row_ids)
+
     for updated_table in updated_tables:
         _notify_table_data_updated(updated_table)
 
 
+@receiver(table_updated)
+def notify_table_updated(sender, table, user, force_table_refresh=False, **kwargs):
+    # The rows of the table have changed without sending the row signals, for
+    # example when many rows are restored at once.
+    if force_table_refresh:
+        _notify_table_data_updated(table)
+
+
+@receiver(before_rows_create)
+def aggregations_before_rows_create(sender, user, table, model, **kwargs):
+    return ViewHandler().get_aggregations_delta(table, model, [])
+
+
+@receiver(before_rows_update)
+def aggregations_before_rows_update(
+    sender, rows, user, table, model, updated_field_ids, **kwargs
+):
+    if not updated_field_ids:
+        return []
+    return ViewHandler().get_aggregations_delta(table, model, [r.id for r in rows])
+
+
+@receiver(before_rows_delete)
+def aggregations_before_rows_delete(sender, rows, user, table, model, **kwargs):
+    return ViewHandler().get_aggregations_delta(table, model, [r.id for r in rows])
+
+
+def _apply_aggregations_delta(before_receiver, rows, model, kwargs, row_ids=None):
+    """
+    Updates the cached view aggregations with the deltas collected by the provided
+    before receiver, if they were collected for this change.
+    """
+
+    deltas = dict(kwargs.get("before_return") or {}).get(before_receiver)
+    cascade_update = kwargs.get("cascade_update")
+    if not deltas or (cascade_update and cascade_update.row_ids):
+        return
+
+    ViewHandler().apply_aggregations_delta(
+        deltas,
+        model,
+        [r.id for r in rows] if row_ids is None else row_ids,
+        kwargs.get("fields") or [],
+        kwargs.get("dependant_fields") or [],
+    )
+
+
+@receiver(rows_created)
+def aggregations_rows_created(sender, rows, user, table, model, **kwargs):
+    _apply_aggregations_delta(aggregations_before_rows_create, rows, model, kwargs)
+
+
+@receiver(rows_updated)
+def aggregations_rows_updated(sender, rows, user, table, model, **kwargs):
+    _apply_aggregations_delta(aggregations_before_rows_update, rows, model, kwargs)
+
+
+@receiver(rows_deleted)
+def aggregations_rows_deleted(sender, rows, user, table, model, **kwargs):
+    # The deleted rows are not part of the view anymore, so nothing is added.
+    _apply_aggregations_delta(
+        aggregations_before_rows_delete, rows, model, kwargs, row_ids=[]
+    )
+
+
 @receiver(view_updated)
 def notify_view_updated(sender, view, user, old_view, **kwargs):
     _notify_view_results_updated(view)
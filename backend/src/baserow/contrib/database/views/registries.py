@@ -49,6 +49,7 @@ from baserow.core.utils import (
 )
 
 from .exceptions import (
+    AggregationDeltaNotApplicable,
     AggregationTypeAlreadyRegistered,
     AggregationTypeDoesNotExist,
     DecoratorTypeAlreadyRegistered,
@@ -719,6 +720,23 @@ class ViewType(
             "`get_aggregations` method."
         )
 
+    def get_table_aggregations(
+        self, table: "Table"
+    ) -> Dict["View", List[Tuple[django_models.Field, str]]]:
+        """
+        Returns the aggregation list of every view of this type in the provided
+        table, keyed by view. This is used to find the cached aggregations that must
+        be maintained when rows of the table change. Can be overridden to fetch them
+        with fewer queries.
+
+        returns a dict of view -> list of tuple (Field, aggregation_type)
+        """
+
+        return {
+            view: self.get_aggregations(view)
+            for view in self.model_class.objects.filter(table=table)
+        }
+
     def after_field_value_update(
         self, updated_fields: Union[Iterable["Field"], "Field"]
     ):
@@ -1108,6 +1126,13 @@ class ViewAggregationType(Instance):
 
     allowed_in_view = True
 
+    can_apply_delta = False
+    """
+    Indicates whether a cached aggregation value can be updated with the aggregation
+    of the changed rows by the `apply_delta` method instead of being recomputed over
+    the whole table.
+    """
+
     def get_aggregation(
         self,
         field_name: str,
@@ -1149,6 +1174,24 @@ class ViewAggregationType(Instance):
             for t in self.compatible_field_types
         )
 
+    def apply_delta(self, value: Any, removed_value: Any, added_value: Any) -> Any:
+        """
+        Returns the new aggregation value of a view after some of its rows have
+        changed. `removed_value` is the aggregation of the changed rows before the
+        change and `added_value` the aggregation of the same rows after the change.
+        Created rows are only part of the added value and deleted rows only part of
+        the removed value.
+
+        :param value: The aggregation value before the rows changed.
+        :param removed_value: The aggregation of the changed rows before the change.
+        :param added_value: The aggregation of the changed rows after the change.
+        :raises AggregationDeltaNotApplicable: When the new value can't be derived
+            from the provided values and must be recomputed.
+        :return: The aggregation value after the rows changed.
+        """
+
+        raise AggregationDeltaNotApplicable()
+
 
 class ViewAggregationTypeRegistry(Registry):
     """
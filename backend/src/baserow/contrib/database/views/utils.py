@@ -1,4 +1,5 @@
-from typing import Any, Dict
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from django.db.models.aggregates import Aggregate, Count
 
@@ -50,3 +51,112 @@ class DistributionAggregation:
             .order_by("-count", self.group_by)
             .values_list(self.group_by, "count")[:limit]
         )
+
+
+class RowIdRanges:
+    """
+    A set of row ids stored compactly as sorted, non overlapping and inclusive ranges.
+    Because row ids are sequential, the rows of a view are often consecutive, and a
+    range of any number of consecutive ids only takes two integers. The ranges are
+    serialized as a flat list `[start_1, end_1, start_2, end_2, ...]`.
+    """
+
+    def __init__(self, ranges: Optional[List[int]] = None):
+        """
+        :param ranges: The flat list of ranges as returned by `to_list`.
+        """
+
+        ranges = ranges or []
+        self._starts = list(ranges[0::2])
+        self._ends = list(ranges[1::2])
+
+    @classmethod
+    def from_ids(cls, row_ids: Iterable[int]) -> "RowIdRanges":
+        """
+        Compresses the provided row ids into ranges.
+
+        :param row_ids: The row ids in any order, duplicates are allowed.
+        :return: The ranges containing exactly the provided row ids.
+        """
+
+        ranges = cls()
+        for row_id in sorted(set(row_ids)):
+            if ranges._ends and ranges._ends[-1] == row_id - 1:
+                ranges._ends[-1] = row_id
+            else:
+                ranges._starts.append(row_id)
+                ranges._ends.append(row_id)
+        return ranges
+
+    def to_list(self) -> List[int]:
+        """
+        :return: The flat list of ranges that can be stored.
+        """
+
+        return [value for pair in zip(self._starts, self._ends) for value in pair]
+
+    def _find(self, row_id: int) -> int:
+        # The index of the range starting at or right before the row id.
+        return bisect_right(self._starts, row_id) - 1
+
+    def __contains__(self, row_id: int) -> bool:
+        index = self._find(row_id)
+        return index >= 0 and self._ends[index] >= row_id
+
+    def __iter__(self) -> Iterator[int]:
+        for start, end in zip(self._starts, self._ends):
+            yield from range(start, end + 1)
+
+    def __len__(self) -> int:
+        return sum(end - start + 1 for start, end in zip(self._starts, self._ends))
+
+    def add(self, row_id: int):
+        """
+        Adds the row id, merging the ranges it connects.
+
+        :param row_id: The row id to add.
+        """
+
+        index = self._find(row_id)
+        if index >= 0 and self._ends[index] >= row_id:
+            return
+
+        joins_previous = index >= 0 and self._ends[index] == row_id - 1
+        joins_next = (
+            index + 1 < len(self._starts) and self._starts[index + 1] == row_id + 1
+        )
+        if joins_previous and joins_next:
+            self._ends[index] = self._ends[index + 1]
+            del self._starts[index + 1]
+            del self._ends[index + 1]
+        elif joins_previous:
+            self._ends[index] = row_id
+        elif joins_next:
+            self._starts[index + 1] = row_id
+        else:
+            self._starts.insert(index + 1, row_id)
+            self._ends.insert(index + 1, row_id)
+
+    def remove(self, row_id: int):
+        """
+        Removes the row id, splitting the range it's in if needed.
+
+        :param row_id: The row id to remove.
+        """
+
+        index = self._find(row_id)
+        if index < 0 or self._ends[index] < row_id:
+            return
+
+        start, end = self._starts[index], self._ends[index]
+        if start == end:
+            del self._starts[index]
+            del self._ends[index]
+        elif row_id == start:
+            self._starts[index] = row_id + 1
+        elif row_id == end:
+            self._ends[index] = row_id - 1
+        else:
+            self._ends[index] = row_id - 1
+            self._starts.insert(index + 1, row_id + 1)
+            self._ends.insert(index + 1, end)
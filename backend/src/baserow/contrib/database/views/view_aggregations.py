@@ -52,6 +52,7 @@ from baserow.contrib.database.formula.types.formula_types import (
     BaserowFormulaSingleFileType,
 )
 
+from .exceptions import AggregationDeltaNotApplicable
 from .registries import ViewAggregationType
 from .utils import AnnotatedAggregation, DistributionAggregation
 
@@ -71,7 +72,19 @@ def get_has_relations_annotation(field_name: str, model_field: Field) -> Dict:
     return {f"has_relations_{field_name}": Exists(subquery)}
 
 
-class CountViewAggregationType(ViewAggregationType):
+class CountDeltaMixin:
+    """
+    Applies the delta of count aggregations, which can't be empty and are simply
+    incremented or decremented with the count of the changed rows.
+    """
+
+    can_apply_delta = True
+
+    def apply_delta(self, value, removed_value, added_value):
+        return value - removed_value + added_value
+
+
+class CountViewAggregationType(CountDeltaMixin, ViewAggregationType):
     """
     The count aggregation counts how many rows
     are in the table.
@@ -117,7 +130,7 @@ class CountViewAggregationType(ViewAggregationType):
         )
 
 
-class EmptyCountViewAggregationType(ViewAggregationType):
+class EmptyCountViewAggregationType(CountDeltaMixin, ViewAggregationType):
     """
     The empty count aggregation counts how many values are considered empty for
     the given field.
@@ -248,6 +261,7 @@ class MinViewAggregationType(ViewAggregationType):
     """
 
     type = "min"
+    can_apply_delta = True
 
     compatible_field_types = [
         DateFieldType.type,
@@ -267,6 +281,13 @@ class MinViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Min(field_name)
 
+    def apply_delta(self, value, removed_value, added_value):
+        if removed_value is not None and (value is None or removed_value <= value):
+            # One of the changed rows might have held the minimum before the change.
+            raise AggregationDeltaNotApplicable()
+
+        return min((v for v in (value, added_value) if v is not None), default=None)
+
 
 class MaxViewAggregationType(ViewAggregationType):
     """
@@ -274,6 +295,7 @@ class MaxViewAggregationType(ViewAggregationType):
     """
 
     type = "max"
+    can_apply_delta = True
 
     compatible_field_types = [
         DateFieldType.type,
@@ -293,6 +315,13 @@ class MaxViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Max(field_name)
 
+    def apply_delta(self, value, removed_value, added_value):
+        if removed_value is not None and (value is None or removed_value >= value):
+            # One of the changed rows might have held the maximum before the change.
+            raise AggregationDeltaNotApplicable()
+
+        return max((v for v in (value, added_value) if v is not None), default=None)
+
 
 class SumViewAggregationType(ViewAggregationType):
     """
@@ -300,6 +329,7 @@ class SumViewAggregationType(ViewAggregationType):
     """
 
     type = "sum"
+    can_apply_delta = True
 
     compatible_field_types = [
         NumberFieldType.type,
@@ -313,6 +343,20 @@ class SumViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Sum(field_name)
 
+    def apply_delta(self, value, removed_value, added_value):
+        if removed_value is not None and (value is None or value == removed_value):
+            # The changed rows might have been the only ones with a value, in which
+            # case the sum becomes empty instead of zero.
+            raise AggregationDeltaNotApplicable()
+
+        if value is None:
+            return added_value
+        if added_value is not None:
+            value += added_value
+        if removed_value is not None:
+            value -= removed_value
+        return value
+
 
 class AverageViewAggregationType(ViewAggregationType):
     """
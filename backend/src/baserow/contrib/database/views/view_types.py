@@ -282,6 +282,24 @@ class GridViewType(ViewType):
         )
         return [(option.field, option.aggregation_raw_type) for option in field_options]
 
+    def get_table_aggregations(self, table):
+        """
+        Returns the (Field, aggregation_type) list of every grid view of the table,
+        keyed by view, computed with a single query.
+        """
+
+        field_options = (
+            GridViewFieldOptions.objects.filter(grid_view__table=table)
+            .exclude(aggregation_raw_type="")
+            .select_related("grid_view", "field")
+        )
+        aggregations = defaultdict(list)
+        for option in field_options:
+            aggregations[option.grid_view].append(
+                (option.field, option.aggregation_raw_type)
+            )
+        return aggregations
+
     def after_field_value_update(self, updated_fields):
         """
         When a field value change, we need to invalidate the aggregation cache for this
@@ -0,0 +1,489 @@
+import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+
+from django_redis import get_redis_connection
+from loguru import logger
+from opentelemetry import metrics
+
+from .exceptions import WebhookPayloadTooLarge
+from .models import TableWebhook
+from .notification_types import WebhookPayloadTooLargeNotificationType
+from .tasks import save_webhook_call, send_webhook_request, update_webhook_after_call
+from .validators import get_webhook_session
+
+meter = metrics.get_meter(__name__)
+webhook_delivery_latency_histogram = meter.create_histogram(
+    "baserow.webhook_delivery_latency",
+    unit="ms",
+    description="The time between a webhook event being queued and delivered.",
+)
+webhook_calls_queued_counter = meter.create_up_down_counter(
+    "baserow.webhook_calls_queued",
+    unit="1",
+    description="The number of webhook calls waiting to be delivered.",
+)
+
+# Sorted set of the webhooks having calls to deliver, scored by the timestamp from
+# when they can be delivered. Webhooks that are being delivered or waiting for a
+# retry get a score in the future, so that they're not picked up by another
+# dispatcher in the meantime.
+READY_WEBHOOKS_KEY = "webhook_delivery_ready"
+# Set when a dispatcher is running or scheduled, so that not every queued call
+# schedules a new task.
+DISPATCHER_SCHEDULED_KEY = "webhook_delivery_dispatcher_scheduled"
+DISPATCHER_SCHEDULED_EXPIRY_SECONDS = settings.CELERY_TIME_LIMIT
+# The dispatcher stops claiming new calls after this time and schedules a new task
+# to continue, so that it stays within the Celery time limit.
+DISPATCHER_MAX_RUN_SECONDS = settings.CELERY_SOFT_TIME_LIMIT / 2
+
+
+def _get_redis_client():
+    return get_redis_connection("default")
+
+
+def get_delivery_queue_key(webhook_id: int) -> str:
+    return f"webhook_{webhook_id}_delivery_queue"
+
+
+def get_delivery_lock_key(webhook_id: int) -> str:
+    return f"webhook_{webhook_id}_delivery_lock"
+
+
+def get_delivery_lock_expiry_seconds() -> int:
+    return settings.BASEROW_WEBHOOKS_REQUEST_TIMEOUT_SECONDS * 2 + 60
+
+
+def enqueue_webhook_call(
+    webhook_id: int,
+    event_id: str,
+    event_type: str,
+    method: str,
+    url: str,
+    headers: dict,
+    payload: dict,
+):
+    """
+    Queues a webhook call to be delivered by the `deliver_webhook_calls` task. The
+    calls of the same webhook are delivered one at a time in the order in which they
+    were queued, while the calls of different webhooks are delivered concurrently.
+
+    :param webhook_id: The id of the webhook related to the call.
+    :param event_id: A unique event id that can used as id for the table webhook call
+        model.
+    :param event_type: The event type related to the webhook trigger.
+    :param method: The request method the must be used.
+    :param url: The URL can must be called.
+    :param headers: The additional headers that must be added to the request.
+    :param payload: The JSON serializable payload that must be used as request body.
+    """
+
+    from .tasks import deliver_webhook_calls
+
+    now = time.time()
+    call = {
+        "event_id": event_id,
+        "event_type": event_type,
+        "method": method,
+        "url": url,
+        "headers": headers,
+        "payload": payload,
+        "retries": 0,
+        "queued_at": now,
+    }
+    queue_key = get_delivery_queue_key(webhook_id)
+    max_length = settings.BASEROW_MAX_WEBHOOK_CALLS_IN_QUEUE_PER_WEBHOOK
+
+    pipeline = _get_redis_client().pipeline()
+    pipeline.rpush(queue_key, json.dumps(call))
+    if max_length:
+        pipeline.ltrim(queue_key, 0, max_length - 1)
+    pipeline.zadd(READY_WEBHOOKS_KEY, {webhook_id: now}, nx=True)
+    pipeline.set(
+        DISPATCHER_SCHEDULED_KEY, 1, nx=True, ex=DISPATCHER_SCHEDULED_EXPIRY_SECONDS
+    )
+    results = pipeline.execute()
+
+    if max_length and results[0] > max_length:
+        logger.warning(
+            f"Webhook call {event_id} is not enqueued because webhook id "
+            f"{webhook_id} reached the limit of {max_length}."
+        )
+    else:
+        webhook_calls_queued_counter.add(1)
+
+    if results[-1]:
+        deliver_webhook_calls.delay()
+
+
+@dataclass
+class WebhookDelivery:
+    """
+    One request to a webhook endpoint, containing one or more queued calls.
+    """
+
+    webhook: TableWebhook
+    calls: List[Dict[str, Any]]
+    payload: Any = None
+    remaining_payload: Optional[dict] = None
+    payload_too_large: bool = False
+    request: Any = None
+    response: Any = None
+    success: bool = False
+    error: str = ""
+
+    @property
+    def first_call(self) -> Dict[str, Any]:
+        return self.calls[0]
+
+
+class WebhookDeliveryDispatcher:
+    """
+    Delivers the queued webhook calls. The HTTP requests are made concurrently in a
+    pool of threads with one keep-alive session per thread, while everything
+    touching the database happens in the thread of the dispatcher. A webhook is
+    claimed with a lock for as long as one of its calls is in flight, so that its
+    calls are delivered in order. A failed call stays at the head of the queue until
+    it succeeds or runs out of retries.
+    """
+
+    def __init__(self, concurrency: Optional[int] = None):
+        self.concurrency = concurrency or settings.BASEROW_WEBHOOKS_DELIVERY_CONCURRENCY
+        self.redis = _get_redis_client()
+        self._local = threading.local()
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+
+    def run(self):
+        """
+        Delivers calls until there is nothing left to deliver or the maximum run
+        time has been reached, in which case a new task is scheduled to continue.
+        """
+
+        from .tasks import deliver_webhook_calls
+
+        deadline = time.monotonic() + DISPATCHER_MAX_RUN_SECONDS
+        in_flight = {}
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                while True:
+                    timed_out = time.monotonic() >= deadline
+                    free_slots = self.concurrency - len(in_flight)
+                    if free_slots > 0 and not timed_out:
+                        for delivery in self.claim_deliveries(free_slots):
+                            if delivery.payload_too_large:
+                                self.complete_delivery(delivery)
+                            else:
+                                future = executor.submit(self.send, delivery)
+                                in_flight[future] = delivery
+
+                    if not in_flight:
+                        if timed_out:
+                            if self.has_due_webhooks():
+                                deliver_webhook_calls.delay()
+                            break
+                        if self.stop_if_idle():
+                            break
+                        # Another dispatcher is about to release a ready webhook.
+                        time.sleep(0.1)
+                        continue
+
+                    # Wake up regularly to claim the webhooks that became ready.
+                    done, _ = wait(in_flight, timeout=1, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        delivery = in_flight.pop(future)
+                        if future.exception() is not None:
+                            delivery.error = str(future.exception())
+                        self.complete_delivery(delivery)
+        finally:
+            for session in self._sessions:
+                session.close()
+
+    def has_due_webhooks(self) -> bool:
+        return self.redis.zcount(READY_WEBHOOKS_KEY, "-inf", time.time()) > 0
+
+    def stop_if_idle(self) -> bool:
+        """
+        Releases the scheduled flag if there is nothing left to deliver. The flag is
+        released before checking, so that a call queued in the meantime either is
+        seen here or schedules a new dispatcher itself.
+
+        :return: True if the dispatcher can stop.
+        """
+
+        self.redis.delete(DISPATCHER_SCHEDULED_KEY)
+        if not self.has_due_webhooks():
+            return True
+
+        # Continue unless another dispatcher has been scheduled in the meantime.
+        return not self.redis.set(
+            DISPATCHER_SCHEDULED_KEY,
+            1,
+            nx=True,
+            ex=DISPATCHER_SCHEDULED_EXPIRY_SECONDS,
+        )
+
+    def claim_deliveries(self, limit: int) -> List[WebhookDelivery]:
+        """
+        Claims up to `limit` webhooks that have calls ready to be delivered and
+        prepares the next request of each one of them.
+        """
+
+        now = time.time()
+        lock_expiry = get_delivery_lock_expiry_seconds()
+        webhook_ids = self.redis.zrangebyscore(
+            READY_WEBHOOKS_KEY, "-inf", now, start=0, num=limit
+        )
+
+        deliveries = []
+        for webhook_id in webhook_ids:
+            webhook_id = int(webhook_id)
+            if not self.redis.set(
+                get_delivery_lock_key(webhook_id), 1, nx=True, ex=lock_expiry
+            ):
+                continue
+
+            # Hide the webhook from the other dispatchers while it's claimed. If this
+            # process dies, it will become ready again after the lock expired.
+            self.redis.zadd(
+                READY_WEBHOOKS_KEY, {webhook_id: now + lock_expiry}, xx=True
+            )
+
+            delivery = self.prepare_delivery(webhook_id)
+            if delivery is None:
+                self.release(webhook_id)
+            else:
+                deliveries.append(delivery)
+
+        return deliveries
+
+    def prepare_delivery(self, webhook_id: int) -> Optional[WebhookDelivery]:
+        """
+        Builds the next request of the webhook from the head of its queue. If the
+        webhook opted in, consecutive calls of the same event type are combined.
+        """
+
+        from .registries import webhook_event_type_registry
+
+        webhook = (
+            TableWebhook.objects.filter(id=webhook_id, active=True)
+            .select_related("table__database__workspace")
+            .first()
+        )
+        if webhook is None:
+            # The webhook has been deleted or deactivated, so the calls don't have to
+            # be delivered anymore.
+            self.clear_queue(webhook_id)
+            return None
+
+        max_calls = (
+            settings.BASEROW_WEBHOOKS_DELIVERY_MAX_BATCH_SIZE
+            if webhook.batch_events
+            else 1
+        )
+        queued_calls = [
+            json.loads(call)
+            for call in self.redis.lrange(
+                get_delivery_queue_key(webhook_id), 0, max_calls - 1
+            )
+        ]
+        if not queued_calls:
+            return None
+
+        first_call = queued_calls[0]
+        delivery = WebhookDelivery(webhook=webhook, calls=[first_call])
+        event_type = webhook_event_type_registry.get(first_call["event_type"])
+        try:
+            delivery.payload, delivery.remaining_payload = event_type.paginate_payload(
+                webhook, first_call["event_id"], deepcopy(first_call["payload"])
+            )
+        except WebhookPayloadTooLarge:
+            delivery.payload_too_large = True
+            return delivery
+
+        if not webhook.batch_events or delivery.remaining_payload is not None:
+            return delivery
+
+        payloads = [delivery.payload]
+        for call in queued_calls[1:]:
+            if any(
+                call[key] != first_call[key] for key in ("event_type", "method", "url")
+            ):
+                break
+            try:
+                payload, remaining_payload = event_type.paginate_payload(
+                    webhook, call["event_id"], deepcopy(call["payload"])
+                )
+            except WebhookPayloadTooLarge:
+                break
+            if remaining_payload is not None:
+                break
+            payloads.append(payload)
+            delivery.calls.append(call)
+
+        if len(payloads) > 1:
+            delivery.payload = payloads
+
+        return delivery
+
+    def _get_session(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = get_webhook_session()
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def send(self, delivery: WebhookDelivery) -> WebhookDelivery:
+        """
+        Makes the HTTP request of the delivery. Runs in one of the pool threads, so
+        it must not touch the database.
+        """
+
+        call = delivery.first_call
+        (
+            delivery.request,
+            delivery.response,
+            delivery.success,
+            delivery.error,
+        ) = send_webhook_request(
+            call["method"],
+            call["url"],
+            call["headers"],
+            delivery.payload,
+            session=self._get_session(),
+        )
+        return delivery
+
+    def complete_delivery(self, delivery: WebhookDelivery):
+        """
+        Stores the outcome of the delivery, removes the delivered calls from the
+        queue or schedules a retry, and releases the webhook.
+        """
+
+        from .tasks import deliver_webhook_calls
+
+        webhook = delivery.webhook
+        webhook_id = webhook.id
+        first_call = delivery.first_call
+        queue_key = get_delivery_queue_key(webhook_id)
+
+        try:
+            with transaction.atomic():
+                if delivery.payload_too_large:
+                    # We don't want to retry this call, because it will fail again.
+                    transaction.on_commit(
+                        lambda: WebhookPayloadTooLargeNotificationType.notify_admins_in_workspace(
+                            webhook, first_call["event_id"]
+                        )
+                    )
+                else:
+                    payloads = (
+                        delivery.payload
+                        if len(delivery.calls) > 1
+                        else [delivery.payload]
+                    )
+                    for call, payload in zip(delivery.calls, payloads):
+                        save_webhook_call(
+                            webhook,
+                            call["event_id"],
+                            call["event_type"],
+                            call["url"],
+                            payload,
+                            delivery.request,
+                            delivery.response,
+                            delivery.error,
+                        )
+                    update_webhook_after_call(webhook, delivery.success)
+        except Exception:
+            logger.exception(
+                f"Could not save the webhook calls of webhook {webhook_id}"
+            )
+            # The calls stay in the queue and are delivered again later.
+            self.release(
+                webhook_id, ready_at=time.time() + get_delivery_lock_expiry_seconds()
+            )
+            return
+
+        if not webhook.active:
+            self.clear_queue(webhook_id)
+            self.release(webhook_id)
+            return
+
+        retries = first_call["retries"]
+        if (
+            delivery.success
+            or delivery.payload_too_large
+            or retries >= settings.BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL
+        ):
+            pipeline = self.redis.pipeline()
+            pipeline.ltrim(queue_key, len(delivery.calls), -1)
+            if delivery.success and delivery.remaining_payload is not None:
+                pipeline.lpush(
+                    queue_key,
+                    json.dumps(
+                        {
+                            **first_call,
+                            "payload": delivery.remaining_payload,
+                            "retries": 0,
+                        }
+                    ),
+                )
+            pipeline.execute()
+
+            if delivery.success and delivery.remaining_payload is not None:
+                # The next page of the same call is now at the head of the queue.
+                webhook_calls_queued_counter.add(1 - len(delivery.calls))
+            else:
+                webhook_calls_queued_counter.add(-len(delivery.calls))
+                now = time.time()
+                for call in delivery.calls:
+                    webhook_delivery_latency_histogram.record(
+                        (now - call["queued_at"]) * 1000
+                    )
+            self.release(webhook_id)
+        else:
+            # Keep the call at the head of the queue, so that the calls of this
+            # webhook stay in order, and retry with an exponential backoff.
+            self.redis.lset(
+                queue_key, 0, json.dumps({**first_call, "retries": retries + 1})
+            )
+            countdown = 2**retries
+            self.release(webhook_id, ready_at=time.time() + countdown)
+            deliver_webhook_calls.apply_async(countdown=countdown)
+
+    def clear_queue(self, webhook_id: int):
+        queue_key = get_delivery_queue_key(webhook_id)
+        pipeline = self.redis.pipeline()
+        pipeline.llen(queue_key)
+        pipeline.delete(queue_key)
+        length, _ = pipeline.execute()
+        webhook_calls_queued_counter.add(-length)
+
+    def release(self, webhook_id: int, ready_at: Optional[float] = None):
+        """
+        Releases the claim on the webhook. If calls are left in its queue, it's made
+        ready again for the next delivery.
+
+        :param webhook_id: The id of the webhook that must be released.
+        :param ready_at: The timestamp from when the next call can be delivered.
+        """
+
+        if ready_at is not None:
+            self.redis.zadd(READY_WEBHOOKS_KEY, {webhook_id: ready_at})
+        else:
+            # Removing it first makes sure that a call queued concurrently is either
+            # seen by the length check or adds the webhook again itself.
+            self.redis.zrem(READY_WEBHOOKS_KEY, webhook_id)
+            if self.redis.llen(get_delivery_queue_key(webhook_id)) > 0:
+                self.redis.zadd(READY_WEBHOOKS_KEY, {webhook_id: time.time()})
+        self.redis.delete(get_delivery_lock_key(webhook_id))
@@ -7,7 +7,7 @@ from django.contrib.auth.models import User as DjangoUser
 from django.db.models import Q
 from django.db.models.query import QuerySet
 
-from requests import PreparedRequest, Response
+from requests import PreparedRequest, Response, Session
 
 from baserow.contrib.database.fields.models import Field
 from baserow.contrib.database.table.models import Table
@@ -237,6 +237,7 @@ class WebhookHandler:
             "request_method",
             "name",
             "include_all_events",
+            "batch_events",
         ]
         values = extract_allowed(kwargs, allowed_fields)
         webhook = TableWebhook.objects.create(table_id=table.id, **values)
@@ -311,6 +312,7 @@ class WebhookHandler:
             "request_method",
             "name",
             "include_all_events",
+            "batch_events",
             "active",
         ]
         webhook = set_allowed_attrs(kwargs, allowed_fields, webhook)
@@ -405,7 +407,12 @@ class WebhookHandler:
         webhook.delete()
 
     def make_request(
-        self, method: str, url: str, headers: dict, payload: dict
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        payload: dict,
+        session: Optional[Session] = None,
     ) -> Response:
         """
         Makes a request to the provided URL with the provided settings. In production
@@ -417,10 +424,14 @@ class WebhookHandler:
         :param headers: The headers that must be sent. The key is the name and the
             value the value.
         :param payload: The JSON pay as dict that must be sent.
+        :param session: An optional session created by `get_webhook_session`, used
+            to keep the connections to the same host alive between calls.
         :return: The request and response as the tuple (request, response)
         """
 
-        request = get_webhook_request_function()
+        request = (
+            session.request if session is not None else get_webhook_request_function()
+        )
 
         response = request(
             method,
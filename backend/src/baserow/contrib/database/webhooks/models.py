@@ -56,6 +56,12 @@ class TableWebhook(CreatedAndUpdatedOnMixin, models.Model):
     failed_triggers = models.IntegerField(
         default=0, help_text="The amount of failed webhook calls."
     )
+    batch_events = models.BooleanField(
+        default=False,
+        help_text="Indicates whether multiple queued events of the same type may be "
+        "sent together in one request. The request body is then a list of the event "
+        "payloads.",
+    )
 
     @property
     def header_dict(self):
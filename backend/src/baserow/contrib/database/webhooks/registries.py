@@ -1,5 +1,6 @@
 import uuid
 
+from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.db import transaction
 from django.db.models import Q
@@ -187,6 +188,7 @@ class WebhookEventType(Instance):
         :param kwargs: The arguments of the signal.
         """
 
+        from baserow.contrib.database.webhooks.delivery import enqueue_webhook_call
         from baserow.contrib.database.webhooks.handler import WebhookHandler
 
         if not kwargs.get("send_webhooks_events", True):
@@ -200,7 +202,7 @@ class WebhookEventType(Instance):
                 payload = self.get_payload(event_id, webhook, **kwargs)
                 headers = webhook.header_dict
                 headers.update(**webhook_handler.get_headers(self.type, event_id))
-                call_webhook.delay(
+                call_kwargs = dict(
                     webhook_id=webhook.id,
                     event_id=str(event_id),
                     event_type=self.type,
@@ -209,6 +211,10 @@ class WebhookEventType(Instance):
                     headers=headers,
                     payload=payload,
                 )
+                if settings.BASEROW_WEBHOOKS_DELIVERY_CONCURRENCY > 0:
+                    enqueue_webhook_call(**call_kwargs)
+                else:
+                    call_webhook.delay(**call_kwargs)
             # Raised if the webhook should be skipped for whatever reason. In that case
             # we don't want to fail, but rather don't do anything.
             except SkipWebhookCall:
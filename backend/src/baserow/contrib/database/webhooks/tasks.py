@@ -1,5 +1,5 @@
 from copy import deepcopy
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from django.conf import settings
 from django.core import cache
@@ -174,17 +174,65 @@ def call_webhook(
         self.retry(countdown=2**retries, kwargs=kwargs)
 
 
+@app.task(bind=True, queue="export")
+def deliver_webhook_calls(self):
+    """
+    Delivers the webhook calls queued by `enqueue_webhook_call`. Many webhooks are
+    called concurrently, while the calls of a single webhook are made one by one in
+    the order in which they were queued. The task stops when there is nothing left to
+    deliver.
+    """
+
+    from .delivery import WebhookDeliveryDispatcher
+
+    if settings.BASEROW_WEBHOOKS_DELIVERY_CONCURRENCY <= 0:
+        return
+
+    WebhookDeliveryDispatcher().run()
+
+
+@app.on_after_finalize.connect
+def setup_periodic_tasks(sender, **kwargs):
+    if settings.BASEROW_WEBHOOKS_DELIVERY_CONCURRENCY > 0:
+        # Picks up the calls of webhooks claimed by a dispatcher that stopped
+        # unexpectedly, once their claim has expired.
+        sender.add_periodic_task(
+            timedelta(minutes=1),
+            deliver_webhook_calls.s(),
+        )
+
+
 def make_request_and_save_result(
     webhook, event_id, event_type, method, url, headers, payload
 ):
+    request, response, success, error = send_webhook_request(
+        method, url, headers, payload
+    )
+    save_webhook_call(
+        webhook, event_id, event_type, url, payload, request, response, error
+    )
+    update_webhook_after_call(webhook, success)
+    return success
+
+
+def send_webhook_request(method, url, headers, payload, session=None):
+    """
+    Makes the HTTP request of a webhook call without touching the database, so that
+    it can also be executed in another thread.
+
+    :param method: The request method the must be used.
+    :param url: The URL can must be called.
+    :param headers: The headers that must be added to the request.
+    :param payload: The JSON serializable payload that must be used as request body.
+    :param session: An optional requests session to reuse connections.
+    :return: A tuple containing the request, the response, whether the call was
+        successful and the error message.
+    """
+
     from advocate import UnacceptableAddressException
     from requests import RequestException
 
     from .handler import WebhookHandler
-    from .models import TableWebhookCall
-    from .notification_types import WebhookDeactivatedNotificationType
-
-    handler = WebhookHandler()
 
     request = None
     response = None
@@ -192,7 +240,9 @@ def make_request_and_save_result(
     error = ""
 
     try:
-        request, response = handler.make_request(method, url, headers, payload)
+        request, response = WebhookHandler().make_request(
+            method, url, headers, payload, session=session
+        )
         success = response.ok
     except RequestException as exception:
         request = exception.request
@@ -201,9 +251,26 @@ def make_request_and_save_result(
     except UnacceptableAddressException as exception:
         error = f"UnacceptableAddressException: {exception}"
 
+    return request, response, success, error
+
+
+def save_webhook_call(
+    webhook, event_id, event_type, url, payload, request, response, error
+):
+    """
+    Stores the webhook call in the call log of the webhook and removes the calls
+    exceeding the log limit.
+    """
+
+    from .handler import WebhookHandler
+    from .models import TableWebhookCall
+
+    handler = WebhookHandler()
+
+    batch_id = payload.get("batch_id", None) if isinstance(payload, dict) else None
     TableWebhookCall.objects.update_or_create(
         event_id=event_id,
-        batch_id=payload.get("batch_id", None),
+        batch_id=batch_id,
         event_type=event_type,
         webhook=webhook,
         defaults={
@@ -219,6 +286,15 @@ def make_request_and_save_result(
     )
     handler.clean_webhook_calls(webhook)
 
+
+def update_webhook_after_call(webhook, success):
+    """
+    Resets or increases the failed triggers of the webhook depending on the outcome
+    of the call, and deactivates it when too many consecutive calls have failed.
+    """
+
+    from .notification_types import WebhookDeactivatedNotificationType
+
     if success:
         if webhook.failed_triggers != 0:
             # If the call was successful and failed triggers had been increased
@@ -251,5 +327,3 @@ def make_request_and_save_result(
                 webhook
             )
         )
-
-    return success
@@ -12,6 +12,7 @@ from advocate.connection import (
     UnacceptableAddressException,
     validating_create_connection,
 )
+from requests import Session
 
 INVALID_URL_CODE = "invalid_url"
 
@@ -38,6 +39,21 @@ def get_webhook_request_function() -> Callable:
         return baserow_advocate.request
 
 
+def get_webhook_session() -> Session:
+    """
+    Returns a new requests session that applies the same address restrictions as
+    `get_webhook_request_function`. Reusing the session keeps the connections to the
+    same host alive between webhook calls.
+    """
+
+    if settings.BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS is True:
+        return Session()
+    else:
+        from advocate import Session as AdvocateSession
+
+        return AdvocateSession(validator=get_advocate_address_validator())
+
+
 def get_advocate_address_validator() -> AddrValidator:
     """
     Return Advocate's AddrValidator with the user configurable white and black lists.
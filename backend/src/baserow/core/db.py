@@ -1,9 +1,11 @@
 import contextlib
+import json
+import operator
 import random
 import time
 from collections import defaultdict
 from decimal import Decimal
-from functools import cache, wraps
+from functools import cache, reduce, wraps
 from math import ceil
 from typing import (
     Any,
@@ -11,8 +13,10 @@ from typing import (
     Dict,
     Generic,
     Iterable,
+    Iterator,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
     TypeVar,
@@ -20,8 +24,19 @@ from typing import (
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import FieldDoesNotExist
 from django.db import DEFAULT_DB_ALIAS, OperationalError, connection, transaction
-from django.db.models import ForeignKey, ManyToManyField, Max, Model, Prefetch, QuerySet
+from django.db.models import (
+    F,
+    ForeignKey,
+    ManyToManyField,
+    Max,
+    Model,
+    OrderBy,
+    Prefetch,
+    Q,
+    QuerySet,
+)
 from django.db.models.functions import Collate
 from django.db.models.query import ModelIterable
 from django.db.models.sql.query import LOOKUP_SEP
@@ -875,3 +890,326 @@ def atomic_with_retry_on_deadlock(
         return wrapper
 
     return decorator
+
+
+def get_queryset_order_bys(queryset: QuerySet) -> List[OrderBy]:
+    """
+    Returns the effective ordering of the provided queryset as a list of `OrderBy`
+    expressions. String references like `-order` are converted to expressions and
+    the default ordering of the model is used if the queryset has not been ordered
+    explicitly.
+
+    :param queryset: The queryset to extract the ordering from.
+    :raises ValueError: When the queryset is randomly ordered.
+    :return: A list of `OrderBy` expressions in the same order as the queryset.
+    """
+
+    query = queryset.query
+    if query.order_by:
+        ordering = query.order_by
+    elif query.default_ordering:
+        ordering = queryset.model._meta.ordering
+    else:
+        ordering = []
+
+    order_bys = []
+    for item in ordering:
+        if isinstance(item, str):
+            if item == "?":
+                raise ValueError("A randomly ordered queryset has no stable ordering.")
+            name = item.lstrip("-+")
+            if name == "pk":
+                name = queryset.model._meta.pk.name
+            order_bys.append(OrderBy(F(name), descending=item.startswith("-")))
+        elif isinstance(item, OrderBy):
+            order_bys.append(item)
+        else:
+            order_bys.append(item.asc())
+    return order_bys
+
+
+def _is_pk_order_by(model: Model, order_by: OrderBy) -> bool:
+    return isinstance(order_by.expression, F) and order_by.expression.name in (
+        "pk",
+        model._meta.pk.name,
+    )
+
+
+def is_ordering_backed_by_index(queryset: QuerySet) -> bool:
+    """
+    Checks if the ordering of the queryset only consists of plain ascending columns
+    which match the primary key or the leading columns of one of the indexes of the
+    model. Only then can every keyset page be fetched without a full table scan,
+    otherwise a single server-side cursor is the faster option.
+
+    :param queryset: The queryset to check.
+    :return: Whether the ordering can use an index.
+    """
+
+    try:
+        order_bys = get_queryset_order_bys(queryset)
+    except ValueError:
+        return False
+
+    pk_name = queryset.model._meta.pk.name
+    column_names = []
+    for order_by in order_bys:
+        if order_by.descending or not isinstance(order_by.expression, F):
+            return False
+        name = order_by.expression.name
+        column_names.append(pk_name if name == "pk" else name)
+        # The primary key is unique, so the columns after it don't matter.
+        if column_names[-1] == pk_name:
+            break
+    else:
+        column_names.append(pk_name)
+
+    indexed_columns = [[pk_name]] + [
+        list(index.fields) for index in queryset.model._meta.indexes
+    ]
+    return any(
+        columns[: len(column_names)] == column_names for columns in indexed_columns
+    )
+
+
+class KeysetPaginator:
+    """
+    Paginates a queryset using keyset (also known as seek) pagination. Instead of
+    using `OFFSET`, which makes every page slower than the previous one, every page
+    is selected by comparing the ordering values with the values of the last row
+    of the previous page. If an index matches the ordering, every page can be
+    fetched in constant time.
+
+    The ordering of the queryset is respected, including the `NULLS FIRST` and
+    `NULLS LAST` placement. The primary key is added as last tiebreaker if it's not
+    part of the ordering yet, so that the keyset of every row is unique.
+
+    Example:
+
+    paginator = KeysetPaginator(model.objects.order_by("order", "id"), 2000)
+    for page in paginator:
+        for row in page:
+            ...
+    """
+
+    annotation_prefix = "keyset_value_"
+
+    def __init__(self, queryset: QuerySet, page_size: int):
+        """
+        :param queryset: The ordered queryset that must be paginated.
+        :param page_size: The maximum number of rows of every page.
+        """
+
+        order_bys = get_queryset_order_bys(queryset)
+        if not any(_is_pk_order_by(queryset.model, o) for o in order_bys):
+            order_bys.append(OrderBy(F(queryset.model._meta.pk.name)))
+
+        self.page_size = page_size
+        self.order_bys = order_bys
+        self.aliases = [
+            f"{self.annotation_prefix}{index}" for index in range(len(order_bys))
+        ]
+        self.queryset = queryset.annotate(
+            **{
+                alias: order_by.expression
+                for alias, order_by in zip(self.aliases, order_bys)
+            }
+        ).order_by(
+            *[
+                OrderBy(
+                    F(alias),
+                    descending=order_by.descending,
+                    nulls_first=order_by.nulls_first,
+                    nulls_last=order_by.nulls_last,
+                )
+                for alias, order_by in zip(self.aliases, order_bys)
+            ]
+        )
+
+    def get_keyset(self, row: Model) -> List[Any]:
+        """
+        Returns the values of the ordering expressions of the provided row. These
+        values can be passed into the `get_page` method to get the next page.
+
+        :param row: A row fetched via one of the pages of this paginator.
+        :return: A list containing the value of every ordering expression.
+        """
+
+        return [getattr(row, alias) for alias in self.aliases]
+
+    def get_after_filter(self, keyset: Sequence[Any]) -> Q:
+        """
+        Constructs the filter that matches all the rows that come after the provided
+        keyset. For an ordering `a, b, id` this is equivalent to the row value
+        comparison `(a, b, id) > (%s, %s, %s)`, but expanded so that mixed sort
+        directions and `NULL` values are respected as well.
+
+        :param keyset: The values returned by `get_keyset` for the last row.
+        :return: A Q object matching the rows after the keyset.
+        """
+
+        conditions = []
+        equal = Q()
+        for alias, order_by, value in zip(self.aliases, self.order_bys, keyset):
+            nullable = self._is_nullable(order_by)
+            nulls_first = order_by.nulls_first or (
+                order_by.descending and not order_by.nulls_last
+            )
+            if value is None:
+                # Nothing comes after a `NULL` value if they're placed last.
+                if nulls_first:
+                    conditions.append(equal & Q(**{f"{alias}__isnull": False}))
+                equal &= Q(**{f"{alias}__isnull": True})
+            else:
+                lookup = "lt" if order_by.descending else "gt"
+                after = Q(**{f"{alias}__{lookup}": value})
+                if nullable and not nulls_first:
+                    after |= Q(**{f"{alias}__isnull": True})
+                conditions.append(equal & after)
+                equal &= Q(**{alias: value})
+
+        after_filter = reduce(operator.or_, conditions, Q(pk__in=[]))
+
+        # The expanded condition above can't be used as index condition by
+        # PostgreSQL. Adding the redundant inclusive range condition on the first
+        # expression allows the planner to start scanning the index at the right
+        # position.
+        first_order_by, first_value = self.order_bys[0], keyset[0]
+        if (
+            len(self.order_bys) > 1
+            and first_value is not None
+            and not self._is_nullable(first_order_by)
+        ):
+            lookup = "lte" if first_order_by.descending else "gte"
+            after_filter &= Q(**{f"{self.aliases[0]}__{lookup}": first_value})
+
+        return after_filter
+
+    def _is_nullable(self, order_by: OrderBy) -> bool:
+        """
+        Only plain references to non nullable concrete fields are guaranteed to never
+        be `NULL`. All other expressions could result in a `NULL` value.
+        """
+
+        if not isinstance(order_by.expression, F):
+            return True
+        try:
+            field = self.queryset.model._meta.get_field(order_by.expression.name)
+        except FieldDoesNotExist:
+            return True
+        return not field.concrete or field.null
+
+    def get_keyset_at(self, offset: int) -> Optional[List[Any]]:
+        """
+        Returns the keyset of the row at the provided position in the ordering. This
+        can be used to split the queryset into multiple ranges.
+
+        :param offset: The zero based position of the row.
+        :return: The keyset of the row, or None if there is no row at the position.
+        """
+
+        values = list(
+            self.queryset.prefetch_related(None).values_list(*self.aliases)[
+                offset : offset + 1
+            ]
+        )
+        return list(values[0]) if values else None
+
+    def get_range_queryset(
+        self,
+        after_keyset: Optional[Sequence[Any]] = None,
+        until_keyset: Optional[Sequence[Any]] = None,
+    ) -> QuerySet:
+        """
+        Returns the ordered queryset narrowed down to the rows after `after_keyset`
+        up to and including `until_keyset`.
+
+        :param after_keyset: The rows up to and including this keyset are excluded.
+            If None, the range starts at the first row.
+        :param until_keyset: The rows after this keyset are excluded. If None, the
+            range ends at the last row.
+        :return: The narrowed down queryset.
+        """
+
+        queryset = self.queryset
+        if after_keyset is not None:
+            queryset = queryset.filter(self.get_after_filter(after_keyset))
+        if until_keyset is not None:
+            queryset = queryset.exclude(self.get_after_filter(until_keyset))
+        return queryset
+
+    def get_page(self, keyset: Optional[Sequence[Any]] = None) -> List[Model]:
+        """
+        Fetches the rows of the page directly after the provided keyset.
+
+        :param keyset: The keyset of the last row of the previous page, or None to
+            fetch the first page.
+        :return: A list containing at most `page_size` rows.
+        """
+
+        queryset = self.queryset
+        if keyset is not None:
+            queryset = queryset.filter(self.get_after_filter(keyset))
+        return list(queryset[: self.page_size])
+
+    def __iter__(self) -> Iterator[List[Model]]:
+        keyset = None
+        while True:
+            page = self.get_page(keyset)
+            if page:
+                yield page
+            if len(page) < self.page_size:
+                return
+            keyset = self.get_keyset(page[-1])
+
+
+def iterate_queryset_in_chunks(
+    queryset: QuerySet, chunk_size: int
+) -> Iterator[List[Model]]:
+    """
+    Streams the rows of the queryset using a server-side cursor and yields them in
+    lists of at most `chunk_size` rows. Unlike `KeysetPaginator`, the query is only
+    executed once, which makes this the preferred approach if the ordering of the
+    queryset can't be served by an index. The multi field prefetch functions are
+    applied to every chunk because `QuerySet.iterator` bypasses `_fetch_all`.
+
+    :param queryset: The queryset to iterate over.
+    :param chunk_size: The number of rows fetched from the cursor at once.
+    :return: An iterator yielding lists of rows.
+    """
+
+    prefetch_functions = (
+        queryset.get_multi_field_prefetches()
+        if isinstance(queryset, MultiFieldPrefetchQuerysetMixin)
+        else []
+    )
+
+    def prefetched(chunk):
+        for prefetch_function in prefetch_functions:
+            prefetch_function(queryset, chunk)
+        return chunk
+
+    chunk = []
+    for row in queryset.iterator(chunk_size=chunk_size):
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield prefetched(chunk)
+            chunk = []
+
+    if chunk:
+        yield prefetched(chunk)
+
+
+def get_estimated_count(queryset: QuerySet) -> int:
+    """
+    Returns the number of rows that the PostgreSQL planner expects the queryset to
+    return. The query itself is not executed, so this is a lot faster than an exact
+    `COUNT(*)` on large tables, but the result can be off, especially when complex
+    filters are applied.
+
+    :param queryset: The queryset to estimate the number of rows for.
+    :return: The estimated number of rows.
+    """
+
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -24,8 +24,8 @@ __all__ = [
     BaserowFormulaSyntaxError,
 ]
 
-from baserow.core.formula.parser.parser import get_parse_tree_for_formula
-from baserow.core.formula.parser.python_executor import BaserowPythonExecutor
+from baserow.core.formula.parser.parser import get_parse_tree_for_formula  # noqa: F401
+from baserow.core.formula.parser.python_compiler import get_compiled_formula
 
 
 def resolve_formula(
@@ -50,5 +50,5 @@ def resolve_formula(
     if formula["mode"] == BASEROW_FORMULA_MODE_RAW:
         return formula["formula"]
 
-    tree = get_parse_tree_for_formula(formula["formula"])
-    return BaserowPythonExecutor(functions, formula_context).visit(tree)
+    compiled_formula = get_compiled_formula(formula["formula"], functions)
+    return compiled_formula(formula_context)
@@ -0,0 +1,217 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from django.conf import settings
+
+from baserow.core.formula import BaserowFormula, BaserowFormulaVisitor
+from baserow.core.formula.parser.exceptions import (
+    BaserowFormulaSyntaxError,
+    FieldByIdReferencesAreDeprecated,
+    FormulaFunctionTypeDoesNotExist,
+    UnknownOperator,
+)
+from baserow.core.formula.parser.parser import get_parse_tree_for_formula
+from baserow.core.formula.parser.python_executor import BaserowPythonExecutor
+from baserow.core.formula.types import (
+    FormulaContext,
+    FormulaFunction,
+    FunctionCollection,
+)
+
+CompiledFormula = Callable[[FormulaContext], Any]
+
+BINARY_OPERATORS = [
+    ("PLUS", "add"),
+    ("MINUS", "minus"),
+    ("SLASH", "divide"),
+    ("EQUAL", "equal"),
+    ("BANG_EQUAL", "not_equal"),
+    ("STAR", "multiply"),
+    ("GT", "greater_than"),
+    ("LT", "less_than"),
+    ("GTE", "greater_than_or_equal"),
+    ("LTE", "less_than_or_equal"),
+    ("AMP_AMP", "and"),
+    ("PIPE_PIPE", "or"),
+]
+
+
+class BaserowPythonCompiler(BaserowFormulaVisitor):
+    """
+    Compiles a parse tree into a callable that only has to be given a formula
+    context to resolve the formula. Literals are converted and the formula functions
+    are looked up once at compile time, so that the same formula can be resolved
+    over and over again without parsing it or walking the tree. The compiled
+    formula behaves exactly like the `BaserowPythonExecutor`.
+    """
+
+    def __init__(self, functions: FunctionCollection):
+        self.functions = functions
+
+    def visitRoot(self, ctx: BaserowFormula.RootContext):
+        return ctx.expr().accept(self)
+
+    def visitStringLiteral(self, ctx: BaserowFormula.StringLiteralContext):
+        literal_without_outer_quotes = ctx.getText()[1:-1]
+        if ctx.SINGLEQ_STRING_LITERAL() is not None:
+            literal = literal_without_outer_quotes.replace("\\'", "'")
+        else:
+            literal = literal_without_outer_quotes.replace('\\"', '"')
+        return self._constant(literal)
+
+    def visitDecimalLiteral(self, ctx: BaserowFormula.DecimalLiteralContext):
+        return self._constant(float(ctx.getText()))
+
+    def visitBooleanLiteral(self, ctx: BaserowFormula.BooleanLiteralContext):
+        return self._constant(ctx.TRUE() is not None)
+
+    def visitIntegerLiteral(self, ctx: BaserowFormula.IntegerLiteralContext):
+        return self._constant(int(ctx.getText()))
+
+    def visitBrackets(self, ctx: BaserowFormula.BracketsContext):
+        return ctx.expr().accept(self)
+
+    def visitLeftWhitespaceOrComments(
+        self, ctx: BaserowFormula.LeftWhitespaceOrCommentsContext
+    ):
+        return ctx.expr().accept(self)
+
+    def visitRightWhitespaceOrComments(
+        self, ctx: BaserowFormula.RightWhitespaceOrCommentsContext
+    ):
+        return ctx.expr().accept(self)
+
+    def visitFunctionCall(self, ctx: BaserowFormula.FunctionCallContext):
+        function_name = ctx.func_name().getText().lower()
+        return self._compile_func(ctx.expr(), function_name)
+
+    def visitBinaryOp(self, ctx: BaserowFormula.BinaryOpContext):
+        for token_name, op in BINARY_OPERATORS:
+            if getattr(ctx, token_name)():
+                return self._compile_func(ctx.expr(), op)
+
+        raise UnknownOperator(ctx.getText())
+
+    def visitFieldByIdReference(self, ctx: BaserowFormula.FieldByIdReferenceContext):
+        raise FieldByIdReferencesAreDeprecated()
+
+    def visitChildren(self, node):
+        # Nodes that the compiler doesn't know about are resolved by the executor at
+        # runtime, so that the result is always the same as not compiling.
+        functions = self.functions
+
+        def execute(context):
+            return BaserowPythonExecutor(functions, context).visit(node)
+
+        return execute
+
+    def _constant(self, value: Any) -> CompiledFormula:
+        return lambda context: value
+
+    def _compile_func(
+        self, function_argument_expressions, function_name: str
+    ) -> CompiledFormula:
+        compiled_args = [expr.accept(self) for expr in function_argument_expressions]
+        formula_function_type = self._get_formula_function_type(function_name)
+
+        def execute(context):
+            args = [compiled_arg(context) for compiled_arg in compiled_args]
+            # Like the executor, a function that doesn't exist is only reported after
+            # the arguments have been resolved.
+            if formula_function_type is None:
+                raise BaserowFormulaSyntaxError(
+                    f"{function_name} is not a valid function"
+                )
+            formula_function_type.validate_args(args)
+            args_parsed = formula_function_type.parse_args(args)
+            return formula_function_type.execute(context, args_parsed)
+
+        return execute
+
+    def _get_formula_function_type(
+        self, function_name: str
+    ) -> Optional[FormulaFunction]:
+        try:
+            return self.functions.get(function_name)
+        except FormulaFunctionTypeDoesNotExist:
+            return None
+
+
+class CompiledFormulasLRUCache:
+    """
+    A bounded, thread safe and process local cache of compiled formulas. An entry is
+    keyed by the formula text, the function collection and the version of that
+    collection, so that registering or unregistering a function never resolves a
+    formula with a stale function.
+    """
+
+    def __init__(self):
+        self._entries: OrderedDict[Tuple, CompiledFormula] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        return settings.BASEROW_COMPILED_FORMULAS_LRU_CACHE_SIZE
+
+    def get(self, key: Tuple) -> Optional[CompiledFormula]:
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+            return compiled
+
+    def set(self, key: Tuple, compiled: CompiledFormula):
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+compiled_formulas_lru_cache = CompiledFormulasLRUCache()
+
+
+def compile_formula(formula: str, functions: FunctionCollection) -> CompiledFormula:
+    """
+    Parses and compiles the formula into a callable accepting a formula context.
+
+    :param formula: The formula string to compile.
+    :param functions: The collection of functions that can be used in the formula.
+    :return: The compiled formula.
+    """
+
+    tree = get_parse_tree_for_formula(formula)
+    return tree.accept(BaserowPythonCompiler(functions))
+
+
+def get_compiled_formula(
+    formula: str, functions: FunctionCollection
+) -> CompiledFormula:
+    """
+    Returns the compiled formula from the process wide cache, or compiles and caches
+    it if it's not there yet. Formulas are not cached if the function collection
+    doesn't have a version because a change to the collection can't be detected.
+
+    :param formula: The formula string to compile.
+    :param functions: The collection of functions that can be used in the formula.
+    :return: The compiled formula.
+    """
+
+    version: Optional[Hashable] = functions.version
+    if version is None or compiled_formulas_lru_cache.max_size <= 0:
+        return compile_formula(formula, functions)
+
+    key = (formula, functions, version)
+    compiled = compiled_formulas_lru_cache.get(key)
+    if compiled is None:
+        compiled = compile_formula(formula, functions)
+        compiled_formulas_lru_cache.set(key, compiled)
+    return compiled
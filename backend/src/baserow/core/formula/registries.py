@@ -136,6 +136,20 @@ class BaserowRuntimeFormulaFunctionRegistry(
     name = "formula_runtime_function"
     does_not_exist_exception_class = FormulaFunctionTypeDoesNotExist
 
+    _version = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def register(self, instance: RuntimeFormulaFunction):
+        super().register(instance)
+        self._version += 1
+
+    def unregister(self, value):
+        super().unregister(value)
+        self._version += 1
+
 
 class DataProviderType(
     Instance,
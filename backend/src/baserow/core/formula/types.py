@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Literal, TypedDict, Union
+from typing import Any, Dict, Hashable, List, Literal, Optional, TypedDict, Union
 
 from baserow.core.formula.exceptions import RuntimeFormulaRecursion
 
@@ -54,6 +54,16 @@ class FunctionCollection(ABC):
         :return: The function itself
         """
 
+    @property
+    def version(self) -> Optional[Hashable]:
+        """
+        Should change every time the functions in the collection change, so that
+        formulas compiled against the collection can be cached. Formulas are not
+        cached if None is returned.
+        """
+
+        return None
+
 
 class FormulaFunction(ABC):
     @abstractmethod
@@ -1555,6 +1555,7 @@ class CoreHandler(metaclass=baserow_trace_methods(tracer)):
             reduce_disk_space_usage=False,
             is_duplicate=True,
             exclude_sensitive_data=False,
+            copy_rows_in_database=True,
         )
         # export the application
         specific_application = application.specific
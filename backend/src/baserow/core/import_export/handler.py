@@ -13,7 +13,6 @@ from zipfile import ZipFile
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import SuspiciousOperation
-from django.core.files.base import ContentFile
 from django.core.files.storage import Storage
 from django.db import transaction
 from django.db.models import Exists, OuterRef, QuerySet
@@ -39,7 +38,7 @@ from baserow.core.import_export.exceptions import (
     ImportExportResourceInvalidFile,
     ImportExportResourceUntrustedSignature,
 )
-from baserow.core.import_export.utils import chunk_generator
+from baserow.core.import_export.utils import chunk_generator, chunk_iterator
 from baserow.core.jobs.constants import JOB_FINISHED
 from baserow.core.models import (
     Application,
@@ -152,10 +151,22 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
         :return: The computed SHA-256 checksum as a hexadecimal string.
         """
 
-        computed_checksum = hashlib.sha256()
         with storage.open(full_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096 * 1024), b""):
-                computed_checksum.update(chunk)
+            return self.compute_checksum_from_stream(f)
+
+    def compute_checksum_from_stream(self, stream: IOBase) -> str:
+        """
+        Computes the SHA-256 checksum of the provided stream by reading it in chunks,
+        so that the whole content never has to be loaded into memory.
+
+        :param stream: The binary stream to compute the checksum for. This can for
+            example be a file in a storage or a member of a zip file.
+        :return: The computed SHA-256 checksum as a hexadecimal string.
+        """
+
+        computed_checksum = hashlib.sha256()
+        for chunk in chunk_iterator(stream):
+            computed_checksum.update(chunk)
         return computed_checksum.hexdigest()
 
     def mark_resource_invalid(self, resource: ImportExportResource):
@@ -738,36 +749,46 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
             except InvalidSignature:
                 raise ImportExportResourceInvalidFile("Signature verification failed.")
 
-    def validate_checksums(self, manifest: Dict, import_tmp_dir: str, storage: Storage):
+    def validate_checksums(
+        self,
+        manifest: Dict,
+        zip_file: ZipFile,
+        progress_builder: Optional[ChildProgressBuilder] = None,
+    ):
         """
-        Validates the checksums of the files extracted from the import zip file.
+        Validates the checksums of the files in the import zip file.
 
         This method computes the SHA-256 checksum for each file listed in the manifest
-        and compares it with the expected checksum provided in the manifest. If any
-        checksum does not match, an ImportWorkspaceFileCorruptedException is raised.
+        while streaming it directly from the zip file, and compares it with the
+        expected checksum provided in the manifest. If any checksum does not match, an
+        ImportExportResourceInvalidFile is raised.
 
         :param manifest: The manifest data containing the expected checksums.
-        :param import_tmp_dir: The temporary directory where the files have been
-            extracted.
-        :param storage: The storage instance used to read the files.
-        :raises ImportWorkspaceFileCorruptedException: If any file's checksum does not
+        :param zip_file: The ZipFile instance containing the files to validate.
+        :param progress_builder: A progress builder that allows for publishing progress.
+        :raises ImportExportResourceDoesNotExist: If a file of the manifest is missing
+            in the zip file.
+        :raises ImportExportResourceInvalidFile: If any file's checksum does not
             match the expected checksum.
         """
 
-        validation_results = {}
-
         checksums = manifest["checksums"]
-        for file_path, checksum in checksums.items():
-            full_path = join(import_tmp_dir, file_path)
+        progress = ChildProgressBuilder.build(
+            progress_builder, child_total=len(checksums)
+        )
+        file_names = set(zip_file.namelist())
 
-            if not storage.exists(full_path):
+        validation_results = {}
+        for file_path, checksum in checksums.items():
+            if file_path not in file_names:
                 raise ImportExportResourceDoesNotExist(
                     f"The file {file_path} does not exist."
                 )
 
-            computed_checksum = self.compute_checksum_from_file(full_path, storage)
-            is_valid = computed_checksum == checksum
-            validation_results[file_path] = is_valid
+            with zip_file.open(file_path) as zip_member:
+                computed_checksum = self.compute_checksum_from_stream(zip_member)
+            validation_results[file_path] = computed_checksum == checksum
+            progress.increment()
 
         if not all(validation_results.values()):
             raise ImportExportResourceInvalidFile("Checksum validation failed")
@@ -777,7 +798,6 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
         workspace: Workspace,
         id_mapping: Dict[str, Any],
         application_manifest: Dict,
-        import_tmp_path: str,
         import_export_config: ImportExportConfig,
         zip_file: ZipFile,
         storage: Storage,
@@ -789,7 +809,6 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
         :param workspace: The workspace into which the application will be imported.
         :param id_mapping: A dictionary for mapping old IDs to new IDs during import.
         :param application_manifest: Information from manifest about application.
-        :param import_tmp_path: The temporary path where the import files are stored.
         :param import_export_config: Configuration options for the import/export
             process.
         :param zip_file: The ZipFile instance containing the application to be imported.
@@ -799,13 +818,17 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
         :return: The imported Application instance.
         """
 
-        data_file_path = join(import_tmp_path, application_manifest["files"]["schema"])
-        if not storage.exists(data_file_path):
+        # The serialized application is read directly from the zip file, so that it
+        # doesn't have to be extracted to the storage first.
+        data_file_path = application_manifest["files"]["schema"]
+        try:
+            data_file = zip_file.open(data_file_path)
+        except KeyError:
             raise ImportExportResourceDoesNotExist(
                 f"The file {data_file_path} does not exist."
             )
 
-        with storage.open(data_file_path) as data_file:
+        with data_file:
             application_data = json.load(data_file)
 
         application_type = application_type_registry.get(application_manifest["type"])
@@ -825,7 +848,6 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
         user: AbstractUser,
         workspace: Workspace,
         manifest: Dict,
-        import_tmp_path: str,
         import_export_config: ImportExportConfig,
         zip_file: ZipFile,
         storage: Storage,
@@ -840,7 +862,6 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
         :param workspace: The workspace into which the applications will be imported.
         :param manifest: A dictionary representing the manifest data of the
             applications.
-        :param import_tmp_path: The temporary path where the import files are stored.
         :param import_export_config: Configuration options for the import/export
             process.
         :param zip_file: The ZipFile instance containing the applications to be
@@ -914,7 +935,6 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
                             workspace,
                             id_mapping,
                             application_manifest,
-                            import_tmp_path,
                             import_export_config,
                             zip_file,
                             storage,
@@ -935,38 +955,6 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
         Application.objects.bulk_update(imported_applications, ["order"])
         return imported_applications
 
-    def extract_files_from_zip(
-        self,
-        tmp_import_path: str,
-        zip_file: ZipFile,
-        storage: Storage,
-        progress_builder: Optional[ChildProgressBuilder] = None,
-    ):
-        """
-        Extracts files from a zip archive to a specified temporary import path.
-
-        This method iterates over the files in the provided zip archive and saves each
-        file to the specified temporary import path using the provided storage instance.
-
-        :param tmp_import_path: The temporary directory where the files will be
-            extracted.
-        :param zip_file: The ZipFile instance containing the files to be extracted.
-        :param storage: The storage instance used to save the extracted files.
-        :param progress_builder: A progress builder that allows for publishing progress.
-        """
-
-        file_list = zip_file.infolist()
-        progress = ChildProgressBuilder.build(
-            progress_builder, child_total=len(file_list)
-        )
-
-        for file_info in file_list:
-            extracted_file_path = join(tmp_import_path, file_info.filename)
-            with zip_file.open(file_info) as extracted_file:
-                file_content = extracted_file.read()
-                storage.save(extracted_file_path, ContentFile(file_content))
-            progress.increment()
-
     def import_workspace_applications(
         self,
         user: AbstractUser,
@@ -1009,8 +997,9 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
         import_file_path = self.get_import_storage_path(archive_name)
         import_tmp_path = self.get_import_storage_path(resource.uuid.hex)
 
-        # If the path for temporary files exists it means that job process
-        # was interrupted, and we need to clean it up before starting the import
+        # The files used to be extracted to this temporary path before being imported.
+        # If it still exists, it means that an import job was interrupted, and we
+        # need to clean it up.
         if storage.exists(import_tmp_path):
             self.clean_storage(import_tmp_path, storage)
 
@@ -1036,15 +1025,12 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
                     self.mark_resource_invalid(resource)
                     raise
 
-                self.extract_files_from_zip(
-                    import_tmp_path,
-                    zip_file,
-                    storage,
-                    progress.create_child_builder(represents_progress=10),
-                )
-
                 try:
-                    self.validate_checksums(manifest_data, import_tmp_path, storage)
+                    self.validate_checksums(
+                        manifest_data,
+                        zip_file,
+                        progress.create_child_builder(represents_progress=10),
+                    )
                 except Exception as e:  # noqa
                     self.mark_resource_invalid(resource)
                     raise
@@ -1063,7 +1049,6 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
                     user,
                     workspace,
                     manifest_data,
-                    import_tmp_path,
                     import_export_config,
                     zip_file,
                     storage,
@@ -1084,7 +1069,6 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
                         )
 
         progress.set_progress(95)
-        self.clean_storage(import_tmp_path, storage)
         self.clean_storage(import_file_path, storage)
         progress.set_progress(100)
 
@@ -114,6 +114,14 @@ class ImportExportConfig:
     ensures that sensitive data are excluded from the exported workspace file.
     """
 
+    copy_rows_in_database: bool = False
+    """
+    When True, the rows of the database tables are not serialized, but copied from
+    the original tables inside the database when the export is imported. This can
+    only be used when the export is imported right away in the same transaction, like
+    when duplicating an application or creating a snapshot.
+    """
+
 
 class Plugin(APIUrlsInstanceMixin, Instance):
     """
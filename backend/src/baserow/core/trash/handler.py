@@ -38,7 +38,12 @@ from baserow.core.trash.registries import (
     trash_item_type_registry,
     trash_operation_type_registry,
 )
-from baserow.core.trash.signals import before_permanently_deleted, permanently_deleted
+from baserow.core.trash.signals import (
+    before_items_permanently_deleted,
+    before_permanently_deleted,
+    items_permanently_deleted,
+    permanently_deleted,
+)
 
 User = get_user_model()
 
@@ -311,33 +316,103 @@ class TrashHandler(metaclass=baserow_trace_methods(tracer)):
                 raise PermanentDeletionMaxLocksExceededException()
             raise e
 
+    @staticmethod
+    def try_perm_delete_trash_entries(
+        trash_entries: List[TrashEntry],
+        trash_item_lookup_cache: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Permanently deletes the items of the provided trash entries at once. All the
+        entries must have the same trash item type and parent, and the type must
+        support batch permanent deletion. The entries themselves are not deleted.
+
+        :param trash_entries: The trash entries to permanently delete the items of.
+        :param trash_item_lookup_cache: An optional dictionary used for caching during
+            many different invocations.
+        """
+
+        trash_item_type = trash_item_type_registry.get(trash_entries[0].trash_item_type)
+        parent_id = trash_entries[0].parent_trash_item_id
+
+        try:
+            to_delete = trash_item_type.lookup_trashed_items(
+                trash_entries, trash_item_lookup_cache
+            )
+            if to_delete:
+                TrashHandler._permanently_delete_many_and_signal(
+                    trash_item_type,
+                    to_delete,
+                    parent_id,
+                    trash_item_lookup_cache,
+                )
+        except TrashItemDoesNotExist:
+            # The parent of the items has already been deleted, and the items
+            # along with it, so only the entries have to be deleted.
+            pass
+        except OperationalError as e:
+            if is_max_lock_exceeded_exception(e):
+                raise PermanentDeletionMaxLocksExceededException()
+            raise e
+
     @staticmethod
     def permanently_delete_marked_trash():
         """
         Looks up every trash item marked for permanent deletion and removes them
         irreversibly from the database along with their corresponding trash entries.
+
+        The entries are processed per trash item type in the `permanent_deletion_order`
+        of the types, so that parents are deleted before their children. The entries
+        of the types supporting batch permanent deletion are deleted in batches of
+        `BASEROW_TRASH_PERMANENT_DELETION_BATCH_SIZE` entries sharing the same parent,
+        every batch in its own transaction. The other entries are deleted one per
+        transaction.
         """
 
         trash_item_lookup_cache = {}
         deleted_count = 0
-        while True:
-            with transaction.atomic():
-                # Perm deleting a workspace or application can cause cascading deletion
-                # of other trash entries hence we only look up one a time. If we instead
-                # looped over a single queryset lookup of all TrashEntries then we could
-                # end up trying to delete TrashEntries which have already been deleted
-                # by a previous cascading delete of a workspace or application.
-                trash_entry = TrashEntry.objects.filter(
-                    should_be_permanently_deleted=True
-                ).first()
-                if not trash_entry:
-                    break
-
-                TrashHandler.try_perm_delete_trash_entry(
-                    trash_entry, trash_item_lookup_cache
-                )
-                trash_entry.delete()
-                deleted_count += 1
+        batch_size = settings.BASEROW_TRASH_PERMANENT_DELETION_BATCH_SIZE
+        trash_item_types = sorted(
+            trash_item_type_registry.get_all(),
+            key=lambda t: t.permanent_deletion_order,
+        )
+
+        for trash_item_type in trash_item_types:
+            while True:
+                with transaction.atomic():
+                    # Perm deleting a workspace or application can cause cascading
+                    # deletion of other trash entries hence we only look up one batch
+                    # at a time. If we instead looped over a single queryset lookup of
+                    # all TrashEntries then we could end up trying to delete
+                    # TrashEntries which have already been deleted by a previous
+                    # cascading delete of a workspace or application.
+                    marked_entries = TrashEntry.objects.filter(
+                        should_be_permanently_deleted=True,
+                        trash_item_type=trash_item_type.type,
+                    ).order_by("id")
+                    trash_entry = marked_entries.first()
+                    if not trash_entry:
+                        break
+
+                    if trash_item_type.supports_batch_permanent_deletion:
+                        trash_entries = list(
+                            marked_entries.filter(
+                                parent_trash_item_id=trash_entry.parent_trash_item_id
+                            )[:batch_size]
+                        )
+                        TrashHandler.try_perm_delete_trash_entries(
+                            trash_entries, trash_item_lookup_cache
+                        )
+                        TrashEntry.objects.filter(
+                            id__in=[entry.id for entry in trash_entries]
+                        ).delete()
+                        deleted_count += len(trash_entries)
+                    else:
+                        TrashHandler.try_perm_delete_trash_entry(
+                            trash_entry, trash_item_lookup_cache
+                        )
+                        trash_entry.delete()
+                        deleted_count += 1
+
         logger.info(
             f"Successfully deleted {deleted_count} trash entries and their associated "
             "trashed items."
@@ -381,6 +456,42 @@ class TrashHandler(metaclass=baserow_trace_methods(tracer)):
             parent_id=parent_id,
         )
 
+    @staticmethod
+    def _permanently_delete_many_and_signal(
+        trash_item_type: TrashableItemType,
+        to_delete: List[Any],
+        parent_id: Optional[int],
+        trash_item_lookup_cache: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Internal method which permanently deletes the provided items, which all share
+        the same parent, at once and triggers the aggregated signals so plugins can
+        do appropriate clean-up.
+
+        :param trash_item_type: The trashable item type of the items being deleted.
+        :param to_delete: The actual instances of the things to delete.
+        :param parent_id: If required for the trashable item type then the id of the
+            parent of the items.
+        :param trash_item_lookup_cache: An optional dictionary used for caching during
+            many different invocations of permanently_delete_items.
+        """
+
+        _check_parent_id_valid(parent_id, trash_item_type)
+        trash_item_ids = [item.id for item in to_delete]
+        before_items_permanently_deleted.send(
+            sender=trash_item_type.type,
+            trash_item_ids=trash_item_ids,
+            trash_items=to_delete,
+            parent_id=parent_id,
+        )
+        trash_item_type.permanently_delete_items(to_delete, trash_item_lookup_cache)
+        items_permanently_deleted.send(
+            sender=trash_item_type.type,
+            trash_item_ids=trash_item_ids,
+            trash_items=to_delete,
+            parent_id=parent_id,
+        )
+
     @staticmethod
     def permanently_delete(trashable_item, parent_id=None):
         """
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from baserow.core.exceptions import TrashItemDoesNotExist
 from baserow.core.registry import (
@@ -20,6 +20,20 @@ class TrashableItemType(ModelInstanceMixin, Instance, ABC):
     A TrashableItemType specifies a baserow model which can be trashed.
     """
 
+    permanent_deletion_order = 100
+    """
+    The marked trash entries are permanently deleted in ascending order of this value.
+    Parents must be deleted before their children, so that the children are removed
+    by the cascade of the parent instead of one by one.
+    """
+
+    supports_batch_permanent_deletion = False
+    """
+    Whether the marked trash entries of this type that share the same parent can be
+    permanently deleted together, in one transaction, using `lookup_trashed_items`
+    and `permanently_delete_items`.
+    """
+
     def lookup_trashed_item(
         self, trashed_entry, trash_item_lookup_cache: Dict[str, Any] = None
     ):
@@ -39,6 +53,51 @@ class TrashableItemType(ModelInstanceMixin, Instance, ABC):
         except self.model_class.DoesNotExist:
             raise TrashItemDoesNotExist()
 
+    def lookup_trashed_items(
+        self,
+        trashed_entries: List["TrashEntry"],
+        trash_item_lookup_cache: Dict[str, Any] = None,
+    ) -> List[Any]:
+        """
+        Returns the actual instances of the trashed items of the provided entries,
+        which all share the same parent. The items that don't exist anymore are left
+        out. Should be overridden to lookup all the items at once if
+        `supports_batch_permanent_deletion` is set.
+
+        :param trashed_entries: The entries to get the real trashed instances for.
+        :param trash_item_lookup_cache: A dictionary which can be used to store
+            expensive objects used to lookup these items.
+        :return: The instances of the model_class that still exist.
+        """
+
+        trashed_items = []
+        for trashed_entry in trashed_entries:
+            try:
+                trashed_items.append(
+                    self.lookup_trashed_item(trashed_entry, trash_item_lookup_cache)
+                )
+            except TrashItemDoesNotExist:
+                pass
+        return trashed_items
+
+    def permanently_delete_items(
+        self,
+        trashed_items: List[Any],
+        trash_item_lookup_cache: Dict[str, Any] = None,
+    ):
+        """
+        Permanently deletes the provided trashed items, which all share the same
+        parent. Should be overridden to delete all the items at once if
+        `supports_batch_permanent_deletion` is set.
+
+        :param trashed_items: The items to delete permanently.
+        :param trash_item_lookup_cache: If a cache is being used to speed up trash
+            item lookups it should be provided here.
+        """
+
+        for trashed_item in trashed_items:
+            self.permanently_delete_item(trashed_item, trash_item_lookup_cache)
+
     @abstractmethod
     def permanently_delete_item(
         self,
@@ -21,3 +21,28 @@ Sent when any trashable item in Baserow is permanently deleted with kwargs conta
     None.
 :param parent_id: The parent id of the trashable item if required for that type.
 """
+
+before_items_permanently_deleted = django.dispatch.Signal()
+"""
+Sent immediately before multiple trashable items of the same type and parent are
+permanently deleted at once. This happens instead of `before_permanently_deleted` for
+the trashable item types that support batch permanent deletion. This signal is sent
+with kwargs containing:
+
+:param trash_items: The actual instances of the trashable items that are about to be
+    deleted.
+:param trash_item_ids: The ids of the items that are about to be deleted.
+:param parent_id: The parent id of the trashable items if required for that type.
+"""
+
+items_permanently_deleted = django.dispatch.Signal()
+"""
+Sent when multiple trashable items of the same type and parent have been permanently
+deleted at once. This happens instead of `permanently_deleted` for the trashable item
+types that support batch permanent deletion. This signal is sent with kwargs
+containing:
+
+:param trash_items: The actual instances of the trashable items that were deleted.
+:param trash_item_ids: The ids of the items that were deleted.
+:param parent_id: The parent id of the trashable items if required for that type.
+"""
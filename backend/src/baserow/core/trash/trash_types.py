@@ -9,11 +9,13 @@ from baserow.core.registries import application_type_registry
 from baserow.core.signals import application_created, workspace_restored
 from baserow.core.snapshots.handler import SnapshotHandler
 from baserow.core.trash.registries import TrashableItemType, trash_item_type_registry
+from baserow.core.usage.handler import UsageHandler
 
 
 class ApplicationTrashableItemType(TrashableItemType):
     type = "application"
     model_class = Application
+    permanent_deletion_order = 10
 
     def get_parent(self, trashed_item: Any) -> Optional[Any]:
         return trashed_item.workspace
@@ -27,12 +29,17 @@ class ApplicationTrashableItemType(TrashableItemType):
         trash_entry: TrashEntry,
     ):
         super().restore(trashed_item, trash_entry)
+        UsageHandler.mark_workspace_for_storage_usage_update(trashed_item.workspace_id)
         application_created.send(
             self,
             application=trashed_item,
             user=None,
         )
 
+    def trash(self, item_to_trash: Application, requesting_user, trash_entry):
+        super().trash(item_to_trash, requesting_user, trash_entry)
+        UsageHandler.mark_workspace_for_storage_usage_update(item_to_trash.workspace_id)
+
     def permanently_delete_item(
         self, trashed_item: Application, trash_item_lookup_cache=None
     ):
@@ -55,6 +62,7 @@ class ApplicationTrashableItemType(TrashableItemType):
 class WorkspaceTrashableItemType(TrashableItemType):
     type = "workspace"
     model_class = Workspace
+    permanent_deletion_order = 0
 
     def get_parent(self, trashed_item: Any) -> Optional[Any]:
         return None
@@ -1,8 +1,19 @@
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Dict, Optional
 
 from django.conf import settings
-from django.db.models import F, OuterRef, PositiveIntegerField, Q, Subquery, Sum
+from django.db.models import (
+    Case,
+    F,
+    IntegerField,
+    OuterRef,
+    PositiveIntegerField,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
 from django.db.models.functions import Coalesce
 
 from baserow.core.models import Workspace
@@ -17,7 +28,11 @@ class UsageHandler:
         progress_builder: Optional[ChildProgressBuilder] = None,
     ) -> int:
         """
-        Calculates the storage usage of every workspace.
+        Calculates the storage usage of the workspaces that have been marked for an
+        update, that have never been calculated, or that have not been fully
+        recalculated in the last `BASEROW_UPDATE_WORKSPACE_STORAGE_USAGE_HOURS`. In
+        between, the storage usage of the workspaces is kept up to date
+        incrementally. The full recalculation reconciles it with the actual usage.
 
         :param progress_builder: An optional progress builder that can be used to
             indicate the progress of the calculation.
@@ -36,23 +51,37 @@ class UsageHandler:
         qs = (
             Workspace.objects.filter(
                 # Only update the workspaces that have been updated more than X number
-                # hours ago. The task runs every 30 minutes, so even if the task fails
-                # or can't complete, it will resume the next time it runs.
+                # hours ago or that have been marked for an update. The task runs
+                # every 30 minutes, so even if the task fails or can't complete, it
+                # will resume the next time it runs.
                 Q(storage_usage_updated_at__lt=hours_ago)
                 | Q(storage_usage_updated_at__isnull=True),
                 template__isnull=True,
             )
-            # Make sure that the workspaces that have last been updated are going to be
-            # updated first.
-            .order_by("storage_usage_updated_at")
+            # Make sure that the workspaces that have been marked for an update and
+            # then the ones that have last been updated are going to be updated first.
+            .order_by(F("storage_usage_updated_at").asc(nulls_first=True))
         )
         workspaces_queryset = qs.iterator(chunk_size=chunk_size)
 
         progress = ChildProgressBuilder.build(progress_builder, child_total=qs.count())
 
+        # The workspaces are claimed with a timestamp that keeps them eligible for
+        # an update before they're recalculated. If a workspace is marked for an
+        # update in the meantime, the claim is cleared and its recalculated usage is
+        # not stored, so that it's recalculated again the next time. If the task
+        # can't complete, the claimed workspaces are picked up the next time it runs.
+        claimed_at = hours_ago - timedelta(seconds=1)
+
         # Loop over the workspaces that have not been updated in the last X number
         # hours. Call the update method for each storage usage type.
         for workspaces in grouper(chunk_size, workspaces_queryset):
+            workspace_ids = [workspace.id for workspace in workspaces]
+            Workspace.objects.filter(id__in=workspace_ids).update(
+                storage_usage_updated_at=claimed_at
+            )
+
+            usages_in_megabytes = {}
             for workspace in workspaces:
                 usage_in_megabytes = 0
                 for item in workspace_storage_usage_item_registry.get_all():
@@ -60,17 +89,75 @@ class UsageHandler:
                         workspace.id
                     )
 
-                workspace.storage_usage = usage_in_megabytes
-                workspace.storage_usage_updated_at = datetime.now(tz=timezone.utc)
+                usages_in_megabytes[workspace.id] = usage_in_megabytes
                 progress.increment()
 
-            Workspace.objects.bulk_update(
-                workspaces, ["storage_usage", "storage_usage_updated_at"]
+            Workspace.objects.filter(
+                id__in=workspace_ids, storage_usage_updated_at=claimed_at
+            ).update(
+                storage_usage=Case(
+                    *[
+                        When(id=workspace_id, then=Value(usage_in_megabytes))
+                        for workspace_id, usage_in_megabytes in (
+                            usages_in_megabytes.items()
+                        )
+                    ],
+                    output_field=IntegerField(),
+                ),
+                storage_usage_updated_at=datetime.now(tz=timezone.utc),
             )
             count += len(workspaces)
 
         return count
 
+    @classmethod
+    def mark_workspace_for_storage_usage_update(cls, workspace_id: int):
+        """
+        Marks the storage usage of the workspace as outdated, so that it's fully
+        recalculated the next time `calculate_storage_usage` runs. Should be called
+        when a change can't be expressed as a delta, like trashing or restoring a
+        table.
+
+        :param workspace_id: The id of the workspace that must be recalculated.
+        """
+
+        Workspace.objects.filter(
+            id=workspace_id, storage_usage_updated_at__isnull=False
+        ).update(storage_usage_updated_at=None)
+
+    @classmethod
+    def update_workspaces_storage_usage(cls, deltas: Dict[int, int]) -> int:
+        """
+        Folds the provided storage usage changes into the storage usage of the
+        workspaces with a single query. The workspaces of which the storage usage has
+        never been calculated are left alone because they're going to be fully
+        calculated anyway.
+
+        :param deltas: A dict where the key is the id of the workspace and the value
+            the change of the storage usage in MB. It can be positive or negative.
+        :return: The number of workspaces that have been updated.
+        """
+
+        deltas = {
+            workspace_id: delta for workspace_id, delta in deltas.items() if delta
+        }
+        if not deltas:
+            return 0
+
+        return Workspace.objects.filter(
+            id__in=deltas.keys(), storage_usage__isnull=False
+        ).update(
+            storage_usage=F("storage_usage")
+            + Case(
+                *[
+                    When(id=workspace_id, then=Value(delta))
+                    for workspace_id, delta in deltas.items()
+                ],
+                default=Value(0),
+                output_field=IntegerField(),
+            )
+        )
+
     @classmethod
     def get_workspace_row_count_annotation(cls, outer_ref_name: str = "id") -> Coalesce:
         """
@@ -0,0 +1,185 @@
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from django_redis import get_redis_connection
+
+PERMITTED_USER_IDS_CACHE_KEY_PREFIX = "ws_permitted_user_ids"
+PERMITTED_USER_IDS_VERSION_CACHE_KEY_PREFIX = "ws_permitted_user_ids_version"
+QUEUED_BROADCASTS_KEY_PREFIX = "ws_queued_permitted_broadcasts"
+QUEUED_BROADCASTS_EXPIRY_SECONDS = 60
+# How long a scheduled flush is waited for, on top of the coalesce window, before
+# it's considered lost and a new one is scheduled by the next broadcast.
+QUEUED_BROADCASTS_FLUSH_SCHEDULED_EXPIRY_SECONDS = 10
+
+
+def _get_redis_client():
+    return get_redis_connection("default")
+
+
+class PermittedUsersHandler:
+    """
+    Resolves and memoizes the users that are permitted to perform an operation on a
+    scope, so that realtime events don't have to load all the workspace users and
+    check the permissions of each one of them for every single event. It also keeps
+    track of the broadcasts that are waiting to be sent together for the same scope
+    and operation.
+    """
+
+    @classmethod
+    def _get_version_cache_key(cls, workspace_id: int) -> str:
+        return f"{PERMITTED_USER_IDS_VERSION_CACHE_KEY_PREFIX}__{workspace_id}"
+
+    @classmethod
+    def _get_queue_key(
+        cls, workspace_id: int, operation_type: str, scope_name: str, scope_id: int
+    ) -> str:
+        return (
+            f"{QUEUED_BROADCASTS_KEY_PREFIX}__"
+            f"{workspace_id}_{operation_type}_{scope_name}_{scope_id}"
+        )
+
+    @classmethod
+    def _get_flush_scheduled_key(cls, queue_key: str) -> str:
+        return f"{queue_key}_flush_scheduled"
+
+    @classmethod
+    def get_permitted_user_ids(
+        cls, workspace, operation_type: str, scope_name: str, scope
+    ) -> List[int]:
+        """
+        Returns the ids of the workspace users that are permitted to perform the
+        provided operation on the scope. The result is memoized per workspace,
+        operation and scope until the memberships or roles in the workspace change.
+
+        :param workspace: The workspace the users are in.
+        :param operation_type: The operation that should be checked for.
+        :param scope_name: The name of the object scope type of the scope.
+        :param scope: The scope instance the operation is executed on.
+        :return: The ids of the permitted users.
+        """
+
+        from baserow.core.handler import CoreHandler
+        from baserow.core.models import WorkspaceUser
+
+        timeout = settings.BASEROW_WS_PERMITTED_USERS_CACHE_TTL_SECONDS
+        if timeout > 0:
+            version = cache.get(cls._get_version_cache_key(workspace.id), 0)
+            cache_key = (
+                f"{PERMITTED_USER_IDS_CACHE_KEY_PREFIX}__{workspace.id}_{version}_"
+                f"{operation_type}_{scope_name}_{scope.id}"
+            )
+            user_ids = cache.get(cache_key)
+            if user_ids is not None:
+                return user_ids
+
+        users_in_workspace = [
+            workspace_user.user
+            for workspace_user in WorkspaceUser.objects.filter(
+                workspace=workspace
+            ).select_related("user")
+        ]
+        user_ids = [
+            u.id
+            for u in CoreHandler().check_permission_for_multiple_actors(
+                users_in_workspace,
+                operation_type,
+                workspace,
+                context=scope,
+            )
+        ]
+
+        if timeout > 0:
+            cache.set(cache_key, user_ids, timeout=timeout)
+
+        return user_ids
+
+    @classmethod
+    def invalidate_workspace(cls, workspace_id: int):
+        """
+        Invalidates all the memoized permitted users of the workspace. Because the
+        permissions can only be trusted once the change has been committed, the
+        version is bumped again after the commit, so that a set resolved in the
+        meantime is never used.
+
+        :param workspace_id: The id of the workspace where the memberships or the
+            roles have changed.
+        """
+
+        def bump_version():
+            key = cls._get_version_cache_key(workspace_id)
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.set(key, 1, timeout=None)
+
+        bump_version()
+        transaction.on_commit(bump_version)
+
+    @classmethod
+    def queue_broadcast(
+        cls,
+        workspace_id: int,
+        operation_type: str,
+        scope_name: str,
+        scope_id: int,
+        payload: Dict[str, Any],
+        ignore_web_socket_id: Optional[str] = None,
+    ) -> bool:
+        """
+        Adds the payload to the broadcasts waiting to be sent to the users that are
+        permitted to perform the operation on the scope.
+
+        :param workspace_id: The workspace the users are in.
+        :param operation_type: The operation that should be checked for.
+        :param scope_name: The name of the scope that the operation is executed on.
+        :param scope_id: The id of the scope instance.
+        :param payload: The message being sent.
+        :param ignore_web_socket_id: An optional web socket id which will not be
+            sent the payload.
+        :return: True if no flush is scheduled for the queued broadcasts, meaning
+            that the caller is responsible for scheduling the flush. A scheduled
+            flush that doesn't run within the coalesce window and
+            `QUEUED_BROADCASTS_FLUSH_SCHEDULED_EXPIRY_SECONDS` is considered lost,
+            so that the queued broadcasts are never stuck.
+        """
+
+        key = cls._get_queue_key(workspace_id, operation_type, scope_name, scope_id)
+        window_seconds = settings.BASEROW_WS_BROADCAST_COALESCE_WINDOW_MS // 1000
+        # Expire the queue at some point if the flush never runs, to not leak keys.
+        expiry = QUEUED_BROADCASTS_EXPIRY_SECONDS + window_seconds
+
+        pipeline = _get_redis_client().pipeline()
+        pipeline.rpush(key, json.dumps([payload, ignore_web_socket_id]))
+        pipeline.expire(key, expiry)
+        pipeline.set(
+            cls._get_flush_scheduled_key(key),
+            1,
+            nx=True,
+            ex=QUEUED_BROADCASTS_FLUSH_SCHEDULED_EXPIRY_SECONDS + window_seconds,
+        )
+        _, _, flush_not_scheduled = pipeline.execute()
+        return bool(flush_not_scheduled)
+
+    @classmethod
+    def pop_queued_broadcasts(
+        cls, workspace_id: int, operation_type: str, scope_name: str, scope_id: int
+    ) -> List[Tuple[Dict[str, Any], Optional[str]]]:
+        """
+        Atomically takes all the broadcasts waiting for the scope and operation, in
+        the order in which they were queued. Broadcasts queued after this call
+        start a new batch, for which a new flush must be scheduled.
+
+        :return: A list of (payload, ignore_web_socket_id) tuples.
+        """
+
+        key = cls._get_queue_key(workspace_id, operation_type, scope_name, scope_id)
+
+        pipeline = _get_redis_client().pipeline()
+        pipeline.lrange(key, 0, -1)
+        pipeline.delete(key, cls._get_flush_scheduled_key(key))
+        entries, _ = pipeline.execute()
+        return [tuple(json.loads(entry)) for entry in entries]
@@ -27,6 +27,7 @@ from baserow.core.registries import object_scope_type_registry
 from baserow.core.user import signals as user_signals
 from baserow.core.utils import generate_hash
 
+from .permitted_users import PermittedUsersHandler
 from .tasks import (
     broadcast_application_created,
     broadcast_to_group,
@@ -42,6 +43,8 @@ def user_updated(sender, performed_by, user, **kwargs):
     workspace_ids = list(
         WorkspaceUser.objects.filter(user=user).values_list("workspace_id", flat=True)
     )
+    for workspace_id in workspace_ids:
+        PermittedUsersHandler.invalidate_workspace(workspace_id)
 
     transaction.on_commit(
         lambda: broadcast_to_groups.delay(
@@ -57,6 +60,8 @@ def user_deleted(sender, performed_by, user, **kwargs):
     workspace_ids = list(
         WorkspaceUser.objects.filter(user=user).values_list("workspace_id", flat=True)
     )
+    for workspace_id in workspace_ids:
+        PermittedUsersHandler.invalidate_workspace(workspace_id)
 
     transaction.on_commit(
         lambda: broadcast_to_groups.delay(
@@ -71,6 +76,8 @@ def user_restored(sender, performed_by, user, **kwargs):
     workspace_ids = list(
         WorkspaceUser.objects.filter(user=user).values_list("workspace_id", flat=True)
     )
+    for workspace_id in workspace_ids:
+        PermittedUsersHandler.invalidate_workspace(workspace_id)
 
     transaction.on_commit(
         lambda: broadcast_to_groups.delay(
@@ -122,6 +129,7 @@ def workspace_updated(sender, workspace, user, **kwargs):
 def workspace_deleted(
     sender, workspace_id, workspace, workspace_users, user=None, **kwargs
 ):
+    PermittedUsersHandler.invalidate_workspace(workspace_id)
     transaction.on_commit(
         lambda: broadcast_to_users.delay(
             [u.id for u in workspace_users],
@@ -136,6 +144,7 @@ def workspace_deleted(
 
 @receiver(signals.workspace_user_added)
 def workspace_user_added(sender, workspace_user, user, **kwargs):
+    PermittedUsersHandler.invalidate_workspace(workspace_user.workspace_id)
     transaction.on_commit(
         lambda: broadcast_to_group.delay(
             workspace_user.workspace_id,
@@ -152,6 +161,7 @@ def workspace_user_added(sender, workspace_user, user, **kwargs):
 
 @receiver(signals.workspace_user_updated)
 def workspace_user_updated(sender, workspace_user, user, **kwargs):
+    PermittedUsersHandler.invalidate_workspace(workspace_user.workspace_id)
     transaction.on_commit(
         lambda: broadcast_to_group.delay(
             workspace_user.workspace_id,
@@ -168,6 +178,8 @@ def workspace_user_updated(sender, workspace_user, user, **kwargs):
 
 @receiver(signals.workspace_user_deleted)
 def workspace_user_deleted(sender, workspace_user_id, workspace_user, user, **kwargs):
+    PermittedUsersHandler.invalidate_workspace(workspace_user.workspace_id)
+
     def broadcast_to_workspace_and_removed_user():
         payload = {
             "type": "group_user_deleted",
@@ -189,8 +201,15 @@ def workspace_user_deleted(sender, workspace_user_id, workspace_user, user, **kw
     transaction.on_commit(broadcast_to_workspace_and_removed_user)
 
 
+@receiver(signals.permissions_updated)
+def permissions_updated(sender, workspace, **kwargs):
+    PermittedUsersHandler.invalidate_workspace(workspace.id)
+
+
 @receiver(signals.workspace_restored)
 def workspace_restored(sender, workspace_user, user, **kwargs):
+    PermittedUsersHandler.invalidate_workspace(workspace_user.workspace_id)
+
     workspaceuser_workspaces = (
         CoreHandler().get_workspaceuser_workspace_queryset().get(id=workspace_user.id)
     )
@@ -1,6 +1,9 @@
 from typing import Any, Dict, Iterable, List, Optional
 
+from django.conf import settings
+
 from baserow.config.celery import app
+from baserow.core.telemetry.tasks import BaserowTelemetryTask
 
 
 @app.task(bind=True)
@@ -92,7 +95,85 @@ def broadcast_to_users(
     )
 
 
-@app.task(bind=True)
+def _get_permitted_users_scope(workspace_id: int, scope_name: str, scope_id: int):
+    """
+    Fetches the workspace and the scope instance a permitted users broadcast is
+    about, or returns None if any of them has been trashed or deleted in the
+    meantime.
+    """
+
+    from baserow.core.mixins import TrashableModelMixin
+    from baserow.core.models import Workspace
+    from baserow.core.registries import object_scope_type_registry
+
+    try:
+        workspace = Workspace.objects.get(id=workspace_id)
+    except Workspace.DoesNotExist:
+        return None  # trashed in the meantime
+
+    scope_type = object_scope_type_registry.get(scope_name)
+    scope_model_class = scope_type.model_class
+
+    objects = (
+        scope_model_class.objects_and_trash
+        if issubclass(scope_model_class, TrashableModelMixin)
+        else scope_model_class.objects
+    )
+
+    try:
+        scope = objects.get(id=scope_id)
+    except scope_model_class.DoesNotExist:
+        return None  # trashed or deleted in the meantime
+
+    return workspace, scope
+
+
+class CoalescingBroadcastToPermittedUsersTask(BaserowTelemetryTask):
+    """
+    Instead of dispatching a task for every single event, `delay` queues the payload
+    and only schedules one flush per workspace, operation and scope within the
+    `BASEROW_WS_BROADCAST_COALESCE_WINDOW_MS` window. The flush resolves the
+    permitted users once and sends all the queued payloads in order.
+    """
+
+    def delay(
+        self,
+        workspace_id: int,
+        operation_type: str,
+        scope_name: str,
+        scope_id: int,
+        payload: Dict[str, any],
+        ignore_web_socket_id: Optional[int] = None,
+    ):
+        from baserow.ws.permitted_users import PermittedUsersHandler
+
+        window_ms = settings.BASEROW_WS_BROADCAST_COALESCE_WINDOW_MS
+        if window_ms <= 0:
+            return super().delay(
+                workspace_id,
+                operation_type,
+                scope_name,
+                scope_id,
+                payload,
+                ignore_web_socket_id,
+            )
+
+        schedule_flush = PermittedUsersHandler.queue_broadcast(
+            workspace_id,
+            operation_type,
+            scope_name,
+            scope_id,
+            payload,
+            ignore_web_socket_id,
+        )
+        if schedule_flush:
+            flush_broadcasts_to_permitted_users.apply_async(
+                (workspace_id, operation_type, scope_name, scope_id),
+                countdown=window_ms / 1000,
+            )
+
+
+@app.task(bind=True, base=CoalescingBroadcastToPermittedUsersTask)
 def broadcast_to_permitted_users(
     self,
     workspace_id: int,
@@ -104,7 +185,9 @@ def broadcast_to_permitted_users(
 ):
     """
     This task will broadcast a websocket message to all the users that are permitted
-    to perform the operation provided.
+    to perform the operation provided. When called with `delay`, messages for the
+    same scope and operation are coalesced, see
+    `CoalescingBroadcastToPermittedUsersTask`.
 
     :param self:
     :param workspace_id: The workspace the users are in
@@ -118,48 +201,70 @@ def broadcast_to_permitted_users(
     :return:
     """
 
-    from baserow.core.handler import CoreHandler
-    from baserow.core.mixins import TrashableModelMixin
-    from baserow.core.models import Workspace, WorkspaceUser
-    from baserow.core.registries import object_scope_type_registry
+    from baserow.ws.permitted_users import PermittedUsersHandler
 
-    try:
-        workspace = Workspace.objects.get(id=workspace_id)
-    except Workspace.DoesNotExist:
-        return  # trashed in the meantime
+    workspace_and_scope = _get_permitted_users_scope(workspace_id, scope_name, scope_id)
+    if workspace_and_scope is None:
+        return
 
-    users_in_workspace = [
-        workspace_user.user
-        for workspace_user in WorkspaceUser.objects.filter(
-            workspace=workspace
-        ).select_related("user")
-    ]
+    workspace, scope = workspace_and_scope
+    user_ids = PermittedUsersHandler.get_permitted_user_ids(
+        workspace, operation_type, scope_name, scope
+    )
 
-    scope_type = object_scope_type_registry.get(scope_name)
-    scope_model_class = scope_type.model_class
+    broadcast_to_users(user_ids, payload, ignore_web_socket_id=ignore_web_socket_id)
 
-    objects = (
-        scope_model_class.objects_and_trash
-        if issubclass(scope_model_class, TrashableModelMixin)
-        else scope_model_class.objects
+
+@app.task(bind=True)
+def flush_broadcasts_to_permitted_users(
+    self, workspace_id: int, operation_type: str, scope_name: str, scope_id: int
+):
+    """
+    Sends all the payloads queued by `broadcast_to_permitted_users.delay` for the
+    provided scope and operation, resolving the permitted users only once.
+
+    :param workspace_id: The workspace the users are in
+    :param operation_type: The operation that should be checked for
+    :param scope_name: The name of the scope that the operation is executed on
+    :param scope_id: The id of the scope instance
+    """
+
+    from asgiref.sync import async_to_sync
+    from channels.layers import get_channel_layer
+
+    from baserow.ws.permitted_users import PermittedUsersHandler
+
+    queued_broadcasts = PermittedUsersHandler.pop_queued_broadcasts(
+        workspace_id, operation_type, scope_name, scope_id
     )
+    if not queued_broadcasts:
+        return
 
-    try:
-        scope = objects.get(id=scope_id)
-    except scope_model_class.DoesNotExist:
-        return  # trashed or deleted in the meantime
+    workspace_and_scope = _get_permitted_users_scope(workspace_id, scope_name, scope_id)
+    if workspace_and_scope is None:
+        return
 
-    user_ids = [
-        u.id
-        for u in CoreHandler().check_permission_for_multiple_actors(
-            users_in_workspace,
-            operation_type,
-            workspace,
-            context=scope,
-        )
-    ]
+    workspace, scope = workspace_and_scope
+    user_ids = PermittedUsersHandler.get_permitted_user_ids(
+        workspace, operation_type, scope_name, scope
+    )
 
-    broadcast_to_users(user_ids, payload, ignore_web_socket_id=ignore_web_socket_id)
+    async def send_all(channel_layer):
+        for payload, ignore_web_socket_id in queued_broadcasts:
+            await channel_layer.group_send(
+                "users",
+                {
+                    "type": "broadcast_to_users",
+                    "user_ids": user_ids,
+                    "payload": payload,
+                    "ignore_web_socket_id": ignore_web_socket_id,
+                    "send_to_all_users": False,
+                },
+            )
+        if hasattr(channel_layer, "close_pools"):
+            await channel_layer.close_pools()
+
+    async_to_sync(send_all)(get_channel_layer())
 
 
 @app.task(bind=True)
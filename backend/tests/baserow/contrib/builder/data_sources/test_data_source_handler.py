@@ -11,6 +11,7 @@ import pytest
 from baserow.contrib.builder.data_sources.builder_dispatch_context import (
     BuilderDispatchContext,
 )
+from baserow.contrib.builder.data_sources.dispatcher import DataSourcesDispatcher
 from baserow.contrib.builder.data_sources.exceptions import DataSourceDoesNotExist
 from baserow.contrib.builder.data_sources.handler import DataSourceHandler
 from baserow.contrib.builder.data_sources.models import DataSource
@@ -19,6 +20,9 @@ from baserow.contrib.integrations.local_baserow.models import (
     LocalBaserowListRows,
 )
 from baserow.core.exceptions import CannotCalculateIntermediateOrder
+from baserow.core.services.exceptions import (
+    ServiceImproperlyConfiguredDispatchException,
+)
 from baserow.core.services.registries import service_type_registry
 from baserow.core.user_sources.user_source_user import UserSourceUser
 from baserow.test_utils.helpers import AnyStr
@@ -705,3 +709,115 @@ def test_query_data_sources_with_missing_specific_service(data_fixture):
         f"The specific object with id {missing_service_id} does not exist."
     )
     assert data_sources == [data_source]
+
+
+@pytest.mark.django_db
+def test_data_sources_dispatcher_get_dependencies(data_fixture):
+    page = data_fixture.create_builder_page()
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, row_id="1"
+    )
+    data_source2 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, row_id=f"get('data_source.{data_source.id}.id')"
+    )
+    data_source3 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, row_id="get('page_parameter.id')"
+    )
+    data_source4 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, row_id="get(concat('data_source.', '1'))"
+    )
+    data_source5 = data_fixture.create_builder_data_source(page=page)
+
+    dispatch_context = BuilderDispatchContext(
+        HttpRequest(), page, only_expose_public_allowed_properties=False
+    )
+    dependencies = DataSourcesDispatcher(
+        DataSourceHandler(), dispatch_context
+    ).get_dependencies(
+        [data_source, data_source2, data_source3, data_source4, data_source5]
+    )
+
+    assert dependencies == {
+        data_source.id: set(),
+        data_source2.id: {data_source.id},
+        data_source3.id: set(),
+        # The referenced data source can't be known before the formula is resolved.
+        data_source4.id: {data_source.id, data_source2.id, data_source3.id},
+        # A data source without a service doesn't have any formula.
+        data_source5.id: set(),
+    }
+
+
+@pytest.mark.django_db(transaction=True)
+def test_dispatch_data_sources_concurrently(data_fixture, settings):
+    settings.BUILDER_DATA_SOURCES_DISPATCH_CONCURRENCY = 4
+
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[["BMW"], ["Audi"], ["Volkswagen"]],
+    )
+    view = data_fixture.create_grid_view(user, table=table)
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=integration,
+        view=view,
+        table=table,
+        row_id="2",
+    )
+    data_source2 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=integration,
+        view=view,
+        table=table,
+        row_id=f"get('data_source.{data_source.id}.id')",
+    )
+    data_source3 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=integration,
+        view=view,
+        table=table,
+        row_id="3",
+    )
+    data_source4 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=integration,
+        view=view,
+        table=table,
+        row_id="b",
+    )
+    # A data source that isn't configured yet doesn't have a service.
+    data_source5 = data_fixture.create_builder_data_source(user=user, page=page)
+
+    dispatch_context = BuilderDispatchContext(
+        HttpRequest(), page, only_expose_public_allowed_properties=False
+    )
+    result = DataSourceHandler().dispatch_data_sources(
+        [data_source, data_source2, data_source3, data_source4, data_source5],
+        dispatch_context,
+    )
+
+    assert list(result.keys()) == [
+        data_source.id,
+        data_source2.id,
+        data_source3.id,
+        data_source4.id,
+        data_source5.id,
+    ]
+    assert result[data_source.id]["id"] == rows[1].id
+    assert result[data_source2.id]["id"] == rows[1].id
+    assert result[data_source3.id]["id"] == rows[2].id
+    assert isinstance(result[data_source4.id], Exception)
+    assert isinstance(
+        result[data_source5.id], ServiceImproperlyConfiguredDispatchException
+    )
@@ -0,0 +1,132 @@
+from unittest.mock import PropertyMock, patch
+
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpRequest
+
+import pytest
+
+from baserow.contrib.builder.data_sources.builder_dispatch_context import (
+    BuilderDispatchContext,
+)
+from baserow.contrib.builder.data_sources.handler import DataSourceHandler
+from baserow.contrib.builder.data_sources.result_cache import data_source_results_cache
+from baserow.contrib.builder.data_sources.service import DataSourceService
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.core.services.handler import ServiceHandler
+from baserow.core.user_sources.user_source_user import UserSourceUser
+
+
+@pytest.fixture
+def public_data_source(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[["BMW"], ["Audi"]],
+    )
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+    data_source = data_fixture.create_builder_local_baserow_list_rows_data_source(
+        user=user, page=page, integration=integration, table=table
+    )
+    data_source.public_cache_ttl = 60
+    data_source.save()
+
+    return user, table, fields, data_source
+
+
+def dispatch(data_source, user_source_user):
+    field_names = [
+        field.db_column for field in data_source.service.specific.table.field_set.all()
+    ]
+    allowed_properties = {data_source.service_id: field_names}
+
+    request = HttpRequest()
+    request.user_source_user = user_source_user
+    with patch(
+        "baserow.contrib.builder.data_sources.builder_dispatch_context."
+        "BuilderDispatchContext.public_allowed_properties",
+        new_callable=PropertyMock,
+    ) as mock_public_allowed_properties:
+        mock_public_allowed_properties.return_value = {
+            "internal": allowed_properties,
+            "external": {},
+            "all": allowed_properties,
+        }
+        dispatch_context = BuilderDispatchContext(
+            request, data_source.page, only_expose_public_allowed_properties=True
+        )
+        return DataSourceHandler().dispatch_data_source(data_source, dispatch_context)
+
+
+@pytest.mark.django_db
+def test_public_data_source_results_are_shared_until_the_table_changes(
+    public_data_source,
+):
+    user, table, fields, data_source = public_data_source
+
+    with patch.object(
+        ServiceHandler, "dispatch_service", wraps=ServiceHandler().dispatch_service
+    ) as mock_dispatch_service:
+        first = dispatch(data_source, AnonymousUser())
+        second = dispatch(data_source, AnonymousUser())
+
+        assert mock_dispatch_service.call_count == 1
+        assert first == second
+        assert len(first["results"]) == 2
+
+        RowHandler().create_row(user, table, {fields[0].id: "Volvo"})
+        third = dispatch(data_source, AnonymousUser())
+
+        assert mock_dispatch_service.call_count == 2
+        assert len(third["results"]) == 3
+
+        DataSourceService().update_data_source(user, data_source, public_cache_ttl=30)
+        dispatch(data_source, AnonymousUser())
+
+        assert mock_dispatch_service.call_count == 3
+
+
+@pytest.mark.django_db
+def test_public_data_source_results_are_not_cached_when_not_opted_in(
+    public_data_source,
+):
+    user, table, fields, data_source = public_data_source
+    data_source.public_cache_ttl = 0
+    data_source.save()
+
+    with patch.object(
+        ServiceHandler, "dispatch_service", wraps=ServiceHandler().dispatch_service
+    ) as mock_dispatch_service:
+        dispatch(data_source, AnonymousUser())
+        dispatch(data_source, AnonymousUser())
+
+    assert mock_dispatch_service.call_count == 2
+
+
+@pytest.mark.django_db
+def test_public_data_source_results_are_not_shared_with_authenticated_users(
+    public_data_source, data_fixture
+):
+    user, table, fields, data_source = public_data_source
+    user_source = data_fixture.create_user_source_with_first_type(
+        application=data_source.page.builder
+    )
+    user_source_user = UserSourceUser(user_source, None, 1, "foo", "foo@bar.com")
+
+    with patch.object(
+        ServiceHandler, "dispatch_service", wraps=ServiceHandler().dispatch_service
+    ) as mock_dispatch_service:
+        dispatch(data_source, user_source_user)
+        dispatch(data_source, user_source_user)
+
+    assert mock_dispatch_service.call_count == 2
+    assert not data_source_results_cache.is_cacheable(
+        data_source,
+        BuilderDispatchContext(
+            HttpRequest(), data_source.page, only_expose_public_allowed_properties=False
+        ),
+    )
@@ -378,6 +378,7 @@ def test_builder_application_export(data_fixture):
                         "id": shared_datasource.id,
                         "name": shared_datasource.name,
                         "order": "1.00000000000000000000",
+                        "public_cache_ttl": 0,
                         "service": {
                             "id": shared_datasource.service.id,
                             "sample_data": None,
@@ -422,6 +423,7 @@ def test_builder_application_export(data_fixture):
                         "id": datasource1.id,
                         "name": "source 1",
                         "order": "1.00000000000000000000",
+                        "public_cache_ttl": 0,
                         "service": {
                             "id": datasource1.service.id,
                             "sample_data": None,
@@ -0,0 +1,128 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.test.utils import override_settings
+
+import pytest
+
+from baserow.contrib.database.airtable.fetch import (
+    fetch_concurrently,
+    get_airtable_session,
+    reset_airtable_session,
+)
+
+
+@pytest.fixture
+def mock_http_server():
+    requests_made = []
+    responses_to_send = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests_made.append((self.path, self.headers.get("Cookie")))
+            status, headers = (
+                responses_to_send.pop(0) if responses_to_send else (200, {})
+            )
+            body = b"ok"
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.requests_made = requests_made
+    server.responses_to_send = responses_to_send
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    reset_airtable_session()
+    yield server
+    reset_airtable_session()
+
+    server.shutdown()
+    server.server_close()
+
+
+@override_settings(
+    BASEROW_AIRTABLE_IMPORT_MAX_RETRIES=2,
+    BASEROW_AIRTABLE_IMPORT_RETRY_BACKOFF_FACTOR=0,
+)
+def test_airtable_session_retries_failed_requests(mock_http_server):
+    mock_http_server.responses_to_send.extend([(503, {}), (429, {})])
+
+    response = get_airtable_session().get(f"{mock_http_server.url}/table")
+
+    assert response.status_code == 200
+    assert len(mock_http_server.requests_made) == 3
+
+    mock_http_server.requests_made.clear()
+    mock_http_server.responses_to_send.extend([(503, {}), (503, {}), (503, {})])
+
+    response = get_airtable_session().get(f"{mock_http_server.url}/table")
+
+    assert response.status_code == 503
+    assert len(mock_http_server.requests_made) == 3
+
+
+@override_settings(BASEROW_AIRTABLE_IMPORT_MAX_RETRIES=0)
+def test_airtable_session_does_not_store_cookies(mock_http_server):
+    mock_http_server.responses_to_send.append((200, {"Set-Cookie": "session=secret"}))
+
+    response = get_airtable_session().get(f"{mock_http_server.url}/base")
+    assert response.cookies.get_dict() == {"session": "secret"}
+
+    get_airtable_session().get(f"{mock_http_server.url}/table")
+    get_airtable_session().get(
+        f"{mock_http_server.url}/view", cookies={"session": "provided"}
+    )
+
+    assert mock_http_server.requests_made == [
+        ("/base", None),
+        ("/table", None),
+        ("/view", "session=provided"),
+    ]
+
+
+@override_settings(BASEROW_AIRTABLE_IMPORT_CONCURRENCY=2)
+def test_fetch_concurrently():
+    lock = threading.Lock()
+    running = []
+    max_running = []
+    completed = []
+
+    def fetch(item):
+        with lock:
+            running.append(item)
+            max_running.append(len(running))
+        time.sleep((5 - item) * 0.01)
+        with lock:
+            running.remove(item)
+        return item * 2
+
+    results = fetch_concurrently(
+        fetch, [1, 2, 3, 4], on_completed=lambda: completed.append(1)
+    )
+
+    assert results == [2, 4, 6, 8]
+    assert len(completed) == 4
+    assert max(max_running) == 2
+
+
+@override_settings(BASEROW_AIRTABLE_IMPORT_CONCURRENCY=2)
+def test_fetch_concurrently_raises_exception():
+    def fetch(item):
+        if item == 2:
+            raise ValueError("Failed")
+        return item
+
+    with pytest.raises(ValueError):
+        fetch_concurrently(fetch, [1, 2, 3])
+
+    assert fetch_concurrently(fetch, []) == []
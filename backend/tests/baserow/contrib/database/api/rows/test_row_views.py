@@ -4770,3 +4770,60 @@ def test_update_single_field_does_not_affect_others(api_client, data_fixture):
 
         # Update original_values for next iteration
         original_values[field_id] = updated_data[f"field_{field_id}"]
+
+
+@pytest.mark.django_db
+def test_list_rows_with_cursor(api_client, data_fixture, settings):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(name="Name", table=table)
+    date_field = data_fixture.create_date_field(
+        name="Date", table=table, date_include_time=True
+    )
+
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    RowHandler().force_create_rows(
+        user,
+        table,
+        rows_values=[
+            {
+                text_field.db_column: f"name {i % 2}",
+                date_field.db_column: start + timedelta(microseconds=i % 3),
+            }
+            for i in range(10)
+        ],
+    )
+    model = table.get_model()
+    expected_ids = list(
+        model.objects.order_by_fields_string(
+            f"field_{text_field.id},-field_{date_field.id}", False
+        ).values_list("id", flat=True)
+    )
+
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+    ids, cursor = [], ""
+    while cursor is not None:
+        response = api_client.get(
+            url,
+            {
+                "cursor": cursor,
+                "size": 3,
+                "order_by": f"field_{text_field.id},-field_{date_field.id}",
+            },
+            HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+        )
+        response_json = response.json()
+        assert response.status_code == HTTP_200_OK
+        assert "count" not in response_json
+        ids += [row["id"] for row in response_json["results"]]
+        cursor = response_json["next_cursor"]
+
+    assert ids == expected_ids
+
+    response = api_client.get(
+        url,
+        {"cursor": "", "size": settings.ROW_PAGE_SIZE_LIMIT + 1},
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_PAGE_SIZE_LIMIT"
@@ -26,7 +26,11 @@ from baserow.contrib.database.rows.registries import (
 )
 from baserow.contrib.database.search.handler import ALL_SEARCH_MODES
 from baserow.contrib.database.table.handler import TableHandler
-from baserow.contrib.database.table.models import TableModelQuerySet
+from baserow.contrib.database.table.models import (
+    TableModelQuerySet,
+    TableUsage,
+    TableUsageUpdate,
+)
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.models import GridView
 from baserow.contrib.database.views.registries import view_aggregation_type_registry
@@ -5325,3 +5329,148 @@ def test_list_rows_with_page_and_invalid_numbers(api_client, data_fixture):
         assert response_json["results"][0][f"field_{text_field.id}"] == "0"
         assert response_json["results"][99][f"field_{text_field.id}"] == "99"
         assert count_calls == 0  # count is not called again
+
+
+@pytest.mark.django_db
+def test_list_rows_with_cursor(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_group_by(view=grid_view, field=text_field)
+    data_fixture.create_view_sort(view=grid_view, field=number_field, order="DESC")
+
+    RowHandler().force_create_rows(
+        user,
+        table,
+        rows_values=[
+            {
+                text_field.db_column: ["b", "a", None][i % 3],
+                number_field.db_column: [1, None, 1, 2][i % 4],
+            }
+            for i in range(25)
+        ],
+    )
+    expected_ids = list(
+        ViewHandler().get_queryset(user, grid_view).values_list("id", flat=True)
+    )
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid_view.id})
+    ids, cursor, requests = [], "", 0
+    while cursor is not None:
+        response = api_client.get(
+            url, {"cursor": cursor, "size": 4}, HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+        response_json = response.json()
+        assert response.status_code == HTTP_200_OK
+        assert "count" not in response_json
+        assert "approximate_count" not in response_json
+        assert f"field_{text_field.id}" in response_json["group_by_metadata"]
+        ids += [row["id"] for row in response_json["results"]]
+        cursor = response_json["next_cursor"]
+        requests += 1
+        if cursor is not None:
+            assert f"cursor={cursor}" in response_json["next"]
+
+    assert ids == expected_ids
+    assert requests == 7
+
+    response = api_client.get(
+        url,
+        {"cursor": "", "approximate_count": "true"},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["approximate_count"] >= 0
+
+    response = api_client.get(
+        url, {"cursor": "invalid"}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+    response = api_client.get(
+        url, {"cursor": "", "size": 4}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    cursor = response.json()["next_cursor"]
+    response = api_client.get(
+        url,
+        {"cursor": cursor, "order_by": f"field_{text_field.id}"},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+
+@pytest.mark.django_db
+def test_list_rows_with_count_strategy(api_client, data_fixture, settings):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    RowHandler().force_create_rows(
+        user, table, rows_values=[{text_field.db_column: "a"} for _ in range(3)]
+    )
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid_view.id})
+
+    response = api_client.get(
+        url, {"count_strategy": "invalid"}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_QUERY_PARAMETER_VALIDATION"
+
+    # Small counts are always counted exactly.
+    response = api_client.get(
+        url, {"count_strategy": "estimated"}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert response_json["count"] == 3
+    assert response_json["count_is_estimated"] is False
+    assert "next" not in response_json
+    assert len(response_json["results"]) == 3
+
+    settings.BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD = 0
+    TableUsage.objects.create(table=table, row_count=100)
+    TableUsageUpdate.objects.create(table=table, row_count=5)
+    response = api_client.get(
+        url,
+        {"count_strategy": "estimated", "count": "true"},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.json() == {"count": 105, "count_is_estimated": True}
+
+    # The table usage can't be used if the view is filtered.
+    response = api_client.get(
+        url,
+        {"count_strategy": "estimated", "count": "true", "search": "a"},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    response_json = response.json()
+    assert response_json["count"] != 105
+    assert response_json["count_is_estimated"] is True
+
+    response = api_client.get(
+        url,
+        {"count_strategy": "cached", "count": "true"},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.json() == {"count": 3, "count_is_estimated": False}
+
+    # Rows created without the signals don't invalidate the cached count.
+    table.get_model().objects.create()
+    response = api_client.get(
+        url,
+        {"count_strategy": "cached", "count": "true"},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.json()["count"] == 3
+
+    RowHandler().create_row(user, table, {})
+    response = api_client.get(
+        url,
+        {"count_strategy": "cached", "count": "true"},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.json()["count"] == 5
@@ -0,0 +1,57 @@
+from datetime import date
+from decimal import Decimal
+
+from baserow.contrib.database.data_sync.diff import (
+    ExternalSorter,
+    get_sort_key,
+    merge_join,
+)
+
+
+def test_get_sort_key_orders_mixed_types():
+    values = [["b"], [2], [None], [Decimal("1.5")], [date(2024, 1, 1)], ["a"]]
+
+    assert sorted(values, key=get_sort_key) == [
+        [None],
+        [Decimal("1.5")],
+        [2],
+        [date(2024, 1, 1)],
+        ["a"],
+        ["b"],
+    ]
+    assert get_sort_key([1]) == get_sort_key([Decimal("1")])
+    assert get_sort_key([1]) != get_sort_key(["1"])
+
+
+def test_external_sorter_spills_to_disk():
+    with ExternalSorter(buffer_size=3) as sorter:
+        for value in [5, 3, 9, 1, 7, 3, 2, 8]:
+            sorter.add(get_sort_key([value]), {"value": value})
+
+        assert len(sorter._runs) == 2
+        assert sorter.count == 8
+        assert [item["value"] for _, item in sorter] == [1, 2, 3, 3, 5, 7, 8, 9]
+
+
+def test_external_sorter_is_stable():
+    with ExternalSorter(buffer_size=2) as sorter:
+        for index, value in enumerate([1, 1, 0, 1, 0]):
+            sorter.add(get_sort_key([value]), index)
+
+        assert [index for _, index in sorter] == [2, 4, 0, 1, 3]
+
+
+def test_merge_join():
+    left = [(get_sort_key([key]), f"left_{key}") for key in [1, 2, 2, 4]]
+    right = [(get_sort_key([key]), f"right_{key}") for key in [2, 3, 4, 5]]
+    counts = []
+
+    assert list(merge_join(left, right, on_group=counts.append)) == [
+        (["left_1"], None),
+        (["left_2", "left_2"], ["right_2"]),
+        (None, ["right_3"]),
+        (["left_4"], ["right_4"]),
+        (None, ["right_5"]),
+    ]
+    assert counts == [1, 3, 1, 2, 1]
+    assert list(merge_join([], [])) == []
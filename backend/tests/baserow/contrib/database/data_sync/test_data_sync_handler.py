@@ -655,6 +655,70 @@ def test_sync_data_sync_table_create_update_delete_row(data_fixture):
     assert getattr(sync_3_rows[0], f"field_{fields['summary'].id}") == "Test event 0"
 
 
+@pytest.mark.django_db
+@responses.activate
+def test_sync_data_sync_table_in_small_batches(data_fixture, settings):
+    settings.BASEROW_DATA_SYNC_BATCH_SIZE = 1
+    responses.add(
+        responses.GET,
+        "https://baserow.io/ical.ics",
+        status=200,
+        body=ICAL_FEED_WITH_TWO_ITEMS,
+    )
+
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+
+    handler = DataSyncHandler()
+
+    data_sync = handler.create_data_sync_table(
+        user=user,
+        database=database,
+        table_name="Test",
+        type_name="ical_calendar",
+        synced_properties=["uid", "dtstart", "dtend", "summary"],
+        ical_url="https://baserow.io/ical.ics",
+    )
+    handler.sync_data_sync_table(user=user, data_sync=data_sync)
+
+    uid_field_name = DataSyncSyncedProperty.objects.get(
+        data_sync=data_sync, key="uid"
+    ).field.db_column
+    model = data_sync.table.get_model()
+    sync_1_rows = list(model.objects.all())
+    assert len(sync_1_rows) == 2
+
+    responses.add(
+        responses.GET,
+        "https://baserow.io/ical.ics",
+        status=200,
+        body=ICAL_FEED_WITH_THREE_ITEMS,
+    )
+    handler.sync_data_sync_table(user=user, data_sync=data_sync)
+    sync_2_rows = list(model.objects.all())
+
+    assert [r.id for r in sync_2_rows[:2]] == [r.id for r in sync_1_rows]
+    assert [getattr(r, uid_field_name) for r in sync_2_rows] == [
+        "1725220374375-34056@ical.marudot.com",
+        "1725220387555-95757@ical.marudot.com",
+        "1725220480937-57370@ical.marudot.com",
+    ]
+
+    responses.add(
+        responses.GET,
+        "https://baserow.io/ical.ics",
+        status=200,
+        body=ICAL_FEED_WITH_ONE_ITEMS,
+    )
+    handler.sync_data_sync_table(user=user, data_sync=data_sync)
+    sync_3_rows = list(model.objects.all())
+
+    assert [r.id for r in sync_3_rows] == [sync_1_rows[0].id]
+    assert getattr(sync_3_rows[0], uid_field_name) == (
+        "1725220374375-34056@ical.marudot.com"
+    )
+
+
 @pytest.mark.django_db
 @responses.activate
 def test_sync_data_sync_table_property_removed_from_data_sync_type(data_fixture):
@@ -14,6 +14,7 @@ from baserow.contrib.database.data_sync.exceptions import SyncError
 from baserow.contrib.database.data_sync.handler import DataSyncHandler
 from baserow.contrib.database.data_sync.models import (
     DataSync,
+    DataSyncSyncedProperty,
     PostgreSQLDataSync,
     SyncDataSyncTableJob,
 )
@@ -928,3 +929,107 @@ def test_create_data_sync_with_negative_int_and_positive_baserow_number_field(
         job["human_readable_error"]
         == f"The value for field {fields[1].id} cannot be negative."
     )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_sync_postgresql_data_sync_incrementally(
+    data_fixture, create_postgresql_test_table
+):
+    default_database = settings.DATABASES["default"]
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    handler = DataSyncHandler()
+
+    data_sync = handler.create_data_sync_table(
+        user=user,
+        database=database,
+        table_name="Test",
+        type_name="postgresql",
+        synced_properties=["id", "text_col", "int_col"],
+        postgresql_host=default_database["HOST"],
+        postgresql_username=default_database["USER"],
+        postgresql_password=default_database["PASSWORD"],
+        postgresql_port=default_database["PORT"],
+        postgresql_database=default_database["NAME"],
+        postgresql_table=create_postgresql_test_table,
+        postgresql_sslmode=default_database["OPTIONS"].get("sslmode", "prefer"),
+        postgresql_incremental_column="int_col",
+    )
+
+    with transaction.atomic():
+        handler.sync_data_sync_table(user=user, data_sync=data_sync)
+
+    data_sync.refresh_from_db()
+    assert data_sync.last_full_sync is not None
+    assert data_sync.incremental_sync_watermark is not None
+    last_full_sync = data_sync.last_full_sync
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {create_postgresql_test_table} "
+                f"SET text_col = 'changed', int_col = int_col + 1000 "
+                f"WHERE id = (SELECT min(id) FROM {create_postgresql_test_table})"
+            )
+            cursor.execute(
+                f"DELETE FROM {create_postgresql_test_table} "
+                f"WHERE id = (SELECT max(id) FROM {create_postgresql_test_table})"
+            )
+
+    with patch(
+        "baserow.contrib.database.data_sync.postgresql_data_sync_type."
+        "PostgreSQLDataSyncType.get_all_rows"
+    ) as mock_get_all_rows, transaction.atomic():
+        handler.sync_data_sync_table(user=user, data_sync=data_sync)
+
+    mock_get_all_rows.assert_not_called()
+    data_sync.refresh_from_db()
+    assert data_sync.last_full_sync == last_full_sync
+
+    text_field = DataSyncSyncedProperty.objects.get(
+        data_sync=data_sync, key="text_col"
+    ).field
+    model = data_sync.table.get_model()
+    rows = list(model.objects.all())
+    # The deleted row can't be detected by an incremental sync.
+    assert len(rows) == 2
+    assert getattr(rows[0], text_field.db_column) == "changed"
+
+    with transaction.atomic():
+        handler.sync_data_sync_table(user=user, data_sync=data_sync, full_sync=True)
+
+    data_sync.refresh_from_db()
+    assert data_sync.last_full_sync > last_full_sync
+    assert model.objects.count() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_sync_postgresql_data_sync_incremental_column_invalid_type(
+    data_fixture, create_postgresql_test_table
+):
+    default_database = settings.DATABASES["default"]
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    handler = DataSyncHandler()
+
+    data_sync = handler.create_data_sync_table(
+        user=user,
+        database=database,
+        table_name="Test",
+        type_name="postgresql",
+        synced_properties=["id"],
+        postgresql_host=default_database["HOST"],
+        postgresql_username=default_database["USER"],
+        postgresql_password=default_database["PASSWORD"],
+        postgresql_port=default_database["PORT"],
+        postgresql_database=default_database["NAME"],
+        postgresql_table=create_postgresql_test_table,
+        postgresql_sslmode=default_database["OPTIONS"].get("sslmode", "prefer"),
+        postgresql_incremental_column="text_col",
+    )
+
+    with transaction.atomic():
+        handler.sync_data_sync_table(user=user, data_sync=data_sync)
+
+    data_sync.refresh_from_db()
+    assert "must be a number, date or timestamp column" in data_sync.last_error
@@ -0,0 +1,154 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import patch
+from uuid import UUID
+
+import pytest
+
+from baserow.contrib.database.db.copy import NotCopyable, copy_insert, to_copy_text
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
+
+
+def test_to_copy_text():
+    assert to_copy_text(None) == "\\N"
+    assert to_copy_text(True) == "t"
+    assert to_copy_text(False) == "f"
+    assert to_copy_text(10) == "10"
+    assert to_copy_text(Decimal("1.50")) == "1.50"
+    assert to_copy_text("a\tb\nc\\d\re") == "a\\tb\\nc\\\\d\\re"
+    assert to_copy_text(date(2024, 1, 2)) == "2024-01-02"
+    assert (
+        to_copy_text(datetime(2024, 1, 2, 3, 4, tzinfo=timezone.utc))
+        == "2024-01-02T03:04:00+00:00"
+    )
+    assert to_copy_text(timedelta(hours=1, seconds=1)) == "3601.0 seconds"
+    assert (
+        to_copy_text(UUID("8a1c2b6e-3b6a-4e4e-9a5f-3d0b1e0c7a11"))
+        == "8a1c2b6e-3b6a-4e4e-9a5f-3d0b1e0c7a11"
+    )
+    assert to_copy_text(b"\x01\xff") == "\\\\x01ff"
+
+    with pytest.raises(NotCopyable):
+        to_copy_text(object())
+
+
+@pytest.mark.django_db
+def test_import_rows_using_copy(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field_handler = FieldHandler()
+    name_field = field_handler.create_field(
+        user, table, "text", name="Name", primary=True
+    )
+    number_field = field_handler.create_field(
+        user, table, "number", name="Number", number_decimal_places=2
+    )
+    boolean_field = field_handler.create_field(user, table, "boolean", name="Bool")
+    date_field = field_handler.create_field(user, table, "date", name="Date")
+    autonumber_field = field_handler.create_field(
+        user, table, "autonumber", name="Autonumber"
+    )
+    formula_field = field_handler.create_field(
+        user, table, "formula", name="Formula", formula="concat(field('Name'), '!')"
+    )
+
+    RowHandler().create_row(user, table, {name_field.id: "Existing"})
+
+    with patch(
+        "baserow.contrib.database.rows.handler.copy_insert", wraps=copy_insert
+    ) as mock_copy_insert:
+        rows, report = RowHandler().import_rows(
+            user,
+            table,
+            data=[
+                ["Tesla\ttab", "1.5", True, "2024-01-02"],
+                ["Audi\\slash", None, False, None],
+                ["BMW\nnewline", "-3", False, "2024-12-31"],
+            ],
+            send_realtime_update=False,
+        )
+
+    assert mock_copy_insert.call_count == 1
+    assert report == {}
+    assert len(rows) == 3
+
+    model = table.get_model()
+    imported = list(model.objects.order_by("id"))[1:]
+    assert [row.id for row in imported] == [row.id for row in rows]
+    assert [getattr(row, name_field.db_column) for row in imported] == [
+        "Tesla\ttab",
+        "Audi\\slash",
+        "BMW\nnewline",
+    ]
+    assert [getattr(row, number_field.db_column) for row in imported] == [
+        Decimal("1.50"),
+        None,
+        Decimal("-3.00"),
+    ]
+    assert [getattr(row, boolean_field.db_column) for row in imported] == [
+        True,
+        False,
+        False,
+    ]
+    assert [getattr(row, date_field.db_column) for row in imported] == [
+        date(2024, 1, 2),
+        None,
+        date(2024, 12, 31),
+    ]
+    assert [getattr(row, autonumber_field.db_column) for row in imported] == [
+        2,
+        3,
+        4,
+    ]
+    assert [getattr(row, formula_field.db_column) for row in imported] == [
+        "Tesla\ttab!",
+        "Audi\\slash!",
+        "BMW\nnewline!",
+    ]
+    assert all(row.created_on is not None for row in imported)
+
+    # The sequences must have been advanced, so that regular inserts still work.
+    row = RowHandler().create_row(user, table, {name_field.id: "Volvo"})
+    row.refresh_from_db()
+    assert row.id == imported[-1].id + 1
+    assert getattr(row, autonumber_field.db_column) == 5
+
+
+@pytest.mark.django_db
+def test_copy_insert_doesnt_insert_uncopyable_values(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+
+    instance = model(**{text_field.db_column: "test"})
+    with patch(
+        "baserow.contrib.database.db.copy.to_copy_text", side_effect=NotCopyable
+    ):
+        assert copy_insert(model, [instance]) is False
+
+    assert instance.pk is None
+    assert model.objects.count() == 0
+
+    assert copy_insert(model, []) is False
+
+
+@pytest.mark.django_db
+def test_copy_insert_with_primary_keys(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+
+    instances = [
+        model(id=10, order=Decimal("1"), **{text_field.db_column: "a"}),
+        model(id=20, order=Decimal("2"), **{text_field.db_column: "b"}),
+    ]
+    assert copy_insert(model, instances) is True
+    assert [instance.id for instance in instances] == [10, 20]
+    assert list(
+        model.objects.order_by("id").values_list("id", text_field.db_column)
+    ) == [(10, "a"), (20, "b")]
+
+    # Mixing instances with and without a primary key isn't supported.
+    assert copy_insert(model, [model(id=30), model()]) is False
+    assert model.objects.count() == 2
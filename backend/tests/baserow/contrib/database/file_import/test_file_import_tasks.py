@@ -1,8 +1,12 @@
+import io
 import json
 from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
 from typing import NamedTuple
+from unittest.mock import patch
 
 from django.conf import settings
+from django.core.files.storage import FileSystemStorage
 from django.test.utils import override_settings
 
 import pytest
@@ -17,7 +21,13 @@ from baserow.contrib.database.fields.field_constraints import (
 )
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import SelectOption, TextField
+from baserow.contrib.database.file_import.data_file import (
+    FileImportDataFile,
+    JSONStreamParser,
+)
+from baserow.contrib.database.file_import.job_types import FileImportJobType
 from baserow.contrib.database.rows.exceptions import InvalidRowLength
+from baserow.contrib.database.rows.handler import BATCH_SIZE, RowHandler
 from baserow.contrib.database.table.models import GeneratedTableModel
 from baserow.core.exceptions import UserNotInWorkspace
 from baserow.core.jobs.constants import (
@@ -1714,3 +1724,94 @@ def test_run_file_import_task_with_upsert_and_none_skipped_fields(
 
     assert getattr(charlie, age_field.db_column) == 28
     assert getattr(charlie, email_field.db_column) == "charlie@example.com"
+
+
+def test_file_import_data_file_streams_the_rows(tmpdir):
+    storage = FileSystemStorage(location=str(tmpdir))
+    rows = [["a", 1, None], ["é€", 2.5], [], ['b,]"}']]
+    configuration = {"upsert_fields": [1], "upsert_values": [["a"]] * 4}
+
+    for name, content in [
+        ("legacy.json", {"data": rows, "configuration": configuration}),
+        (
+            "streamed.json",
+            {"row_count": 4, "configuration": configuration, "data": rows},
+        ),
+    ]:
+        storage.save(name, io.BytesIO(json.dumps(content).encode("utf8")))
+        data = FileImportDataFile(SimpleNamespace(storage=storage, name=name))
+
+        assert len(data) == 4
+        assert data.configuration == configuration
+        assert list(data) == rows
+        # The file is read again for every iteration.
+        assert list(data) == rows
+
+    content = json.dumps({"row_count": 4, "data": rows}, ensure_ascii=False)
+    parser = JSONStreamParser(io.BytesIO(content.encode("utf8")), chunk_size=1)
+    keys = parser.iter_object_keys()
+    assert next(keys) == "row_count"
+    assert parser.read_value() == 4
+    assert next(keys) == "data"
+    assert list(parser.iter_array()) == rows
+    assert list(keys) == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_run_file_import_task_imports_the_rows_by_chunk(
+    data_fixture, patch_filefield_storage
+):
+    user = data_fixture.create_user()
+    table, fields, existing_rows = data_fixture.build_table(
+        columns=[("name", "text"), ("number", "number")],
+        rows=[["existing", 1]],
+        user=user,
+    )
+    name_field, number_field = fields
+    row_count = BATCH_SIZE + 6
+
+    data = [[f"row-{index}", index] for index in range(row_count)]
+    data[3] = ["row-3", "bad"]
+    data[BATCH_SIZE + 4] = ["row-bad", "bad"]
+    data[BATCH_SIZE + 5] = ["existing", 42]
+
+    with patch_filefield_storage():
+        job = data_fixture.create_file_import_job(
+            table=table, user=user, first_row_header=False
+        )
+        FileImportJobType().after_job_creation(
+            job,
+            {
+                "data": data,
+                "configuration": {
+                    "upsert_fields": [name_field.id],
+                    "upsert_values": [[row[0]] for row in data],
+                },
+            },
+        )
+
+        with patch.object(
+            RowHandler,
+            "force_create_rows_by_batch",
+            autospec=True,
+            side_effect=RowHandler.force_create_rows_by_batch,
+        ) as force_create_rows_by_batch:
+            run_async_job(job.id)
+
+    job.refresh_from_db()
+    assert job.state == JOB_FINISHED
+    assert job.progress_percentage == 100
+    assert sorted(job.report["failing_rows"].keys()) == sorted(
+        ["3", str(BATCH_SIZE + 4)]
+    )
+
+    assert force_create_rows_by_batch.call_count == 2
+    assert [
+        len(call.args[3]) for call in force_create_rows_by_batch.call_args_list
+    ] == [BATCH_SIZE - 1, 4]
+
+    model = table.get_model()
+    assert model.objects.count() == row_count - 2
+    existing_row = model.objects.get(id=existing_rows[0].id)
+    assert getattr(existing_row, name_field.db_column) == "existing"
+    assert getattr(existing_row, number_field.db_column) == 42
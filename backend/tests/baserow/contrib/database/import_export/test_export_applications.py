@@ -251,22 +251,20 @@ def test_exported_files_checksum(
     )
     assert file_path.isfile()
 
-    storage = get_default_storage()
-    path = ImportExportHandler().get_import_storage_path(resource.uuid.hex)
-
     handler = ImportExportHandler()
 
     with zipfile.ZipFile(file_path, "r") as zip_ref:
         manifest_data = handler.validate_manifest(zip_ref)
-        handler.extract_files_from_zip(path, zip_ref, storage)
+        handler.validate_checksums(manifest_data, zip_ref)
         checksums = manifest_data["checksums"]
         db_files = manifest_data["applications"]["database"]["items"][0]["files"]
         database_file = db_files["schema"]
         database_file_checksum = checksums[database_file]
 
-        file_path = handler.get_import_storage_path(resource.uuid.hex, database_file)
-
-        calculated_checksum = handler.compute_checksum_from_file(file_path, storage)
+        with zip_ref.open(database_file) as database_file_stream:
+            calculated_checksum = handler.compute_checksum_from_stream(
+                database_file_stream
+            )
         assert database_file_checksum == calculated_checksum
 
 
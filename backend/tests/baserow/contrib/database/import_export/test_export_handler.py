@@ -4,8 +4,11 @@ from io import BytesIO, StringIO
 from typing import List
 from unittest.mock import MagicMock, patch
 
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import FileSystemStorage
 from django.db import connection
-from django.test.utils import CaptureQueriesContext
+from django.test.utils import CaptureQueriesContext, override_settings
 from django.utils.dateparse import parse_date, parse_datetime
 
 import pytest
@@ -35,6 +38,7 @@ from baserow.contrib.database.export.registries import (
     TableExporter,
     table_exporter_registry,
 )
+from baserow.contrib.database.export.tasks import run_export_job_shard
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.views.exceptions import ViewNotInTable
@@ -1117,3 +1121,136 @@ def test_csv_is_escaped(get_storage_mock, data_fixture):
     bom = "\ufeff"
     expected = bom + "id,text_field\r\n1,'=1+2\r\n"
     assert contents == expected
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("with_sort", [False, True])
+@patch("baserow.core.storage.get_default_storage")
+def test_csv_export_over_multiple_chunks(get_storage_mock, data_fixture, with_sort):
+    storage_mock = MagicMock()
+    get_storage_mock.return_value = storage_mock
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text_field")
+    grid_view = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    for value in ["C", "A", "E", "B", "D"]:
+        model.objects.create(**{f"field_{text_field.id}": value})
+    if with_sort:
+        data_fixture.create_view_sort(view=grid_view, field=text_field, order="ASC")
+
+    with patch(
+        "baserow.contrib.database.export.file_writer.PaginatedExportJobFileWriter"
+        ".EXPORT_ROWS_CHUNK_SIZE",
+        2,
+    ):
+        job, contents = run_export_job_with_mock_storage(
+            table, grid_view, storage_mock, user
+        )
+
+    if with_sort:
+        expected_rows = "2,A\r\n4,B\r\n1,C\r\n5,D\r\n3,E\r\n"
+    else:
+        expected_rows = "1,C\r\n2,A\r\n3,E\r\n4,B\r\n5,D\r\n"
+    assert contents == "\ufeffid,text_field\r\n" + expected_rows
+    assert job.progress_percentage == 100.0
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_EXPORT_SHARDS=3, BASEROW_EXPORT_SHARD_MIN_ROWS=1)
+def test_csv_export_in_shards_is_merged_in_order(data_fixture, tmpdir):
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text_field")
+    model = table.get_model()
+    for value in ["C", "A", "E", "B", "D", "F", "G"]:
+        model.objects.create(**{f"field_{text_field.id}": value})
+
+    with patch("baserow.core.storage.get_default_storage", new=lambda: storage), patch(
+        "baserow.contrib.database.export.handler.get_default_storage",
+        new=lambda: storage,
+    ):
+        handler = ExportHandler()
+        job = handler.create_pending_export_job(
+            user, table, None, {"exporter_type": "csv", "export_charset": "utf-8"}
+        )
+        handler.run_export_job(job)
+
+    job.refresh_from_db()
+    assert job.shard_count == 3
+    assert job.state == EXPORT_JOB_FINISHED_STATUS
+    assert job.progress_percentage == 100.0
+
+    file_path = tmpdir.join(settings.EXPORT_FILES_DIRECTORY, job.exported_file_name)
+    assert file_path.read_binary().decode("utf-8") == (
+        "\ufeffid,text_field\r\n" "1,C\r\n2,A\r\n3,E\r\n4,B\r\n5,D\r\n6,F\r\n7,G\r\n"
+    )
+    assert sorted(tmpdir.join(settings.EXPORT_FILES_DIRECTORY).listdir()) == [file_path]
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_EXPORT_SHARDS=3, BASEROW_EXPORT_SHARD_MIN_ROWS=1)
+def test_sharded_export_is_merged_when_the_cache_is_cleared(data_fixture, tmpdir):
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    model = table.get_model()
+    for _ in range(6):
+        model.objects.create()
+
+    def clear_cache_and_run_shard(job_id, *args):
+        # The finished shards must still be counted if the cache is evicted or
+        # restarted while the shards are running.
+        cache.clear()
+        run_export_job_shard(job_id, *args)
+
+    with patch("baserow.core.storage.get_default_storage", new=lambda: storage), patch(
+        "baserow.contrib.database.export.handler.get_default_storage",
+        new=lambda: storage,
+    ), patch(
+        "baserow.contrib.database.export.handler.run_export_job_shard.delay",
+        side_effect=clear_cache_and_run_shard,
+    ):
+        handler = ExportHandler()
+        job = handler.create_pending_export_job(
+            user, table, None, {"exporter_type": "csv"}
+        )
+        handler.run_export_job(job)
+
+    job.refresh_from_db()
+    assert job.shard_count == 3
+    assert job.finished_shard_count == 3
+    assert job.state == EXPORT_JOB_FINISHED_STATUS
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_EXPORT_SHARDS=2, BASEROW_EXPORT_SHARD_MIN_ROWS=1)
+def test_cancelled_sharded_export_is_not_merged(data_fixture, tmpdir):
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    model = table.get_model()
+    for _ in range(4):
+        model.objects.create()
+
+    def cancel_job_and_run_shard(job_id, *args):
+        ExportJob.objects.filter(id=job_id).update(state=EXPORT_JOB_CANCELLED_STATUS)
+        run_export_job_shard(job_id, *args)
+
+    with patch("baserow.core.storage.get_default_storage", new=lambda: storage), patch(
+        "baserow.contrib.database.export.handler.run_export_job_shard.delay",
+        side_effect=cancel_job_and_run_shard,
+    ), patch(
+        "baserow.contrib.database.export.handler.merge_export_job_shards.delay"
+    ) as merge_mock:
+        handler = ExportHandler()
+        job = handler.create_pending_export_job(
+            user, table, None, {"exporter_type": "csv"}
+        )
+        handler.run_export_job(job)
+
+    job.refresh_from_db()
+    assert job.shard_count == 2
+    assert job.state == EXPORT_JOB_CANCELLED_STATUS
+    merge_mock.assert_not_called()
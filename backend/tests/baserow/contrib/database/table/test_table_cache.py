@@ -3,7 +3,11 @@ from django.test.utils import override_settings
 import pytest
 
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.table.cache import get_cached_model_field_attrs
+from baserow.contrib.database.table.cache import (
+    generated_models_lru_cache,
+    get_cached_model_field_attrs,
+)
+from baserow.contrib.database.table.models import Table
 from baserow.core.trash.handler import TrashHandler
 
 
@@ -204,3 +208,72 @@ def test_deleting_field_invalidates_tables_model_cache(data_fixture):
 
     table.refresh_from_db()
     assert get_cached_model_field_attrs(table) is None
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_GENERATED_MODELS_LRU_CACHE_SIZE=2)
+def test_generated_models_lru_cache(data_fixture):
+    generated_models_lru_cache.clear()
+    user = data_fixture.create_user()
+    table_a, table_b, link_field = data_fixture.create_two_linked_tables(user=user)
+    table_c = data_fixture.create_database_table(user=user)
+
+    # The per request local cache is bypassed by using `_get_model` directly.
+    model_a = table_a._get_model()
+    assert table_a._get_model() is model_a
+    assert table_a._get_model(attribute_names=True) is not model_a
+
+    # The model of table a contains the model of table b, so it must be evicted
+    # when table b changes.
+    field = data_fixture.create_text_field(table=table_b)
+    new_model_a = table_a._get_model()
+    assert new_model_a is not model_a
+    related_model_b = new_model_a._meta.get_field(link_field.db_column).related_model
+    assert field.db_column in [f.name for f in related_model_b._meta.get_fields()]
+
+    model_b = table_b._get_model()
+    assert field.db_column in [f.name for f in model_b._meta.get_fields()]
+    assert table_b._get_model() is model_b
+
+    # Only the two most recently used models are kept.
+    table_c._get_model()
+    assert table_b._get_model() is model_b
+    assert table_a._get_model() is not new_model_a
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_GENERATED_MODELS_LRU_CACHE_SIZE=2)
+def test_generated_models_lru_cache_ignores_models_invalidated_while_generated(
+    data_fixture,
+):
+    generated_models_lru_cache.clear()
+    table = data_fixture.create_database_table()
+
+    sequence = generated_models_lru_cache.get_sequence()
+    model = table._get_model()
+    generated_models_lru_cache.invalidate(table.id)
+    generated_models_lru_cache.set(table, model, sequence)
+    assert generated_models_lru_cache.get(table) is None
+
+    sequence = generated_models_lru_cache.get_sequence()
+    generated_models_lru_cache.set(table, model, sequence)
+    assert generated_models_lru_cache.get(table) is model
+
+    table.version = "other_version"
+    assert generated_models_lru_cache.get(table) is None
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_GENERATED_MODELS_LRU_CACHE_SIZE=2)
+def test_generated_models_lru_cache_does_not_mutate_cached_models(data_fixture):
+    generated_models_lru_cache.clear()
+    table = data_fixture.create_database_table()
+
+    model = table._get_model()
+    assert model.baserow_table is table
+
+    # The cached model is shared by all the threads, so another instance of the
+    # same table must not replace the instance of the model.
+    other_table_instance = Table.objects.get(id=table.id)
+    assert other_table_instance._get_model() is model
+    assert model.baserow_table is table
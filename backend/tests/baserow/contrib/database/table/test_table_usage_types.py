@@ -1,12 +1,17 @@
+from unittest.mock import patch
+
 import pytest
+from celery.exceptions import SoftTimeLimitExceeded
 from pyinstrument import Profiler
 
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.table.models import TableUsage, TableUsageUpdate
 from baserow.contrib.database.table.usage_types import (
     TableWorkspaceStorageUsageItemType,
 )
 from baserow.core.trash.handler import TrashHandler
+from baserow.core.usage.handler import UsageHandler
 from baserow.core.usage.registries import USAGE_UNIT_MB
 
 pytestmark = pytest.mark.enable_signals(
@@ -307,3 +312,114 @@ def test_table_workspace_storage_usage_item_type_performance(data_fixture):
     print(profiler.output_text(unicode=True, color=True))
 
     assert usage == files_amount * file_size_each_in_USAGE_UNIT_MB
+
+
+@pytest.mark.django_db(transaction=True)
+def test_workspace_storage_usage_is_updated_incrementally(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(user=user, database=database)
+    file_field = data_fixture.create_file_field(table=table)
+
+    UsageHandler.calculate_storage_usage()
+
+    workspace.refresh_from_db()
+    assert workspace.storage_usage == 0
+    updated_at = workspace.storage_usage_updated_at
+    assert updated_at is not None
+
+    user_file_1 = data_fixture.create_user_file(
+        original_name="test.png", is_image=True, size=3 * USAGE_UNIT_MB
+    )
+    RowHandler().create_row(user, table, {file_field.id: [{"name": user_file_1.name}]})
+
+    # The change of the table is folded into the storage usage of the workspace
+    # without fully recalculating it.
+    assert UsageHandler.calculate_storage_usage() == 0
+    workspace.refresh_from_db()
+    assert workspace.storage_usage == 3
+    assert workspace.storage_usage_updated_at == updated_at
+
+    # Trashing the table can't be expressed as a delta, so the workspace is fully
+    # recalculated.
+    TrashHandler().trash(user, workspace, database, table)
+    workspace.refresh_from_db()
+    assert workspace.storage_usage_updated_at is None
+
+    assert UsageHandler.calculate_storage_usage() == 1
+    workspace.refresh_from_db()
+    assert workspace.storage_usage == 0
+    assert workspace.storage_usage_updated_at is not None
+
+
+@pytest.mark.django_db(transaction=True)
+def test_workspace_storage_usage_delta_is_not_applied_twice_if_interrupted(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(user=user, database=database)
+    file_field = data_fixture.create_file_field(table=table)
+
+    UsageHandler.calculate_storage_usage()
+
+    user_file_1 = data_fixture.create_user_file(
+        original_name="test.png", is_image=True, size=3 * USAGE_UNIT_MB
+    )
+    RowHandler().create_row(user, table, {file_field.id: [{"name": user_file_1.name}]})
+
+    # Stop the update between folding the delta into the workspace and storing the
+    # new usage of the table.
+    with patch.object(
+        TableUsage.objects, "bulk_create", side_effect=SoftTimeLimitExceeded
+    ):
+        with pytest.raises(SoftTimeLimitExceeded):
+            UsageHandler.calculate_storage_usage()
+
+    workspace.refresh_from_db()
+    assert workspace.storage_usage == 0
+    assert TableUsageUpdate.objects.filter(table_id=table.id).exists()
+
+    UsageHandler.calculate_storage_usage()
+
+    workspace.refresh_from_db()
+    assert workspace.storage_usage == 3
+    assert not TableUsageUpdate.objects.filter(table_id=table.id).exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_workspace_marked_during_storage_usage_calculation_stays_marked(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(user=user, database=database)
+
+    calculate_storage_usage_workspace = (
+        TableWorkspaceStorageUsageItemType.calculate_storage_usage_workspace
+    )
+
+    def trash_table_during_calculation(self, workspace_id):
+        usage = calculate_storage_usage_workspace(self, workspace_id)
+        TrashHandler().trash(user, workspace, database, table)
+        return usage
+
+    with patch.object(
+        TableWorkspaceStorageUsageItemType,
+        "calculate_storage_usage_workspace",
+        trash_table_during_calculation,
+    ):
+        assert UsageHandler.calculate_storage_usage() == 1
+
+    # The recalculated usage is not stored because it doesn't take the trashed
+    # table into account, so the workspace is recalculated the next time.
+    workspace.refresh_from_db()
+    assert workspace.storage_usage_updated_at is None
+
+    assert UsageHandler.calculate_storage_usage() == 1
+    workspace.refresh_from_db()
+    assert workspace.storage_usage == 0
+    assert workspace.storage_usage_updated_at is not None
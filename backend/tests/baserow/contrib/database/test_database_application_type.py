@@ -7,6 +7,10 @@ from django.core.files.storage import FileSystemStorage
 import pytest
 from freezegun import freeze_time
 
+from baserow.contrib.database.api.rows.serializers import (
+    RowSerializer,
+    get_row_serializer_class,
+)
 from baserow.contrib.database.application_types import DatabaseApplicationType
 from baserow.contrib.database.fields.models import FormulaField, TextField
 from baserow.contrib.database.rows.handler import RowHandler
@@ -20,7 +24,10 @@ from baserow.core.models import Template
 from baserow.core.registries import ImportExportConfig, application_type_registry
 from baserow.core.snapshots.handler import SnapshotHandler
 from baserow.core.utils import Progress
-from baserow.test_utils.helpers import setup_interesting_test_database
+from baserow.test_utils.helpers import (
+    assert_serialized_rows_contain_same_values,
+    setup_interesting_test_database,
+)
 
 
 @pytest.mark.django_db
@@ -264,3 +271,52 @@ def test_perform_restore_interesting_database(data_fixture):
         model = snapshotted_table.get_model()
         assert model.objects.count() == 2
     assert progress.progress == 100
+
+
+def get_serialized_table_rows(table):
+    model = table.get_model()
+    serializer_class = get_row_serializer_class(
+        model, RowSerializer, is_response=True, user_field_names=True
+    )
+    return serializer_class(model.objects.all().enhance_by_fields(), many=True).data
+
+
+@pytest.mark.django_db
+def test_duplicate_database_copies_rows_in_database(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = setup_interesting_test_database(
+        data_fixture, user=user, workspace=workspace, name="db"
+    )
+    table_a = Table.objects.get(database=database, name="A")
+    trashed_row = RowHandler().create_row(user, table_a, {})
+    RowHandler().delete_row(user, table_a, trashed_row)
+
+    serialized = DatabaseApplicationType().export_serialized(
+        database,
+        ImportExportConfig(include_permission_data=False, copy_rows_in_database=True),
+    )
+    for serialized_table in serialized["tables"]:
+        assert serialized_table["rows"] == []
+        assert serialized_table["copy_rows_from_table_id"] == serialized_table["id"]
+
+    with patch.object(
+        DatabaseApplicationType, "_import_serialized_fields_values_to_row"
+    ) as mock_import_serialized_fields_values_to_row:
+        duplicated = CoreHandler().duplicate_application(user, database)
+
+    mock_import_serialized_fields_values_to_row.assert_not_called()
+    for table in database.table_set.all():
+        duplicated_table = Table.objects.get(database=duplicated, name=table.name)
+        original_rows = get_serialized_table_rows(table)
+        duplicated_rows = get_serialized_table_rows(duplicated_table)
+
+        assert len(original_rows) > 0
+        assert len(original_rows) == len(duplicated_rows)
+        for original_row, duplicated_row in zip(original_rows, duplicated_rows):
+            assert_serialized_rows_contain_same_values(original_row, duplicated_row)
+
+    # The rows are copied with their ids, so the sequence must have been updated.
+    duplicated_table_a = Table.objects.get(database=duplicated, name="A")
+    row = RowHandler().create_row(user, duplicated_table_a, {})
+    assert row.id not in [r["id"] for r in get_serialized_table_rows(table_a)]
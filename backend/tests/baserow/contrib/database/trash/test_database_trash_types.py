@@ -3,6 +3,7 @@ from unittest.mock import patch
 
 from django.conf import settings
 from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 import pytest
@@ -48,9 +49,9 @@ def test_delete_row_by_id(data_fixture):
 
 
 @pytest.mark.django_db
-@patch("baserow.core.trash.signals.permanently_deleted.send")
+@patch("baserow.core.trash.signals.items_permanently_deleted.send")
 def test_perm_deleting_many_rows_at_once_only_looks_up_the_model_once(
-    mock, data_fixture, django_assert_num_queries
+    mock, data_fixture
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(name="Car", user=user)
@@ -68,7 +69,7 @@ def test_perm_deleting_many_rows_at_once_only_looks_up_the_model_once(
     TrashEntry.objects.update(should_be_permanently_deleted=True)
 
     invalidate_table_in_model_cache(table.id)
-    with django_assert_num_queries(14):
+    with CaptureQueriesContext(connection) as captured_1:
         TrashHandler.permanently_delete_marked_trash()
 
     row_2 = handler.create_row(user=user, table=table)
@@ -83,20 +84,19 @@ def test_perm_deleting_many_rows_at_once_only_looks_up_the_model_once(
     TrashEntry.objects.update(should_be_permanently_deleted=True)
 
     invalidate_table_in_model_cache(table.id)
-    # We only want 8 more queries when deleting 2 rows instead of 1 compared to
-    # above:
-    # 1. An extra query to open the second trash entries savepoint
-    # 2. An extra query to lookup the second trash entry
-    # 3. A query to lookup the extra row we are deleting
-    # 4. A query to delete said row
-    # 5. A query to delete it's trash entry.
-    # 6. A query to delete any related row comments.
-    # 7. An extra query to close the second trash entries savepoint
-    # If we weren't caching the table models an extra number of queries would be first
-    # performed to lookup the table information which breaks this assertion.
-    with django_assert_num_queries(21):
+    # The rows of the same table are looked up and deleted together, so deleting two
+    # rows doesn't need any extra query compared to deleting one. If we weren't
+    # caching the table models an extra number of queries would be performed to
+    # lookup the table information which breaks this assertion.
+    with CaptureQueriesContext(connection) as captured_2:
         TrashHandler.permanently_delete_marked_trash()
 
+    assert len(captured_2.captured_queries) == len(captured_1.captured_queries)
+    assert model.trash.all().count() == 0
+    assert TrashEntry.objects.count() == 0
+    assert mock.call_count == 2
+    assert sorted(mock.call_args.kwargs["trash_item_ids"]) == [row_2.id, row_3.id]
+
 
 @pytest.mark.django_db
 def test_can_delete_fields_and_rows_in_the_same_perm_delete_batch(
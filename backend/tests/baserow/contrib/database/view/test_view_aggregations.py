@@ -1,5 +1,8 @@
 import random
 from decimal import Decimal
+from unittest.mock import patch
+
+from django.test.utils import override_settings
 
 import pytest
 from faker import Faker
@@ -7,9 +10,17 @@ from faker import Faker
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.contrib.database.fields.field_types import SingleSelectFieldType
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.views.exceptions import FieldAggregationNotSupported
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.views.exceptions import (
+    AggregationDeltaNotApplicable,
+    FieldAggregationNotSupported,
+)
+from baserow.contrib.database.views.filters import AdHocFilters
 from baserow.contrib.database.views.handler import ViewHandler
-from baserow.contrib.database.views.registries import view_aggregation_type_registry
+from baserow.contrib.database.views.registries import (
+    view_aggregation_type_registry,
+    view_type_registry,
+)
 from baserow.core.trash.handler import TrashHandler
 from baserow.test_utils.helpers import setup_interesting_test_table
 
@@ -627,3 +638,220 @@ class TestViewDistributionAggregation:
         # the boolean field distribution:
         for value, count in result[f"field_{boolean_formula_field.id}"]:
             assert self.expected_distributions[boolean_field].get(value) == count
+
+
+@pytest.mark.parametrize(
+    "aggregation_type_name,value,removed,added,expected",
+    [
+        ("empty_count", 3, 1, 0, 2),
+        ("not_empty_count", 3, 0, 2, 5),
+        ("sum", Decimal("10"), Decimal("4"), Decimal("1"), Decimal("7")),
+        ("sum", None, None, Decimal("1"), Decimal("1")),
+        ("sum", Decimal("10"), None, None, Decimal("10")),
+        ("sum", Decimal("4"), Decimal("4"), None, AggregationDeltaNotApplicable),
+        ("min", 2, 5, 1, 1),
+        ("min", 2, None, 3, 2),
+        ("min", None, None, 3, 3),
+        ("min", 2, 2, 3, AggregationDeltaNotApplicable),
+        ("max", 8, 5, 9, 9),
+        ("max", 8, 8, 7, AggregationDeltaNotApplicable),
+        ("unique_count", 3, 1, 1, AggregationDeltaNotApplicable),
+    ],
+)
+def test_view_aggregation_apply_delta(
+    aggregation_type_name, value, removed, added, expected
+):
+    aggregation_type = view_aggregation_type_registry.get(aggregation_type_name)
+
+    if expected is AggregationDeltaNotApplicable:
+        with pytest.raises(AggregationDeltaNotApplicable):
+            aggregation_type.apply_delta(value, removed, added)
+    else:
+        assert aggregation_type.apply_delta(value, removed, added) == expected
+
+
+@pytest.mark.django_db
+def test_view_aggregations_are_updated_incrementally_when_rows_change(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    min_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_grid_view_field_option(
+        grid_view, text_field, aggregation_raw_type="empty_count"
+    )
+    data_fixture.create_grid_view_field_option(
+        grid_view, number_field, aggregation_raw_type="sum"
+    )
+    data_fixture.create_grid_view_field_option(
+        grid_view, min_field, aggregation_raw_type="min"
+    )
+
+    view_handler = ViewHandler()
+    row_handler = RowHandler()
+    rows = row_handler.create_rows(
+        user,
+        table,
+        [
+            {
+                text_field.db_column: "a",
+                number_field.db_column: 1,
+                min_field.db_column: 1,
+            },
+            {
+                text_field.db_column: "",
+                number_field.db_column: 2,
+                min_field.db_column: 2,
+            },
+        ],
+    ).created_rows
+    aggregations = view_handler.get_view_field_aggregations(user, grid_view)
+    assert aggregations == {
+        text_field.db_column: 1,
+        number_field.db_column: Decimal("3"),
+        min_field.db_column: Decimal("1"),
+    }
+
+    def assert_cached(expected, need_computation):
+        values, to_compute = view_handler._get_aggregations_to_compute(
+            grid_view, view_type_registry.get("grid").get_aggregations(grid_view)
+        )
+        assert values == expected
+        assert set(to_compute) == need_computation
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.create_rows(
+            user, table, [{text_field.db_column: "", number_field.db_column: 4}]
+        )
+    assert_cached(
+        {
+            text_field.db_column: 2,
+            number_field.db_column: Decimal("7"),
+            min_field.db_column: Decimal("1"),
+        },
+        set(),
+    )
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.update_rows(
+            user,
+            table,
+            [{"id": rows[1].id, text_field.db_column: "b", number_field.db_column: 5}],
+        )
+    assert_cached(
+        {
+            text_field.db_column: 1,
+            number_field.db_column: Decimal("10"),
+            min_field.db_column: Decimal("1"),
+        },
+        set(),
+    )
+
+    # Deleting the row holding the minimum can't be applied incrementally, so only
+    # that aggregation must be recomputed.
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.delete_rows(user, table, [rows[0].id])
+    assert_cached(
+        {text_field.db_column: 1, number_field.db_column: Decimal("9")},
+        {min_field.db_column},
+    )
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        text_field.db_column: 1,
+        number_field.db_column: Decimal("9"),
+        min_field.db_column: Decimal("2"),
+    }
+
+
+@pytest.mark.django_db
+@override_settings(
+    BASEROW_FILTERED_AGGREGATIONS_CACHE_TTL_SECONDS=60,
+    BASEROW_FILTERED_AGGREGATIONS_CACHE_MAX_ENTRIES=1,
+)
+def test_filtered_view_aggregations_are_cached(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_grid_view_field_option(
+        grid_view, number_field, aggregation_raw_type="sum"
+    )
+    model = table.get_model()
+    model.objects.create(**{number_field.db_column: 1})
+    model.objects.create(**{number_field.db_column: 5})
+
+    def higher_than(value):
+        return AdHocFilters(
+            filter_type="AND",
+            filter_object={f"filter__field_{number_field.id}__higher_than": value},
+        )
+
+    view_handler = ViewHandler()
+    with patch.object(
+        view_handler,
+        "get_field_aggregations",
+        wraps=view_handler.get_field_aggregations,
+    ) as get_field_aggregations:
+        for _ in range(2):
+            result = view_handler.get_view_field_aggregations(
+                user, grid_view, adhoc_filters=higher_than("2")
+            )
+            assert result == {number_field.db_column: Decimal("5")}
+        assert get_field_aggregations.call_count == 1
+
+        # Changing the data of the table invalidates the cached value.
+        RowHandler().create_row(user, table, {number_field.db_column: 3})
+        result = view_handler.get_view_field_aggregations(
+            user, grid_view, adhoc_filters=higher_than("2")
+        )
+        assert result == {number_field.db_column: Decimal("8")}
+        assert get_field_aggregations.call_count == 2
+
+        # Only one entry is kept per view, so the least recently used one is evicted.
+        result = view_handler.get_view_field_aggregations(
+            user, grid_view, adhoc_filters=higher_than("0")
+        )
+        assert result == {number_field.db_column: Decimal("9")}
+        result = view_handler.get_view_field_aggregations(
+            user, grid_view, adhoc_filters=higher_than("2")
+        )
+        assert result == {number_field.db_column: Decimal("8")}
+        assert get_field_aggregations.call_count == 4
+
+
+def test_adhoc_filters_hash_does_not_depend_on_the_filters_order():
+    first = AdHocFilters(
+        api_filters={
+            "filter_type": "AND",
+            "filters": [
+                {"field": 1, "type": "equal", "value": "a"},
+                {"field": 2, "type": "equal", "value": "b"},
+            ],
+            "groups": [],
+        }
+    )
+    second = AdHocFilters(
+        api_filters={
+            "groups": [],
+            "filters": [
+                {"value": "b", "type": "equal", "field": 2},
+                {"field": 1, "type": "equal", "value": "a"},
+            ],
+            "filter_type": "AND",
+        }
+    )
+    third = AdHocFilters(
+        api_filters={
+            "filter_type": "OR",
+            "filters": [
+                {"field": 1, "type": "equal", "value": "a"},
+                {"field": 2, "type": "equal", "value": "b"},
+            ],
+            "groups": [],
+        }
+    )
+
+    assert first.get_hash() == second.get_hash()
+    assert first.get_hash() != third.get_hash()
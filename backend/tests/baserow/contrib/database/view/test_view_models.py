@@ -13,6 +13,7 @@ from baserow.contrib.database.views.models import (
     ViewFilter,
     ViewSort,
 )
+from baserow.contrib.database.views.utils import RowIdRanges
 from baserow.contrib.database.views.view_types import GridViewType
 
 
@@ -415,3 +416,28 @@ def test_migration_remove_stale_fieldoptions(
 
     # Only the stale field option should be deleted.
     assert GridViewFieldOptions.objects.filter(grid_view=grid_view).count() == 1
+
+
+def test_row_id_ranges():
+    row_id_ranges = RowIdRanges.from_ids([5, 1, 2, 3, 3, 9])
+    assert row_id_ranges.to_list() == [1, 3, 5, 5, 9, 9]
+    assert list(row_id_ranges) == [1, 2, 3, 5, 9]
+    assert len(row_id_ranges) == 5
+    assert 2 in row_id_ranges
+    assert 4 not in row_id_ranges
+
+    row_id_ranges.add(4)
+    assert row_id_ranges.to_list() == [1, 5, 9, 9]
+    row_id_ranges.add(10)
+    row_id_ranges.add(7)
+    assert row_id_ranges.to_list() == [1, 5, 7, 7, 9, 10]
+
+    row_id_ranges.remove(3)
+    assert row_id_ranges.to_list() == [1, 2, 4, 5, 7, 7, 9, 10]
+    row_id_ranges.remove(7)
+    row_id_ranges.remove(9)
+    row_id_ranges.remove(6)
+    assert row_id_ranges.to_list() == [1, 2, 4, 5, 10, 10]
+
+    assert RowIdRanges(row_id_ranges.to_list()).to_list() == [1, 2, 4, 5, 10, 10]
+    assert RowIdRanges().to_list() == []
@@ -5,15 +5,20 @@ from django.db import transaction
 import pytest
 from freezegun import freeze_time
 
+from baserow.contrib.database.field_rules.handlers import FieldRuleHandler
+from baserow.contrib.database.field_rules.registries import RowRuleChanges
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.tasks import run_periodic_fields_updates
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.table.signals import table_updated
 from baserow.contrib.database.views.handler import ViewHandler, ViewSubscriptionHandler
+from baserow.contrib.database.views.models import ViewRows
 from baserow.contrib.database.views.signals import (
     view_loaded_create_indexes_and_columns,
 )
 from baserow.core.cache import local_cache
 from baserow.core.trash.handler import TrashHandler
+from tests.baserow.contrib.database.utils import DummyFieldRuleType
 
 
 @patch("baserow.contrib.database.views.handler.ViewIndexingHandler")
@@ -534,3 +539,120 @@ def test_rows_enter_and_exit_view_when_data_changes_in_looked_up_tables(
         p.assert_called_once()
         assert p.call_args[1]["view"].id == view_a.id
         assert p.call_args[1]["row_ids"] == [row_a2.id, row_a3.id]
+
+
+@pytest.mark.django_db
+def test_only_the_changed_rows_are_checked_when_rows_enter_and_exit_a_view(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+
+    view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=view, field=text_field, type="equal", value="aaa"
+    )
+    rows = [model.objects.create(**{text_field.db_column: "aaa"}) for _ in range(4)]
+    row_1, row_2, row_3, row_4 = rows
+
+    ViewSubscriptionHandler.subscribe_to_views(user, [view])
+
+    # The rows in the view are stored as ranges of consecutive ids.
+    assert ViewRows.objects.get(view=view).row_id_ranges == [row_1.id, row_4.id]
+
+    # A row not matching the filters anymore without being changed isn't noticed,
+    # because only the changed rows are checked against the filters.
+    model.objects.filter(id=row_4.id).update(**{text_field.db_column: "bbb"})
+
+    with patch("baserow.contrib.database.views.signals.rows_exited_view.send") as p:
+        RowHandler().force_update_rows(
+            user, table, [{"id": row_2.id, text_field.db_column: "bbb"}], model
+        )
+        p.assert_called_once()
+        assert p.call_args[1]["view"].id == view.id
+        assert p.call_args[1]["row_ids"] == [row_2.id]
+
+    assert ViewRows.objects.get(view=view).row_id_ranges == [
+        row_1.id,
+        row_1.id,
+        row_3.id,
+        row_4.id,
+    ]
+
+    with patch("baserow.contrib.database.views.signals.rows_entered_view.send") as p:
+        RowHandler().force_update_rows(
+            user, table, [{"id": row_2.id, text_field.db_column: "aaa"}], model
+        )
+        p.assert_called_once()
+        assert p.call_args[1]["row_ids"] == [row_2.id]
+
+    assert ViewRows.objects.get(view=view).row_id_ranges == [row_1.id, row_4.id]
+
+
+@pytest.mark.django_db
+def test_rows_updated_in_cascade_by_field_rules_enter_and_exit_a_view(
+    data_fixture, fake_field_rule_registry
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    FieldRuleHandler(table, user).create_rule("dummy", {})
+    model = table.get_model()
+
+    view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=view, field=text_field, type="equal", value="aaa"
+    )
+    row_1, row_2, row_3 = [
+        model.objects.create(**{text_field.db_column: "aaa"}) for _ in range(3)
+    ]
+
+    ViewSubscriptionHandler.subscribe_to_views(user, [view])
+
+    # The rule copies the new value of the row to the next row.
+    def copy_value_to_next_row(self, row, rule, updated_values, collector):
+        return [
+            RowRuleChanges(row.id, dict(updated_values), {text_field.id}),
+            RowRuleChanges(row.id + 1, dict(updated_values), {text_field.id}),
+        ]
+
+    with patch.object(
+        DummyFieldRuleType, "before_row_updated", copy_value_to_next_row
+    ), patch("baserow.contrib.database.views.signals.rows_exited_view.send") as p:
+        RowHandler().force_update_rows(
+            user, table, [{"id": row_1.id, text_field.db_column: "bbb"}], model
+        )
+        p.assert_called_once()
+        assert p.call_args[1]["row_ids"] == [row_1.id, row_2.id]
+
+    assert ViewRows.objects.get(view=view).row_id_ranges == [row_3.id, row_3.id]
+
+
+@pytest.mark.django_db
+def test_table_refresh_checks_all_the_rows_of_the_views(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+
+    view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=view, field=text_field, type="equal", value="aaa"
+    )
+    row = model.objects.create(**{text_field.db_column: "aaa"})
+
+    ViewSubscriptionHandler.subscribe_to_views(user, [view])
+
+    # The rows can be changed without sending the row signals, for example when
+    # many rows are restored at once.
+    model.objects.filter(id=row.id).update(**{text_field.db_column: "bbb"})
+
+    with patch("baserow.contrib.database.views.signals.rows_exited_view.send") as p:
+        table_updated.send(None, table=table, user=None, force_table_refresh=False)
+        p.assert_not_called()
+
+        table_updated.send(None, table=table, user=None, force_table_refresh=True)
+        p.assert_called_once()
+        assert p.call_args[1]["row_ids"] == [row.id]
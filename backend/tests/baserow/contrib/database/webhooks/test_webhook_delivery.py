@@ -0,0 +1,135 @@
+import json
+from unittest.mock import patch
+
+import pytest
+import responses
+from django_redis import get_redis_connection
+
+from baserow.contrib.database.webhooks.delivery import (
+    READY_WEBHOOKS_KEY,
+    WebhookDeliveryDispatcher,
+    enqueue_webhook_call,
+    get_delivery_queue_key,
+)
+from baserow.contrib.database.webhooks.models import TableWebhookCall
+
+
+def enqueue_call(webhook, event_id, event_type="rows.created"):
+    enqueue_webhook_call(
+        webhook_id=webhook.id,
+        event_id=event_id,
+        event_type=event_type,
+        method="POST",
+        url=webhook.url,
+        headers={"X-Baserow-Event": event_type},
+        payload={"event_id": event_id, "event_type": event_type},
+    )
+
+
+@pytest.mark.django_db
+@responses.activate
+@patch("baserow.contrib.database.webhooks.tasks.deliver_webhook_calls")
+def test_deliver_webhook_calls_in_order_per_webhook(
+    mock_deliver_webhook_calls, data_fixture, settings
+):
+    settings.BASEROW_WEBHOOKS_DELIVERY_CONCURRENCY = 4
+
+    webhook_1 = data_fixture.create_table_webhook(url="http://localhost/1")
+    webhook_2 = data_fixture.create_table_webhook(url="http://localhost/2")
+    responses.add(responses.POST, "http://localhost/1", json={}, status=200)
+    responses.add(responses.POST, "http://localhost/2", json={}, status=200)
+
+    event_ids = [
+        "00000000-0000-0000-0000-000000000001",
+        "00000000-0000-0000-0000-000000000002",
+        "00000000-0000-0000-0000-000000000003",
+    ]
+    for event_id in event_ids:
+        enqueue_call(webhook_1, event_id)
+        enqueue_call(webhook_2, event_id)
+
+    # Only the first queued call schedules a dispatcher.
+    mock_deliver_webhook_calls.delay.assert_called_once()
+
+    WebhookDeliveryDispatcher().run()
+
+    for url in ["http://localhost/1", "http://localhost/2"]:
+        delivered_event_ids = [
+            json.loads(call.request.body)["event_id"]
+            for call in responses.calls
+            if call.request.url == url
+        ]
+        assert delivered_event_ids == event_ids
+
+    assert TableWebhookCall.objects.filter(webhook=webhook_1).count() == 3
+    assert TableWebhookCall.objects.filter(webhook=webhook_2).count() == 3
+
+
+@pytest.mark.django_db
+@responses.activate
+@patch("baserow.contrib.database.webhooks.tasks.deliver_webhook_calls")
+def test_deliver_webhook_calls_batches_events_when_opted_in(
+    mock_deliver_webhook_calls, data_fixture, settings
+):
+    settings.BASEROW_WEBHOOKS_DELIVERY_CONCURRENCY = 4
+    settings.BASEROW_WEBHOOKS_DELIVERY_MAX_BATCH_SIZE = 2
+
+    webhook = data_fixture.create_table_webhook(
+        url="http://localhost/", batch_events=True
+    )
+    responses.add(responses.POST, "http://localhost/", json={}, status=200)
+
+    enqueue_call(webhook, "00000000-0000-0000-0000-000000000001")
+    enqueue_call(webhook, "00000000-0000-0000-0000-000000000002")
+    enqueue_call(webhook, "00000000-0000-0000-0000-000000000003")
+    enqueue_call(webhook, "00000000-0000-0000-0000-000000000004", "rows.deleted")
+
+    WebhookDeliveryDispatcher().run()
+
+    bodies = [json.loads(call.request.body) for call in responses.calls]
+    assert [
+        [payload["event_id"][-1] for payload in body]
+        if isinstance(body, list)
+        else body["event_id"][-1]
+        for body in bodies
+    ] == [["1", "2"], "3", "4"]
+    assert TableWebhookCall.objects.filter(webhook=webhook).count() == 4
+
+
+@pytest.mark.django_db
+@responses.activate
+@patch("baserow.contrib.database.webhooks.tasks.deliver_webhook_calls")
+def test_failed_webhook_call_blocks_the_queue_until_retried(
+    mock_deliver_webhook_calls, data_fixture, settings
+):
+    settings.BASEROW_WEBHOOKS_DELIVERY_CONCURRENCY = 4
+    settings.BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL = 1
+
+    webhook = data_fixture.create_table_webhook(url="http://localhost/")
+    responses.add(responses.POST, "http://localhost/", json={}, status=500)
+
+    enqueue_call(webhook, "00000000-0000-0000-0000-000000000001")
+    enqueue_call(webhook, "00000000-0000-0000-0000-000000000002")
+
+    WebhookDeliveryDispatcher().run()
+
+    # The failed call stays at the head of the queue and is retried later.
+    assert len(responses.calls) == 1
+    mock_deliver_webhook_calls.apply_async.assert_called_once_with(countdown=1)
+    redis = get_redis_connection("default")
+    queued_calls = [
+        json.loads(call)
+        for call in redis.lrange(get_delivery_queue_key(webhook.id), 0, -1)
+    ]
+    assert [call["retries"] for call in queued_calls] == [1, 0]
+    assert queued_calls[0]["event_id"] == "00000000-0000-0000-0000-000000000001"
+
+    # Once the retry is due, the call is given up after the max retries and the
+    # next call is delivered.
+    redis.zadd(READY_WEBHOOKS_KEY, {webhook.id: 0})
+    WebhookDeliveryDispatcher().run()
+
+    assert len(responses.calls) == 3
+    assert redis.llen(get_delivery_queue_key(webhook.id)) == 1
+    webhook.refresh_from_db()
+    assert webhook.failed_triggers == 3
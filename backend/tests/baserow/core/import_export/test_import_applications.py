@@ -1,3 +1,4 @@
+import json
 import os
 import zipfile
 from unittest.mock import call, patch
@@ -6,7 +7,10 @@ from django.conf import settings
 
 import pytest
 
-from baserow.core.import_export.exceptions import ImportExportResourceInvalidFile
+from baserow.core.import_export.exceptions import (
+    ImportExportResourceDoesNotExist,
+    ImportExportResourceInvalidFile,
+)
 from baserow.core.import_export.handler import ImportExportHandler
 from baserow.test_utils.zip_helpers import (
     add_file_to_zip,
@@ -191,3 +195,29 @@ def test_import_workspace_applications_calls_signals(
 
     mock_application_created.send.assert_has_calls(expected_calls)
     mock_application_imported.send.assert_has_calls(expected_calls)
+
+
+def test_validate_checksums_reads_files_from_zip(tmp_path):
+    handler = ImportExportHandler()
+
+    with zipfile.ZipFile(INTERESTING_DB_EXPORT_PATH, "r") as zip_file:
+        manifest_data = json.loads(zip_file.read("manifest.json"))
+        file_to_change = next(iter(manifest_data["checksums"]))
+        handler.validate_checksums(manifest_data, zip_file)
+
+    new_zip_path = change_file_content_in_zip(
+        INTERESTING_DB_EXPORT_PATH,
+        f"{tmp_path}/modified.zip",
+        file_to_change,
+        b"some new content",
+    )
+    with zipfile.ZipFile(new_zip_path, "r") as zip_file:
+        with pytest.raises(ImportExportResourceInvalidFile):
+            handler.validate_checksums(manifest_data, zip_file)
+
+    new_zip_path = remove_file_from_zip(
+        INTERESTING_DB_EXPORT_PATH, f"{tmp_path}/missing.zip", file_to_change
+    )
+    with zipfile.ZipFile(new_zip_path, "r") as zip_file:
+        with pytest.raises(ImportExportResourceDoesNotExist):
+            handler.validate_checksums(manifest_data, zip_file)
@@ -2,7 +2,7 @@ from unittest.mock import MagicMock, patch
 
 from django.contrib.contenttypes.models import ContentType
 from django.db import connection
-from django.db.models import CharField, Prefetch, Value
+from django.db.models import CharField, F, Prefetch, Value
 from django.db.models.expressions import ExpressionWrapper
 from django.db.models.functions import Concat
 from django.test.utils import override_settings
@@ -25,9 +25,11 @@ from baserow.contrib.database.views.models import (
 )
 from baserow.core.db import (
     CombinedForeignKeyAndManyToManyMultipleFieldPrefetch,
+    KeysetPaginator,
     LockedAtomicTransaction,
     MultiFieldPrefetchQuerysetMixin,
     QuerySet,
+    iterate_queryset_in_chunks,
     specific_iterator,
     specific_queryset,
 )
@@ -701,3 +703,79 @@ def test_specific_iterator_skip_missing_specific_objects(data_fixture):
     mock_logger.error.assert_called_once_with(
         f"The specific object with id {field_without_specific.id} does not exist."
     )
+
+
+@pytest.mark.django_db
+def test_keyset_paginator_default_ordering(data_fixture):
+    table = data_fixture.create_database_table()
+    model = table.get_model()
+    rows = [model.objects.create(order=order) for order in [3, 1, 2, 1, 1]]
+
+    paginator = KeysetPaginator(model.objects.all(), 2)
+    pages = [[row.id for row in page] for page in paginator]
+
+    assert pages == [
+        [rows[1].id, rows[3].id],
+        [rows[4].id, rows[2].id],
+        [rows[0].id],
+    ]
+
+
+@pytest.mark.django_db
+def test_keyset_paginator_respects_direction_and_nulls(data_fixture):
+    table = data_fixture.create_database_table()
+    number_field = data_fixture.create_number_field(table=table)
+    text_field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    values = [(1, "b"), (None, "a"), (2, None), (1, "a"), (None, None), (2, "c")]
+    for number, text in values:
+        model.objects.create(
+            **{f"field_{number_field.id}": number, f"field_{text_field.id}": text}
+        )
+
+    for order_by in [
+        [F(f"field_{number_field.id}").asc(), F(f"field_{text_field.id}").desc()],
+        [
+            F(f"field_{number_field.id}").desc(nulls_last=True),
+            F(f"field_{text_field.id}").asc(nulls_first=True),
+        ],
+        [f"-field_{number_field.id}", f"field_{text_field.id}"],
+    ]:
+        queryset = model.objects.all().order_by(*order_by, "id")
+        expected = [row.id for row in queryset]
+
+        for page_size in [1, 2, 4]:
+            paginator = KeysetPaginator(queryset, page_size)
+            assert [row.id for page in paginator for row in page] == expected
+
+
+@pytest.mark.django_db
+def test_keyset_paginator_adds_primary_key_as_tiebreaker(data_fixture):
+    table = data_fixture.create_database_table()
+    number_field = data_fixture.create_number_field(table=table)
+    model = table.get_model()
+    for _ in range(5):
+        model.objects.create(**{f"field_{number_field.id}": 1})
+
+    queryset = model.objects.all().order_by(f"field_{number_field.id}")
+    paginator = KeysetPaginator(queryset, 2)
+    ids = [row.id for page in paginator for row in page]
+
+    assert ids == sorted(ids)
+    assert len(ids) == 5
+
+
+@pytest.mark.django_db
+def test_iterate_queryset_in_chunks_applies_multi_field_prefetch(data_fixture):
+    table = data_fixture.create_database_table()
+    model = table.get_model()
+    for _ in range(5):
+        model.objects.create()
+
+    prefetch_function = MagicMock()
+    queryset = model.objects.all().multi_field_prefetch(prefetch_function)
+    chunks = list(iterate_queryset_in_chunks(queryset, 2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert prefetch_function.call_count == 3
+    assert [call[0][1] for call in prefetch_function.call_args_list] == chunks
@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta, timezone
 
 from django.db import OperationalError, connection
+from django.test.utils import override_settings
 
 import pytest
 from freezegun import freeze_time
@@ -16,6 +17,7 @@ from baserow.core.trash.exceptions import (
     PermanentDeletionMaxLocksExceededException,
 )
 from baserow.core.trash.handler import TrashHandler, _get_trash_entry
+from baserow.core.trash.signals import items_permanently_deleted
 
 
 @pytest.mark.django_db
@@ -282,6 +284,44 @@ def test_perm_deleting_a_table_with_a_trashed_row_also_cleans_up_the_row_entry(
     assert f"database_table_{table.id}" not in connection.introspection.table_names()
 
 
+@pytest.mark.django_db
+@override_settings(BASEROW_TRASH_PERMANENT_DELETION_BATCH_SIZE=2)
+def test_perm_deleting_marked_rows_deletes_them_in_batches_per_table(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(user=user, workspace=workspace)
+    table_1 = data_fixture.create_database_table(database=database)
+    table_2 = data_fixture.create_database_table(database=database)
+    rows_1 = [table_1.get_model().objects.create() for _ in range(3)]
+    rows_2 = [table_2.get_model().objects.create() for _ in range(2)]
+
+    for row in rows_2 + rows_1:
+        TrashHandler.trash(user, workspace, database, row)
+    TrashHandler.empty(user, workspace.id, database.id)
+
+    deleted_batches = []
+
+    def items_permanently_deleted_receiver(sender, trash_item_ids, parent_id, **kw):
+        deleted_batches.append((sender, parent_id, sorted(trash_item_ids)))
+
+    items_permanently_deleted.connect(items_permanently_deleted_receiver)
+    try:
+        TrashHandler.permanently_delete_marked_trash()
+    finally:
+        items_permanently_deleted.disconnect(items_permanently_deleted_receiver)
+
+    assert deleted_batches == [
+        ("row", table_2.id, [rows_2[0].id, rows_2[1].id]),
+        ("row", table_1.id, [rows_1[0].id, rows_1[1].id]),
+        ("row", table_1.id, [rows_1[2].id]),
+    ]
+    assert TrashEntry.objects.count() == 0
+    assert table_1.get_model().objects_and_trash.count() == 0
+    assert table_2.get_model().objects_and_trash.count() == 0
+
+
 @pytest.mark.django_db
 def test_trash_contents_are_ordered_from_newest_to_oldest_entries(
     data_fixture,
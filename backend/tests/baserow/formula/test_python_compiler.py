@@ -0,0 +1,115 @@
+from unittest.mock import patch
+
+import pytest
+
+from baserow.core.formula import BaserowFormulaObject, resolve_formula
+from baserow.core.formula.parser.exceptions import (
+    BaserowFormulaSyntaxError,
+    InvalidNumberOfArguments,
+)
+from baserow.core.formula.parser.parser import get_parse_tree_for_formula
+from baserow.core.formula.parser.python_compiler import (
+    compile_formula,
+    compiled_formulas_lru_cache,
+    get_compiled_formula,
+)
+from baserow.core.formula.registries import (
+    BaserowRuntimeFormulaFunctionRegistry,
+    formula_runtime_function_registry,
+)
+from baserow.core.formula.runtime_formula_types import RuntimeAdd, RuntimeGet
+from baserow.test_utils.helpers import load_test_cases
+
+TEST_DATA = load_test_cases("formula_runtime_cases")
+
+VALID_FORMULA_TESTS = TEST_DATA["VALID_FORMULA_TESTS"]
+INVALID_FORMULA_TESTS = TEST_DATA["INVALID_FORMULA_TESTS"]
+
+
+@pytest.fixture(autouse=True)
+def clear_compiled_formulas():
+    compiled_formulas_lru_cache.clear()
+    yield
+    compiled_formulas_lru_cache.clear()
+
+
+@pytest.mark.parametrize("test_data", VALID_FORMULA_TESTS)
+def test_compiled_valid_formulas(test_data):
+    compiled = compile_formula(test_data["formula"], formula_runtime_function_registry)
+    assert compiled(test_data["context"]) == test_data["result"]
+
+
+@pytest.mark.parametrize("test_data", INVALID_FORMULA_TESTS)
+def test_compiled_invalid_formulas(test_data):
+    with pytest.raises(Exception):
+        compile_formula(test_data["formula"], formula_runtime_function_registry)(
+            test_data["context"]
+        )
+
+
+def test_compiled_formula_function_does_not_exist():
+    compiled = compile_formula(
+        "notExistingFunction(1,2,3)", formula_runtime_function_registry
+    )
+    with pytest.raises(BaserowFormulaSyntaxError):
+        compiled({})
+
+
+def test_compiled_invalid_number_of_arguments():
+    compiled = compile_formula("get(1,2)", formula_runtime_function_registry)
+    with pytest.raises(InvalidNumberOfArguments):
+        compiled({})
+
+
+def test_resolve_formula_parses_a_formula_only_once(settings):
+    settings.BASEROW_COMPILED_FORMULAS_LRU_CACHE_SIZE = 10
+    formula = BaserowFormulaObject.create("get('a') + get('b')")
+
+    with patch(
+        "baserow.core.formula.parser.python_compiler.get_parse_tree_for_formula",
+        wraps=get_parse_tree_for_formula,
+    ) as mock_parse:
+        for a in range(3):
+            assert (
+                resolve_formula(
+                    formula, formula_runtime_function_registry, {"a": a, "b": 1}
+                )
+                == a + 1
+            )
+
+    assert mock_parse.call_count == 1
+
+
+def test_compiled_formulas_cache_is_bounded(settings):
+    settings.BASEROW_COMPILED_FORMULAS_LRU_CACHE_SIZE = 2
+
+    first = get_compiled_formula("get('a')", formula_runtime_function_registry)
+    get_compiled_formula("get('b')", formula_runtime_function_registry)
+    # Using the first formula again makes the second one the least recently used.
+    assert get_compiled_formula("get('a')", formula_runtime_function_registry) is first
+    get_compiled_formula("get('c')", formula_runtime_function_registry)
+
+    assert len(compiled_formulas_lru_cache) == 2
+    assert get_compiled_formula("get('a')", formula_runtime_function_registry) is first
+
+
+def test_compiled_formulas_are_not_cached_when_disabled(settings):
+    settings.BASEROW_COMPILED_FORMULAS_LRU_CACHE_SIZE = 0
+
+    get_compiled_formula("get('a')", formula_runtime_function_registry)
+
+    assert len(compiled_formulas_lru_cache) == 0
+
+
+def test_compiled_formulas_are_invalidated_when_the_functions_change(settings):
+    settings.BASEROW_COMPILED_FORMULAS_LRU_CACHE_SIZE = 10
+    registry = BaserowRuntimeFormulaFunctionRegistry()
+    registry.register(RuntimeGet())
+
+    compiled = get_compiled_formula("add(1, 2)", registry)
+    with pytest.raises(BaserowFormulaSyntaxError):
+        compiled({})
+
+    registry.register(RuntimeAdd())
+
+    assert get_compiled_formula("add(1, 2)", registry)({}) == 3
@@ -1,15 +1,22 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 from asgiref.sync import sync_to_async
 from channels.db import database_sync_to_async
 from channels.testing import WebsocketCommunicator
+from django_redis import get_redis_connection
 
 from baserow.config.asgi import application
+from baserow.core.handler import CoreHandler
+from baserow.ws.permitted_users import PermittedUsersHandler
 from baserow.ws.tasks import (
     broadcast_to_channel_group,
     broadcast_to_group,
     broadcast_to_groups,
+    broadcast_to_permitted_users,
     broadcast_to_users,
     broadcast_to_users_individual_payloads,
+    flush_broadcasts_to_permitted_users,
     force_disconnect_users,
 )
 
@@ -567,3 +574,110 @@ def test_broadcast_to_permitted_users_does_not_fail_for_trashed_objects(data_fix
         )
     except Exception as e:
         pytest.fail(f"broadcast_to_permitted_users raised an exception: {e}")
+
+
+@pytest.mark.django_db
+def test_permitted_user_ids_are_memoized_until_membership_changes(
+    data_fixture, settings
+):
+    settings.BASEROW_WS_PERMITTED_USERS_CACHE_TTL_SECONDS = 60
+
+    user_1 = data_fixture.create_user()
+    user_2 = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(users=[user_1])
+    application = data_fixture.create_database_application(workspace=workspace)
+
+    def get_permitted_user_ids():
+        return PermittedUsersHandler.get_permitted_user_ids(
+            workspace, "application.read", "application", application
+        )
+
+    with patch.object(
+        CoreHandler,
+        "check_permission_for_multiple_actors",
+        wraps=CoreHandler().check_permission_for_multiple_actors,
+    ) as check_permission:
+        assert get_permitted_user_ids() == [user_1.id]
+        assert get_permitted_user_ids() == [user_1.id]
+        assert check_permission.call_count == 1
+
+        CoreHandler().add_user_to_workspace(workspace, user_2)
+
+        assert sorted(get_permitted_user_ids()) == [user_1.id, user_2.id]
+        assert check_permission.call_count == 2
+
+
+@pytest.mark.django_db
+def test_broadcast_to_permitted_users_coalesces_events(data_fixture, settings):
+    settings.BASEROW_WS_BROADCAST_COALESCE_WINDOW_MS = 100
+
+    user_1 = data_fixture.create_user()
+    user_2 = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(users=[user_1, user_2])
+    application = data_fixture.create_database_application(workspace=workspace)
+    other_application = data_fixture.create_database_application(workspace=workspace)
+
+    args = (workspace.id, "application.read", "application")
+    with patch(
+        "baserow.ws.tasks.flush_broadcasts_to_permitted_users.apply_async"
+    ) as apply_async:
+        broadcast_to_permitted_users.delay(*args, application.id, {"n": 1})
+        broadcast_to_permitted_users.delay(*args, application.id, {"n": 2}, "ws1")
+        broadcast_to_permitted_users.delay(*args, other_application.id, {"n": 3})
+
+    # Only one flush is scheduled per scope and operation.
+    assert apply_async.call_count == 2
+    assert apply_async.call_args_list[0].args[0] == (*args, application.id)
+    assert apply_async.call_args_list[0].kwargs["countdown"] == 0.1
+
+    channel_layer = MagicMock(group_send=AsyncMock(), spec=["group_send"])
+    with patch("channels.layers.get_channel_layer", return_value=channel_layer):
+        flush_broadcasts_to_permitted_users(*args, application.id)
+
+    messages = [call.args[1] for call in channel_layer.group_send.call_args_list]
+    assert [m["payload"] for m in messages] == [{"n": 1}, {"n": 2}]
+    assert [m["ignore_web_socket_id"] for m in messages] == [None, "ws1"]
+    assert all(sorted(m["user_ids"]) == [user_1.id, user_2.id] for m in messages)
+
+    # The queue has been drained, so the next event starts a new batch.
+    with patch(
+        "baserow.ws.tasks.flush_broadcasts_to_permitted_users.apply_async"
+    ) as apply_async:
+        broadcast_to_permitted_users.delay(*args, application.id, {"n": 4})
+    apply_async.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_broadcast_to_permitted_users_schedules_a_new_flush_if_it_is_lost(
+    data_fixture, settings
+):
+    settings.BASEROW_WS_BROADCAST_COALESCE_WINDOW_MS = 100
+
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    application = data_fixture.create_database_application(workspace=workspace)
+
+    args = (workspace.id, "application.read", "application", application.id)
+    flush_scheduled_key = PermittedUsersHandler._get_flush_scheduled_key(
+        PermittedUsersHandler._get_queue_key(*args)
+    )
+
+    with patch(
+        "baserow.ws.tasks.flush_broadcasts_to_permitted_users.apply_async"
+    ) as apply_async:
+        broadcast_to_permitted_users.delay(*args, {"n": 1})
+        broadcast_to_permitted_users.delay(*args, {"n": 2})
+        apply_async.assert_called_once()
+
+        # The scheduled flush never runs, so it's considered lost once the marker
+        # expires and the next event schedules a new flush.
+        get_redis_connection("default").delete(flush_scheduled_key)
+        broadcast_to_permitted_users.delay(*args, {"n": 3})
+        assert apply_async.call_count == 2
+
+    channel_layer = MagicMock(group_send=AsyncMock(), spec=["group_send"])
+    with patch("channels.layers.get_channel_layer", return_value=channel_layer):
+        flush_broadcasts_to_permitted_users(*args)
+
+    messages = [call.args[1] for call in channel_layer.group_send.call_args_list]
+    assert [m["payload"] for m in messages] == [{"n": 1}, {"n": 2}, {"n": 3}]
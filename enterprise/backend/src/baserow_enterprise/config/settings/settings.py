@@ -35,6 +35,14 @@ def setup(settings):
         os.getenv("BASEROW_ENTERPRISE_AUDIT_LOG_RETENTION_DAYS", "") or 365
     )
 
+    # How long the operations that a user is permitted to perform on a scope, and the
+    # queryset filters selecting the objects a user is permitted to list, as computed
+    # from the roles, are kept in the cache. The cache of a workspace is invalidated
+    # whenever its roles, teams or members change. Set to 0 to disable.
+    settings.BASEROW_ENTERPRISE_ROLE_PERMISSION_INDEX_TTL_SECONDS = int(
+        os.getenv("BASEROW_ENTERPRISE_ROLE_PERMISSION_INDEX_TTL_SECONDS", "") or 60 * 60
+    )
+
     # Set this to True to enable users to login with auth providers different than
     # the one they were originally created with.
     settings.BASEROW_ALLOW_MULTIPLE_SSO_PROVIDERS_FOR_SAME_ACCOUNT = bool(
@@ -0,0 +1,146 @@
+import hashlib
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from baserow.core.registries import operation_type_registry
+from baserow.version import VERSION
+
+ROLE_PERMISSION_INDEX_CACHE_KEY_PREFIX = "role_permission_index"
+ROLE_PERMISSION_INDEX_VERSION_CACHE_KEY_PREFIX = "role_permission_index_version"
+
+
+@lru_cache(maxsize=None)
+def get_operations_fingerprint() -> str:
+    """
+    Returns a short fingerprint of the registered operations. It's part of the cache
+    keys because the bits of the bitsets depend on the registered operations.
+    """
+
+    operation_names = ",".join(sorted(operation_type_registry.get_types()))
+    return hashlib.sha256(operation_names.encode("utf-8")).hexdigest()[:12]
+
+
+class RolePermissionIndex:
+    """
+    Materializes the permissions computed by the role permission manager, per
+    workspace. An entry is either a bitset of the operations that an actor is
+    permitted to perform on a scope, or a compiled queryset filter selecting the
+    objects an actor is permitted to perform an operation on. The entries are stored
+    in the cache until the roles, teams or memberships of the workspace change. Every
+    change bumps the version stamp of the workspace, so that all its entries are
+    discarded at once.
+    """
+
+    @classmethod
+    def _get_version_cache_key(cls, workspace_id: int) -> str:
+        return f"{ROLE_PERMISSION_INDEX_VERSION_CACHE_KEY_PREFIX}__{workspace_id}"
+
+    @classmethod
+    def get_entry_key(
+        cls,
+        actor: Any,
+        context: Any,
+        include_trash: bool,
+        name: str = "operations",
+    ) -> Optional[str]:
+        """
+        Returns the key of the entry of the actor on the context, or None if the
+        context can't be identified, in which case it can't be indexed.
+
+        :param actor: The actor performing the operations.
+        :param context: The scope object the operations are performed on.
+        :param include_trash: Whether the trashed memberships are taken into account.
+        :param name: The name of the kind of entry.
+        :return: The key of the entry.
+        """
+
+        context_id = getattr(context, "id", None)
+        if context_id is None or not hasattr(context, "_meta"):
+            return None
+
+        return (
+            f"{name}_{actor._meta.label_lower}_{actor.id}_"
+            f"{context._meta.label_lower}_{context_id}_{include_trash}"
+        )
+
+    def __init__(self, workspace_id: int):
+        """
+        :param workspace_id: The workspace of the entries. The version stamp of the
+            workspace is read immediately, so that entries computed from data that
+            changes in the meantime are stored under the outdated version.
+        """
+
+        self.timeout = settings.BASEROW_ENTERPRISE_ROLE_PERMISSION_INDEX_TTL_SECONDS
+        self.enabled = self.timeout > 0
+        self.cache_key_prefix = None
+        if self.enabled:
+            version = cache.get(self._get_version_cache_key(workspace_id), 0)
+            self.cache_key_prefix = (
+                f"{ROLE_PERMISSION_INDEX_CACHE_KEY_PREFIX}__{VERSION}_"
+                f"{get_operations_fingerprint()}_{workspace_id}_{version}"
+            )
+
+    def get_many(self, entry_keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Returns the indexed values of the provided entries. Entries that aren't
+        indexed yet are not included.
+
+        :param entry_keys: The keys generated by `get_entry_key`.
+        :return: A dict where the key is the entry key and the value the indexed
+            value.
+        """
+
+        entry_keys = list(entry_keys)
+        if not self.enabled or not entry_keys:
+            return {}
+
+        cached = cache.get_many(
+            [f"{self.cache_key_prefix}_{key}" for key in entry_keys]
+        )
+        return {
+            key: cached[f"{self.cache_key_prefix}_{key}"]
+            for key in entry_keys
+            if f"{self.cache_key_prefix}_{key}" in cached
+        }
+
+    def set_many(self, values: Dict[str, Any]):
+        """
+        Stores the values of the provided entries.
+
+        :param values: A dict where the key is the entry key generated by
+            `get_entry_key` and the value the value to index.
+        """
+
+        if not self.enabled or not values:
+            return
+
+        cache.set_many(
+            {f"{self.cache_key_prefix}_{key}": value for key, value in values.items()},
+            timeout=self.timeout,
+        )
+
+    @classmethod
+    def invalidate_workspace(cls, workspace_id: int):
+        """
+        Invalidates all the indexed permissions of the workspace. Because the
+        permissions can only be trusted once the change has been committed, the
+        version is bumped again after the commit, so that an entry indexed in the
+        meantime is never used.
+
+        :param workspace_id: The id of the workspace where the roles, teams or
+            memberships have changed.
+        """
+
+        def bump_version():
+            key = cls._get_version_cache_key(workspace_id)
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.set(key, 1, timeout=None)
+
+        bump_version()
+        transaction.on_commit(bump_version)
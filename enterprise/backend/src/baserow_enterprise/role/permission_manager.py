@@ -1,9 +1,10 @@
 from collections import defaultdict
 from functools import cached_property, partial
-from typing import Any, Dict, List, Optional, Set, Tuple, TypedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, TypedDict
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
+from django.db.models import Q
 
 from baserow_premium.license.handler import LicenseHandler
 
@@ -11,6 +12,7 @@ from baserow.core.cache import local_cache
 from baserow.core.exceptions import PermissionDenied
 from baserow.core.models import Workspace
 from baserow.core.registries import (
+    ObjectScopeType,
     OperationType,
     PermissionManagerType,
     object_scope_type_registry,
@@ -24,6 +26,7 @@ from baserow_enterprise.role.handler import RoleAssignmentHandler
 
 from .constants import READ_ONLY_ROLE_UID
 from .models import Role
+from .permission_index import RolePermissionIndex
 
 User = get_user_model()
 
@@ -92,32 +95,74 @@ class RolePermissionManagerType(PermissionManagerType):
             actors_by_subject_type[s_type].add(actor)
             checks_by_actor_and_context[actor][context].append(check)
 
-        result = {}
-        roles_per_scope_by_actor = {}
+        # The permitted operations of every actor on every context are looked up in
+        # the permission index first, so that the roles only have to be computed for
+        # the ones that haven't been indexed yet.
+        permission_index = RolePermissionIndex(workspace.id)
+        entry_keys = {}
+        for actor, context_and_checks in checks_by_actor_and_context.items():
+            for context in context_and_checks.keys():
+                entry_key = RolePermissionIndex.get_entry_key(
+                    actor, context, include_trash
+                )
+                if entry_key is not None:
+                    entry_keys[(actor, context)] = entry_key
+        indexed_bitsets = permission_index.get_many(entry_keys.values())
+
+        bitsets = {}
+        for actor_and_context, entry_key in entry_keys.items():
+            if entry_key in indexed_bitsets:
+                bitsets[actor_and_context] = indexed_bitsets[entry_key]
+
+        missing_actors_by_subject_type = defaultdict(set)
         for actor_subject_type, actors in actors_by_subject_type.items():
+            for actor in actors:
+                if any(
+                    (actor, context) not in bitsets
+                    for context in checks_by_actor_and_context[actor].keys()
+                ):
+                    missing_actors_by_subject_type[actor_subject_type].add(actor)
+
+        roles_per_scope_by_actor = {}
+        for actor_subject_type, actors in missing_actors_by_subject_type.items():
             roles_per_scope_by_actor.update(
                 RoleAssignmentHandler().get_roles_per_scope_for_actors(
                     workspace, actor_subject_type, actors, include_trash=include_trash
                 )
             )
 
+        bitsets_to_index = {}
         scope_includes_cache = {}
-        for actor, context_and_checks in checks_by_actor_and_context.items():
-            for context, checks in context_and_checks.items():
-                computed_roles = RoleAssignmentHandler().get_computed_roles(
-                    roles_per_scope_by_actor[actor], context, scope_includes_cache
-                )
-                permitted_operations = set(
-                    [
+        for actors in missing_actors_by_subject_type.values():
+            for actor in actors:
+                for context in checks_by_actor_and_context[actor].keys():
+                    if (actor, context) in bitsets:
+                        continue
+
+                    computed_roles = RoleAssignmentHandler().get_computed_roles(
+                        roles_per_scope_by_actor.get(actor, []),
+                        context,
+                        scope_includes_cache,
+                    )
+                    bitset = self.get_operations_bitset(
                         operation_name
                         for r in computed_roles
                         for operation_name in self.get_role_operations(r)
-                    ]
-                )
+                    )
+                    bitsets[(actor, context)] = bitset
+                    if (actor, context) in entry_keys:
+                        bitsets_to_index[entry_keys[(actor, context)]] = bitset
+
+        permission_index.set_many(bitsets_to_index)
+
+        result = {}
+        for actor, context_and_checks in checks_by_actor_and_context.items():
+            for context, checks in context_and_checks.items():
+                bitset = bitsets[(actor, context)]
                 check_results = {
                     check: (
                         True
-                        if check.operation_name in permitted_operations
+                        if self.is_operation_in_bitset(check.operation_name, bitset)
                         else PermissionDenied()
                     )
                     for check in checks
@@ -126,6 +171,46 @@ class RolePermissionManagerType(PermissionManagerType):
 
         return result
 
+    @cached_property
+    def operation_bits(self) -> Dict[str, int]:
+        """
+        Returns the bit of every registered operation in the permitted operations
+        bitsets of the permission index.
+        """
+
+        return {
+            operation_name: 1 << index
+            for index, operation_name in enumerate(
+                sorted(operation_type_registry.get_types())
+            )
+        }
+
+    def get_operations_bitset(self, operation_names: Iterable[str]) -> int:
+        """
+        Converts the provided operation names to a bitset. Operations that are not
+        registered are ignored because they can't be checked.
+
+        :param operation_names: The permitted operation names.
+        :return: An int where the bit of every permitted operation is set.
+        """
+
+        operation_bits = self.operation_bits
+        bitset = 0
+        for operation_name in operation_names:
+            bitset |= operation_bits.get(operation_name, 0)
+        return bitset
+
+    def is_operation_in_bitset(self, operation_name: str, bitset: int) -> bool:
+        """
+        Checks whether the bit of the operation is set in the provided bitset.
+
+        :param operation_name: The name of the operation to check.
+        :param bitset: The bitset created by `get_operations_bitset`.
+        :return: True if the operation is permitted.
+        """
+
+        return bool(bitset & self.operation_bits.get(operation_name, 0))
+
     def get_operation_policy(
         self,
         roles_by_scope: List[Tuple[Any, List[Role]]],
@@ -316,6 +401,103 @@ class RolePermissionManagerType(PermissionManagerType):
 
         return policy_per_operation_with_exception_ids
 
+    def compile_operation_filter(
+        self,
+        default: bool,
+        exceptions: Set[Any],
+        inclusions: Set[Any],
+        object_scope_type: ObjectScopeType,
+    ) -> Q:
+        """
+        Compiles the policy returned by `get_operation_policy` into a filter that
+        selects the permitted objects. The filter only references the scopes of the
+        policy, so it stays valid when objects are created in those scopes.
+
+        :param default: The default policy of the operation.
+        :param exceptions: The scopes that are an exception to the default policy.
+        :param inclusions: The scopes that are an exception to the exceptions.
+        :param object_scope_type: The object scope type of the objects to filter.
+        :return: A Q object selecting the permitted objects.
+        """
+
+        if not exceptions:
+            return Q() if default else Q(pk__in=[])
+
+        scopes_by_level = defaultdict(lambda: (set(), set()))
+        for scope in exceptions | inclusions:
+            level = object_scope_type_registry.get_by_model(scope).level
+            scopes_by_level[level][0 if scope in exceptions else 1].add(scope)
+
+        # Like the exception ids in `get_permissions_object`, the most precise scope
+        # wins, so the scopes are applied from the least to the most precise one.
+        # Objects can only be in one scope per level, so the order within a level
+        # doesn't matter.
+        in_exceptions = Q(pk__in=[])
+        for level in sorted(scopes_by_level.keys()):
+            level_exceptions, level_inclusions = scopes_by_level[level]
+            if level_exceptions:
+                in_exceptions |= object_scope_type.get_filter_for_scopes(
+                    level_exceptions
+                )
+            if level_inclusions:
+                in_exceptions &= ~object_scope_type.get_filter_for_scopes(
+                    level_inclusions
+                )
+
+        return ~in_exceptions if default else in_exceptions
+
+    def get_operation_filters(
+        self,
+        actor: AbstractUser,
+        workspace: Workspace,
+        operation_types: List[OperationType],
+    ) -> Dict[str, Q]:
+        """
+        Returns the compiled filters that select the objects the actor is permitted
+        to perform the provided operations on. The filters are stored in the role
+        permission index of the workspace, so that they only have to be compiled
+        again when the roles in the workspace change.
+
+        :param actor: The actor performing the operations.
+        :param workspace: The workspace of the objects.
+        :param operation_types: The operations to get the filters for.
+        :return: A dict where the key is the operation name and the value the filter.
+        """
+
+        permission_index = RolePermissionIndex(workspace.id)
+        entry_keys = {
+            operation_type.type: RolePermissionIndex.get_entry_key(
+                actor, workspace, False, f"filter_{operation_type.type}"
+            )
+            for operation_type in operation_types
+        }
+        indexed_filters = permission_index.get_many(entry_keys.values())
+
+        filters = {}
+        filters_to_index = {}
+        roles_by_scope = None
+        for operation_type in operation_types:
+            entry_key = entry_keys[operation_type.type]
+            if entry_key in indexed_filters:
+                filters[operation_type.type] = indexed_filters[entry_key]
+                continue
+
+            if roles_by_scope is None:
+                roles_by_scope = RoleAssignmentHandler().get_roles_per_scope(
+                    workspace, actor
+                )
+            default, exceptions, inclusions = self.get_operation_policy(
+                roles_by_scope, operation_type, use_object_scope=True
+            )
+            operation_filter = self.compile_operation_filter(
+                default, exceptions, inclusions, operation_type.object_scope
+            )
+            filters[operation_type.type] = operation_filter
+            filters_to_index[entry_key] = operation_filter
+
+        permission_index.set_many(filters_to_index)
+        return filters
+
     def filter_queryset(self, actor, operation_name, queryset, workspace=None):
         """
         Filter the given queryset according to the role given for the specified
@@ -326,25 +508,8 @@ class RolePermissionManagerType(PermissionManagerType):
             return
 
         operation_type = operation_type_registry.get(operation_name)
+        operation_filter = self.get_operation_filters(
+            actor, workspace, [operation_type]
+        )[operation_type.type]
 
-        permission_obj = self.get_permissions_object(
-            actor,
-            workspace,
-            for_operation_types=[operation_type],
-            use_object_scope=True,
-        )
-
-        default = permission_obj[operation_type.type]["default"]
-        exceptions = permission_obj[operation_type.type]["exceptions"]
-
-        # Finally filter the queryset with the exception filter.
-        if default:
-            if exceptions:
-                queryset = queryset.exclude(id__in=exceptions)
-        else:
-            if exceptions:
-                queryset = queryset.filter(id__in=exceptions)
-            else:
-                queryset = queryset.none()
-
-        return queryset
+        return queryset.filter(operation_filter)
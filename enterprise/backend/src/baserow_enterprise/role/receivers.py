@@ -1,23 +1,30 @@
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from baserow.core.models import Workspace, WorkspaceUser
 from baserow.core.registries import subject_type_registry
 from baserow.core.signals import permissions_updated, workspace_user_updated
 from baserow.core.types import Subject
+from baserow.ws.permitted_users import PermittedUsersHandler
 from baserow.ws.tasks import broadcast_to_users
 from baserow_enterprise.signals import (
+    field_permissions_updated,
     role_assignment_created,
     role_assignment_deleted,
     role_assignment_updated,
     team_deleted,
     team_restored,
+    team_subject_created,
+    team_subject_deleted,
+    team_subject_restored,
 )
 from baserow_enterprise.teams.models import Team
 
+from .permission_index import RolePermissionIndex
+
 User = get_user_model()
 
 
@@ -65,6 +72,64 @@ def notify_users_about_updated_permissions(
     )
 
 
+@receiver(team_subject_created)
+@receiver(team_subject_deleted)
+@receiver(team_subject_restored)
+def invalidate_permitted_users_when_team_subject_changed(sender, subject, **kwargs):
+    PermittedUsersHandler.invalidate_workspace(subject.team.workspace_id)
+
+
+@receiver(permissions_updated)
+def invalidate_role_permission_index_when_permissions_updated(
+    sender, subject: Subject, workspace: Workspace, **kwargs
+):
+    RolePermissionIndex.invalidate_workspace(workspace.id)
+
+
+@receiver(team_subject_created)
+@receiver(team_subject_deleted)
+@receiver(team_subject_restored)
+def invalidate_role_permission_index_when_team_subject_changed(
+    sender, subject, **kwargs
+):
+    RolePermissionIndex.invalidate_workspace(subject.team.workspace_id)
+
+
+def invalidate_role_permission_index_of_instance_workspace(sender, instance, **kwargs):
+    """
+    Invalidates the role permission index of the workspace of the saved or deleted
+    role assignment, workspace user or team. This also covers the role assignments
+    that are deleted because their scope or subject has been deleted.
+    """
+
+    RolePermissionIndex.invalidate_workspace(instance.workspace_id)
+
+
+def invalidate_role_permission_index_of_team_subject_workspace(
+    sender, instance, **kwargs
+):
+    """
+    Invalidates the role permission index of the workspace of the team of the saved
+    or deleted team subject. If the team itself has been deleted as well, then the
+    index has already been invalidated when the team was deleted.
+    """
+
+    workspace_id = (
+        Team.objects_and_trash.filter(id=instance.team_id)
+        .values_list("workspace_id", flat=True)
+        .first()
+    )
+    if workspace_id is not None:
+        RolePermissionIndex.invalidate_workspace(workspace_id)
+
+
+@receiver(field_permissions_updated)
+def invalidate_permitted_users_when_field_permissions_updated(
+    sender, workspace: Workspace, **kwargs
+):
+    PermittedUsersHandler.invalidate_workspace(workspace.id)
+
+
 def cascade_subject_delete(sender, instance, **kwargs):
     """
     Delete role assignments linked to deleted subjects.
@@ -107,7 +172,8 @@ def cascade_scope_delete(sender, instance, **kwargs):
 def connect_to_post_delete_signals_to_cascade_deletion_to_role_assignments():
     """
     Connect to post_delete signal of all role_assignment generic foreign key to delete
-    all related role_assignments.
+    all related role_assignments, and to the signals of the models that the role
+    permission index depends on.
     """
 
     from baserow.core.models import WorkspaceUser
@@ -116,6 +182,9 @@ def connect_to_post_delete_signals_to_cascade_deletion_to_role_assignments():
         subject_type_registry,
     )
     from baserow_enterprise.role.constants import ROLE_ASSIGNABLE_OBJECT_MAP
+    from baserow_enterprise.teams.models import TeamSubject
+
+    from .models import RoleAssignment
 
     # Add the subject handler
     for subject_type in subject_type_registry.get_all():
@@ -128,3 +197,13 @@ def connect_to_post_delete_signals_to_cascade_deletion_to_role_assignments():
     for role_assignable_object_type in ROLE_ASSIGNABLE_OBJECT_MAP.keys():
         scope_type = object_scope_type_registry.get(role_assignable_object_type)
         post_delete.connect(cascade_scope_delete, scope_type.model_class)
+
+    # Keep the role permission index of the workspace up to date.
+    for signal in [post_save, post_delete]:
+        for model in [RoleAssignment, WorkspaceUser, Team]:
+            signal.connect(
+                invalidate_role_permission_index_of_instance_workspace, model
+            )
+        signal.connect(
+            invalidate_role_permission_index_of_team_subject_workspace, TeamSubject
+        )
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.db import IntegrityError, connection, reset_queries
 from django.test import override_settings
 from django.test.utils import CaptureQueriesContext
@@ -1852,3 +1854,133 @@ def test_fetching_permissions_does_not_extra_queries_per_snapshot(
         CoreHandler().get_permissions(viewer, workspace=workspace)
 
     assert len(captured_1.captured_queries) == len(captured_2.captured_queries)
+
+
+@pytest.mark.django_db
+def test_check_multiple_permissions_uses_role_permission_index(
+    data_fixture, enterprise_data_fixture
+):
+    admin = data_fixture.create_user()
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=admin, members=[user])
+    database = data_fixture.create_database_application(user=admin, workspace=workspace)
+    table = data_fixture.create_database_table(user=admin, database=database)
+
+    viewer_role = Role.objects.get(uid="VIEWER")
+    builder_role = Role.objects.get(uid="BUILDER")
+    RoleAssignmentHandler().assign_role(
+        user, workspace, role=viewer_role, scope=workspace
+    )
+
+    permission_manager = RolePermissionManagerType()
+    checks = [
+        PermissionCheck(
+            original_actor=user,
+            operation_name=ReadDatabaseTableOperationType.type,
+            context=table,
+        ),
+        PermissionCheck(
+            original_actor=user,
+            operation_name=UpdateDatabaseTableOperationType.type,
+            context=table,
+        ),
+    ]
+
+    def check():
+        with local_cache.context():
+            result = permission_manager.check_multiple_permissions(
+                checks, workspace=workspace
+            )
+        return [result[c] is True for c in checks]
+
+    assert check() == [True, False]
+
+    # The second time the permissions are looked up in the index.
+    with patch.object(
+        RoleAssignmentHandler,
+        "get_roles_per_scope_for_actors",
+        side_effect=AssertionError("Should not be called"),
+    ):
+        assert check() == [True, False]
+
+    # Assigning a role invalidates the index of the workspace.
+    RoleAssignmentHandler().assign_role(user, workspace, role=builder_role, scope=table)
+    assert check() == [True, True]
+
+    # The roles of the teams of the user are indexed as well, and removing the user
+    # from the team invalidates the index.
+    team = enterprise_data_fixture.create_team(workspace=workspace, members=[user])
+    RoleAssignmentHandler().assign_role(user, workspace, role=None, scope=table)
+    RoleAssignmentHandler().assign_role(team, workspace, role=builder_role, scope=table)
+    assert check() == [True, True]
+
+    team.subjects.all().delete()
+    assert check() == [True, False]
+
+    with override_settings(BASEROW_ENTERPRISE_ROLE_PERMISSION_INDEX_TTL_SECONDS=0):
+        with patch.object(
+            RoleAssignmentHandler,
+            "get_roles_per_scope_for_actors",
+            wraps=RoleAssignmentHandler().get_roles_per_scope_for_actors,
+        ) as mock_get_roles_per_scope_for_actors:
+            assert check() == [True, False]
+            assert check() == [True, False]
+        assert mock_get_roles_per_scope_for_actors.call_count == 2
+
+
+@pytest.mark.django_db
+def test_filter_queryset_uses_compiled_filter_from_role_permission_index(
+    data_fixture, enterprise_data_fixture
+):
+    admin = data_fixture.create_user()
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=admin, members=[user])
+    database_1 = data_fixture.create_database_application(
+        user=admin, workspace=workspace
+    )
+    database_2 = data_fixture.create_database_application(
+        user=admin, workspace=workspace
+    )
+    table_1_1 = data_fixture.create_database_table(user=admin, database=database_1)
+    table_1_2 = data_fixture.create_database_table(user=admin, database=database_1)
+    table_2_1 = data_fixture.create_database_table(user=admin, database=database_2)
+
+    RoleAssignmentHandler().assign_role(
+        user, workspace, role=Role.objects.get(uid="VIEWER"), scope=workspace
+    )
+    RoleAssignmentHandler().assign_role(
+        user, workspace, role=Role.objects.get(uid="NO_ACCESS"), scope=database_1
+    )
+    RoleAssignmentHandler().assign_role(
+        user, workspace, role=Role.objects.get(uid="BUILDER"), scope=table_1_2
+    )
+
+    perm_manager = RolePermissionManagerType()
+    table_queryset = Table.objects.filter(database__workspace=workspace)
+
+    def filter_tables():
+        with local_cache.context():
+            return list(
+                perm_manager.filter_queryset(
+                    user,
+                    ListTablesDatabaseTableOperationType.type,
+                    table_queryset,
+                    workspace=workspace,
+                ).order_by("id")
+            )
+
+    assert filter_tables() == [table_1_2, table_2_1]
+
+    # The compiled filter is reused, and it still applies to the tables that are
+    # created afterwards.
+    table_1_3 = data_fixture.create_database_table(user=admin, database=database_1)
+    table_2_2 = data_fixture.create_database_table(user=admin, database=database_2)
+    with patch.object(
+        RoleAssignmentHandler,
+        "get_roles_per_scope",
+        side_effect=AssertionError("Should not be called"),
+    ):
+        assert filter_tables() == [table_1_2, table_2_1, table_2_2]
+
+    RoleAssignmentHandler().assign_role(user, workspace, role=None, scope=database_1)
+    assert filter_tables() == [table_1_1, table_1_2, table_2_1, table_1_3, table_2_2]
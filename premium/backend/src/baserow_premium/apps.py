@@ -71,6 +71,7 @@ class BaserowPremiumConfig(AppConfig):
             ExcelTableExporter,
             FileTableExporter,
             JSONTableExporter,
+            ParquetTableExporter,
             XMLTableExporter,
         )
         from .plugins import PremiumPlugin
@@ -92,6 +93,7 @@ class BaserowPremiumConfig(AppConfig):
         table_exporter_registry.register(XMLTableExporter())
         table_exporter_registry.register(ExcelTableExporter())
         table_exporter_registry.register(FileTableExporter())
+        table_exporter_registry.register(ParquetTableExporter())
 
         row_metadata_registry.register(RowCommentCountMetadataType())
         row_metadata_registry.register(RowCommentsNotificationModeMetadataType())
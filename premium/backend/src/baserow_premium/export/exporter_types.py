@@ -1,6 +1,8 @@
 import json
 from collections import OrderedDict
-from typing import List, Optional, Type
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, List, Optional, Tuple, Type
 
 import zipstream
 from baserow_premium.license.features import PREMIUM
@@ -10,15 +12,36 @@ from baserow.config.settings.base import BASEROW_DEFAULT_ZIP_COMPRESS_LEVEL
 from baserow.contrib.database.api.export.serializers import (
     BaseExporterOptionsSerializer,
 )
-from baserow.contrib.database.export.file_writer import FileWriter, QuerysetSerializer
+from baserow.contrib.database.export.file_writer import (
+    FileWriter,
+    PaginatedExportJobFileWriter,
+    QuerysetSerializer,
+)
 from baserow.contrib.database.export.registries import TableExporter
 from baserow.contrib.database.export.utils import view_is_publicly_exportable
 from baserow.contrib.database.fields.field_helpers import prepare_files_for_export
-from baserow.contrib.database.fields.field_types import FileFieldType
+from baserow.contrib.database.fields.field_types import (
+    AutonumberFieldType,
+    BooleanFieldType,
+    DateFieldType,
+    DurationFieldType,
+    FileFieldType,
+    FormulaFieldType,
+    LinkRowFieldType,
+    MultipleCollaboratorsFieldType,
+    MultipleSelectFieldType,
+    NumberFieldType,
+    RatingFieldType,
+)
+from baserow.contrib.database.table.models import FieldObject
 from baserow.contrib.database.views.view_types import GridViewType
 from baserow.core.storage import ExportZipFile, get_default_storage
 
-from .serializers import ExcelExporterOptionsSerializer, FileExporterOptionsSerializer
+from .serializers import (
+    ExcelExporterOptionsSerializer,
+    FileExporterOptionsSerializer,
+    ParquetExporterOptionsSerializer,
+)
 from .utils import get_unique_name, safe_xml_tag_name, to_xml
 
 
@@ -42,6 +65,7 @@ class PremiumTableExporter(TableExporter):
 
 class JSONQuerysetSerializer(QuerysetSerializer):
     can_handle_rich_value = True
+    can_be_sharded = True
 
     def write_to_file(self, file_writer: FileWriter, export_charset="utf-8"):
         """
@@ -102,6 +126,7 @@ class JSONTableExporter(PremiumTableExporter):
 
 class XMLQuerysetSerializer(QuerysetSerializer):
     can_handle_rich_value = True
+    can_be_sharded = True
 
     def write_to_file(self, file_writer: FileWriter, export_charset="utf-8"):
         """
@@ -328,3 +353,177 @@ class FileTableExporter(PremiumTableExporter):
     @property
     def queryset_serializer_class(self):
         return FileQuerysetSerializer
+
+
+class ParquetQuerysetSerializer(QuerysetSerializer):
+    can_handle_rich_value = True
+
+    def _get_parquet_column(
+        self, field_object: FieldObject, field_serializer: Callable
+    ) -> Tuple[Any, Callable[[Any], Any]]:
+        """
+        Returns the Arrow data type and a function that extracts the matching python
+        value from a row for the given field. Numbers, booleans, dates and durations
+        keep their native type so that the exported file can be queried without any
+        parsing. Fields holding multiple values become a list of strings and all
+        other fields are written as their rich export value in string form.
+
+        :param field_object: The field object to get the column for.
+        :param field_serializer: The serializer function of the field object.
+        :return: A tuple containing the Arrow type and the value getter.
+        """
+
+        import pyarrow as pa
+
+        field = field_object["field"]
+        field_type = field_object["type"]
+        field_name = field_object["name"]
+
+        formula_type = None
+        if isinstance(field_type, FormulaFieldType):
+            formula_type = field.formula_type
+
+        def get_raw_value(row):
+            return getattr(row, field_name)
+
+        if isinstance(field_type, NumberFieldType) or formula_type == "number":
+            decimal_places = field.number_decimal_places or 0
+            exponent = Decimal(1).scaleb(-decimal_places)
+
+            def get_decimal(row):
+                value = get_raw_value(row)
+                return None if value is None else Decimal(value).quantize(exponent)
+
+            return (
+                pa.decimal256(
+                    NumberFieldType.MAX_DIGITS + decimal_places, decimal_places
+                ),
+                get_decimal,
+            )
+        elif isinstance(field_type, (RatingFieldType, AutonumberFieldType)):
+            return pa.int64(), get_raw_value
+        elif isinstance(field_type, BooleanFieldType) or formula_type == "boolean":
+            return pa.bool_(), get_raw_value
+        elif isinstance(field_type, DurationFieldType) or formula_type == "duration":
+            return pa.duration("us"), get_raw_value
+        elif isinstance(field_type, DateFieldType) or formula_type == "date":
+            if field.date_include_time:
+                return pa.timestamp("us", tz="UTC"), get_raw_value
+
+            def get_date(row):
+                value = get_raw_value(row)
+                return value.date() if isinstance(value, datetime) else value
+
+            return pa.date32(), get_date
+
+        def to_string(value):
+            return value if isinstance(value, str) else json.dumps(value, default=str)
+
+        if formula_type == "array" or isinstance(
+            field_type,
+            (
+                LinkRowFieldType,
+                MultipleSelectFieldType,
+                MultipleCollaboratorsFieldType,
+                FileFieldType,
+            ),
+        ):
+
+            def get_list(row):
+                _, _, value = field_serializer(row)
+                if not isinstance(value, list):
+                    return None
+                return [to_string(item) for item in value]
+
+            return pa.list_(pa.string()), get_list
+
+        def get_string(row):
+            if get_raw_value(row) is None:
+                return None
+            _, _, value = field_serializer(row)
+            return to_string(value)
+
+        return pa.string(), get_string
+
+    def write_to_file(
+        self,
+        file_writer: FileWriter,
+        export_charset: Optional[str] = None,
+        parquet_compression: str = "snappy",
+    ):
+        """
+        Writes the queryset to the provided file in the columnar Apache Parquet
+        format. The rows are streamed into the file in row groups of
+        `EXPORT_ROWS_CHUNK_SIZE` rows, so that the memory usage doesn't depend on the
+        size of the table.
+
+        :param file_writer: The FileWriter instance to write to.
+        :param export_charset: Unused because Parquet always stores strings as
+            UTF-8.
+        :param parquet_compression: The compression codec used for the column
+            chunks.
+        """
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        names = {"id": True}
+        fields = [pa.field("id", pa.int64(), nullable=False)]
+        getters = [lambda row: row.id]
+
+        for field_object, field_serializer in zip(
+            self.ordered_field_objects, self.field_serializers[1:]
+        ):
+            name = get_unique_name(names, field_object["field"].name, separator=" ")
+            names[name] = True
+            arrow_type, getter = self._get_parquet_column(
+                field_object, field_serializer
+            )
+            fields.append(pa.field(name, arrow_type))
+            getters.append(getter)
+
+        schema = pa.schema(fields)
+        columns = [[] for _ in getters]
+        writer = pq.ParquetWriter(
+            file_writer._file, schema, compression=parquet_compression
+        )
+
+        def write_row(row, is_last):
+            for column, getter in zip(columns, getters):
+                column.append(getter(row))
+
+            if is_last or len(columns[0]) >= (
+                PaginatedExportJobFileWriter.EXPORT_ROWS_CHUNK_SIZE
+            ):
+                writer.write_batch(pa.record_batch(columns, schema=schema))
+                for column in columns:
+                    column.clear()
+
+        try:
+            file_writer.write_rows(self.queryset, write_row)
+        finally:
+            writer.close()
+
+
+class ParquetTableExporter(PremiumTableExporter):
+    type = "parquet"
+
+    @property
+    def option_serializer_class(self) -> Type[BaseExporterOptionsSerializer]:
+        return ParquetExporterOptionsSerializer
+
+    @property
+    def can_export_table(self) -> bool:
+        return True
+
+    @property
+    def supported_views(self) -> List[str]:
+        return [GridViewType.type]
+
+    @property
+    def file_extension(self) -> str:
+        return ".parquet"
+
+    @property
+    def queryset_serializer_class(self):
+        return ParquetQuerysetSerializer
@@ -18,3 +18,12 @@ class FileExporterOptionsSerializer(BaseExporterOptionsSerializer):
         default=True,
         help_text="Whether or not to group files by row id in the export.",
     )
+
+
+class ParquetExporterOptionsSerializer(BaseExporterOptionsSerializer):
+    parquet_compression = fields.ChoiceField(
+        choices=["snappy", "zstd", "gzip", "none"],
+        default="snappy",
+        help_text="The compression codec used for the column chunks of the Parquet "
+        "file.",
+    )
@@ -153,6 +153,12 @@ class AIFieldType(CollationSortMixin, SelectOptionBaseFieldType):
         baserow_field_type = self.get_baserow_field_type(instance)
         return baserow_field_type.get_model_field(instance, **kwargs)
 
+    def get_in_database_copy_sql(self, field, source_sql, id_mapping):
+        baserow_field_type = self.get_baserow_field_type(field)
+        return baserow_field_type.get_in_database_copy_sql(
+            field, source_sql, id_mapping
+        )
+
     def get_serializer_help_text(self, instance):
         return (
             "Holds a value that is generated by a generative AI model using a "
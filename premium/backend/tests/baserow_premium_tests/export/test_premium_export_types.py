@@ -1,9 +1,12 @@
 import zipfile
+from decimal import Decimal
 from io import BytesIO
 from unittest.mock import MagicMock, patch
 
 from django.test.utils import override_settings
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from baserow_premium.license.exceptions import FeaturesNotAvailableError
 from openpyxl import load_workbook
@@ -1027,6 +1030,65 @@ def test_can_export_every_interesting_different_field_to_excel_without_header(
     assert actual_headers[0] == "1"
 
 
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+@patch("baserow.core.storage.get_default_storage")
+def test_cannot_export_parquet_without_premium_license(
+    get_storage_mock, premium_data_fixture
+):
+    storage_mock = MagicMock()
+    get_storage_mock.return_value = storage_mock
+    with pytest.raises(FeaturesNotAvailableError):
+        run_export_over_interesting_test_table(
+            premium_data_fixture, storage_mock, {"exporter_type": "parquet"}
+        )
+
+
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+@patch("baserow.core.storage.get_default_storage")
+def test_can_export_every_interesting_different_field_to_parquet(
+    get_storage_mock, premium_data_fixture
+):
+    storage_mock = MagicMock()
+    get_storage_mock.return_value = storage_mock
+
+    contents = run_export_over_interesting_test_table(
+        premium_data_fixture,
+        storage_mock,
+        {
+            "exporter_type": "parquet",
+            "export_charset": None,
+            "parquet_compression": "zstd",
+        },
+        user_kwargs={"has_active_premium_license": True, "email": "user@example.com"},
+    )
+
+    parquet_table = pq.read_table(BytesIO(contents))
+    schema = parquet_table.schema
+
+    assert parquet_table.num_rows == 2
+    assert schema.names[0] == "id"
+    assert schema.field("id").type == pa.int64()
+    assert schema.field("text").type == pa.string()
+    assert schema.field("positive_decimal").type == pa.decimal256(51, 1)
+    assert schema.field("rating").type == pa.int64()
+    assert schema.field("boolean").type == pa.bool_()
+    assert schema.field("datetime_us").type == pa.timestamp("us", tz="UTC")
+    assert schema.field("date_us").type == pa.date32()
+    assert schema.field("duration_hm").type == pa.duration("us")
+    assert schema.field("multiple_select").type == pa.list_(pa.string())
+    assert schema.field("formula_bool").type == pa.bool_()
+
+    rows = parquet_table.to_pylist()
+    assert [row["id"] for row in rows] == [1, 2]
+    assert rows[0]["decimal_with_default"] == Decimal("1.8")
+    assert rows[0]["boolean"] is False
+    assert rows[0]["boolean_with_default"] is True
+    assert rows[0]["text"] is None
+    assert rows[0]["last_modified_by"] == "user@example.com"
+
+
 @pytest.mark.django_db
 @override_settings(DEBUG=True)
 def test_can_trigger_export_files_with_premium_license(premium_data_fixture):
@@ -4,6 +4,7 @@ import {
   XMLTableExporter,
   ExcelTableExporterType,
   FileTableExporter,
+  ParquetTableExporterType,
 } from '@baserow_premium/tableExporterTypes'
 import { LicensesAdminType } from '@baserow_premium/adminTypes'
 import rowCommentsStore from '@baserow_premium/store/row_comments'
@@ -157,6 +158,7 @@ export default (context) => {
   app.$registry.register('exporter', new XMLTableExporter(context))
   app.$registry.register('exporter', new ExcelTableExporterType(context))
   app.$registry.register('exporter', new FileTableExporter(context))
+  app.$registry.register('exporter', new ParquetTableExporterType(context))
   app.$registry.register('field', new AIFieldType(context))
   app.$registry.register('field', new PremiumFormulaFieldType(context))
   app.$registry.register('view', new KanbanViewType(context))
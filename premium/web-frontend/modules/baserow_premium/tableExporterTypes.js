@@ -5,6 +5,7 @@ import TableXMLExporter from '@baserow_premium/components/exporter/TableXMLExpor
 import PremiumFeatures from '@baserow_premium/features'
 import TableExcelExporter from '@baserow_premium/components/exporter/TableExcelExporter'
 import TableFileExporter from '@baserow_premium/components/exporter/TableFileExporter'
+import TableParquetExporter from '@baserow_premium/components/exporter/TableParquetExporter'
 import PaidFeaturesModal from '@baserow_premium/components/PaidFeaturesModal'
 import { ExportsPaidFeature } from '@baserow_premium/paidFeatures'
 
@@ -145,3 +146,34 @@ export class FileTableExporter extends PremiumTableExporterType {
     return [GridViewType.getType()]
   }
 }
+
+export class ParquetTableExporterType extends PremiumTableExporterType {
+  static getType() {
+    return 'parquet'
+  }
+
+  getFileExtension() {
+    return 'parquet'
+  }
+
+  getIconClass() {
+    return 'baserow-icon-file-code'
+  }
+
+  getName() {
+    const { i18n } = this.app
+    return i18n.t('premium.exporterType.parquet')
+  }
+
+  getFormComponent() {
+    return TableParquetExporter
+  }
+
+  getCanExportTable() {
+    return true
+  }
+
+  getSupportedViews() {
+    return [GridViewType.getType()]
+  }
+}